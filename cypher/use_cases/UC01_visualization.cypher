@@ -1,10 +1,12 @@
 // UC01: Regelbedarfsermittlung für Familie - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.norm_chunk_paths
 
+:params {"sgb": "II", "paragraphs": ["20", "21", "22", "23"], "limit": 50}
 
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE norm.paragraph_nummer IN ['20', '21', '22', '23']
-                    RETURN path LIMIT 50
-                
\ No newline at end of file
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
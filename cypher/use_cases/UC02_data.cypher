@@ -1,18 +1,18 @@
 // UC02: Sanktionsprüfung bei Meldeversäumnis
 // SGB: II | Paragraphen: 32
 // Priority: P0 | Tool: Neo4j Browser
+// Registry: validate.uc02
 
+:params {"sgb": "II", "paragraph": "32", "terms": ["Meldeversäumnis", "Minderung", "Sanktion"]}
 
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer = '32'
-                    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Meldeversäumnis' 
-                       OR chunk.text CONTAINS 'Minderung'
-                       OR chunk.text CONTAINS 'Sanktion'
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        count(DISTINCT chunk) as relevante_chunks,
-                        collect(DISTINCT chunk.text)[0..1] as beispiele
-                
\ No newline at end of file
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer = $paragraph
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        count(DISTINCT chunk) as relevante_chunks,
+        collect(DISTINCT chunk.text)[0..1] as beispiele
+    
\ No newline at end of file
@@ -1,9 +1,12 @@
 // UC02: Sanktionsprüfung bei Meldeversäumnis - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.norm_chunk_paths
 
+:params {"sgb": "II", "paragraphs": ["32"], "limit": 30}
 
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: '32'})
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    RETURN path LIMIT 30
-                
\ No newline at end of file
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
@@ -1,16 +1,18 @@
 // UC06: Bedarfsgemeinschaft vs. Haushaltsgemeinschaft
 // SGB: II | Paragraphen: 7
 // Priority: P0 | Tool: Neo4j Browser + Bloom (Graph Exploration)
+// Registry: validate.uc06
 
+:params {"sgb": "II", "paragraph": "7"}
 
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer = '7'
-                    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        count(chunk) as chunks,
-                        collect(chunk.text)[0..3] as beispiel_definitionen
-                    ORDER BY chunk.chunk_index
-                
\ No newline at end of file
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer = $paragraph
+    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        count(chunk) as chunks,
+        collect(chunk.text)[0..3] as beispiel_definitionen
+    ORDER BY chunk.chunk_index
+    
\ No newline at end of file
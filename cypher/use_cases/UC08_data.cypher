@@ -1,19 +1,14 @@
 // UC08: Darlehen für Erstausstattung
 // SGB: II | Paragraphen: 24
 // Priority: P0 | Tool: Neo4j Browser
+// Registry: validate.uc08
 
+:params {"sgb": "II", "paragraph": "24", "terms": ["Erstausstattung", "Schwangerschaft", "Darlehen"]}
 
-                    MATCH (norm:LegalNorm)
-                    WHERE norm.paragraph_nummer = '24'
-                      AND EXISTS {
-                          MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: 'II'})
-                      }
-                    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Erstausstattung' 
-                       OR chunk.text CONTAINS 'Schwangerschaft'
-                       OR chunk.text CONTAINS 'Darlehen'
-                    RETURN 
-                        norm.enbez,
-                        count(chunk) as relevante_chunks,
-                        collect(chunk.text)[0..2] as beispiele
-                
\ No newline at end of file
+    MATCH (chunk:Chunk {sgb_nummer: $sgb, paragraph_nummer: $paragraph})
+    WHERE any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN
+        chunk.enbez as enbez,
+        count(chunk) as relevante_chunks,
+        collect(chunk.text)[0..2] as beispiele
+    
\ No newline at end of file
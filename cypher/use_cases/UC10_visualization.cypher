@@ -1,9 +1,11 @@
 // UC10: Widerspruch bearbeiten - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.norm_paths
 
+:params {"sgb": "X", "paragraphs": ["79", "80", "84", "85"], "limit": 20}
 
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'X'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['79', '80', '84', '85']
-                    RETURN path LIMIT 20
-                
\ No newline at end of file
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
@@ -1,11 +1,13 @@
 // UC13: Prozessanalyse - Durchlaufzeiten Erstantrag - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.norm_term_chunk_paths
 
+:params {"sgb": "II", "paragraphs": ["37", "41", "44"], "terms": ["Frist", "Monat"], "limit": 30}
 
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE norm.paragraph_nummer IN ['37', '41', '44']
-                      AND (chunk.text CONTAINS 'Frist' OR chunk.text CONTAINS 'Monat')
-                    RETURN path LIMIT 30
-                
\ No newline at end of file
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE norm.paragraph_nummer IN $paragraphs
+      AND any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
@@ -1,23 +1,22 @@
 // UC16: Qualitätssicherung - Fehlerquellen in Bescheiden
 // SGB: II | Paragraphen: *
 // Priority: P0 | Tool: Neo4j Browser + Cypher Analytics
+// Registry: validate.uc16
 
+:params {"sgb": "II", "min_chunks": 10, "terms": ["Ausnahme", "abweichend", "jedoch"], "limit": 10}
 
-                    MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE EXISTS {
-                        MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: 'II'})
-                    }
-                    WITH norm, count(chunk) as chunk_count
-                    WHERE chunk_count > 10
-                    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Ausnahme' 
-                       OR chunk.text CONTAINS 'abweichend'
-                       OR chunk.text CONTAINS 'jedoch'
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        chunk_count as komplexitaet,
-                        count(DISTINCT chunk) as ausnahmen
-                    ORDER BY komplexitaet DESC, ausnahmen DESC
-                    LIMIT 10
-                
\ No newline at end of file
+    MATCH (chunk:Chunk {sgb_nummer: $sgb})
+    WITH chunk.norm_id as norm_id,
+         chunk.paragraph_nummer as paragraph_nummer,
+         chunk.enbez as enbez,
+         count(chunk) as chunk_count,
+         count(CASE WHEN any(term IN $terms WHERE chunk.text CONTAINS term) THEN chunk END) as ausnahmen
+    WHERE chunk_count > $min_chunks AND ausnahmen > 0
+    RETURN
+        paragraph_nummer,
+        enbez,
+        chunk_count as komplexitaet,
+        ausnahmen
+    ORDER BY komplexitaet DESC, ausnahmen DESC
+    LIMIT $limit
+    
\ No newline at end of file
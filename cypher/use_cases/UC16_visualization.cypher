@@ -1,13 +1,15 @@
 // UC16: Qualitätssicherung - Fehlerquellen in Bescheiden - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.complex_norm_paths
 
+:params {"sgb": "II", "min_chunks": 15, "limit": 50}
 
-                    MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE EXISTS {
-                        MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: 'II'})
-                    }
-                    WITH norm, count(chunk) as chunk_count
-                    WHERE chunk_count > 15
-                    MATCH path = (norm)-[:HAS_CHUNK]->(chunk)
-                    RETURN path LIMIT 50
-                
\ No newline at end of file
+    MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE EXISTS {
+        MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: $sgb})
+    }
+    WITH norm, count(chunk) as chunk_count
+    WHERE chunk_count > $min_chunks
+    MATCH path = (norm)-[:HAS_CHUNK]->(chunk)
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
@@ -1,19 +1,16 @@
 // UC18: Prozessmodellierung - Ideal-Prozess Antragsprüfung
 // SGB: II | Paragraphen: 7, 11, 11b, 12, 37, 33
 // Priority: P0 | Tool: Neo4j Browser + BPMN Modeler
+// Registry: validate.uc18
 
+:params {"sgb": "II", "paragraphs": ["7", "11", "11b", "12", "37", "33"], "phases": {"7": "2 - Anspruchsprüfung", "11": "2 - Bedürftigkeitsprüfung", "11b": "2 - Bedürftigkeitsprüfung", "12": "2 - Bedürftigkeitsprüfung", "37": "3 - Entscheidung", "33": "3 - Entscheidung"}}
 
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['7', '11', '11b', '12', '37', '33']
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        'Phase: ' + 
-                        CASE 
-                            WHEN norm.paragraph_nummer = '7' THEN '2 - Anspruchsprüfung'
-                            WHEN norm.paragraph_nummer IN ['11', '11b', '12'] THEN '2 - Bedürftigkeitsprüfung'
-                            WHEN norm.paragraph_nummer IN ['37', '33'] THEN '3 - Entscheidung'
-                        END as prozessphase
-                    ORDER BY prozessphase, norm.paragraph_nummer
-                
\ No newline at end of file
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        'Phase: ' + $phases[norm.paragraph_nummer] as prozessphase
+    ORDER BY prozessphase, norm.paragraph_nummer
+    
\ No newline at end of file
@@ -1,9 +1,11 @@
 // UC18: Prozessmodellierung - Ideal-Prozess Antragsprüfung - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.norm_paths
 
+:params {"sgb": "II", "paragraphs": ["7", "11", "11b", "12", "37", "33"], "limit": 100}
 
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['7', '11', '11b', '12', '37', '33']
-                    RETURN path
-                
\ No newline at end of file
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
@@ -1,18 +1,20 @@
 // UC19: Schulungskonzept - Gesetzesänderungen
 // SGB: II | Paragraphen: *
 // Priority: P1 | Tool: N/A (Amendment data import required)
+// Registry: validate.uc19
 
+:params {"sgb": "II", "since": "2023-01-01", "limit": 10}
 
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                          -[:AMENDED_BY]->(amendment:Amendment)
-                    WHERE amendment.date >= date('2023-01-01')
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        amendment.title,
-                        amendment.date,
-                        amendment.summary
-                    ORDER BY amendment.date DESC
-                    LIMIT 10
-                
\ No newline at end of file
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+          -[:AMENDED_BY]->(amendment:Amendment)
+    WHERE amendment.date >= date($since)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        amendment.title,
+        amendment.date,
+        amendment.summary
+    ORDER BY amendment.date DESC
+    LIMIT $limit
+    
\ No newline at end of file
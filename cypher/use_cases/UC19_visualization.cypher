@@ -1,9 +1,11 @@
 // UC19: Schulungskonzept - Gesetzesänderungen - Visualization
 // Run this in Neo4j Browser for graph visualization
+// Registry: validate.amendment_paths
 
+:params {"sgb": "II", "limit": 20}
 
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:AMENDED_BY]->(amendment:Amendment)
-                    RETURN path LIMIT 20
-                
\ No newline at end of file
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:AMENDED_BY]->(amendment:Amendment)
+    RETURN path LIMIT $limit
+    
\ No newline at end of file
@@ -2,11 +2,11 @@
 """Quick import script for SGB II"""
 
 import sys
-sys.path.insert(0, 'src')
-
 from pathlib import Path
-from xml_legal_parser import LegalXMLParser
-from graphrag_legal_extractor import LegalKnowledgeGraphBuilder
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.xml_legal_parser import LegalXMLParser
+from src.graphrag_legal_extractor import LegalKnowledgeGraphBuilder
 from neo4j import GraphDatabase
 import os
 from dotenv import load_dotenv
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+GraphRAG Latency Benchmark
+==========================
+Runs the use-case queries from test_graphrag_efficiency.py repeatedly
+(warm-up + N iterations) and reports p50/p95/p99 and throughput per case.
+
+Results are written to logs/graphrag_latency_benchmark.json. The run fails
+(exit code 1) as soon as a case is slower than the baseline in
+logs/graphrag_latency_baseline.json by more than --threshold, or has no
+baseline at all. The baseline is only written with --save-baseline; together
+with --case only those cases are replaced in the existing baseline.
+
+Usage:
+    python scripts/benchmark_graphrag_latency.py --save-baseline
+    python scripts/benchmark_graphrag_latency.py --save-baseline --case cross_sgb
+    python scripts/benchmark_graphrag_latency.py --iterations 200 --threshold 0.2
+    python scripts/benchmark_graphrag_latency.py --case semantic_search --case cross_sgb
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from neo4j import GraphDatabase
+from dotenv import load_dotenv
+import logging
+
+from test_graphrag_efficiency import (
+    REGELBEDARF_QUERY,
+    LEISTUNGSBERECHTIGUNG_QUERY,
+    SEMANTIC_SEARCH_QUERY,
+    ANTRAGSPRUEFUNG_QUERY,
+    CROSS_SGB_QUERY,
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RESULTS_FILE = PROJECT_ROOT / "logs" / "graphrag_latency_benchmark.json"
+BASELINE_FILE = PROJECT_ROOT / "logs" / "graphrag_latency_baseline.json"
+
+SEMANTIC_QUERY_TEXT = "Regelbedarfe für Alleinstehende"
+
+# name -> (label, Cypher, needs query embedding)
+BENCHMARK_CASES = {
+    'regelbedarf_lookup': ("§20 SGB II Direct Lookup", REGELBEDARF_QUERY, False),
+    'leistungsberechtigung_batch': ("§§7-9 SGB II Batch Lookup", LEISTUNGSBERECHTIGUNG_QUERY, False),
+    'semantic_search': ("Semantic Search 'Regelbedarfe'", SEMANTIC_SEARCH_QUERY, True),
+    'antragspruefung_workflow': ("Antragsprüfung Workflow", ANTRAGSPRUEFUNG_QUERY, False),
+    'cross_sgb': ("Cross-SGB Income Analysis", CROSS_SGB_QUERY, False),
+}
+
+PERCENTILES = (50, 95, 99)
+
+
+class GraphRAGLatencyBenchmark:
+    """Warm-up + repeated timing of the GraphRAG use-case queries"""
+
+    def __init__(self, iterations: int = 50, warmup: int = 5):
+        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        username = os.getenv("NEO4J_USERNAME", "neo4j")
+        password = os.getenv("NEO4J_PASSWORD")
+
+        if not password:
+            raise ValueError("❌ NEO4J_PASSWORD not set in .env")
+
+        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.iterations = iterations
+        self.warmup = warmup
+        self._query_embedding = None
+
+    def close(self):
+        self.driver.close()
+
+    def _get_query_embedding(self) -> List[float]:
+        """Embed the semantic test query once; the benchmark measures Neo4j only"""
+        if self._query_embedding is None:
+            from sentence_transformers import SentenceTransformer
+
+            logger.info("Loading embedding model...")
+            model = SentenceTransformer('paraphrase-multilingual-mpnet-base-v2')
+            self._query_embedding = model.encode(SEMANTIC_QUERY_TEXT).tolist()
+        return self._query_embedding
+
+    def _run_once(self, session, query: str, params: Dict) -> int:
+        return len(list(session.run(query, params)))
+
+    def run_case(self, name: str) -> Dict:
+        """Benchmark a single case
+
+        Returns:
+            Dict with latency percentiles (ms), mean, throughput (queries/s) and record count
+        """
+        label, query, needs_embedding = BENCHMARK_CASES[name]
+        params = {'embedding': self._get_query_embedding()} if needs_embedding else {}
+
+        logger.info(f"⏱️  {label}: {self.warmup} warm-up + {self.iterations} iterations")
+
+        timings = []
+        with self.driver.session() as session:
+            for _ in range(self.warmup):
+                records = self._run_once(session, query, params)
+
+            bench_start = time.perf_counter()
+            for _ in range(self.iterations):
+                start = time.perf_counter()
+                records = self._run_once(session, query, params)
+                timings.append(time.perf_counter() - start)
+            bench_elapsed = time.perf_counter() - bench_start
+
+        timings_ms = np.array(timings) * 1000
+        result = {
+            'label': label,
+            'iterations': self.iterations,
+            'records': records,
+            'mean_ms': round(float(timings_ms.mean()), 3),
+            'throughput_qps': round(self.iterations / bench_elapsed, 2),
+        }
+        for p in PERCENTILES:
+            result[f'p{p}_ms'] = round(float(np.percentile(timings_ms, p)), 3)
+
+        return result
+
+    def run(self, case_names: List[str]) -> Dict[str, Dict]:
+        results = {}
+        for name in case_names:
+            try:
+                results[name] = self.run_case(name)
+            except Exception as e:
+                logger.warning(f"  ⚠️  {name} failed: {e}")
+        return results
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                        metric: str, threshold: float) -> List[str]:
+    """Return a message for every case that regressed beyond the threshold or has no baseline"""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            regressions.append(f"{result['label']}: no baseline (run with --save-baseline --case {name})")
+            continue
+        before = baseline[name][metric]
+        after = result[metric]
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append(
+                f"{result['label']}: {metric} {before:.2f}ms → {after:.2f}ms "
+                f"(+{(after / before - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def print_report(results: Dict[str, Dict], baseline: Optional[Dict[str, Dict]], metric: str):
+    print("\n" + "="*90)
+    print("📊 GRAPHRAG LATENCY BENCHMARK")
+    print("="*90)
+    print(f"\n{'Case':<34} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} {'QPS':>9} {'Δ ' + metric:>12}")
+    print("-" * 90)
+
+    for name, r in results.items():
+        delta = ""
+        if baseline is not None and name not in baseline:
+            delta = "no baseline"
+        elif baseline and baseline[name][metric] > 0:
+            delta = f"{(r[metric] / baseline[name][metric] - 1) * 100:+.0f}%"
+        print(f"{r['label']:<34} {r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f} {r['p99_ms']:>10.2f} "
+              f"{r['throughput_qps']:>9.1f} {delta:>12}")
+
+    print("-" * 90)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GraphRAG latency benchmark with regression gate")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed runs per case (default: 50)")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed warm-up runs per case (default: 5)")
+    parser.add_argument("--case", action="append", choices=sorted(BENCHMARK_CASES),
+                        help="Only run this case; repeatable")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store the measured cases in the baseline (other cases are kept)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed slowdown vs. baseline (0.2 = 20%%)")
+    parser.add_argument("--metric", default="p95_ms", choices=[f"p{p}_ms" for p in PERCENTILES] + ["mean_ms"],
+                        help="Metric used for the regression gate (default: p95_ms)")
+
+    args = parser.parse_args()
+    case_names = args.case or list(BENCHMARK_CASES)
+    baseline_file = Path(args.baseline)
+
+    baseline = None
+    if baseline_file.exists():
+        with open(baseline_file) as f:
+            baseline = json.load(f)['cases']
+    elif not args.save_baseline:
+        print(f"❌ No baseline at {baseline_file} - run with --save-baseline first")
+        return 1
+
+    benchmark = GraphRAGLatencyBenchmark(iterations=args.iterations, warmup=args.warmup)
+    try:
+        results = benchmark.run(case_names)
+    finally:
+        benchmark.close()
+
+    print_report(results, baseline, args.metric)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'iterations': args.iterations,
+        'warmup': args.warmup,
+        'cases': results
+    }
+
+    RESULTS_FILE.parent.mkdir(exist_ok=True)
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n📊 Results saved to: {RESULTS_FILE}")
+
+    if args.save_baseline:
+        # Nur die gemessenen Cases ersetzen, --case darf die Baseline nicht kürzen
+        baseline_report = dict(report, cases={**(baseline or {}), **results})
+        baseline_file.parent.mkdir(exist_ok=True)
+        with open(baseline_file, 'w') as f:
+            json.dump(baseline_report, f, indent=2, ensure_ascii=False)
+        print(f"📌 Baseline updated for {len(results)} case(s): {baseline_file}")
+        return 1 if len(results) < len(case_names) else 0
+
+    regressions = compare_to_baseline(results, baseline, args.metric, args.threshold)
+    failed = [name for name in case_names if name not in results]
+
+    if failed:
+        print(f"\n❌ Failed cases: {', '.join(failed)}")
+    if regressions:
+        print(f"\n❌ Regressions (> {args.threshold * 100:.0f}% on {args.metric}) or missing baselines:")
+        for message in regressions:
+            print(f"   - {message}")
+    if failed or regressions:
+        return 1
+
+    print(f"\n✅ No regression > {args.threshold * 100:.0f}% on {args.metric}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+XML Parser Microbenchmark
+=========================
+Times the text extraction of LegalXMLParser over all XML files in xml_cache/
+and compares it with the previous recursive implementation (one list and one
+" ".join per element level). Since the old output was not whitespace-normalised,
+it is reported both raw and with the same normalisation applied.
+
+Both extractors run on exactly the elements the parser feeds them
+(<Content>/P, <Content>/table, DL/DT, DL/DD); afterwards the full
+parse_dokument() is timed per file.
+
+Usage:
+    python scripts/benchmark_xml_parser.py
+    python scripts/benchmark_xml_parser.py --repeat 10 --show-diffs 5
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lxml import etree
+import logging
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+from src.xml_legal_parser import LegalXMLParser, normalize_whitespace
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def legacy_extract_text(elem) -> str:
+    """Previous LegalXMLParser._extract_text_recursive (reference only)"""
+    texts = []
+    if elem.text:
+        texts.append(elem.text)
+    for child in elem:
+        texts.append(legacy_extract_text(child))
+        if child.tail:
+            texts.append(child.tail)
+    return " ".join(texts).strip()
+
+
+def collect_text_elements(xml_files):
+    """Elements the parser extracts text from, across all files"""
+    elements = []
+    for xml_file in xml_files:
+        root = etree.parse(str(xml_file)).getroot()
+        for content in root.iter('Content'):
+            for child in content:
+                if child.tag in ('P', 'table'):
+                    elements.append(child)
+                elif child.tag == 'DL':
+                    elements.extend(child.findall('DT'))
+                    elements.extend(child.findall('DD'))
+    return elements
+
+
+def time_extractor(extract, elements, repeat: int) -> float:
+    """Best-of-repeat seconds for one pass over all elements"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for elem in elements:
+            extract(elem)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark for LegalXMLParser text extraction")
+    parser.add_argument("--xml-cache", default=str(PROJECT_ROOT / "xml_cache"), help="XML cache directory")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per extractor, best is reported (default: 5)")
+    parser.add_argument("--show-diffs", type=int, default=0, help="Print N texts where old and new output differ")
+
+    args = parser.parse_args()
+
+    xml_files = sorted(Path(args.xml_cache).glob("sgb_*/*.xml"))
+    if not xml_files:
+        print(f"❌ No XML files in {args.xml_cache}")
+        return 1
+
+    legal_parser = LegalXMLParser()
+    elements = collect_text_elements(xml_files)
+
+    print("=" * 70)
+    print("⏱️  XML PARSER MICROBENCHMARK")
+    print("=" * 70)
+    print(f"  Files:     {len(xml_files)}")
+    print(f"  Elements:  {len(elements):,}")
+
+    legacy = time_extractor(legacy_extract_text, elements, args.repeat)
+    legacy_normalized = time_extractor(lambda e: normalize_whitespace(legacy_extract_text(e)),
+                                       elements, args.repeat)
+    current = time_extractor(legal_parser._extract_text, elements, args.repeat)
+    leaves = sum(1 for e in elements if len(e) == 0)
+
+    print(f"  Leaves:    {leaves:,} ({leaves / len(elements):.0%}, plain text only)")
+    print(f"\n  Text extraction (best of {args.repeat}):")
+    print(f"    recursive join:                 {legacy * 1000:8.1f} ms  (no whitespace normalisation)")
+    print(f"    recursive join + normalisation: {legacy_normalized * 1000:8.1f} ms")
+    print(f"    single pass:                    {current * 1000:8.1f} ms")
+    print(f"    speedup vs. same output:        {legacy_normalized / current:8.2f}x")
+
+    diffs = [(old, new) for old, new in ((legacy_extract_text(e), legal_parser._extract_text(e)) for e in elements)
+             if old != new]
+    print(f"\n  Texts with changed spacing: {len(diffs):,}")
+    for old, new in diffs[:args.show_diffs]:
+        print(f"    - {old[:100]!r}")
+        print(f"    + {new[:100]!r}")
+
+    start = time.perf_counter()
+    norms = sum(len(legal_parser.parse_dokument(xml_file).norms) for xml_file in xml_files)
+    elapsed = time.perf_counter() - start
+    print(f"\n  Full parse_dokument(): {elapsed:.2f}s for {norms:,} norms "
+          f"({elapsed / len(xml_files) * 1000:.0f} ms/file)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
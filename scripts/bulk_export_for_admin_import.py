@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Bulk Export for Offline Full Rebuild
+====================================
+Parses all SGB XML files in xml_cache/, chunks and embeds them and writes
+node/relationship CSVs for `neo4j-admin database import full`.
+
+Usage:
+    python scripts/bulk_export_for_admin_import.py --output bulk_import/
+    python scripts/bulk_export_for_admin_import.py --sgb 2 --sgb 10
+    python scripts/bulk_export_for_admin_import.py --workers 4     # parse in 4 processes
+    python scripts/bulk_export_for_admin_import.py --post-import   # after neo4j-admin import
+"""
+
+import sys
+import os
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+import logging
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def export_all(xml_cache: Path, output_dir: Path, sgb_filter=None, workers: int = 0) -> int:
+    """Parse, chunk, embed and export every SGB directory in xml_cache
+
+    With workers > 0 the XML files are parsed in worker processes, which send
+    back CompactLegalDocument columns instead of the object graph; the main
+    process chunks, embeds and writes the CSVs in SGB order.
+    """
+    from src.xml_legal_parser import LegalXMLParser
+    from src.compact_legal_document import parse_compact
+    from src.neo4j_bulk_export import Neo4jBulkExporter
+    from src.instrumentation import format_stage_report
+
+    sgb_dirs = sorted([d for d in xml_cache.iterdir()
+                       if d.is_dir() and d.name.startswith('sgb_')])
+
+    if sgb_filter:
+        wanted = {s.upper() for s in sgb_filter}
+        sgb_dirs = [d for d in sgb_dirs if d.name.replace('sgb_', '').upper() in wanted]
+
+    logger.info(f"Found {len(sgb_dirs)} SGB directories to export\n")
+
+    failed = []
+    xml_paths = []
+    for sgb_dir in sgb_dirs:
+        xml_files = list(sgb_dir.glob("*.xml"))
+        if not xml_files:
+            logger.warning(f"  ⚠️  No XML files found in {sgb_dir}")
+            failed.append((sgb_dir.name, "No XML files"))
+            continue
+        xml_paths.append((sgb_dir.name, xml_files[0]))
+
+    exporter = Neo4jBulkExporter(output_dir)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    start = time.time()
+
+    try:
+        if pool:
+            pending = [(name, pool.submit(parse_compact, xml_path)) for name, xml_path in xml_paths]
+        else:
+            parser = LegalXMLParser()
+            pending = [(name, xml_path) for name, xml_path in xml_paths]
+
+        for name, item in pending:
+            try:
+                document = item.result() if pool else parser.parse_dokument(item)
+                exporter.export_document(document)
+            except Exception as e:
+                logger.error(f"  ❌ Failed {name}: {e}")
+                failed.append((name, str(e)))
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        exporter.close()
+
+    elapsed = time.time() - start
+
+    print("\n" + "="*70)
+    print("📦 BULK EXPORT SUMMARY")
+    print("="*70)
+    for name, count in exporter.counts.items():
+        print(f"  {name:<28} {count:>10,}")
+    print(f"\n  ⏱️  Export time: {elapsed:.1f}s")
+    if failed:
+        print(f"  ❌ Failed: {', '.join(name for name, _ in failed)}")
+
+    print("\n⏱️  Stages (main process):")
+    print(format_stage_report())
+
+    print("\n🚀 Next steps (database must be stopped):")
+    print(exporter.admin_import_command())
+    print("\n   Then start Neo4j and run:")
+    print("   python scripts/bulk_export_for_admin_import.py --post-import")
+
+    return 1 if failed else 0
+
+
+def post_import(embedding_dimensions: int) -> int:
+    """Create constraints and indexes on the freshly imported database"""
+    from neo4j import GraphDatabase
+    from src.neo4j_bulk_export import apply_post_import_schema
+
+    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+    username = os.getenv("NEO4J_USERNAME", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD")
+
+    if not password:
+        print("❌ NEO4J_PASSWORD not set in .env")
+        return 1
+
+    driver = GraphDatabase.driver(uri, auth=(username, password))
+    try:
+        apply_post_import_schema(driver, embedding_dimensions)
+    finally:
+        driver.close()
+
+    print("✅ Constraints, indexes and vector index created")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk export for neo4j-admin import")
+    parser.add_argument("--xml-cache", default=str(PROJECT_ROOT / "xml_cache"), help="XML cache directory")
+    parser.add_argument("--output", default=str(PROJECT_ROOT / "bulk_import"), help="CSV output directory")
+    parser.add_argument("--sgb", action="append", help="Only export this SGB (e.g. 2, 10); repeatable")
+    parser.add_argument("--post-import", action="store_true", help="Create indexes/constraints after import")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Parse XML in N worker processes (compact columnar transfer); 0 = in-process")
+    parser.add_argument("--dimensions", type=int, default=768, help="Embedding dimensions for vector index")
+
+    args = parser.parse_args()
+
+    if args.post_import:
+        return post_import(args.dimensions)
+
+    return export_all(Path(args.xml_cache), Path(args.output), args.sgb, args.workers)
+
+
+if __name__ == "__main__":
+    exit(main())
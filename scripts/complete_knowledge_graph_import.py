@@ -4,8 +4,8 @@ Complete Knowledge Graph Import
 ================================
 1. Re-import ALL SGBs with full chunks
 2. Import all Fachliche Weisungen PDFs
-3. Create version relationships (SUPERSEDES, VERSION_OF)
-4. Build amendment history links
+3. Report norm versions (HAS_VERSION, SUPERSEDES)
+4. Build amendment history links (BGBlReference hubs)
 """
 
 import sys
@@ -15,11 +15,14 @@ from datetime import datetime
 import re
 from typing import List, Dict, Optional
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from neo4j import GraphDatabase
-from xml_legal_parser import LegalXMLParser
-from graphrag_legal_extractor import LegalKnowledgeGraphBuilder
+from src.xml_legal_parser import LegalXMLParser, parse_amending_act, parse_german_date
+from src.graphrag_legal_extractor import LegalKnowledgeGraphBuilder
+from src.graph_statistics import node_counts, relationship_counts, sgb_counters
+from src.instrumentation import format_stage_report
+from src.neo4j_prozess_integration import Neo4jProzessIntegration
 from dotenv import load_dotenv
 import logging
 
@@ -102,26 +105,10 @@ class CompleteKnowledgeGraphImporter:
                 logger.info(f"     - Norms: {len(document.norms)}")
                 logger.info(f"     - Build date: {document.builddate}")
                 
-                # Delete existing data for this SGB
-                with self.driver.session() as session:
-                    result = session.run("""
-                        MATCH (doc:LegalDocument {sgb_nummer: $sgb})
-                        OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(struct:StructuralUnit)
-                                            -[:CONTAINS_NORM]->(norm:LegalNorm)
-                        OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
-                        OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                        OPTIONAL MATCH (norm)-[:HAS_AMENDMENT]->(amend:Amendment)
-                        DETACH DELETE doc, struct, norm, text, chunk, amend
-                        RETURN count(*) as deleted
-                    """, sgb=sgb_name)
-                    deleted = result.single()['deleted']
-                    if deleted > 0:
-                        logger.info(f"  🗑️  Deleted {deleted} existing nodes")
-                
-                # Build knowledge graph with chunks
+                # Re-import keeps LegalNorm/NormVersion history, replaces the rest
                 logger.info(f"  🔨 Building knowledge graph with chunks...")
                 kg_builder = LegalKnowledgeGraphBuilder(self.driver)
-                kg_builder.build_from_xml(document)
+                kg_builder.rebuild_from_xml(document)
                 
                 # Verify import
                 with self.driver.session() as session:
@@ -219,6 +206,11 @@ class CompleteKnowledgeGraphImporter:
         if failed:
             logger.warning(f"   ❌ Failed: {len(failed)}")
         logger.info("="*70)
+        
+        # Documents were written directly (not via SozialrechtNeo4jRAG), so the
+        # materialised process-step recommendations are refreshed here
+        if success_count:
+            Neo4jProzessIntegration(self.driver).refresh_step_recommendations()
     
     def _import_single_pdf(self, pdf_path: Path, sgb_folder: str):
         """Import a single PDF as Document node with chunks"""
@@ -258,73 +250,73 @@ class CompleteKnowledgeGraphImporter:
         logger.info(f"     Document node created (full chunking requires OpenAI API)")
     
     # ========================================================================
-    # TASK 3: Create version relationships (SUPERSEDES, VERSION_OF)
+    # TASK 3: Norm versions (HAS_VERSION, SUPERSEDES)
     # ========================================================================
     
     def create_version_relationships(self):
-        """Task 3: Create SUPERSEDES and VERSION_OF relationships between norms"""
+        """Task 3: Report the NormVersion history (HAS_VERSION / SUPERSEDES)
+        
+        Die Fassungen selbst schreibt LegalKnowledgeGraphBuilder bei jedem
+        Import eines neuen builddate; hier wird nur der Stand ausgewertet.
+        """
         logger.info("\n" + "="*70)
         logger.info("🔗 TASK 3: CREATE VERSION RELATIONSHIPS")
         logger.info("="*70)
         
-        # Strategy: Use amendment dates and standkommentar to identify versions
         with self.driver.session() as session:
-            # Find norms with amendments
+            counts = session.run("""
+                MATCH (v:NormVersion)
+                WITH count(v) as versions
+                OPTIONAL MATCH ()-[s:SUPERSEDES]->()
+                RETURN versions, count(s) as supersedes
+            """).single()
+            
+            if counts['versions'] == 0:
+                logger.warning("⚠️  No NormVersion nodes found")
+                logger.info("   Re-import the SGB XML files to create the current versions")
+                return
+            
+            # Norms with more than one version (imports with different builddate)
             result = session.run("""
-                MATCH (norm:LegalNorm)-[:HAS_AMENDMENT]->(amend:Amendment)
-                WHERE amend.amendment_date IS NOT NULL
+                MATCH (norm:LegalNorm)-[:HAS_VERSION]->(v:NormVersion)
+                WITH norm, v ORDER BY v.valid_from
+                WITH norm, collect(v) as versions
+                WHERE size(versions) > 1
                 RETURN norm.enbez as paragraph,
-                       norm.paragraph_nummer as para_nr,
-                       collect({
-                           date: amend.amendment_date,
-                           comment: amend.standkommentar,
-                           ref: amend.fundstelle_periodikum
-                       }) as amendments
+                       [v IN versions | {valid_from: v.valid_from, valid_to: v.valid_to}] as timeline
                 ORDER BY paragraph
             """)
             
-            amendments_found = list(result)
-            logger.info(f"Found {len(amendments_found)} norms with amendment data\n")
-            
-            if len(amendments_found) == 0:
-                logger.warning("⚠️  No amendment data available for version tracking")
-                logger.info("   This is expected if SGBs don't have historical versions in XML")
-                return
-            
-            # For each norm with amendments, create timeline relationships
-            version_links_created = 0
-            
-            for record in amendments_found[:10]:  # Show first 10
-                para = record['paragraph']
-                amendments = sorted(record['amendments'], 
-                                   key=lambda x: x['date'] or '')
-                
-                if len(amendments) > 1:
-                    logger.info(f"  📜 {para}: {len(amendments)} versions")
-                    
-                    # Create SUPERSEDES chain
-                    for i in range(len(amendments) - 1):
-                        older = amendments[i]
-                        newer = amendments[i + 1]
-                        
-                        # This would require having historical norm nodes
-                        # For now, document the relationship pattern
-                        logger.info(f"     {older['date']} → {newer['date']}")
-                        version_links_created += 1
+            versioned_norms = list(result)
+            for record in versioned_norms[:10]:  # Show first 10
+                logger.info(f"  📜 {record['paragraph']}: {len(record['timeline'])} versions")
+                for version in record['timeline']:
+                    logger.info(f"     {version['valid_from']} → {version['valid_to']}")
             
             logger.info("\n" + "="*70)
             logger.info(f"📊 TASK 3 SUMMARY:")
-            logger.info(f"   Found {len(amendments_found)} norms with version data")
-            logger.info(f"   Identified {version_links_created} version transitions")
-            logger.info(f"   Note: Full version tracking requires historical XML snapshots")
+            logger.info(f"   NormVersion nodes: {counts['versions']}")
+            logger.info(f"   SUPERSEDES links: {counts['supersedes']}")
+            logger.info(f"   Norms with history: {len(versioned_norms)}")
             logger.info("="*70)
     
     # ========================================================================
     # TASK 4: Build amendment history links
     # ========================================================================
     
-    def build_amendment_history_links(self):
-        """Task 4: Enhance HAS_AMENDMENT relationships with detailed metadata"""
+    def build_amendment_history_links(self, batch_size: int = 1000):
+        """Task 4: Normalise amendments and link norms to their amending acts (BGBlReference)
+        
+        Neue Importe schreiben Datum, BGBl-Fundstelle und Hub bereits beim
+        Import (LegalXMLParser / LegalKnowledgeGraphBuilder). Für ältere
+        Graphen werden die noch nicht verlinkten Amendments einmal gelesen,
+        mit denselben Parser-Funktionen normalisiert und in UNWIND-Batches
+        zurückgeschrieben: O(n) statt einem Statement pro Amendment und
+        paarweisen SAME_BGBl_REFERENCE-Kanten.
+        
+        Args:
+            batch_size: Amendments per write transaction
+        """
         logger.info("\n" + "="*70)
         logger.info("📅 TASK 4: BUILD AMENDMENT HISTORY LINKS")
         logger.info("="*70)
@@ -349,60 +341,81 @@ class CompleteKnowledgeGraphImporter:
                 logger.info("   XML imports should create these automatically")
                 return
             
-            # Enhance amendment nodes with parsed metadata
-            logger.info("Enhancing amendment metadata...\n")
-            
+            # Amendments imported before the parser normalised them
             result = session.run("""
                 MATCH (amend:Amendment)
                 WHERE amend.standkommentar IS NOT NULL
-                  AND amend.parsed_date IS NULL
-                RETURN amend.standkommentar as comment, 
-                       elementId(amend) as id
-                LIMIT 100
+                  AND NOT (amend)-[:PUBLISHED_IN]->(:BGBlReference)
+                RETURN amend.id as id, amend.standkommentar as comment
             """)
             
-            enhanced_count = 0
+            amendments = []
             for record in result:
-                comment = record['comment']
-                amend_id = record['id']
-                
-                # Parse date from standkommentar (e.g., "Stand: 01.01.2024")
-                date_match = re.search(r'(\d{2}\.\d{2}\.\d{4})', comment)
-                if date_match:
-                    date_str = date_match.group(1)
-                    # Convert to ISO format
-                    day, month, year = date_str.split('.')
-                    iso_date = f"{year}-{month}-{day}"
-                    
-                    session.run("""
-                        MATCH (amend:Amendment)
-                        WHERE elementId(amend) = $id
-                        SET amend.parsed_date = date($iso_date),
-                            amend.original_date_string = $date_str
-                    """, id=amend_id, iso_date=iso_date, date_str=date_str)
-                    
-                    enhanced_count += 1
-                    if enhanced_count <= 5:
-                        logger.info(f"  ✅ Parsed: {comment} → {iso_date}")
+                act = parse_amending_act(record['comment'])
+                amendment_date = act.act_date if act and act.act_date else parse_german_date(record['comment'])
+                amendments.append({
+                    'id': record['id'],
+                    'amendment_date': amendment_date.isoformat() if amendment_date else None,
+                    'bgbl_reference': act.bgbl_reference if act else None,
+                    'act': LegalKnowledgeGraphBuilder.amending_act_record(act) if act else None
+                })
+            
+            logger.info(f"Normalising {len(amendments)} amendments in batches of {batch_size}...")
             
-            # Create cross-references between amendments
-            logger.info("\nCreating amendment cross-references...")
+            hubs_created = 0
+            links_created = 0
+            for start in range(0, len(amendments), batch_size):
+                batch = amendments[start:start + batch_size]
+                summary = session.execute_write(
+                    lambda tx: tx.run("""
+                        UNWIND $amendments AS amendment
+                        MATCH (amend:Amendment {id: amendment.id})
+                        SET amend.amendment_date = coalesce(date(amendment.amendment_date), amend.amendment_date),
+                            amend.bgbl_reference = amendment.bgbl_reference
+                        WITH amend, amendment
+                        WHERE amendment.act IS NOT NULL
+                        MERGE (ref:BGBlReference {id: amendment.act.id})
+                        ON CREATE SET ref.reference = amendment.act.reference,
+                                      ref.teil = amendment.act.teil,
+                                      ref.year = amendment.act.year,
+                                      ref.nummer = amendment.act.nummer,
+                                      ref.seite = amendment.act.seite,
+                                      ref.act_date = date(amendment.act.act_date),
+                                      ref.act_type = amendment.act.act_type
+                        MERGE (amend)-[:PUBLISHED_IN]->(ref)
+                        WITH amend, ref
+                        MATCH (norm:LegalNorm)-[:HAS_AMENDMENT]->(amend)
+                        MERGE (norm)-[:AMENDED_BY]->(ref)
+                    """, amendments=batch).consume()
+                )
+                hubs_created += summary.counters.nodes_created
+                links_created += summary.counters.relationships_created
             
+            # Pairwise edges of the previous implementation
             result = session.run("""
-                MATCH (amend1:Amendment)
-                WHERE amend1.fundstelle_periodikum IS NOT NULL
-                MATCH (amend2:Amendment)
-                WHERE amend2.fundstelle_periodikum = amend1.fundstelle_periodikum
-                  AND elementId(amend1) < elementId(amend2)
-                MERGE (amend1)-[r:SAME_BGBl_REFERENCE]->(amend2)
-                RETURN count(r) as cross_refs
+                MATCH ()-[r:SAME_BGBl_REFERENCE]->()
+                CALL { WITH r DELETE r } IN TRANSACTIONS OF 10000 ROWS
+                RETURN count(*) as removed
             """)
-            cross_refs = result.single()['cross_refs']
+            legacy_removed = result.single()['removed']
+            
+            top_refs = list(session.run("""
+                MATCH (ref:BGBlReference)
+                RETURN ref.reference as reference, count { (ref)<-[:AMENDED_BY]-() } as norms
+                ORDER BY norms DESC
+                LIMIT 5
+            """))
+            
+            for record in top_refs:
+                logger.info(f"  🔗 {record['reference']}: {record['norms']} norms")
             
             logger.info("\n" + "="*70)
             logger.info(f"📊 TASK 4 SUMMARY:")
-            logger.info(f"   ✅ Enhanced {enhanced_count} amendment nodes with parsed dates")
-            logger.info(f"   🔗 Created {cross_refs} cross-reference links between amendments")
+            logger.info(f"   ✅ Normalised {len(amendments)} amendment nodes")
+            logger.info(f"   🔗 Created {hubs_created} BGBlReference nodes and {links_created} "
+                        f"PUBLISHED_IN/AMENDED_BY links")
+            if legacy_removed:
+                logger.info(f"   🧹 Removed {legacy_removed} legacy SAME_BGBl_REFERENCE relationships")
             logger.info("="*70)
     
     # ========================================================================
@@ -415,60 +428,36 @@ class CompleteKnowledgeGraphImporter:
         logger.info("🎉 COMPLETE KNOWLEDGE GRAPH IMPORT FINISHED")
         logger.info("="*80)
         
+        # Node/relationship totals from the count store, SGB coverage from the
+        # import-time counters on LegalDocument (no scan over chunks)
+        logger.info("\n📦 NODE STATISTICS:")
+        logger.info(f"{'Node Type':<25} {'Count':>15}")
+        logger.info(f"{'-'*40}")
+        for node_type, count in sorted(node_counts(self.driver).items(), key=lambda item: -item[1]):
+            logger.info(f"{node_type:<25} {count:>15,}")
+        
+        logger.info("\n🔗 RELATIONSHIP STATISTICS:")
+        logger.info(f"{'Relationship Type':<35} {'Count':>15}")
+        logger.info(f"{'-'*50}")
+        for rel_type, count in sorted(relationship_counts(self.driver).items(), key=lambda item: -item[1]):
+            logger.info(f"{rel_type:<35} {count:>15,}")
+        
+        logger.info("\n📚 SGB COVERAGE:")
+        logger.info(f"{'SGB':<10} {'Norms':>10} {'Chunks':>10} {'Avg Chunks/Norm':>18}")
+        logger.info(f"{'-'*48}")
+        total_norms = 0
+        total_chunks = 0
+        for r in sgb_counters(self.driver)['legal']:
+            avg = r['chunks'] / r['norms'] if r['norms'] > 0 else 0
+            logger.info(f"{r['sgb'] or '-':<10} {r['norms']:>10,} {r['chunks']:>10,} {avg:>18.1f}")
+            total_norms += r['norms']
+            total_chunks += r['chunks']
+        
+        logger.info(f"{'-'*48}")
+        total_avg = total_chunks / total_norms if total_norms > 0 else 0
+        logger.info(f"{'TOTAL':<10} {total_norms:>10,} {total_chunks:>10,} {total_avg:>18.1f}")
+        
         with self.driver.session() as session:
-            # Node statistics
-            result = session.run("""
-                MATCH (n)
-                RETURN labels(n)[0] as node_type, count(*) as count
-                ORDER BY count DESC
-            """)
-            
-            logger.info("\n📦 NODE STATISTICS:")
-            logger.info(f"{'Node Type':<25} {'Count':>15}")
-            logger.info(f"{'-'*40}")
-            for r in result:
-                logger.info(f"{r['node_type']:<25} {r['count']:>15,}")
-            
-            # Relationship statistics
-            result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as rel_type, count(*) as count
-                ORDER BY count DESC
-            """)
-            
-            logger.info("\n🔗 RELATIONSHIP STATISTICS:")
-            logger.info(f"{'Relationship Type':<35} {'Count':>15}")
-            logger.info(f"{'-'*50}")
-            for r in result:
-                logger.info(f"{r['rel_type']:<35} {r['count']:>15,}")
-            
-            # SGB coverage
-            result = session.run("""
-                MATCH (doc:LegalDocument)
-                OPTIONAL MATCH (doc)-[:CONTAINS_NORM]->(norm:LegalNorm)
-                OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                WITH doc.sgb_nummer as sgb,
-                     count(DISTINCT norm) as norms,
-                     count(DISTINCT chunk) as chunks
-                RETURN sgb, norms, chunks
-                ORDER BY sgb
-            """)
-            
-            logger.info("\n📚 SGB COVERAGE:")
-            logger.info(f"{'SGB':<10} {'Norms':>10} {'Chunks':>10} {'Avg Chunks/Norm':>18}")
-            logger.info(f"{'-'*48}")
-            total_norms = 0
-            total_chunks = 0
-            for r in result:
-                avg = r['chunks'] / r['norms'] if r['norms'] > 0 else 0
-                logger.info(f"{r['sgb']:<10} {r['norms']:>10,} {r['chunks']:>10,} {avg:>18.1f}")
-                total_norms += r['norms']
-                total_chunks += r['chunks']
-            
-            logger.info(f"{'-'*48}")
-            total_avg = total_chunks / total_norms if total_norms > 0 else 0
-            logger.info(f"{'TOTAL':<10} {total_norms:>10,} {total_chunks:>10,} {total_avg:>18.1f}")
-            
             # Document (PDF) coverage
             result = session.run("""
                 MATCH (d:Document)
@@ -485,15 +474,16 @@ class CompleteKnowledgeGraphImporter:
             # Amendment coverage
             result = session.run("""
                 MATCH (amend:Amendment)
-                WHERE amend.parsed_date IS NOT NULL
+                WHERE amend.amendment_date IS NOT NULL
                 RETURN count(*) as with_dates,
-                       min(amend.parsed_date) as earliest,
-                       max(amend.parsed_date) as latest
+                       min(amend.amendment_date) as earliest,
+                       max(amend.amendment_date) as latest
             """)
             amend_stats = result.single()
             
             logger.info("\n📅 AMENDMENT HISTORY:")
             logger.info(f"   Amendments with dates: {amend_stats['with_dates']}")
+            logger.info(f"   BGBl references: {node_counts(self.driver).get('BGBlReference', 0)}")
             if amend_stats['with_dates'] > 0:
                 logger.info(f"   Date range: {amend_stats['earliest']} to {amend_stats['latest']}")
         
@@ -533,6 +523,8 @@ def main():
         return 1
     finally:
         importer.close()
+        print("\n⏱️  Stages:")
+        print(format_stage_report())
     
     print("\n✅ All tasks completed successfully!")
     return 0
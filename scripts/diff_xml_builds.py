@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Diff Two XML Builds
+===================
+Compares two builds of the same law (e.g. the cached xml.zip and a freshly
+downloaded one) norm by norm before re-importing: which paragraphs were
+added, removed, renumbered or changed, and how (Absatz- und Wort-Diff).
+
+The change set can be written as JSON for the incremental import
+(upsert_norm_ids / delete_norm_ids) and change-notification reports.
+
+Usage:
+    python scripts/diff_xml_builds.py xml_cache/sgb_2/xml.zip ~/Downloads/sgb_2/xml.zip
+    python scripts/diff_xml_builds.py old.xml new.xml --json logs/sgb_2_changes.json
+    python scripts/diff_xml_builds.py old.xml new.xml --show 0    # summary only
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import logging
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+from src.xml_legal_parser import LegalXMLParser
+from src.legal_diff import diff_documents, load_build, render_word_diff, ADDED, REMOVED, REKEYED
+
+
+def print_change(change):
+    """Print one NormChange with its text unit changes"""
+    icons = {ADDED: '🆕', REMOVED: '🗑️ '}
+    flags = []
+    if change.titel_changed:
+        flags.append("Titel")
+    if change.amendments_changed:
+        flags.append("Stand")
+    suffix = f"  ({', '.join(flags)} geändert)" if flags else ""
+
+    print(f"\n  {icons.get(change.kind, '✏️ ')} {change.label} [{change.kind}]{suffix}")
+    if change.kind in (ADDED, REMOVED):
+        return
+
+    for unit_change in change.unit_changes:
+        position = f"Absatz {unit_change.new_range[0] + 1}"
+        if unit_change.word_diff:
+            print(f"     {position}: {render_word_diff(unit_change.word_diff)[:300]}")
+            continue
+        for text in unit_change.old_texts:
+            print(f"     {position} - {text[:150]}")
+        for text in unit_change.new_texts:
+            print(f"     {position} + {text[:150]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Norm-level diff between two XML builds of a law")
+    parser.add_argument("old", help="Old build: .xml, xml.zip or xml_cache/sgb_* directory")
+    parser.add_argument("new", help="New build: .xml, xml.zip or xml_cache/sgb_* directory")
+    parser.add_argument("--json", help="Write the change set as JSON to this file")
+    parser.add_argument("--show", type=int, default=20, help="Print the first N changes (default: 20)")
+    parser.add_argument("--no-word-diff", action="store_true", help="Only diff whole text units")
+
+    args = parser.parse_args()
+
+    legal_parser = LegalXMLParser()
+
+    start = time.perf_counter()
+    old_doc = load_build(Path(args.old), legal_parser)
+    new_doc = load_build(Path(args.new), legal_parser)
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    change_set = diff_documents(old_doc, new_doc, with_word_diff=not args.no_word_diff)
+    diff_time = time.perf_counter() - start
+
+    summary = change_set.summary()
+
+    print("=" * 70)
+    print(f"🔍 XML BUILD DIFF: {change_set.jurabk}")
+    print("=" * 70)
+    print(f"  Old build:  {change_set.old_builddate}  ({len(old_doc.norms)} norms)")
+    print(f"  New build:  {change_set.new_builddate}  ({len(new_doc.norms)} norms)")
+    print(f"  Added: {summary[ADDED]}  Removed: {summary[REMOVED]}  "
+          f"Modified: {summary['modified']}  Renumbered: {summary['renumbered']}  "
+          f"Unchanged: {summary['unchanged']}")
+    if summary[REKEYED]:
+        print(f"  Re-keyed (same content, new norm ID): {summary[REKEYED]}")
+    print(f"  Parse: {parse_time:.2f}s  Diff: {diff_time * 1000:.1f} ms")
+
+    content_changes = [change for change in change_set.changes if change.kind != REKEYED]
+    for change in content_changes[:args.show]:
+        print_change(change)
+    if len(content_changes) > args.show > 0:
+        print(f"\n  ... {len(content_changes) - args.show} more")
+
+    if args.json:
+        json_path = Path(args.json)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(change_set.to_json(indent=2), encoding='utf-8')
+        print(f"\n💾 Change set written to {json_path}")
+
+    if not change_set.changes:
+        print("\n✅ No changes")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -16,6 +16,8 @@ from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import json
 
+from src.query_registry import get_query, warm_plan_cache
+
 load_dotenv()
 
 
@@ -30,12 +32,26 @@ class SachbearbeiterUseCaseEvaluator:
         self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
         self.results = []
         
+        # Every use case then runs against an already cached plan
+        warm_plan_cache(self.driver, prefix="uc.")
+        
     def close(self):
         self.driver.close()
     
-    def evaluate_use_case(self, name: str, query: str, expected_min: int = 1, 
-                         description: str = "") -> Dict:
-        """Evaluate a single use case"""
+    def evaluate_use_case(self, name: str, query_name: str, expected_min: int = 1, 
+                         description: str = "", **params) -> Dict:
+        """Evaluate a single use case
+        
+        Args:
+            name: Use case label
+            query_name: Registered query (src/query_registry.py)
+            expected_min: Minimum number of records for PASS
+            description: Scenario description
+            **params: Query parameters (override the registry defaults)
+        """
+        query = get_query(query_name)
+        params = query.params(**params)
+        
         print(f"\n{'='*70}")
         print(f"USE CASE: {name}")
         print(f"{'='*70}")
@@ -45,7 +61,7 @@ class SachbearbeiterUseCaseEvaluator:
         
         with self.driver.session() as session:
             try:
-                result = session.run(query)
+                result = session.run(query.cypher, params)
                 records = list(result)
                 elapsed = time.time() - start
                 
@@ -58,6 +74,7 @@ class SachbearbeiterUseCaseEvaluator:
                 
                 result_data = {
                     'use_case': name,
+                    'query': query_name,
                     'description': description,
                     'found': found,
                     'expected_min': expected_min,
@@ -96,15 +113,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC01: Regelbedarf ermitteln (§ 20 SGB II)"""
         return self.evaluate_use_case(
             "UC01: Regelbedarf ermitteln",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: "20"})
-            OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-            RETURN norm.enbez as paragraph,
-                   norm.titel as titel,
-                   count(chunk) as chunks,
-                   norm.content_text as text
-            """,
+            "uc.norm_overview",
+            sgb="II", paragraph="20",
             expected_min=1,
             description="Sachbearbeiter muss Regelbedarf für Alleinstehende/Familie prüfen"
         )
@@ -113,17 +123,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC02: Leistungsberechtigung prüfen (§§ 7-9 SGB II)"""
         return self.evaluate_use_case(
             "UC02: Leistungsberechtigung prüfen",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["7", "8", "9"]
-            OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
-            RETURN norm.paragraph_nummer as para_nr,
-                   norm.enbez as paragraph,
-                   norm.titel as pruefpunkt,
-                   count(text) as text_units
-            ORDER BY para_nr
-            """,
+            "uc.norms_text_units",
+            sgb="II", paragraphs=["7", "8", "9"],
             expected_min=3,
             description="Prüfung: Alter (15-67), Erwerbsfähigkeit (3h/Tag), Hilfebedürftigkeit"
         )
@@ -132,15 +133,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC03: Einkommen anrechnen (§ 11 SGB II)"""
         return self.evaluate_use_case(
             "UC03: Einkommen berechnen",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer STARTS WITH "11"
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as thema,
-                   norm.enbez as paragraph
-            ORDER BY para
-            """,
+            "uc.norms_by_prefix",
+            sgb="II", prefix="11",
             expected_min=5,
             description="Einkommensanrechnung inkl. § 11a (Freibeträge), § 11b (Absetzbeträge)"
         )
@@ -149,15 +143,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC04: Vermögen prüfen (§ 12 SGB II)"""
         return self.evaluate_use_case(
             "UC04: Vermögen prüfen",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["12", "12a"]
-            OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel,
-                   count(chunk) as chunks
-            """,
+            "uc.norm_chunks",
+            sgb="II", paragraphs=["12", "12a"],
             expected_min=1,
             description="Vermögensprüfung und Freibeträge"
         )
@@ -166,14 +153,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC05: Mehrbedarf für Alleinerziehende (§ 21 SGB II)"""
         return self.evaluate_use_case(
             "UC05: Mehrbedarf Alleinerziehende",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer STARTS WITH "21"
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as mehrbedarf_typ
-            ORDER BY para
-            """,
+            "uc.norms_by_prefix",
+            sgb="II", prefix="21",
             expected_min=2,
             description="Mehrbedarfe: Alleinerziehende, Behinderung, kostenaufwändige Ernährung"
         )
@@ -182,15 +163,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC06: Kosten der Unterkunft (§ 22 SGB II)"""
         return self.evaluate_use_case(
             "UC06: Kosten der Unterkunft",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer STARTS WITH "22"
-            OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel,
-                   count(chunk) as chunks
-            """,
+            "uc.norm_chunks_by_prefix",
+            sgb="II", prefix="22",
             expected_min=1,
             description="Mietkosten, Heizkosten, Warmwasser"
         )
@@ -199,14 +173,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC07: Sanktionen bei Pflichtverletzung (§§ 31-32 SGB II)"""
         return self.evaluate_use_case(
             "UC07: Sanktionen prüfen",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["31", "31a", "31b", "32"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as sanktion_typ
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="II", paragraphs=["31", "31a", "31b", "32"],
             expected_min=3,
             description="Pflichtverletzungen und Minderung der Leistung"
         )
@@ -215,14 +183,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC08: Eingliederungsvereinbarung (§ 15 SGB II)"""
         return self.evaluate_use_case(
             "UC08: Eingliederungsvereinbarung",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: "15"})
-            OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
-            RETURN norm.enbez as paragraph,
-                   norm.titel as titel,
-                   count(text) as text_units
-            """,
+            "uc.norm_text_units",
+            sgb="II", paragraph="15",
             expected_min=1,
             description="EGV-Abschluss und Pflichten des Leistungsberechtigten"
         )
@@ -231,14 +193,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC09: Arbeitslosengeld I prüfen (§§ 136-150 SGB III)"""
         return self.evaluate_use_case(
             "UC09: ALG I Anspruchsprüfung",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "III"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["136", "137", "138", "142", "143"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="III", paragraphs=["136", "137", "138", "142", "143"],
             expected_min=2,
             description="Anspruchsvoraussetzungen für ALG I (Arbeitslosigkeit, Verfügbarkeit)"
         )
@@ -247,14 +203,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC10: Zuständigkeit und Antrag (§§ 37, 40 SGB II)"""
         return self.evaluate_use_case(
             "UC10: Zuständigkeit klären",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["37", "37a", "37b", "37c", "40", "40a"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="II", paragraphs=["37", "37a", "37b", "37c", "40", "40a"],
             expected_min=2,
             description="Örtliche Zuständigkeit und Antragserfordernis"
         )
@@ -265,14 +215,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC11: Krankenversicherung - Wirtschaftlichkeitsprüfung (§§ 106-106d SGB V)"""
         return self.evaluate_use_case(
             "UC11: Krankenversicherung",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "V"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["106", "106a", "106b"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="V", paragraphs=["106", "106a", "106b"],
             expected_min=2,
             description="Wirtschaftlichkeitsprüfung in der KV"
         )
@@ -281,14 +225,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC12: Rentenversicherung (§§ 100-107 SGB VI)"""
         return self.evaluate_use_case(
             "UC12: Rentenversicherung",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "VI"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["100", "101", "102", "106", "107"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="VI", paragraphs=["100", "101", "102", "106", "107"],
             expected_min=3,
             description="Beginn, Änderung und Ende von Renten"
         )
@@ -297,14 +235,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC13: Rehabilitation - Eingliederungshilfe (§§ 100-105 SGB IX)"""
         return self.evaluate_use_case(
             "UC13: Rehabilitation",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "IX"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["100", "101", "102", "103", "104", "105"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as titel
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="IX", paragraphs=["100", "101", "102", "103", "104", "105"],
             expected_min=4,
             description="Eingliederungshilfe für Menschen mit Behinderungen"
         )
@@ -313,14 +245,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC14: Sozialhilfe - Kostenerstattung (§§ 102-110 SGB XII)"""
         return self.evaluate_use_case(
             "UC14: Sozialhilfe",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "XII"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["102", "103", "104", "105", "106"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as leistungsart
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="XII", paragraphs=["102", "103", "104", "105", "106"],
             expected_min=3,
             description="Kostenerstattung in der Sozialhilfe"
         )
@@ -329,14 +255,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC15: Datenschutz (§§ 67-85 SGB X)"""
         return self.evaluate_use_case(
             "UC15: Sozialdatenschutz",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "X"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN ["67", "67a", "67b", "68", "69"]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as datenschutz_regel
-            ORDER BY para
-            """,
+            "uc.norm_titles",
+            sgb="X", paragraphs=["67", "67a", "67b", "68", "69"],
             expected_min=2,
             description="Schutz von Sozialdaten bei Antragsbearbeitung"
         )
@@ -347,25 +267,14 @@ class SachbearbeiterUseCaseEvaluator:
         """UC16: Kompletter Bürgergeld-Antrag Workflow"""
         return self.evaluate_use_case(
             "UC16: Vollständiger Antrag",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            WHERE norm.paragraph_nummer IN [
-                "7", "8", "9",     // Berechtigung
-                "11", "12",        // Einkommen & Vermögen
-                "20", "21", "22",  // Bedarf
-                "37", "40"         // Zuständigkeit & Antrag
-            ]
-            RETURN norm.paragraph_nummer as para,
-                   norm.titel as pruefschritt
-            ORDER BY 
-                CASE norm.paragraph_nummer
-                    WHEN "7" THEN 1 WHEN "8" THEN 2 WHEN "9" THEN 3
-                    WHEN "11" THEN 4 WHEN "12" THEN 5
-                    WHEN "20" THEN 6 WHEN "21" THEN 7 WHEN "22" THEN 8
-                    WHEN "37" THEN 9 WHEN "40" THEN 10
-                END
-            """,
+            "uc.pruefschritte",
+            sgb="II",
+            paragraphs=[
+                "7", "8", "9",     # Berechtigung
+                "11", "12",        # Einkommen & Vermögen
+                "20", "21", "22",  # Bedarf
+                "37", "40"         # Zuständigkeit & Antrag
+            ],
             expected_min=8,
             description="Alle Prüfschritte für Bürgergeld-Antrag"
         )
@@ -374,17 +283,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC17: Hierarchische Navigation durch SGB II"""
         return self.evaluate_use_case(
             "UC17: Strukturnavigation",
-            """
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})
-                  -[:HAS_STRUCTURE]->(struct:StructuralUnit)
-                  -[:CONTAINS_NORM]->(norm:LegalNorm)
-            RETURN struct.gliederungsbez as struktur,
-                   struct.gliederungstitel as titel,
-                   count(norm) as anzahl_normen,
-                   struct.order_index as order_idx
-            ORDER BY order_idx
-            LIMIT 10
-            """,
+            "uc.structure_navigation",
+            sgb="II", limit=10,
             expected_min=5,
             description="Navigation durch Kapitel und Abschnitte"
         )
@@ -393,17 +293,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC18: Semantische Suche 'Regelbedarfe'"""
         return self.evaluate_use_case(
             "UC18: Semantische Suche",
-            """
-            MATCH (chunk:Chunk)
-            WHERE chunk.paragraph_context CONTAINS "Regelbedarf"
-               OR chunk.text CONTAINS "Regelbedarf"
-            OPTIONAL MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk)
-            RETURN DISTINCT norm.enbez as paragraph,
-                   norm.titel as titel,
-                   count(chunk) as relevante_chunks
-            ORDER BY relevante_chunks DESC
-            LIMIT 5
-            """,
+            "uc.chunk_text_search",
+            term="Regelbedarf", limit=5,
             expected_min=1,
             description="Textsuche über alle Chunks zu 'Regelbedarfe'"
         )
@@ -412,17 +303,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC19: Handlungsanweisungen zu SGB II"""
         return self.evaluate_use_case(
             "UC19: Fachliche Weisungen",
-            """
-            MATCH (d:Document)
-            WHERE d.document_type = "Fachliche Weisung"
-              AND (d.sgb_nummer = "II" OR d.filename CONTAINS "SGB")
-            OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-            RETURN d.filename as dokument,
-                   d.trust_score as vertrauenswuerdigkeit,
-                   count(c) as chunks
-            ORDER BY d.trust_score DESC
-            LIMIT 5
-            """,
+            "uc.weisungen",
+            document_type="Fachliche Weisung", sgb="II", filename_term="SGB", limit=5,
             expected_min=1,
             description="PDF-Handlungsanweisungen mit Verknüpfung zum Gesetzestext"
         )
@@ -431,17 +313,8 @@ class SachbearbeiterUseCaseEvaluator:
         """UC20: Gesetzesänderungen nachvollziehen"""
         return self.evaluate_use_case(
             "UC20: Änderungshistorie",
-            """
-            MATCH (norm:LegalNorm)-[:HAS_AMENDMENT]->(amendment:Amendment)
-            MATCH (doc:LegalDocument {sgb_nummer: "II"})-[:CONTAINS_NORM]->(norm)
-            WHERE amendment.amendment_date IS NOT NULL
-            RETURN norm.enbez as paragraph,
-                   norm.titel as titel,
-                   amendment.standkommentar as aenderung,
-                   amendment.amendment_date as datum
-            ORDER BY amendment.amendment_date DESC
-            LIMIT 10
-            """,
+            "uc.amendments",
+            sgb="II", limit=10,
             expected_min=1,
             description="BGBl-Änderungen mit Datum nachvollziehen"
         )
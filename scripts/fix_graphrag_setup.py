@@ -69,6 +69,8 @@ def create_property_indexes(driver):
         ("INDEX idx_legal_norm_para IF NOT EXISTS FOR (n:LegalNorm) ON (n.paragraph_nummer)", "LegalNorm.paragraph_nummer"),
         ("INDEX idx_document_type IF NOT EXISTS FOR (d:Document) ON (d.document_type)", "Document.document_type"),
         ("INDEX idx_document_sgb IF NOT EXISTS FOR (d:Document) ON (d.sgb_nummer)", "Document.sgb_nummer"),
+        ("INDEX idx_chunk_sgb IF NOT EXISTS FOR (c:Chunk) ON (c.sgb_nummer)", "Chunk.sgb_nummer"),
+        ("INDEX idx_chunk_norm IF NOT EXISTS FOR (c:Chunk) ON (c.norm_id)", "Chunk.norm_id"),
     ]
     
     with driver.session() as session:
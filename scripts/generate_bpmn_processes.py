@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Generate BPMN Processes
+=======================
+Writes all predefined SGB process templates (incl. the swimlane variant) to
+processes/ as BPMN 2.0 XML with BPMNDI auto-layout (opens in Camunda Modeler,
+bpmn.io, Signavio without manual layout) plus Mermaid.
+
+Usage:
+    python scripts/generate_bpmn_processes.py
+    python scripts/generate_bpmn_processes.py --output /tmp/processes --no-mermaid
+    python scripts/generate_bpmn_processes.py --benchmark 2000    # synthetic process with 2000 elements
+"""
+
+import sys
+import argparse
+import random
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bpmn_prozess_generator import (
+    create_sgb2_antrag_prozess,
+    create_sgb2_sanktion_prozess,
+    create_sgb12_grundsicherung_alter_prozess,
+    create_sgb3_vermittlung_prozess,
+)
+from src.bpmn_advanced_generator import AdvancedBPMNGenerator, create_sgb2_antrag_mit_swimlanes
+
+PROCESSES = {
+    'SGB_II_Antragstellung': create_sgb2_antrag_prozess,
+    'SGB_II_Sanktionsverfahren': create_sgb2_sanktion_prozess,
+    'SGB_XII_Grundsicherung_Alter': create_sgb12_grundsicherung_alter_prozess,
+    'SGB_III_Arbeitsvermittlung': create_sgb3_vermittlung_prozess,
+    'SGB_II_Antrag_Swimlanes': create_sgb2_antrag_mit_swimlanes,
+}
+
+
+def synthetic_process(elements: int, lanes: int = 5, seed: int = 42) -> AdvancedBPMNGenerator:
+    """Random process with gateways, back edges and swimlanes for timing the writer"""
+    rng = random.Random(seed)
+    bpmn = AdvancedBPMNGenerator()
+    lane_ids = [bpmn.add_swimlane(f"Lane {i + 1}") for i in range(lanes)]
+
+    nodes = [bpmn.add_start_event()]
+    for i in range(elements):
+        if i % 5 == 0:
+            node = bpmn.add_exclusive_gateway(f"Entscheidung {i}?")
+        else:
+            node = bpmn.add_task_to_lane(f"Schritt {i}", rng.choice(lane_ids), sgb_ref=f"SGB II § {i % 70 + 1}")
+        bpmn.add_sequence_flow(rng.choice(nodes[-8:]), node)
+        if i % 7 == 0 and len(nodes) > 20:
+            bpmn.add_sequence_flow(node, rng.choice(nodes[-20:]), "Zurück")
+        nodes.append(node)
+
+    bpmn.add_sequence_flow(nodes[-1], bpmn.add_end_event())
+    return bpmn
+
+
+def write_process(bpmn, name: str, output_dir: Path, mermaid: bool) -> float:
+    """Write one process, returns seconds"""
+    start = time.perf_counter()
+    bpmn.write_bpmn_xml(str(output_dir / f"{name}.bpmn"), process_name=name.replace('_', ' '))
+    if mermaid:
+        (output_dir / f"{name}.mmd").write_text(bpmn.generate_mermaid(), encoding='utf-8')
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate BPMN 2.0 XML (with auto-layout) for all SGB processes")
+    parser.add_argument("--output", default=str(Path(__file__).parent.parent / "processes"), help="Output directory")
+    parser.add_argument("--no-mermaid", action="store_true", help="Skip the Mermaid .mmd files")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Also write a synthetic process with N elements")
+
+    args = parser.parse_args()
+
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    processes = {name: factory() for name, factory in PROCESSES.items()}
+    if args.benchmark:
+        processes[f"Benchmark_{args.benchmark}"] = synthetic_process(args.benchmark)
+
+    print("=" * 70)
+    print(f"📐 BPMN GENERATION → {output_dir}")
+    print("=" * 70)
+
+    total = 0.0
+    for name, bpmn in processes.items():
+        seconds = write_process(bpmn, name, output_dir, mermaid=not args.no_mermaid)
+        total += seconds
+        print(f"  ✅ {name:<32} {len(bpmn.elements):>6} elements {len(bpmn.flows):>6} flows "
+              f"{seconds * 1000:>8.1f} ms")
+
+    print(f"\n✨ {len(processes)} Prozesse in {total:.2f}s generiert")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Graph Consistency Engine - Orphaned LegalNorm Repair
+
+Gemeinsame Engine für link_orphaned_norms.py, fix_sgb_coverage.py und
+find_doknr_patterns.py. Statt pro SGB/doknr-Prefix eigene Queries zu
+schicken, arbeitet sie mengenbasiert:
+
+1. doknr-Prefix → LegalDocument Map einmal laden (eine Query)
+2. Alle verwaisten Norms (kein LegalDocument -CONTAINS_NORM->) inkl.
+   doknr-Prefix, Chunk-Anzahl und Dokument über StructuralUnit einmal laden
+3. Reparaturplan in Python bauen (StructuralUnit-Pfad vor doknr-Prefix)
+4. Links in Batches per UNWIND + MERGE schreiben (idempotent, re-run safe)
+5. Document → Norm → Chunk Erreichbarkeit in einem Durchlauf prüfen
+
+Usage:
+    python scripts/graph_consistency.py --analyze
+    python scripts/graph_consistency.py --fix [--yes] [--batch-size 1000]
+    python scripts/graph_consistency.py --verify
+"""
+
+import os
+import time
+import argparse
+from collections import defaultdict
+from typing import Dict, List
+
+from dotenv import load_dotenv
+from neo4j import GraphDatabase
+
+load_dotenv()
+
+DOKNR_PREFIX_LENGTH = 13
+
+# Bekannte doknr-Prefixe (nur für Reports: welches SGB fehlt als LegalDocument?)
+SGB_DOKNR_MAP = {
+    'BJNR030150975': 'I',      # Allgemeiner Teil
+    'BJNR295500003': 'II',     # Grundsicherung für Arbeitsuchende
+    'BJNR059500997': 'III',    # Arbeitsförderung
+    'BJNR138450976': 'IV',     # Gemeinsame Vorschriften
+    'BJNR024820988': 'V',      # Gesetzliche Krankenversicherung
+    'BJNR122610989': 'VI',     # Gesetzliche Rentenversicherung
+    'BJNR125410996': 'VII',    # Gesetzliche Unfallversicherung
+    'BJNR111630990': 'VIII',   # Kinder- und Jugendhilfe
+    'BJNR323410016': 'IX',     # Rehabilitation und Teilhabe (2016)
+    'BJNR114690980': 'X',      # Sozialverwaltungsverfahren und Sozialdatenschutz
+    'BJNR101500994': 'XI',     # Soziale Pflegeversicherung
+    'BJNR302300003': 'XII',    # Sozialhilfe
+    'BJNR104600001': 'XIII',   # (historisch, ggf. nicht mehr gültig)
+    'BJNR265210019': 'XIV',    # Soziale Entschädigung (2019)
+}
+
+DOCUMENT_MAP_QUERY = '''
+    MATCH (doc:LegalDocument)
+    WHERE doc.doknr IS NOT NULL
+    RETURN substring(doc.doknr, 0, $prefix_length) as prefix,
+           elementId(doc) as doc_element_id,
+           doc.sgb_nummer as sgb
+'''
+
+# Aufgehobene Normen (repealed_at, siehe replace_legal_document) hängen
+# absichtlich an keinem LegalDocument und sind keine Orphans
+ORPHANS_QUERY = '''
+    MATCH (norm:LegalNorm)
+    WHERE norm.repealed_at IS NULL AND NOT EXISTS {
+        MATCH (:LegalDocument)-[:CONTAINS_NORM]->(norm)
+    }
+    OPTIONAL MATCH (struct_doc:LegalDocument)-[:HAS_STRUCTURE]->(:StructuralUnit)
+                   -[:CONTAINS_NORM]->(norm)
+    WITH norm, collect(DISTINCT elementId(struct_doc)) as struct_docs
+    RETURN elementId(norm) as norm_element_id,
+           substring(norm.norm_doknr, 0, $prefix_length) as prefix,
+           struct_docs,
+           size([(norm)-[:HAS_CHUNK]->(c:Chunk) | c]) as chunks
+'''
+
+LINK_QUERY = '''
+    UNWIND $links AS link
+    MATCH (doc:LegalDocument) WHERE elementId(doc) = link.doc
+    MATCH (norm:LegalNorm) WHERE elementId(norm) = link.norm
+    MERGE (doc)-[:CONTAINS_NORM]->(norm)
+'''
+
+# One pass over all (not repealed) norms: SGB of the owning document (NULL = orphan) and chunks
+REACHABILITY_QUERY = '''
+    MATCH (norm:LegalNorm)
+    WHERE norm.repealed_at IS NULL
+    OPTIONAL MATCH (doc:LegalDocument)-[:CONTAINS_NORM]->(norm)
+    WITH norm, min(doc.sgb_nummer) as sgb
+    WITH sgb, norm, size([(norm)-[:HAS_CHUNK]->(c:Chunk) | c]) as chunks
+    RETURN sgb,
+           count(norm) as norms,
+           sum(CASE WHEN chunks > 0 THEN 1 ELSE 0 END) as norms_with_chunks,
+           sum(chunks) as chunks
+    ORDER BY sgb
+'''
+
+
+class GraphConsistencyEngine:
+    """Set-based detection and repair of LegalNorms without CONTAINS_NORM"""
+
+    def __init__(self, driver=None, batch_size: int = 1000):
+        """Initialize engine
+
+        Args:
+            driver: Neo4j driver (default: from NEO4J_URI / NEO4J_PASSWORD)
+            batch_size: Links per write transaction
+        """
+        if driver is None:
+            uri = os.getenv('NEO4J_URI')
+            password = os.getenv('NEO4J_PASSWORD')
+            driver = GraphDatabase.driver(uri, auth=(os.getenv('NEO4J_USERNAME', 'neo4j'), password))
+            self._owns_driver = True
+        else:
+            self._owns_driver = False
+
+        self.driver = driver
+        self.batch_size = batch_size
+
+    def close(self):
+        if self._owns_driver:
+            self.driver.close()
+
+    def document_map(self) -> Dict[str, Dict]:
+        """doknr prefix → {'doc': elementId, 'sgb': sgb_nummer}"""
+        with self.driver.session() as session:
+            records = list(session.run(DOCUMENT_MAP_QUERY, prefix_length=DOKNR_PREFIX_LENGTH))
+
+        documents = {}
+        for r in records:
+            if r['prefix'] in documents:
+                print(f"⚠️  Several LegalDocuments with doknr prefix {r['prefix']} - using the first")
+                continue
+            documents[r['prefix']] = {'doc': r['doc_element_id'], 'sgb': r['sgb']}
+        return documents
+
+    def find_orphans(self) -> List[Dict]:
+        """All LegalNorms without an owning LegalDocument (one query)"""
+        with self.driver.session() as session:
+            return [dict(r) for r in session.run(ORPHANS_QUERY, prefix_length=DOKNR_PREFIX_LENGTH)]
+
+    def plan(self, strategies=('structure', 'doknr')) -> Dict:
+        """Resolve every orphan to a LegalDocument
+
+        Args:
+            strategies: 'structure' (Document→StructuralUnit→Norm exists) and/or
+                        'doknr' (norm_doknr prefix == LegalDocument.doknr)
+
+        Returns:
+            {'links': [{'doc', 'norm', 'strategy'}], 'unresolved': [...],
+             'by_prefix': {prefix: {...counts}}, 'documents', 'orphans'}
+        """
+        documents = self.document_map()
+        orphans = self.find_orphans()
+
+        links, unresolved = [], []
+        by_prefix = defaultdict(lambda: {'norms': 0, 'chunks': 0, 'linkable': 0, 'sgb': None, 'strategy': set()})
+
+        for orphan in orphans:
+            prefix = orphan['prefix'] or 'N/A'
+            entry = by_prefix[prefix]
+            entry['norms'] += 1
+            entry['chunks'] += orphan['chunks']
+
+            document = documents.get(orphan['prefix'])
+            entry['sgb'] = (document or {}).get('sgb') or SGB_DOKNR_MAP.get(prefix)
+
+            if 'structure' in strategies and len(orphan['struct_docs']) == 1:
+                link = {'doc': orphan['struct_docs'][0], 'norm': orphan['norm_element_id'], 'strategy': 'structure'}
+            elif 'doknr' in strategies and document:
+                link = {'doc': document['doc'], 'norm': orphan['norm_element_id'], 'strategy': 'doknr'}
+            else:
+                unresolved.append(orphan)
+                continue
+
+            links.append(link)
+            entry['linkable'] += 1
+            entry['strategy'].add(link['strategy'])
+
+        return {
+            'links': links,
+            'unresolved': unresolved,
+            'by_prefix': dict(by_prefix),
+            'documents': len(documents),
+            'orphans': len(orphans),
+        }
+
+    def repair(self, plan: Dict) -> int:
+        """Write the planned CONTAINS_NORM links in batches
+
+        MERGE macht die Reparatur idempotent: ein zweiter Lauf legt nichts doppelt an.
+
+        Returns:
+            Number of relationships created
+        """
+        links = [{'doc': link['doc'], 'norm': link['norm']} for link in plan['links']]
+        created = 0
+
+        with self.driver.session() as session:
+            for start in range(0, len(links), self.batch_size):
+                batch = links[start:start + self.batch_size]
+                summary = session.execute_write(
+                    lambda tx: tx.run(LINK_QUERY, links=batch).consume()
+                )
+                created += summary.counters.relationships_created
+
+        return created
+
+    def reachability(self) -> Dict:
+        """Document → Norm → Chunk coverage per SGB in one pass
+
+        Returns:
+            {'by_sgb': {sgb: {...}}, 'orphans': {...}, 'accessible_chunks', 'orphan_chunks'}
+        """
+        with self.driver.session() as session:
+            records = list(session.run(REACHABILITY_QUERY))
+
+        by_sgb, orphans = {}, {'norms': 0, 'norms_with_chunks': 0, 'chunks': 0}
+        for r in records:
+            row = {'norms': r['norms'], 'norms_with_chunks': r['norms_with_chunks'], 'chunks': r['chunks']}
+            if r['sgb'] is None:
+                orphans = row
+            else:
+                by_sgb[r['sgb']] = row
+
+        return {
+            'by_sgb': by_sgb,
+            'orphans': orphans,
+            'accessible_chunks': sum(row['chunks'] for row in by_sgb.values()),
+            'orphan_chunks': orphans['chunks'],
+        }
+
+    # === REPORTS ===
+
+    def print_analysis(self, plan: Dict):
+        print("=" * 90)
+        print("ANALYSIS: Orphaned LegalNorm Nodes")
+        print("=" * 90)
+        print(f"\n  LegalDocuments with doknr: {plan['documents']:,}")
+        print(f"  Orphaned norms:            {plan['orphans']:,}")
+
+        print(f"\n{'DOKNR Prefix':<16} | {'SGB':<6} | {'Norms':>7} | {'Chunks':>8} | {'Linkable':>8} | Strategy")
+        print("-" * 90)
+        for prefix, entry in sorted(plan['by_prefix'].items(), key=lambda item: -item[1]['chunks']):
+            strategy = ", ".join(sorted(entry['strategy'])) or "❌ no LegalDocument"
+            print(f"{prefix:<16} | {entry['sgb'] or '?':<6} | {entry['norms']:>7,} | {entry['chunks']:>8,} | "
+                  f"{entry['linkable']:>8,} | {strategy}")
+
+        print("-" * 90)
+        print(f"  Linkable: {len(plan['links']):,}   Unresolved: {len(plan['unresolved']):,}")
+
+    def print_reachability(self, coverage: Dict):
+        print("\n" + "=" * 90)
+        print("VERIFICATION: Document → Norm → Chunk")
+        print("=" * 90)
+        print(f"\n{'SGB':<8} | {'Norms':>8} | {'Norms w/Chunks':>15} | {'Chunks':>10} | Status")
+        print("-" * 90)
+        for sgb, row in sorted(coverage['by_sgb'].items()):
+            status = '✅' if row['chunks'] > 0 else '❌'
+            print(f"SGB {sgb:<4} | {row['norms']:>8,} | {row['norms_with_chunks']:>15,} | "
+                  f"{row['chunks']:>10,} | {status}")
+
+        orphans = coverage['orphans']
+        total = coverage['accessible_chunks'] + coverage['orphan_chunks']
+        pct = (coverage['accessible_chunks'] / total * 100) if total else 0
+
+        print("-" * 90)
+        print(f"  Norm chunks accessible via documents: {coverage['accessible_chunks']:,} ({pct:.1f}%)")
+        if orphans['norms'] == 0:
+            print("\n✅ SUCCESS: All norms are connected to documents!")
+        else:
+            print(f"\n⚠️  {orphans['norms']:,} norms ({orphans['norms_with_chunks']:,} with chunks, "
+                  f"{orphans['chunks']:,} chunks) still orphaned")
+            print("   → Missing LegalDocument for their doknr prefix (see --analyze)")
+
+
+def run_cli(description: str, default_strategies=('structure', 'doknr')):
+    """Shared command line for the repair scripts"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--analyze', action='store_true', help='Show orphans and the repair plan (read-only)')
+    parser.add_argument('--fix', action='store_true', help='Create missing CONTAINS_NORM relationships')
+    parser.add_argument('--verify', action='store_true', help='Verify Document → Norm → Chunk reachability')
+    parser.add_argument('--yes', action='store_true', help='Do not ask for confirmation before --fix')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Links per write transaction')
+    parser.add_argument('--strategy', action='append', choices=['structure', 'doknr'],
+                        help=f"Repair strategy; repeatable (default: {', '.join(default_strategies)})")
+
+    args = parser.parse_args()
+
+    if not any([args.analyze, args.fix, args.verify]):
+        parser.print_help()
+        print("\n⚠️  Please specify at least one action: --analyze, --fix, or --verify")
+        return
+
+    engine = GraphConsistencyEngine(batch_size=args.batch_size)
+    strategies = tuple(args.strategy or default_strategies)
+
+    try:
+        if args.analyze or args.fix:
+            start = time.perf_counter()
+            plan = engine.plan(strategies)
+            engine.print_analysis(plan)
+            print(f"\n⏱️  Plan built in {time.perf_counter() - start:.2f}s")
+
+        if args.fix:
+            if not plan['links']:
+                print("\n✅ Nothing to repair")
+            else:
+                print("\n" + "=" * 90)
+                print("⚠️  WARNING: This will modify the Neo4j database!")
+                print(f"   It will create up to {len(plan['links']):,} CONTAINS_NORM relationships.")
+                print("=" * 90)
+                if args.yes or input("\nType 'yes' to proceed: ").lower() == 'yes':
+                    start = time.perf_counter()
+                    created = engine.repair(plan)
+                    print(f"\n✅ Created {created:,} relationships in {time.perf_counter() - start:.2f}s")
+                else:
+                    print("\n❌ Aborted by user")
+                    return
+
+        if args.verify:
+            engine.print_reachability(engine.reachability())
+
+    finally:
+        engine.close()
+
+    print("\n✅ Done!\n")
+
+
+if __name__ == '__main__':
+    run_cli('Detect and repair orphaned LegalNorm nodes (set-based)')
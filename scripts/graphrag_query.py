@@ -62,25 +62,40 @@ def graphrag_search(driver, query_embedding: List[float], limit: int = 5, sgb_fi
     GraphRAG: Vector Search + Graph Context
     
     1. Vector Search: Finde relevante Chunks
-    2. Graph Traversal: Hole Kontext (Paragraph, Absätze, verwandte Normen)
+    2. Kontext: SGB, Paragraph und Gliederung direkt vom Chunk (ohne Traversal),
+       Graph nur für verwandte Chunks und Absätze der Norm
     3. Return: Angereicherte Resultate mit Graph-Kontext
     """
     
-    cypher_query = """
-        // 1. Vector Search: Top K relevante Chunks
+    if sgb_filter:
+        # 1. Partition-Scan: nur Chunks des gefilterten SGB bewerten.
+        # Der Filter greift vor dem LIMIT, daher immer bis zu $limit Treffer
+        # (ANN + nachträgliches WHERE liefert bei kleinen SGBs oft weniger).
+        # sgb_nummer ist auf den Chunk projiziert (Index auf Chunk.sgb_nummer).
+        # gds.similarity.cosine wie in query_registry (vector.similarity.* erst ab Neo4j 5.18),
+        # auf (1 + cos) / 2 skaliert wie der Score von db.index.vector.queryNodes
+        cypher_query = """
+        MATCH (chunk:Chunk {sgb_nummer: $sgb})
+        WITH chunk,
+             (1 + gds.similarity.cosine(chunk.embedding, $query_embedding)) / 2 as score
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    else:
+        cypher_query = """
+        // 1. Vector Search: Top K relevante Chunks (nur Gesetzes-Chunks)
         CALL db.index.vector.queryNodes('chunk_embeddings', $limit, $query_embedding)
         YIELD node as chunk, score
-        
-        // 2. Graph Traversal: Hole Kontext
-        MATCH (chunk)<-[:HAS_CHUNK]-(norm:LegalNorm)<-[:CONTAINS_NORM]-(doc:LegalDocument)
-    """
-    
-    if sgb_filter:
-        cypher_query += " WHERE doc.sgb_nummer = $sgb"
+        WHERE chunk.norm_id IS NOT NULL
+        """
     
     cypher_query += """
         
+        // 2. Kontext (SGB, Paragraph, Gliederung) steht direkt am Chunk
+        //    (Retrieval-Projektion des LegalKnowledgeGraphBuilder)
+        
         // 3. Sammle verwandte Chunks aus dem gleichen Paragraphen
+        OPTIONAL MATCH (norm:LegalNorm {id: chunk.norm_id})
         OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(related_chunk:Chunk)
         WHERE related_chunk <> chunk
         
@@ -94,13 +109,14 @@ def graphrag_search(driver, query_embedding: List[float], limit: int = 5, sgb_fi
             score,
             
             // Norm-Context
-            norm.paragraph_nummer as paragraph,
-            norm.enbez as norm_titel,
-            norm.titel as norm_beschreibung,
+            chunk.paragraph_nummer as paragraph,
+            chunk.enbez as norm_titel,
+            chunk.norm_titel as norm_beschreibung,
+            chunk.structure_path as struktur,
             
             // Document-Context
-            doc.sgb_nummer as sgb,
-            doc.title as doc_title,
+            chunk.sgb_nummer as sgb,
+            chunk.jurabk as doc_title,
             
             // Graph-Context: Verwandte Chunks
             collect(DISTINCT related_chunk.text)[0..3] as related_chunks,
@@ -207,6 +223,9 @@ def print_results(query: str, results: List[Dict], llm_response: Optional[str] =
         print(f"\n{i}. Score: {score:.4f} | SGB {sgb} {para} ({titel})")
         print(f"   {'-' * 75}")
         
+        if result.get('struktur'):
+            print(f"   📂 {' › '.join(result['struktur'])}")
+        
         # Haupt-Text
         display_text = text[:400] + "..." if len(text) > 400 else text
         print(f"   {display_text}")
@@ -5,6 +5,7 @@ GraphRAG Status Summary - Complete overview of the system
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -12,68 +13,57 @@ sys.path.append(str(Path(__file__).parent.parent))
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 
+from src.graph_statistics import graph_overview, refresh_document_counters
+
 load_dotenv()
 
 
-def print_status():
+def print_status(refresh_counters: bool = False):
     uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     username = os.getenv("NEO4J_USERNAME", "neo4j")
     password = os.getenv("NEO4J_PASSWORD")
     
     driver = GraphDatabase.driver(uri, auth=(username, password))
     
+    if refresh_counters:
+        refresh_document_counters(driver)
+    
     print("\n" + "="*70)
     print("📊 GRAPHRAG STATUS SUMMARY")
     print("="*70)
     
+    # Count Store + Import-Zähler: konstante Zeit, egal wie groß der Graph ist
+    overview = graph_overview(driver)
+    nodes = overview['nodes']
+    rels = overview['relationships']
+    
+    xml_stats = {
+        'docs': nodes['LegalDocument'],
+        'structures': nodes['StructuralUnit'],
+        'norms': nodes['LegalNorm'],
+        'chunks': rels['LegalNorm-HAS_CHUNK'],
+    }
+    pdf_stats = {
+        'docs': nodes['Document'],
+        'chunks': rels['Document-HAS_CHUNK'],
+        'paragraphs': nodes['Paragraph'],
+    }
+    
     with driver.session() as session:
-        # XML Graph stats
-        result = session.run("""
-            MATCH (doc:LegalDocument)
-            OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(struct:StructuralUnit)
-            OPTIONAL MATCH (struct)-[:CONTAINS_NORM]->(norm:LegalNorm)
-            OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-            RETURN
-              COUNT(DISTINCT doc) as docs,
-              COUNT(DISTINCT struct) as structures,
-              COUNT(DISTINCT norm) as norms,
-              COUNT(DISTINCT chunk) as chunks
-        """)
-        
-        xml_stats = result.single()
-        
-        # PDF Graph stats
-        result = session.run("""
-            MATCH (d:Document)
-            OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-            OPTIONAL MATCH (d)-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
-            RETURN
-              COUNT(DISTINCT d) as docs,
-              COUNT(DISTINCT c) as chunks,
-              COUNT(DISTINCT p) as paragraphs
-        """)
-        
-        pdf_stats = result.single()
-        
         # Check vector index
         result = session.run("""
             SHOW INDEXES
-            YIELD name, type, state
+            YIELD name, type, state, populationPercent
             WHERE name = 'chunk_embeddings' AND type = 'VECTOR'
-            RETURN state
+            RETURN state, populationPercent
         """)
         
         vector_index = result.single()
         vector_status = vector_index['state'] if vector_index else "NOT CREATED"
         
-        # Count indexed chunks
-        result = session.run("""
-            MATCH (c:Chunk)
-            WHERE c.embedding IS NOT NULL
-            RETURN COUNT(c) as count
-        """)
-        
-        indexed_chunks = result.single()['count']
+        # Indexed chunks from the index population instead of scanning all chunks
+        population = vector_index['populationPercent'] if vector_index else 0
+        indexed_chunks = int(round(nodes['Chunk'] * (population or 0) / 100))
     
     print("\n📚 XML GRAPH (Gesetze from gesetze-im-internet.de)")
     print("-" * 70)
@@ -89,6 +79,11 @@ def print_status():
             missing = xml_stats['norms'] - xml_stats['chunks']
             print(f"  ⚠️  Missing chunks:    {missing:>6}")
     
+    if overview['legal_by_sgb']:
+        print(f"\n  {'SGB':<8} {'Docs':>6} {'Norms':>8} {'Chunks':>8}")
+        for row in overview['legal_by_sgb']:
+            print(f"  {row['sgb'] or '-':<8} {row['documents']:>6} {row['norms']:>8} {row['chunks']:>8}")
+    
     print("\n📄 PDF GRAPH (Handlungsanweisungen)")
     print("-" * 70)
     print(f"  Documents:            {pdf_stats['docs']:>6}")
@@ -142,4 +137,10 @@ def print_status():
 
 
 if __name__ == "__main__":
-    print_status()
+    parser = argparse.ArgumentParser(description="GraphRAG Status Summary")
+    parser.add_argument("--refresh-counters", action="store_true",
+                        help="Per-document counters einmalig aus dem Graphen neu berechnen "
+                             "(für Graphen, die ohne Import-Zähler entstanden sind)")
+    args = parser.parse_args()
+    
+    print_status(refresh_counters=args.refresh_counters)
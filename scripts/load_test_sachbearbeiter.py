@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Load Test: Concurrent Sachbearbeiter Traffic
+============================================
+Replays a weighted mix of the 20 Sachbearbeiter use cases
+(evaluate_sachbearbeiter_use_cases.py) plus semantic queries against
+SozialrechtNeo4jRAG and reports latency histograms, error rates and
+saturation points.
+
+Arrival models:
+- closed loop: N case workers, each sends the next query when the last one
+  returned (optional --think-time)
+- open loop:   Poisson arrivals at --rate requests/s, at most --concurrency in
+  flight; latency is measured from the scheduled arrival, so queueing shows up
+
+Usage:
+    python scripts/load_test_sachbearbeiter.py --concurrency 50 --duration 60
+    python scripts/load_test_sachbearbeiter.py --mode asyncio --rate 40 --concurrency 100
+    python scripts/load_test_sachbearbeiter.py --sweep 1,5,10,25,50 --pool-size 10
+"""
+
+import sys
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from dotenv import load_dotenv
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from evaluate_sachbearbeiter_use_cases import SachbearbeiterUseCaseEvaluator
+from src.query_registry import get_query, warm_plan_cache, warm_plan_cache_async
+from src.instrumentation import format_stage_report, reset_metrics, slow_queries, stage_metrics
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RESULTS_FILE = PROJECT_ROOT / "logs" / "load_test_sachbearbeiter.json"
+
+SEMANTIC_OPERATION = "Semantic Search"
+
+# Typical free-text questions from case workers
+SEMANTIC_QUERIES = [
+    "Was ist der Regelbedarf für Alleinstehende?",
+    "Wann liegt Hilfebedürftigkeit vor?",
+    "Welche Fristen gelten für den Widerspruch?",
+    "Wie wird Einkommen aus Minijob angerechnet?",
+    "Welches Schonvermögen steht Antragstellern zu?",
+    "Mehrbedarf für Alleinerziehende mit zwei Kindern",
+    "Übernahme der Kosten der Unterkunft bei Umzug",
+    "Welche Pflichten hat der Leistungsberechtigte bei Meldeversäumnis?",
+    "Wer ist für den Antrag auf Rehabilitation zuständig?",
+    "Dürfen Sozialdaten an das Finanzamt übermittelt werden?",
+]
+
+# SGB II use cases (UC01-UC08) are the bulk of daily Jobcenter traffic
+SGB_II_WEIGHT = 2.0
+DEFAULT_WEIGHT = 1.0
+
+HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+# Semantic query text or (Cypher, parameters) of a use case
+Payload = Union[str, Tuple[str, Dict]]
+
+
+def collect_use_case_queries() -> Dict[str, Tuple[str, Dict]]:
+    """Collect name -> (Cypher, parameters) of all ucXX_* methods without touching Neo4j"""
+
+    class _QueryCollector(SachbearbeiterUseCaseEvaluator):
+        def __init__(self):
+            self.queries = {}
+
+        def evaluate_use_case(self, name: str, query_name: str, expected_min: int = 1,
+                              description: str = "", **params) -> Dict:
+            query = get_query(query_name)
+            self.queries[name] = (query.cypher, query.params(**params))
+            return {}
+
+    collector = _QueryCollector()
+    for method_name in sorted(dir(collector)):
+        if method_name.startswith('uc') and method_name[2:4].isdigit():
+            getattr(collector, method_name)()
+
+    return collector.queries
+
+
+class Workload:
+    """Weighted random mix of use-case queries and semantic searches"""
+
+    def __init__(self, use_case_queries: Dict[str, Tuple[str, Dict]], semantic_share: float, seed: int = 42):
+        self.use_case_queries = use_case_queries
+        self.semantic_share = semantic_share
+        self.names = list(use_case_queries)
+        self.weights = [
+            SGB_II_WEIGHT if name[2:4].isdigit() and int(name[2:4]) <= 8 else DEFAULT_WEIGHT
+            for name in self.names
+        ]
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> Tuple[str, Payload]:
+        """Return (operation, payload): payload is (Cypher, parameters) or the semantic query text"""
+        with self._lock:
+            if self._random.random() < self.semantic_share:
+                return SEMANTIC_OPERATION, self._random.choice(SEMANTIC_QUERIES)
+            name = self._random.choices(self.names, weights=self.weights)[0]
+            return name, self.use_case_queries[name]
+
+    def interarrival(self, rate: float) -> float:
+        """Exponential inter-arrival time for a Poisson process"""
+        with self._lock:
+            return self._random.expovariate(rate)
+
+
+class LoadRecorder:
+    """Thread-safe collection of (operation, latency, error) samples"""
+
+    def __init__(self):
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, latency: float, error: Optional[str] = None):
+        with self._lock:
+            self.samples.append((operation, latency, error))
+
+
+# === THREAD MODE (SozialrechtNeo4jRAG) ===
+
+def _execute_sync(rag, operation: str, payload: Payload):
+    if operation == SEMANTIC_OPERATION:
+        rag.hybrid_search_with_source_ranking(payload, k=5)
+    else:
+        with rag.driver.session() as session:
+            cypher, params = payload
+            list(session.run(cypher, params))
+
+
+def _timed_sync(rag, recorder: LoadRecorder, operation: str, payload: Payload, start: float):
+    try:
+        _execute_sync(rag, operation, payload)
+        recorder.record(operation, time.perf_counter() - start)
+    except Exception as e:
+        recorder.record(operation, time.perf_counter() - start, type(e).__name__)
+
+
+def run_threads(rag, workload: Workload, concurrency: int, duration: float,
+                rate: Optional[float], think_time: float) -> LoadRecorder:
+    recorder = LoadRecorder()
+    deadline = time.perf_counter() + duration
+
+    if rate is None:
+        def case_worker():
+            while time.perf_counter() < deadline:
+                operation, payload = workload.next()
+                _timed_sync(rag, recorder, operation, payload, time.perf_counter())
+                if think_time:
+                    time.sleep(think_time)
+
+        workers = [threading.Thread(target=case_worker) for _ in range(concurrency)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return recorder
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        next_arrival = time.perf_counter()
+        while next_arrival < deadline:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            operation, payload = workload.next()
+            executor.submit(_timed_sync, rag, recorder, operation, payload, next_arrival)
+            next_arrival += workload.interarrival(rate)
+
+    return recorder
+
+
+# === ASYNCIO MODE (AsyncSozialrechtNeo4jRAG) ===
+
+async def _execute_async(rag, operation: str, payload: Payload):
+    if operation == SEMANTIC_OPERATION:
+        await rag.hybrid_search_with_source_ranking(payload, k=5)
+    else:
+        async with rag.driver.session() as session:
+            cypher, params = payload
+            result = await session.run(cypher, params)
+            [record async for record in result]
+
+
+async def _timed_async(rag, recorder: LoadRecorder, operation: str, payload: Payload, start: float):
+    try:
+        await _execute_async(rag, operation, payload)
+        recorder.record(operation, time.perf_counter() - start)
+    except Exception as e:
+        recorder.record(operation, time.perf_counter() - start, type(e).__name__)
+
+
+async def run_asyncio(rag, workload: Workload, concurrency: int, duration: float,
+                      rate: Optional[float], think_time: float) -> LoadRecorder:
+    recorder = LoadRecorder()
+    deadline = time.perf_counter() + duration
+
+    if rate is None:
+        async def case_worker():
+            while time.perf_counter() < deadline:
+                operation, payload = workload.next()
+                await _timed_async(rag, recorder, operation, payload, time.perf_counter())
+                if think_time:
+                    await asyncio.sleep(think_time)
+
+        await asyncio.gather(*(case_worker() for _ in range(concurrency)))
+        return recorder
+
+    in_flight = asyncio.Semaphore(concurrency)
+
+    async def arrival(operation: str, payload: Payload, scheduled: float):
+        async with in_flight:
+            await _timed_async(rag, recorder, operation, payload, scheduled)
+
+    tasks = []
+    next_arrival = time.perf_counter()
+    while next_arrival < deadline:
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        operation, payload = workload.next()
+        tasks.append(asyncio.create_task(arrival(operation, payload, next_arrival)))
+        next_arrival += workload.interarrival(rate)
+
+    await asyncio.gather(*tasks)
+    return recorder
+
+
+# === REPORTING ===
+
+def summarize(samples: List[Tuple], wall_time: float) -> Dict:
+    """Latency percentiles, error rate and throughput for a set of samples"""
+    latencies_ms = np.array([latency for _, latency, error in samples if error is None]) * 1000
+    errors = sum(1 for _, _, error in samples if error is not None)
+
+    summary = {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'throughput_qps': round((len(samples) - errors) / wall_time, 2) if wall_time else 0.0,
+    }
+    for p in (50, 95, 99):
+        summary[f'p{p}_ms'] = round(float(np.percentile(latencies_ms, p)), 2) if len(latencies_ms) else None
+
+    return summary
+
+
+def histogram(samples: List[Tuple]) -> Dict[str, int]:
+    """Count successful requests per latency bucket"""
+    bounds = HISTOGRAM_BUCKETS_MS + [float('inf')]
+    counts = {}
+    lower = 0
+    for upper in bounds:
+        label = f"<{upper}ms" if upper != float('inf') else f">={lower}ms"
+        counts[label] = sum(1 for _, latency, error in samples
+                            if error is None and lower <= latency * 1000 < upper)
+        lower = upper
+    return counts
+
+
+def build_report(recorder: LoadRecorder, wall_time: float, embedding_stats: Dict) -> Dict:
+    by_operation = {}
+    for sample in recorder.samples:
+        by_operation.setdefault(sample[0], []).append(sample)
+
+    errors_by_type = {}
+    for _, _, error in recorder.samples:
+        if error:
+            errors_by_type[error] = errors_by_type.get(error, 0) + 1
+
+    return {
+        'overall': summarize(recorder.samples, wall_time),
+        'operations': {op: summarize(samples, wall_time) for op, samples in sorted(by_operation.items())},
+        'histogram': histogram(recorder.samples),
+        'errors_by_type': errors_by_type,
+        'embedding': {
+            **embedding_stats,
+            'texts_per_second': round(embedding_stats['texts'] / wall_time, 2) if wall_time else 0.0,
+            'avg_batch_size': round(embedding_stats['texts'] / embedding_stats['batches'], 2)
+            if embedding_stats['batches'] else 0.0,
+        },
+    }
+
+
+def _fmt_ms(value: Optional[float]) -> str:
+    return f"{value:.1f}" if value is not None else "-"
+
+
+def print_report(report: Dict):
+    overall = report['overall']
+
+    print("\n" + "="*90)
+    print("📊 LOAD TEST REPORT")
+    print("="*90)
+    print(f"\n  Requests: {overall['requests']:,}   Errors: {overall['errors']:,} "
+          f"({overall['error_rate']*100:.2f}%)   Throughput: {overall['throughput_qps']:.1f} q/s")
+    print(f"  p50: {_fmt_ms(overall['p50_ms'])}ms   p95: {_fmt_ms(overall['p95_ms'])}ms   "
+          f"p99: {_fmt_ms(overall['p99_ms'])}ms")
+
+    print(f"\n{'Operation':<44} {'Count':>7} {'Err%':>6} {'p50':>8} {'p95':>8} {'p99':>8}")
+    print("-" * 90)
+    for op, s in report['operations'].items():
+        print(f"{op[:44]:<44} {s['requests']:>7} {s['error_rate']*100:>6.1f} "
+              f"{_fmt_ms(s['p50_ms']):>8} {_fmt_ms(s['p95_ms']):>8} {_fmt_ms(s['p99_ms']):>8}")
+
+    print("\n📈 Latency histogram:")
+    peak = max(report['histogram'].values()) or 1
+    for label, count in report['histogram'].items():
+        print(f"  {label:>10} {count:>7}  {'█' * int(40 * count / peak)}")
+
+    embedding = report['embedding']
+    print(f"\n🧮 Embedding: {embedding['texts']:,} texts in {embedding['batches']:,} batches "
+          f"(avg {embedding['avg_batch_size']:.1f}/batch, {embedding['texts_per_second']:.1f} texts/s)")
+
+    print("\n⏱️  Stages:")
+    print(format_stage_report())
+    if report['slow_queries']:
+        print(f"\n🐢 Slow queries: {len(report['slow_queries'])} (see {RESULTS_FILE.name})")
+
+    if report['errors_by_type']:
+        print("\n❌ Errors:")
+        for error, count in report['errors_by_type'].items():
+            print(f"  {error}: {count}")
+
+
+def find_saturation_point(steps: List[Dict], min_gain: float = 0.1) -> Optional[Dict]:
+    """First step where throughput grows < min_gain while p95 keeps rising"""
+    for previous, current in zip(steps, steps[1:]):
+        before, after = previous['overall'], current['overall']
+        if not before['throughput_qps'] or before['p95_ms'] is None or after['p95_ms'] is None:
+            continue
+        gain = after['throughput_qps'] / before['throughput_qps'] - 1
+        if gain < min_gain and after['p95_ms'] > before['p95_ms']:
+            return previous
+    return None
+
+
+def print_sweep(steps: List[Dict], pool_size: int):
+    print("\n" + "="*90)
+    print(f"📈 SATURATION SWEEP (connection pool: {pool_size})")
+    print("="*90)
+    print(f"\n{'Concurrency':>11} {'QPS':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'Err%':>6} "
+          f"{'Sem. p95':>9} {'Emb/s':>8} {'Batch':>6}")
+    print("-" * 90)
+    for step in steps:
+        s = step['overall']
+        semantic = step['operations'].get(SEMANTIC_OPERATION, {})
+        print(f"{step['concurrency']:>11} {s['throughput_qps']:>9.1f} {_fmt_ms(s['p50_ms']):>8} "
+              f"{_fmt_ms(s['p95_ms']):>8} {_fmt_ms(s['p99_ms']):>8} {s['error_rate']*100:>6.1f} "
+              f"{_fmt_ms(semantic.get('p95_ms')):>9} {step['embedding']['texts_per_second']:>8.1f} "
+              f"{step['embedding']['avg_batch_size']:>6.1f}")
+
+    saturation = find_saturation_point(steps)
+    if not saturation:
+        print("\n✅ No saturation within the sweep")
+        return
+
+    print(f"\n⚠️  Saturation at ~{saturation['concurrency']} concurrent case workers "
+          f"({saturation['overall']['throughput_qps']:.1f} q/s)")
+    if saturation['concurrency'] >= pool_size:
+        print(f"   → Concurrency reached the connection pool ({pool_size}); try --pool-size")
+
+    batch_sizes = [step['embedding']['avg_batch_size'] for step in steps]
+    if batch_sizes[-1] > batch_sizes[0] * 2:
+        print("   → Embedding batches keep growing: model forward pass is a bottleneck")
+
+
+def _finish_step(rag, recorder: LoadRecorder, start: float, stats_before: Dict,
+                 concurrency: int, print_single: bool) -> Dict:
+    wall_time = time.perf_counter() - start
+    embedding_stats = {key: rag.embedder.stats[key] - stats_before[key] for key in stats_before}
+
+    report = build_report(recorder, wall_time, embedding_stats)
+    report['concurrency'] = concurrency
+    report['stages'] = stage_metrics()
+    report['slow_queries'] = slow_queries()
+    if print_single:
+        print_report(report)
+    return report
+
+
+def _log_step(args, concurrency: int):
+    arrival = f"open loop @ {args.rate} req/s" if args.rate else "closed loop"
+    logger.info(f"🚀 {args.mode}, {arrival}, concurrency {concurrency}, {args.duration:.0f}s")
+
+
+def run_steps_threads(args, workload: Workload, steps: List[int]) -> List[Dict]:
+    from src.sozialrecht_neo4j_rag import SozialrechtNeo4jRAG
+
+    rag = SozialrechtNeo4jRAG(max_connection_pool_size=args.pool_size)
+    reports = []
+    try:
+        warm_plan_cache(rag.driver, prefix="uc.")
+        for concurrency in steps:
+            _log_step(args, concurrency)
+            reset_metrics()
+            stats_before, start = dict(rag.embedder.stats), time.perf_counter()
+            recorder = run_threads(rag, workload, concurrency, args.duration, args.rate, args.think_time)
+            reports.append(_finish_step(rag, recorder, start, stats_before, concurrency, not args.sweep))
+    finally:
+        rag.close()
+    return reports
+
+
+async def run_steps_asyncio(args, workload: Workload, steps: List[int]) -> List[Dict]:
+    # Driver must be created and used inside the same event loop
+    from src.sozialrecht_neo4j_rag_async import AsyncSozialrechtNeo4jRAG
+
+    reports = []
+    async with AsyncSozialrechtNeo4jRAG(max_connection_pool_size=args.pool_size) as rag:
+        await warm_plan_cache_async(rag.driver, prefix="uc.")
+        for concurrency in steps:
+            _log_step(args, concurrency)
+            reset_metrics()
+            stats_before, start = dict(rag.embedder.stats), time.perf_counter()
+            recorder = await run_asyncio(rag, workload, concurrency, args.duration, args.rate, args.think_time)
+            reports.append(_finish_step(rag, recorder, start, stats_before, concurrency, not args.sweep))
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent Sachbearbeiter load test")
+    parser.add_argument("--mode", choices=["threads", "asyncio"], default="threads",
+                        help="threads = SozialrechtNeo4jRAG, asyncio = AsyncSozialrechtNeo4jRAG")
+    parser.add_argument("--concurrency", type=int, default=50,
+                        help="Case workers (closed loop) or max in-flight requests (open loop)")
+    parser.add_argument("--rate", type=float, help="Open loop: Poisson arrival rate in requests/s")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per run (default: 30)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Closed loop: pause between queries (s)")
+    parser.add_argument("--semantic-share", type=float, default=0.3,
+                        help="Share of semantic searches in the mix (default: 0.3)")
+    parser.add_argument("--pool-size", type=int, default=50, help="Neo4j connection pool size")
+    parser.add_argument("--sweep", help="Comma-separated concurrency steps, e.g. 1,5,10,25,50")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the query mix")
+
+    args = parser.parse_args()
+
+    use_case_queries = collect_use_case_queries()
+    logger.info(f"✅ Loaded {len(use_case_queries)} use cases + {len(SEMANTIC_QUERIES)} semantic queries")
+    workload = Workload(use_case_queries, args.semantic_share, args.seed)
+
+    steps = [int(c) for c in args.sweep.split(',')] if args.sweep else [args.concurrency]
+
+    if args.mode == "asyncio":
+        reports = asyncio.run(run_steps_asyncio(args, workload, steps))
+    else:
+        reports = run_steps_threads(args, workload, steps)
+
+    if args.sweep:
+        print_sweep(reports, args.pool_size)
+
+    RESULTS_FILE.parent.mkdir(exist_ok=True)
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump({
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'config': vars(args),
+            'runs': reports
+        }, f, indent=2, ensure_ascii=False)
+
+    print(f"\n📊 Results saved to: {RESULTS_FILE}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,10 @@
 """
 Optimize Graph Relations and Structure
 Apply identified optimizations to improve query performance
+
+LegalKnowledgeGraphBuilder maintains the direct Document→Norm/Chunk edges and
+the Chunk retrieval projection at import time; this script backfills graphs
+that were imported before.
 """
 
 import sys
@@ -14,6 +18,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 
+from src.graphrag_legal_extractor import chunk_id_for
+
 load_dotenv()
 
 
@@ -180,6 +186,121 @@ class GraphOptimizer:
             "Fast sorting: Order relationships without loading node properties"
         )
     
+    def optimize_9_backfill_chunk_projection(self):
+        """Copy the retrieval projection onto chunks imported before the builder wrote it"""
+        query = """
+        MATCH (doc:LegalDocument)-[:CONTAINS_NORM]->(norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
+        WHERE chunk.norm_id IS NULL
+        WITH doc, norm, chunk
+        LIMIT 10000
+        OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(struct:StructuralUnit)-[:CONTAINS_NORM]->(norm)
+        OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(parent:StructuralUnit)
+        WHERE struct.gliederungskennzahl STARTS WITH parent.gliederungskennzahl
+        WITH doc, norm, chunk, parent
+        ORDER BY size(parent.gliederungskennzahl)
+        WITH doc, norm, chunk,
+             [p IN collect(DISTINCT parent) |
+                 trim(coalesce(p.gliederungsbez, '') + ' ' + coalesce(p.gliederungstitel, ''))] as path
+        SET chunk.doc_id = doc.id,
+            chunk.norm_id = norm.id,
+            chunk.sgb_nummer = doc.sgb_nummer,
+            chunk.jurabk = doc.jurabk,
+            chunk.document_type = doc.source_type,
+            chunk.trust_score = doc.trust_score,
+            chunk.paragraph_nummer = norm.paragraph_nummer,
+            chunk.enbez = norm.enbez,
+            chunk.norm_titel = norm.titel,
+            chunk.structure_path = path
+        RETURN count(*) as added
+        """
+        
+        print(f"\n9. Backfill Chunk Retrieval Projection (Batched)")
+        print("-" * 70)
+        
+        total_added = 0
+        batch_num = 0
+        
+        with self.driver.session() as session:
+            for index_query in [
+                "CREATE INDEX IF NOT EXISTS FOR (c:Chunk) ON (c.sgb_nummer)",
+                "CREATE INDEX IF NOT EXISTS FOR (c:Chunk) ON (c.norm_id)",
+            ]:
+                session.run(index_query).consume()
+            
+            self._backfill_chunk_ids(session)
+            
+            while True:
+                count = session.run(query).single()['added']
+                
+                if count == 0:
+                    break
+                
+                batch_num += 1
+                total_added += count
+                print(f"   Batch {batch_num}: +{count:,} chunks (total: {total_added:,})")
+                
+                if batch_num > 100:  # Safety limit
+                    print("   ⚠️  Reached batch limit, stopping")
+                    break
+        
+        if total_added > 0:
+            print(f"   ✅ Total projected: {total_added:,} chunks")
+        else:
+            print(f"   ✅ All chunks already carry the projection")
+        return True
+    
+    def _backfill_chunk_ids(self, session):
+        """Give legacy chunks the builder's chunk_id so the next import MERGEs instead of duplicating
+
+        sha256 gibt es in Cypher nicht (ohne APOC), daher wird chunk_id_for
+        batchweise in Python berechnet. Doppelte Legacy-Chunks derselben
+        (Norm, chunk_index) und solche, deren chunk_id schon existiert,
+        werden gelöscht.
+        """
+        fetch_query = """
+        MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
+        WHERE chunk.chunk_id IS NULL
+        RETURN elementId(chunk) as element_id, norm.id as norm_id, chunk.chunk_index as chunk_index
+        LIMIT 10000
+        """
+        write_query = """
+        UNWIND $rows AS row
+        MATCH (chunk:Chunk) WHERE elementId(chunk) = row.element_id
+        OPTIONAL MATCH (existing:Chunk {chunk_id: row.chunk_id})
+        FOREACH (_ IN CASE WHEN existing IS NULL THEN [1] ELSE [] END |
+            SET chunk.chunk_id = row.chunk_id)
+        FOREACH (_ IN CASE WHEN existing IS NOT NULL THEN [1] ELSE [] END |
+            DETACH DELETE chunk)
+        """
+        
+        assigned = deleted = 0
+        while True:
+            records = list(session.run(fetch_query))
+            if not records:
+                break
+            
+            rows, duplicates, seen = [], [], set()
+            for record in records:
+                chunk_id = chunk_id_for(record['norm_id'], record['chunk_index'] or 0)
+                if chunk_id in seen:
+                    duplicates.append(record['element_id'])
+                    continue
+                seen.add(chunk_id)
+                rows.append({'element_id': record['element_id'], 'chunk_id': chunk_id})
+            
+            counters = session.run(write_query, rows=rows).consume().counters
+            session.run("""
+            UNWIND $ids AS element_id
+            MATCH (chunk:Chunk) WHERE elementId(chunk) = element_id
+            DETACH DELETE chunk
+            """, ids=duplicates).consume()
+            
+            deleted += counters.nodes_deleted + len(duplicates)
+            assigned += len(rows) - counters.nodes_deleted
+        
+        if assigned or deleted:
+            print(f"   🔑 chunk_id: {assigned:,} assigned, {deleted:,} duplicate legacy chunks deleted")
+    
     def optimize_8_fix_orphaned_norms(self):
         """Connect orphaned LegalNorms to their documents"""
         print(f"\n8. Fix Orphaned LegalNorms")
@@ -263,6 +384,7 @@ def main():
         optimizer.optimize_5_document_direct_to_chunk()
         optimizer.optimize_6_add_document_to_chunk_batch()
         optimizer.optimize_7_add_relationship_properties()
+        optimizer.optimize_9_backfill_chunk_projection()
         
         print("\n\n🔍 QUALITY CHECKS")
         print("="*70)
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Cypher Plan Profiler & Regression Check
+=======================================
+Runs every query of the repo's query library under PROFILE (read queries) or
+EXPLAIN (write queries) and records operator tree, db hits and rows:
+
+- cypher/*.cypher (statements separated by ';')
+- src/query_registry.py (RAG, UC01-UC20 and use-case validation queries,
+  also exported to cypher/use_cases/) with their default parameters
+- Use-case queries in scripts/test_graphrag_efficiency.py
+
+Flagged plan patterns:
+- label_scan:     NodeByLabelScan / AllNodesScan
+- missing_index:  label scan directly filtered on a property of that label
+- cartesian:      CartesianProduct
+- eager:          Eager operator (materialises all rows)
+
+Results go to logs/cypher_plan_report.json. Compared against
+logs/cypher_plan_baseline.json the run fails (exit code 1) if a query gains a
+new flag, its db hits grow by more than --threshold, it errors after having
+planned in the baseline, or it has no baseline. The baseline is only written
+with --save-baseline; with --filter/--source only those queries are replaced.
+
+Usage:
+    python scripts/profile_cypher_plans.py --save-baseline
+    python scripts/profile_cypher_plans.py --save-baseline --filter UC19
+    python scripts/profile_cypher_plans.py --threshold 0.5
+    python scripts/profile_cypher_plans.py --source registry --explain-only
+"""
+
+import sys
+import os
+import re
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from neo4j import GraphDatabase
+from dotenv import load_dotenv
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.query_registry import queries_with_prefix
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CYPHER_DIR = PROJECT_ROOT / "cypher"
+RESULTS_FILE = PROJECT_ROOT / "logs" / "cypher_plan_report.json"
+BASELINE_FILE = PROJECT_ROOT / "logs" / "cypher_plan_baseline.json"
+
+SOURCES = ("cypher", "registry", "efficiency")
+
+EMBEDDING_DIMENSIONS = 768
+
+LABEL_SCAN_OPERATORS = {"NodeByLabelScan", "AllNodesScan"}
+SCHEMA_STATEMENT = re.compile(r"^\s*(CREATE|DROP)\s+(CONSTRAINT|INDEX|VECTOR\s+INDEX|FULLTEXT\s+INDEX)", re.I)
+WRITE_CLAUSE = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE)\b", re.I)
+PARAMETER = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _strip_comments(text: str) -> str:
+    """Remove /* */ blocks, full-line // comments and Browser commands (:param)"""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    return "\n".join(line for line in text.splitlines()
+                     if not line.strip().startswith(("//", ":")))
+
+
+def _statement_title(block: str) -> Optional[str]:
+    """Last '// <title>' comment in front of a statement, skipping '// ====' rulers"""
+    titles = [line.strip()[2:].strip() for line in block.splitlines()
+              if line.strip().startswith("//") and not line.strip().lstrip("/ ").startswith("=")]
+    return titles[-1] if titles else None
+
+
+def load_cypher_file_queries(path: Path) -> List[Tuple[str, str, Optional[Dict]]]:
+    """Split a .cypher file into (name, statement, None) triples"""
+    text = path.read_text(encoding="utf-8")
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+
+    queries = []
+    for i, block in enumerate(text.split(";"), start=1):
+        statement = _strip_comments(block).strip()
+        if not statement:
+            continue
+        title = _statement_title(block) or f"#{i}"
+        queries.append((f"{path.relative_to(PROJECT_ROOT)}: {title}", statement, None))
+    return queries
+
+
+def collect_queries(sources: List[str]) -> List[Tuple[str, str, Optional[Dict]]]:
+    """(name, cypher, parameters or None) for every query of the selected sources"""
+    queries = []
+
+    if "cypher" in sources:
+        for path in sorted(CYPHER_DIR.glob("*.cypher")):
+            queries.extend(load_cypher_file_queries(path))
+
+    if "registry" in sources:
+        for query in queries_with_prefix():
+            queries.append((f"registry: {query.name}", query.cypher.strip(), query.defaults))
+
+    if "efficiency" in sources:
+        import test_graphrag_efficiency as efficiency
+
+        for constant in ("REGELBEDARF_QUERY", "LEISTUNGSBERECHTIGUNG_QUERY", "SEMANTIC_SEARCH_QUERY",
+                         "ANTRAGSPRUEFUNG_QUERY", "CROSS_SGB_QUERY"):
+            queries.append((f"efficiency: {constant}", getattr(efficiency, constant).strip(), None))
+
+    return queries
+
+
+def _embedding_parameter() -> List[float]:
+    """Deterministic unit vector so vector-index plans are stable between runs"""
+    rng = random.Random(42)
+    vector = [rng.gauss(0, 1) for _ in range(EMBEDDING_DIMENSIONS)]
+    norm = sum(v * v for v in vector) ** 0.5
+    return [v / norm for v in vector]
+
+
+def build_parameters(cypher: str) -> Tuple[Dict, List[str]]:
+    """Parameters we can fill in (embeddings) and the names we cannot"""
+    params, missing = {}, []
+    for name in sorted(set(PARAMETER.findall(cypher))):
+        if "embedding" in name:
+            params[name] = _embedding_parameter()
+        else:
+            missing.append(name)
+    return params, missing
+
+
+def _operator_name(operator: Dict) -> str:
+    return operator.get('operatorType', '?').split('@')[0]
+
+
+def _details(operator: Dict) -> str:
+    # Plan-Dicts des Python-Treibers: {'operatorType', 'identifiers', 'args', 'children', ...}
+    arguments = operator.get('args', {})
+    return str(arguments.get('Details', arguments.get('details', '')))
+
+
+def analyze_plan(plan: Dict) -> Dict:
+    """Flatten the operator tree and detect problematic operators
+
+    Returns:
+        Dict with operators (one line per operator), db_hits, rows and flags
+    """
+    operators, flags = [], []
+    db_hits = 0
+
+    def walk(operator: Dict, depth: int):
+        nonlocal db_hits
+        name = _operator_name(operator)
+        details = _details(operator)
+        db_hits += operator.get('dbHits', 0) or 0
+
+        line = f"{'  ' * depth}{name}"
+        if details:
+            line += f" [{details}]"
+        if 'rows' in operator:
+            line += f" rows={operator.get('rows')} dbHits={operator.get('dbHits')}"
+        operators.append(line)
+
+        if name in LABEL_SCAN_OPERATORS:
+            flags.append(f"label_scan: {details or name}")
+        elif name == "CartesianProduct":
+            flags.append("cartesian: CartesianProduct")
+        elif name == "Eager":
+            flags.append("eager: Eager")
+
+        children = operator.get('children', [])
+        if name == "Filter":
+            flags.extend(_missing_index_flags(details, children))
+
+        for child in children:
+            walk(child, depth + 1)
+
+    walk(plan, 0)
+
+    return {
+        'operators': operators,
+        'db_hits': db_hits,
+        'rows': plan.get('rows'),
+        'flags': sorted(set(flags)),
+    }
+
+
+def _missing_index_flags(filter_details: str, children: List[Dict]) -> List[str]:
+    """Filter on `var.prop` directly above a label scan of `var:Label`"""
+    flags = []
+    for child in children:
+        if _operator_name(child) != "NodeByLabelScan":
+            continue
+        match = re.match(r"(\w+):(\w+)", _details(child))
+        if not match:
+            continue
+        variable, label = match.groups()
+        for prop in sorted(set(re.findall(rf"\b{variable}\.(\w+)\b", filter_details))):
+            flags.append(f"missing_index: :{label}({prop})")
+    return flags
+
+
+class CypherPlanProfiler:
+    """Captures PROFILE / EXPLAIN plans for the query library"""
+
+    def __init__(self, explain_only: bool = False):
+        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        username = os.getenv("NEO4J_USERNAME", "neo4j")
+        password = os.getenv("NEO4J_PASSWORD")
+
+        if not password:
+            raise ValueError("❌ NEO4J_PASSWORD not set in .env")
+
+        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.explain_only = explain_only
+
+    def close(self):
+        self.driver.close()
+
+    def profile_query(self, cypher: str, params: Optional[Dict] = None) -> Dict:
+        """PROFILE read queries, EXPLAIN write queries and queries with unknown parameters
+
+        Args:
+            cypher: Query text
+            params: Known parameters (registry defaults); otherwise guessed
+        """
+        if SCHEMA_STATEMENT.match(cypher):
+            return {'mode': 'skipped', 'reason': 'schema statement'}
+
+        if params is None:
+            params, missing = build_parameters(cypher)
+        else:
+            missing = []
+        explain = self.explain_only or bool(missing) or bool(WRITE_CLAUSE.search(cypher))
+        mode = "EXPLAIN" if explain else "PROFILE"
+
+        start = time.perf_counter()
+        with self.driver.session() as session:
+            summary = session.run(f"{mode} {cypher}", params).consume()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        plan = summary.profile if mode == "PROFILE" else summary.plan
+        if not plan:
+            return {'mode': mode, 'reason': 'no plan returned'}
+
+        result = analyze_plan(plan)
+        result['mode'] = mode
+        result['elapsed_ms'] = round(elapsed_ms, 2)
+        if missing:
+            result['missing_parameters'] = missing
+        return result
+
+    def run(self, queries: List[Tuple[str, str, Optional[Dict]]]) -> Dict[str, Dict]:
+        results = {}
+        for name, cypher, params in queries:
+            try:
+                results[name] = self.profile_query(cypher, params)
+            except Exception as e:
+                logger.warning(f"  ⚠️  {name} failed: {e}")
+                results[name] = {'mode': 'error', 'error': str(e)}
+        return results
+
+
+def _plan_shape(operators: List[str]) -> List[str]:
+    """Operator lines without rows/dbHits, which change with the data"""
+    return [operator.split(" rows=")[0] for operator in operators]
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                        threshold: float) -> Tuple[List[str], List[str]]:
+    """Regressions (new flags, db hit growth, new errors, no baseline) and plan changes (operator tree differs)"""
+    regressions, changes = [], []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            regressions.append(f"{name}: no baseline (run with --save-baseline --filter ...)")
+            continue
+        if result['mode'] == 'error' and before['mode'] != 'error':
+            regressions.append(f"{name}: {before['mode']} → error ({result['error'][:80]})")
+            continue
+        if 'operators' not in before or 'operators' not in result:
+            continue
+
+        for flag in sorted(set(result['flags']) - set(before['flags'])):
+            regressions.append(f"{name}: new {flag}")
+
+        if result['mode'] == before['mode'] == "PROFILE" and before['db_hits'] > 0:
+            growth = result['db_hits'] / before['db_hits'] - 1
+            if growth > threshold:
+                regressions.append(f"{name}: dbHits {before['db_hits']:,} → {result['db_hits']:,} "
+                                   f"(+{growth * 100:.0f}%)")
+
+        if _plan_shape(result['operators']) != _plan_shape(before['operators']):
+            changes.append(name)
+    return regressions, changes
+
+
+def print_report(results: Dict[str, Dict]):
+    print("\n" + "="*100)
+    print("🔍 CYPHER PLAN REPORT")
+    print("="*100)
+    print(f"\n{'Query':<62} {'Mode':<8} {'dbHits':>10} {'Rows':>7}  Flags")
+    print("-" * 100)
+
+    for name, r in results.items():
+        db_hits = f"{r['db_hits']:,}" if r.get('mode') == "PROFILE" else "-"
+        rows = r.get('rows') if r.get('mode') == "PROFILE" else "-"
+        flags = ", ".join(flag.split(":")[0] for flag in r.get('flags', [])) or r.get('error', r.get('reason', ''))
+        print(f"{name[:62]:<62} {r['mode']:<8} {db_hits:>10} {str(rows):>7}  {flags[:40]}")
+
+    print("-" * 100)
+
+    flagged = {name: r['flags'] for name, r in results.items() if r.get('flags')}
+    if flagged:
+        print("\n⚠️  Flagged plans:")
+        for name, flags in flagged.items():
+            print(f"  {name}")
+            for flag in flags:
+                print(f"     - {flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the Cypher query library and check for plan regressions")
+    parser.add_argument("--source", action="append", choices=SOURCES, help="Only this query source; repeatable")
+    parser.add_argument("--filter", help="Only queries whose name contains this text")
+    parser.add_argument("--explain-only", action="store_true", help="Never execute queries (EXPLAIN instead of PROFILE)")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store the profiled queries in the baseline (other queries are kept)")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="Allowed dbHits growth vs. baseline (0.5 = 50%%)")
+    parser.add_argument("--list", action="store_true", help="Only list the collected queries")
+
+    args = parser.parse_args()
+
+    queries = collect_queries(args.source or list(SOURCES))
+    if args.filter:
+        queries = [query for query in queries if args.filter in query[0]]
+
+    if args.list:
+        for name, _, _ in queries:
+            print(name)
+        return 0
+
+    logger.info(f"🔍 Profiling {len(queries)} queries")
+
+    baseline_file = Path(args.baseline)
+    baseline = None
+    if baseline_file.exists():
+        with open(baseline_file) as f:
+            baseline = json.load(f)['queries']
+    elif not args.save_baseline:
+        print(f"❌ No baseline at {baseline_file} - run with --save-baseline first")
+        return 1
+
+    profiler = CypherPlanProfiler(explain_only=args.explain_only)
+    try:
+        results = profiler.run(queries)
+    finally:
+        profiler.close()
+
+    print_report(results)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'queries': results
+    }
+
+    RESULTS_FILE.parent.mkdir(exist_ok=True)
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n📊 Results saved to: {RESULTS_FILE}")
+
+    if args.save_baseline:
+        # Nur die profilierten Queries ersetzen, --filter/--source darf die Baseline nicht kürzen
+        baseline_report = dict(report, queries={**(baseline or {}), **results})
+        baseline_file.parent.mkdir(exist_ok=True)
+        with open(baseline_file, 'w') as f:
+            json.dump(baseline_report, f, indent=2, ensure_ascii=False)
+        print(f"📌 Baseline updated for {len(results)} queries: {baseline_file}")
+        return 0
+
+    regressions, changes = compare_to_baseline(results, baseline, args.threshold)
+
+    if changes:
+        print(f"\n🔀 Plan changed ({len(changes)}):")
+        for name in changes:
+            print(f"   - {name}")
+    if regressions:
+        print("\n❌ Plan regressions:")
+        for message in regressions:
+            print(f"   - {message}")
+        return 1
+
+    print("\n✅ No plan regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,11 @@ import sys
 import os
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from neo4j import GraphDatabase
-from xml_legal_parser import LegalXMLParser
-from graphrag_legal_extractor import LegalKnowledgeGraphBuilder
+from src.xml_legal_parser import LegalXMLParser
+from src.graphrag_legal_extractor import LegalKnowledgeGraphBuilder
 from dotenv import load_dotenv
 import logging
 
@@ -92,24 +92,10 @@ class GraphRAGReimporter:
         document = parser.parse_dokument(xml_file)
         logger.info(f"  ✅ Parsed: {document.jurabk} ({len(document.norms)} norms)")
         
-        # Delete existing data for this SGB
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (doc:LegalDocument {sgb_nummer: $sgb})
-                OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(struct:StructuralUnit)
-                                    -[:CONTAINS_NORM]->(norm:LegalNorm)
-                OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
-                OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                DETACH DELETE doc, struct, norm, text, chunk
-                RETURN count(*) as deleted
-            """, sgb=sgb_name)
-            deleted = result.single()['deleted']
-            logger.info(f"  🗑️  Deleted {deleted} existing nodes for SGB {sgb_name}")
-        
-        # Build knowledge graph with chunks
+        # Re-import keeps LegalNorm/NormVersion history, replaces the rest
         logger.info("  🔨 Building knowledge graph with embeddings...")
         kg_builder = LegalKnowledgeGraphBuilder(self.driver)
-        kg_builder.build_from_xml(document)
+        kg_builder.rebuild_from_xml(document)
         
         logger.info(f"  ✅ SGB {sgb_name} imported successfully!")
         return True
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test EmbeddingMicroBatcher: abgebrochene Aufrufer dürfen den Worker nicht beenden
+
+Prüft:
+1. Ein asyncio-Aufrufer wird abgebrochen, während seine Anfrage noch wartet
+2. Der Worker-Thread lebt danach weiter
+3. Eine zweite Anfrage wird weiterhin beantwortet
+
+Läuft ohne Modell und ohne Neo4j (Dummy-Modell):
+    python scripts/test_embedding_batcher.py
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.embedding_batcher import EmbeddingMicroBatcher
+
+
+class BlockingModel:
+    """Dummy-Modell: der erste encode()-Aufruf wartet, bis release gesetzt ist"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def encode(self, texts, show_progress_bar=False):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_cancelled_caller_keeps_worker_alive():
+    model = BlockingModel()
+    batcher = EmbeddingMicroBatcher(model, max_batch_size=1, max_wait_ms=0)
+
+    async def scenario():
+        # Worker hängt im ersten Batch, die zweite Anfrage wartet in der Queue
+        first = asyncio.wrap_future(batcher.submit(["erste"]))
+        await asyncio.get_running_loop().run_in_executor(None, model.started.wait, 5)
+
+        request = batcher.submit(["abgebrochen"])
+        cancelled = asyncio.ensure_future(asyncio.wrap_future(request))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        try:
+            await cancelled
+        except asyncio.CancelledError:
+            pass
+        # wrap_future reicht den Abbruch per call_soon an das concurrent Future weiter
+        await asyncio.sleep(0)
+        assert request.cancelled()
+
+        model.release.set()
+        return await first
+
+    try:
+        assert asyncio.run(scenario()) == [[5.0, 1.0]]
+
+        # Zweite Anfrage nach dem Abbruch muss durchlaufen
+        assert batcher.submit(["danach"]).result(timeout=5) == [[6.0, 1.0]]
+        assert batcher._worker.is_alive()
+    finally:
+        model.release.set()
+        batcher.close()
+
+
+if __name__ == "__main__":
+    test_cancelled_caller_keeps_worker_alive()
+    print("✅ Abgebrochener Aufrufer: Worker lebt, Folgeanfrage beantwortet")
@@ -25,6 +25,100 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+# Use-case queries (shared with scripts/benchmark_graphrag_latency.py)
+# Test 2: § 20 SGB II Direct Lookup
+REGELBEDARF_QUERY = """
+    MATCH (doc:LegalDocument {sgb_nummer: "II"})
+    -[:HAS_STRUCTURE]->(struct:StructuralUnit)
+    -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer = "20"
+    
+    MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    
+    RETURN 
+      doc.jurabk as gesetz,
+      struct.gliederungsbez as kapitel,
+      norm.enbez as paragraph,
+      norm.titel as titel,
+      COLLECT(DISTINCT text.text)[0..3] as first_texts,
+      COUNT(DISTINCT chunk) as chunk_count
+"""
+
+# Test 3: §§ 7-9 SGB II Batch Lookup
+LEISTUNGSBERECHTIGUNG_QUERY = """
+    MATCH (doc:LegalDocument {sgb_nummer: "II"})
+    -[:HAS_STRUCTURE]->(struct:StructuralUnit)
+    -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN ["7", "8", "9"]
+    
+    MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
+    
+    RETURN 
+      norm.paragraph_nummer as paragraph_nr,
+      norm.enbez as paragraph,
+      norm.titel as titel,
+      COUNT(text) as text_units
+    ORDER BY norm.paragraph_nummer
+"""
+
+# Test 4: Vector search (needs $embedding)
+SEMANTIC_SEARCH_QUERY = """
+    CALL db.index.vector.queryNodes('chunk_embeddings', 5, $embedding)
+    YIELD node as chunk, score
+    WHERE chunk.norm_id IS NOT NULL
+    
+    // Kontext aus der Retrieval-Projektion am Chunk, ohne Traversal
+    RETURN 
+      score as relevance,
+      chunk.sgb_nummer as sgb,
+      chunk.enbez as paragraph,
+      chunk.norm_titel as titel,
+      SUBSTRING(chunk.text, 0, 150) as text_preview
+    ORDER BY score DESC
+"""
+
+# Test 5: Antragsprüfung Workflow
+ANTRAGSPRUEFUNG_QUERY = """
+    MATCH (doc:LegalDocument {sgb_nummer: "II"})
+    -[:HAS_STRUCTURE]->()-[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN [
+      "7",   // Leistungsberechtigte
+      "8",   // Erwerbsfähigkeit
+      "9",   // Hilfebedürftigkeit
+      "11",  // Einkommen
+      "12",  // Vermögen
+      "20",  // Regelbedarf
+      "21",  // Mehrbedarf
+      "22"   // Kosten der Unterkunft
+    ]
+    
+    RETURN 
+      norm.paragraph_nummer as step,
+      norm.enbez as paragraph,
+      norm.titel as check_point
+    ORDER BY step
+"""
+
+# Test 6: Cross-SGB income analysis
+CROSS_SGB_QUERY = """
+    MATCH (chunk:Chunk {sgb_nummer: "II", paragraph_nummer: "11"})
+    WITH chunk.embedding as query_embedding
+    LIMIT 1
+    
+    CALL db.index.vector.queryNodes('chunk_embeddings', 5, query_embedding)
+    YIELD node as similar_chunk, score
+    WHERE similar_chunk.sgb_nummer <> "II"
+    
+    RETURN 
+      score as similarity,
+      similar_chunk.sgb_nummer as other_sgb,
+      similar_chunk.enbez as paragraph,
+      similar_chunk.norm_titel as titel
+    ORDER BY score DESC
+"""
+
+
 class GraphRAGEfficiencyTester:
     """Test GraphRAG efficiency with realistic use cases"""
     
@@ -73,15 +167,17 @@ class GraphRAGEfficiencyTester:
         logger.info("TEST 1: Graph Statistics (Overall Health Check)")
         logger.info("="*60)
         
+        # Count-Store-Zählungen (konstante Zeit), Embedding-Dimension aus einem Chunk
         query = """
-        MATCH (d:Document)
-        OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-        OPTIONAL MATCH (d)-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
-        RETURN
-          COUNT(DISTINCT d) as documents,
-          COUNT(DISTINCT c) as chunks,
-          COUNT(DISTINCT p) as paragraphs,
-          CASE WHEN COUNT(c) > 0 THEN AVG(SIZE(c.embedding)) ELSE 0 END as avg_embedding_dim
+        CALL { MATCH (d:Document) RETURN count(d) as documents }
+        CALL { MATCH (:Document)-[r:HAS_CHUNK]->() RETURN count(r) as chunks }
+        CALL { MATCH (p:Paragraph) RETURN count(p) as paragraphs }
+        CALL {
+          OPTIONAL MATCH (:Document)-[:HAS_CHUNK]->(c:Chunk)
+          RETURN coalesce(size(c.embedding), 0) as embedding_dim
+          LIMIT 1
+        }
+        RETURN documents, chunks, paragraphs, embedding_dim
         """
         
         elapsed, records = self.run_timed_query("Graph Statistics", query)
@@ -91,7 +187,7 @@ class GraphRAGEfficiencyTester:
             logger.info(f"  Documents: {r['documents']}")
             logger.info(f"  Chunks: {r['chunks']}")
             logger.info(f"  Paragraphs: {r['paragraphs']}")
-            logger.info(f"  Embedding Dimension: {r['avg_embedding_dim']}")
+            logger.info(f"  Embedding Dimension: {r['embedding_dim']}")
             logger.info(f"  ⏱️  Time: {elapsed*1000:.2f}ms")
     
     def test_xml_graph_statistics(self):
@@ -100,17 +196,18 @@ class GraphRAGEfficiencyTester:
         logger.info("TEST 1b: XML Legal Graph Statistics")
         logger.info("="*60)
         
+        # Count-Store-Zählungen (konstante Zeit), Embedding-Dimension aus einem Chunk
         query = """
-        MATCH (doc:LegalDocument)
-        OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(struct:StructuralUnit)
-        OPTIONAL MATCH (struct)-[:CONTAINS_NORM]->(norm:LegalNorm)
-        OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-        RETURN
-          COUNT(DISTINCT doc) as legal_documents,
-          COUNT(DISTINCT struct) as structures,
-          COUNT(DISTINCT norm) as legal_norms,
-          COUNT(DISTINCT chunk) as chunks,
-          CASE WHEN COUNT(chunk) > 0 THEN AVG(SIZE(chunk.embedding)) ELSE 0 END as avg_embedding_dim
+        CALL { MATCH (d:LegalDocument) RETURN count(d) as legal_documents }
+        CALL { MATCH (s:StructuralUnit) RETURN count(s) as structures }
+        CALL { MATCH (n:LegalNorm) RETURN count(n) as legal_norms }
+        CALL { MATCH (:LegalNorm)-[r:HAS_CHUNK]->() RETURN count(r) as chunks }
+        CALL {
+          OPTIONAL MATCH (:LegalNorm)-[:HAS_CHUNK]->(c:Chunk)
+          RETURN coalesce(size(c.embedding), 0) as embedding_dim
+          LIMIT 1
+        }
+        RETURN legal_documents, structures, legal_norms, chunks, embedding_dim
         """
         
         elapsed, records = self.run_timed_query("XML Graph Statistics", query)
@@ -121,7 +218,7 @@ class GraphRAGEfficiencyTester:
             logger.info(f"  Structures: {r['structures']}")
             logger.info(f"  Legal Norms: {r['legal_norms']}")
             logger.info(f"  Chunks: {r['chunks']}")
-            logger.info(f"  Embedding Dimension: {r['avg_embedding_dim']}")
+            logger.info(f"  Embedding Dimension: {r['embedding_dim']}")
             logger.info(f"  ⏱️  Time: {elapsed*1000:.2f}ms")
     
     def test_use_case_regelbedarf(self):
@@ -131,23 +228,7 @@ class GraphRAGEfficiencyTester:
         logger.info("="*60)
         
         # Test with XML schema
-        query = """
-        MATCH (doc:LegalDocument {sgb_nummer: "II"})
-        -[:HAS_STRUCTURE]->(struct:StructuralUnit)
-        -[:CONTAINS_NORM]->(norm:LegalNorm)
-        WHERE norm.paragraph_nummer = "20"
-        
-        MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
-        OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-        
-        RETURN 
-          doc.jurabk as gesetz,
-          struct.gliederungsbez as kapitel,
-          norm.enbez as paragraph,
-          norm.titel as titel,
-          COLLECT(DISTINCT text.text)[0..3] as first_texts,
-          COUNT(DISTINCT chunk) as chunk_count
-        """
+        query = REGELBEDARF_QUERY
         
         elapsed, records = self.run_timed_query("§20 SGB II Direct Lookup", query)
         
@@ -168,21 +249,7 @@ class GraphRAGEfficiencyTester:
         logger.info("TEST 3: Use Case - Leistungsberechtigung §§ 7-9 SGB II")
         logger.info("="*60)
         
-        query = """
-        MATCH (doc:LegalDocument {sgb_nummer: "II"})
-        -[:HAS_STRUCTURE]->(struct:StructuralUnit)
-        -[:CONTAINS_NORM]->(norm:LegalNorm)
-        WHERE norm.paragraph_nummer IN ["7", "8", "9"]
-        
-        MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
-        
-        RETURN 
-          norm.paragraph_nummer as paragraph_nr,
-          norm.enbez as paragraph,
-          norm.titel as titel,
-          COUNT(text) as text_units
-        ORDER BY norm.paragraph_nummer
-        """
+        query = LEISTUNGSBERECHTIGUNG_QUERY
         
         elapsed, records = self.run_timed_query("§§7-9 SGB II Batch Lookup", query)
         
@@ -228,21 +295,7 @@ class GraphRAGEfficiencyTester:
         logger.info(f"  ✅ Vector index found: {indexes[0]['name']}")
         
         # Semantic search
-        query = """
-        CALL db.index.vector.queryNodes('chunk_embeddings', 5, $embedding)
-        YIELD node as chunk, score
-        
-        MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk)
-        MATCH (doc:LegalDocument)-[:HAS_STRUCTURE]->()-[:CONTAINS_NORM]->(norm)
-        
-        RETURN 
-          score as relevance,
-          doc.sgb_nummer as sgb,
-          norm.enbez as paragraph,
-          norm.titel as titel,
-          SUBSTRING(chunk.text, 0, 150) as text_preview
-        ORDER BY score DESC
-        """
+        query = SEMANTIC_SEARCH_QUERY
         
         elapsed, records = self.run_timed_query("Semantic Search 'Regelbedarfe'", query, {'embedding': embedding})
         
@@ -259,26 +312,7 @@ class GraphRAGEfficiencyTester:
         logger.info("TEST 5: Complete Antragsprüfung Workflow")
         logger.info("="*60)
         
-        query = """
-        MATCH (doc:LegalDocument {sgb_nummer: "II"})
-        -[:HAS_STRUCTURE]->()-[:CONTAINS_NORM]->(norm:LegalNorm)
-        WHERE norm.paragraph_nummer IN [
-          "7",   // Leistungsberechtigte
-          "8",   // Erwerbsfähigkeit
-          "9",   // Hilfebedürftigkeit
-          "11",  // Einkommen
-          "12",  // Vermögen
-          "20",  // Regelbedarf
-          "21",  // Mehrbedarf
-          "22"   // Kosten der Unterkunft
-        ]
-        
-        RETURN 
-          norm.paragraph_nummer as step,
-          norm.enbez as paragraph,
-          norm.titel as check_point
-        ORDER BY step
-        """
+        query = ANTRAGSPRUEFUNG_QUERY
         
         elapsed, records = self.run_timed_query("Antragsprüfung Workflow", query)
         
@@ -293,33 +327,7 @@ class GraphRAGEfficiencyTester:
         logger.info("TEST 6: Cross-SGB Analysis - Income regulations")
         logger.info("="*60)
         
-        query = """
-        MATCH (norm:LegalNorm)
-        WHERE norm.paragraph_nummer = "11" 
-          AND EXISTS {
-            MATCH (norm)<-[:CONTAINS_NORM]-()<-[:HAS_STRUCTURE]-
-                  (doc:LegalDocument {sgb_nummer: "II"})
-          }
-        
-        MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-        WITH chunk.embedding as query_embedding
-        LIMIT 1
-        
-        CALL db.index.vector.queryNodes('chunk_embeddings', 5, query_embedding)
-        YIELD node as similar_chunk, score
-        
-        MATCH (related_norm:LegalNorm)-[:HAS_CHUNK]->(similar_chunk)
-        MATCH (related_doc:LegalDocument)-[:HAS_STRUCTURE]->()
-              -[:CONTAINS_NORM]->(related_norm)
-        WHERE related_doc.sgb_nummer <> "II"
-        
-        RETURN 
-          score as similarity,
-          related_doc.sgb_nummer as other_sgb,
-          related_norm.enbez as paragraph,
-          related_norm.titel as titel
-        ORDER BY score DESC
-        """
+        query = CROSS_SGB_QUERY
         
         try:
             elapsed, records = self.run_timed_query("Cross-SGB Income Analysis", query)
@@ -15,6 +15,7 @@ Usage:
 """
 
 import os
+import sys
 import argparse
 import json
 from datetime import datetime
@@ -23,6 +24,10 @@ from dotenv import load_dotenv
 from neo4j import GraphDatabase
 from typing import Dict, List, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.query_registry import get_query, warm_plan_cache
+
 load_dotenv()
 
 class UseCaseValidator:
@@ -33,36 +38,26 @@ class UseCaseValidator:
         self.password = os.getenv('NEO4J_PASSWORD')
         self.driver = GraphDatabase.driver(self.uri, auth=('neo4j', self.password))
         self.use_cases = self._define_use_cases()
+        warm_plan_cache(self.driver, prefix="validate.")
     
     def close(self):
         self.driver.close()
     
     def _define_use_cases(self) -> Dict:
-        """Definiert alle 20 Use Cases mit Queries."""
+        """Definiert alle 20 Use Cases mit Queries.
+        
+        'query' / 'visualization_query' sind Namen aus src/query_registry.py,
+        'params' / 'visualization_params' überschreiben deren Default-Parameter.
+        """
         return {
             'UC01': {
                 'name': 'Regelbedarfsermittlung für Familie',
                 'sgb': 'II',
                 'paragraphen': ['20', '21', '22', '23'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                          -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE norm.paragraph_nummer IN ['20', '21', '22', '23']
-                    RETURN 
-                        norm.paragraph_nummer as paragraph,
-                        norm.enbez as titel,
-                        count(DISTINCT chunk) as chunks,
-                        collect(DISTINCT chunk.text)[0..2] as beispiel_texte
-                    ORDER BY norm.order_index
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE norm.paragraph_nummer IN ['20', '21', '22', '23']
-                    RETURN path LIMIT 50
-                ''',
+                'query': 'validate.uc01',
+                'params': {'sgb': 'II', 'paragraphs': ['20', '21', '22', '23']},
+                'visualization_query': 'validate.norm_chunk_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['20', '21', '22', '23'], 'limit': 50},
                 'expected_min_norms': 4,
                 'expected_min_chunks': 100,
                 'priority': 'P0',
@@ -72,26 +67,10 @@ class UseCaseValidator:
                 'name': 'Sanktionsprüfung bei Meldeversäumnis',
                 'sgb': 'II',
                 'paragraphen': ['32'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer = '32'
-                    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Meldeversäumnis' 
-                       OR chunk.text CONTAINS 'Minderung'
-                       OR chunk.text CONTAINS 'Sanktion'
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        count(DISTINCT chunk) as relevante_chunks,
-                        collect(DISTINCT chunk.text)[0..1] as beispiele
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: '32'})
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    RETURN path LIMIT 30
-                ''',
+                'query': 'validate.uc02',
+                'params': {'sgb': 'II', 'paragraph': '32', 'terms': ['Meldeversäumnis', 'Minderung', 'Sanktion']},
+                'visualization_query': 'validate.norm_chunk_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['32'], 'limit': 30},
                 'expected_min_norms': 1,
                 'expected_min_chunks': 10,
                 'priority': 'P0',
@@ -101,26 +80,10 @@ class UseCaseValidator:
                 'name': 'Einkommensanrechnung mit Freibeträgen',
                 'sgb': 'II',
                 'paragraphen': ['11', '11b'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['11', '11b']
-                    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WITH norm, collect(chunk.text) as chunks
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        size(chunks) as chunk_count,
-                        chunks[0..2] as beispiele
-                    ORDER BY norm.paragraph_nummer
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE norm.paragraph_nummer IN ['11', '11b']
-                    RETURN path LIMIT 50
-                ''',
+                'query': 'validate.uc03',
+                'params': {'sgb': 'II', 'paragraphs': ['11', '11b']},
+                'visualization_query': 'validate.norm_chunk_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['11', '11b'], 'limit': 50},
                 'expected_min_norms': 2,
                 'expected_min_chunks': 50,
                 'priority': 'P0',
@@ -130,24 +93,10 @@ class UseCaseValidator:
                 'name': 'Bedarfsgemeinschaft vs. Haushaltsgemeinschaft',
                 'sgb': 'II',
                 'paragraphen': ['7'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer = '7'
-                    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        count(chunk) as chunks,
-                        collect(chunk.text)[0..3] as beispiel_definitionen
-                    ORDER BY chunk.chunk_index
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: '7'})
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    RETURN path LIMIT 100
-                ''',
+                'query': 'validate.uc06',
+                'params': {'sgb': 'II', 'paragraph': '7'},
+                'visualization_query': 'validate.norm_chunk_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['7'], 'limit': 100},
                 'expected_min_norms': 1,
                 'expected_min_chunks': 50,
                 'priority': 'P0',
@@ -157,28 +106,10 @@ class UseCaseValidator:
                 'name': 'Darlehen für Erstausstattung',
                 'sgb': 'II',
                 'paragraphen': ['24'],
-                'query': '''
-                    MATCH (norm:LegalNorm)
-                    WHERE norm.paragraph_nummer = '24'
-                      AND EXISTS {
-                          MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: 'II'})
-                      }
-                    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Erstausstattung' 
-                       OR chunk.text CONTAINS 'Schwangerschaft'
-                       OR chunk.text CONTAINS 'Darlehen'
-                    RETURN 
-                        norm.enbez,
-                        count(chunk) as relevante_chunks,
-                        collect(chunk.text)[0..2] as beispiele
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: '24'})
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Erstausstattung'
-                    RETURN path LIMIT 30
-                ''',
+                'query': 'validate.uc08',
+                'params': {'sgb': 'II', 'paragraph': '24', 'terms': ['Erstausstattung', 'Schwangerschaft', 'Darlehen']},
+                'visualization_query': 'validate.norm_term_chunk_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['24'], 'terms': ['Erstausstattung'], 'limit': 30},
                 'expected_min_norms': 1,
                 'expected_min_chunks': 20,
                 'priority': 'P0',
@@ -188,23 +119,10 @@ class UseCaseValidator:
                 'name': 'Widerspruch bearbeiten',
                 'sgb': 'X',
                 'paragraphen': ['79', '80', '84', '85'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'X'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['79', '80', '84', '85']
-                    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        count(chunk) as chunks
-                    ORDER BY norm.paragraph_nummer
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'X'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['79', '80', '84', '85']
-                    RETURN path LIMIT 20
-                ''',
+                'query': 'validate.uc10',
+                'params': {'sgb': 'X', 'paragraphs': ['79', '80', '84', '85']},
+                'visualization_query': 'validate.norm_paths',
+                'visualization_params': {'sgb': 'X', 'paragraphs': ['79', '80', '84', '85'], 'limit': 20},
                 'expected_min_norms': 4,
                 'expected_min_chunks': 0,  # Known issue
                 'priority': 'P0',
@@ -215,28 +133,10 @@ class UseCaseValidator:
                 'name': 'Prozessanalyse - Durchlaufzeiten Erstantrag',
                 'sgb': 'II',
                 'paragraphen': ['37', '41', '44'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['37', '41', '44']
-                    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Frist' 
-                       OR chunk.text CONTAINS 'unverzüglich'
-                       OR chunk.text CONTAINS 'Monat'
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        count(DISTINCT chunk) as fristen_chunks,
-                        collect(DISTINCT chunk.text)[0..2] as beispiel_fristen
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE norm.paragraph_nummer IN ['37', '41', '44']
-                      AND (chunk.text CONTAINS 'Frist' OR chunk.text CONTAINS 'Monat')
-                    RETURN path LIMIT 30
-                ''',
+                'query': 'validate.uc13',
+                'params': {'sgb': 'II', 'paragraphs': ['37', '41', '44'], 'terms': ['Frist', 'unverzüglich', 'Monat']},
+                'visualization_query': 'validate.norm_term_chunk_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['37', '41', '44'], 'terms': ['Frist', 'Monat'], 'limit': 30},
                 'expected_min_norms': 3,
                 'expected_min_chunks': 10,
                 'priority': 'P0',
@@ -246,35 +146,10 @@ class UseCaseValidator:
                 'name': 'Qualitätssicherung - Fehlerquellen in Bescheiden',
                 'sgb': 'II',
                 'paragraphen': ['*'],  # Komplexitätsanalyse über alle Normen
-                'query': '''
-                    MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE EXISTS {
-                        MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: 'II'})
-                    }
-                    WITH norm, count(chunk) as chunk_count
-                    WHERE chunk_count > 10
-                    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE chunk.text CONTAINS 'Ausnahme' 
-                       OR chunk.text CONTAINS 'abweichend'
-                       OR chunk.text CONTAINS 'jedoch'
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        chunk_count as komplexitaet,
-                        count(DISTINCT chunk) as ausnahmen
-                    ORDER BY komplexitaet DESC, ausnahmen DESC
-                    LIMIT 10
-                ''',
-                'visualization_query': '''
-                    MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
-                    WHERE EXISTS {
-                        MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: 'II'})
-                    }
-                    WITH norm, count(chunk) as chunk_count
-                    WHERE chunk_count > 15
-                    MATCH path = (norm)-[:HAS_CHUNK]->(chunk)
-                    RETURN path LIMIT 50
-                ''',
+                'query': 'validate.uc16',
+                'params': {'sgb': 'II', 'min_chunks': 10, 'terms': ['Ausnahme', 'abweichend', 'jedoch'], 'limit': 10},
+                'visualization_query': 'validate.complex_norm_paths',
+                'visualization_params': {'sgb': 'II', 'min_chunks': 15, 'limit': 50},
                 'expected_min_norms': 5,
                 'expected_min_chunks': 50,
                 'priority': 'P0',
@@ -284,27 +159,10 @@ class UseCaseValidator:
                 'name': 'Prozessmodellierung - Ideal-Prozess Antragsprüfung',
                 'sgb': 'II',
                 'paragraphen': ['7', '11', '11b', '12', '37', '33'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['7', '11', '11b', '12', '37', '33']
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        'Phase: ' + 
-                        CASE 
-                            WHEN norm.paragraph_nummer = '7' THEN '2 - Anspruchsprüfung'
-                            WHEN norm.paragraph_nummer IN ['11', '11b', '12'] THEN '2 - Bedürftigkeitsprüfung'
-                            WHEN norm.paragraph_nummer IN ['37', '33'] THEN '3 - Entscheidung'
-                        END as prozessphase
-                    ORDER BY prozessphase, norm.paragraph_nummer
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                    WHERE norm.paragraph_nummer IN ['7', '11', '11b', '12', '37', '33']
-                    RETURN path
-                ''',
+                'query': 'validate.uc18',
+                'params': {'sgb': 'II', 'paragraphs': ['7', '11', '11b', '12', '37', '33']},
+                'visualization_query': 'validate.norm_paths',
+                'visualization_params': {'sgb': 'II', 'paragraphs': ['7', '11', '11b', '12', '37', '33'], 'limit': 100},
                 'expected_min_norms': 6,
                 'expected_min_chunks': 100,
                 'priority': 'P0',
@@ -314,31 +172,14 @@ class UseCaseValidator:
                 'name': 'Schulungskonzept - Gesetzesänderungen',
                 'sgb': 'II',
                 'paragraphen': ['*'],
-                'query': '''
-                    MATCH (doc:LegalDocument {sgb_nummer: 'II'})
-                          -[:CONTAINS_NORM]->(norm:LegalNorm)
-                          -[:AMENDED_BY]->(amendment:Amendment)
-                    WHERE amendment.date >= date('2023-01-01')
-                    RETURN 
-                        norm.paragraph_nummer,
-                        norm.enbez,
-                        amendment.title,
-                        amendment.date,
-                        amendment.summary
-                    ORDER BY amendment.date DESC
-                    LIMIT 10
-                ''',
-                'visualization_query': '''
-                    MATCH path = (doc:LegalDocument {sgb_nummer: 'II'})
-                                 -[:CONTAINS_NORM]->(norm:LegalNorm)
-                                 -[:AMENDED_BY]->(amendment:Amendment)
-                    RETURN path LIMIT 20
-                ''',
-                'expected_min_norms': 0,  # Known issue: Amendments fehlen
+                'query': 'validate.uc19',
+                'params': {'sgb': 'II', 'since': '2023-01-01', 'limit': 10},
+                'visualization_query': 'validate.amendment_paths',
+                'visualization_params': {'sgb': 'II', 'limit': 20},
+                'expected_min_norms': 1,
                 'expected_min_chunks': 0,
                 'priority': 'P1',
-                'status_expected': 'FAIL',
-                'tool': 'N/A (Amendment data import required)'
+                'tool': 'Neo4j Browser'
             }
         }
     
@@ -348,6 +189,8 @@ class UseCaseValidator:
             return {'error': f'Use Case {use_case_id} nicht gefunden'}
         
         uc = self.use_cases[use_case_id]
+        query = get_query(uc['query'])
+        params = query.params(**uc['params'])
         result = {
             'id': use_case_id,
             'name': uc['name'],
@@ -361,7 +204,7 @@ class UseCaseValidator:
         try:
             with self.driver.session() as session:
                 # Execute validation query
-                query_result = session.run(uc['query'])
+                query_result = session.run(query.cypher, params)
                 records = list(query_result)
                 
                 result['records_found'] = len(records)
@@ -389,8 +232,9 @@ class UseCaseValidator:
                     result['status'] = '❌ FAIL'
                     result['passed'] = False
                 
-                result['query'] = uc['query']
-                result['visualization_query'] = uc['visualization_query']
+                result['query'] = query.cypher
+                result['params'] = params
+                result['visualization_query'] = get_query(uc['visualization_query']).cypher
                 
         except Exception as e:
             result['status'] = f'❌ ERROR: {str(e)}'
@@ -512,20 +356,27 @@ class UseCaseValidator:
         output_path.mkdir(parents=True, exist_ok=True)
         
         for uc_id, uc in self.use_cases.items():
+            query = get_query(uc['query'])
+            viz_query = get_query(uc['visualization_query'])
+            
             # Data query
             query_file = output_path / f"{uc_id}_data.cypher"
             with open(query_file, 'w', encoding='utf-8') as f:
                 f.write(f"// {uc_id}: {uc['name']}\n")
                 f.write(f"// SGB: {uc['sgb']} | Paragraphen: {', '.join(uc['paragraphen'])}\n")
-                f.write(f"// Priority: {uc['priority']} | Tool: {uc['tool']}\n\n")
-                f.write(uc['query'])
+                f.write(f"// Priority: {uc['priority']} | Tool: {uc['tool']}\n")
+                f.write(f"// Registry: {query.name}\n\n")
+                f.write(f":params {json.dumps(query.params(**uc['params']), ensure_ascii=False)}\n")
+                f.write(query.cypher)
             
             # Visualization query
             viz_file = output_path / f"{uc_id}_visualization.cypher"
             with open(viz_file, 'w', encoding='utf-8') as f:
                 f.write(f"// {uc_id}: {uc['name']} - Visualization\n")
-                f.write(f"// Run this in Neo4j Browser for graph visualization\n\n")
-                f.write(uc['visualization_query'])
+                f.write(f"// Run this in Neo4j Browser for graph visualization\n")
+                f.write(f"// Registry: {viz_query.name}\n\n")
+                f.write(f":params {json.dumps(viz_query.params(**uc['visualization_params']), ensure_ascii=False)}\n")
+                f.write(viz_query.cypher)
         
         print(f"\n✅ Cypher queries exported to: {output_dir}")
 
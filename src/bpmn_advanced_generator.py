@@ -46,6 +46,10 @@ class AdvancedBPMNGenerator(SozialrechtBPMNGenerator):
 
         return task_id
 
+    def _lanes(self) -> List[Dict]:
+        """Swimlanes für LaneSet und Lane-Bänder im Layout"""
+        return self.swimlanes
+
     def generate_from_neo4j(self, neo4j_rag, sgb: str, prozess_typ: str) -> 'AdvancedBPMNGenerator':
         """Generiere BPMN automatisch aus Neo4j Sozialrecht-Daten
 
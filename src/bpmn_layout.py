@@ -0,0 +1,384 @@
+"""
+Layered Auto-Layout für BPMN-Diagramme
+======================================
+Berechnet BPMNDI-Koordinaten (Shapes, Kanten-Waypoints, Lane-Bänder) für
+generierte Prozesse, damit sie ohne manuelles Layout im Modeler (Camunda,
+bpmn.io, Signavio) geöffnet werden können. Fluss von links nach rechts,
+Swimlanes als horizontale Bänder.
+
+Sugiyama-Phasen:
+1. Zyklen brechen: Rückwärtskanten per iterativer DFS           O(V+E)
+2. Layer je Knoten: längster Pfad über Kahn-Topologie           O(V+E)
+3. Dummy-Knoten für Kanten über mehrere Layer
+4. Kreuzungsminimierung: Baryzentrum-Sweeps, Kreuzungen je
+   Layer-Paar per Fenwick-Baum gezählt, beste Ordnung gewinnt   O(E log E) je Sweep
+5. Koordinaten: Spalte je Layer, Zeilen je Lane; orthogonale
+   Waypoints, Rückwärtskanten als Schleifen unter dem Diagramm  O(V+E)
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MARGIN = 40
+LANE_HEADER = 30
+COLUMN_GAP = 60
+ROW_GAP = 30
+LOOP_GAP = 20
+
+
+@dataclass
+class Bounds:
+    """Rechteck in Diagramm-Koordinaten (dc:Bounds)"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @property
+    def center_x(self) -> float:
+        return self.x + self.width / 2
+
+    @property
+    def center_y(self) -> float:
+        return self.y + self.height / 2
+
+    @property
+    def right(self) -> float:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.height
+
+
+@dataclass
+class DiagramLayout:
+    """Ergebnis von layered_layout()
+
+    Attributes:
+        shapes: node_id → Bounds
+        waypoints: edge_id → [(x, y), ...]
+        lanes: lane_id → Bounds des Lane-Bands
+        node_lanes: node_id → lane_id (auch für Knoten ohne explizite Lane)
+        pool: Bounds des Participants (nur mit Lanes)
+    """
+    shapes: Dict[str, Bounds] = field(default_factory=dict)
+    waypoints: Dict[str, List[Tuple[float, float]]] = field(default_factory=dict)
+    lanes: Dict[str, Bounds] = field(default_factory=dict)
+    node_lanes: Dict[str, str] = field(default_factory=dict)
+    pool: Optional[Bounds] = None
+    width: float = 0.0
+    height: float = 0.0
+
+
+def layered_layout(nodes: Sequence[Tuple[str, float, float]],
+                   edges: Sequence[Tuple[str, str, str]],
+                   lanes: Sequence[str] = (),
+                   lane_of: Optional[Dict[str, str]] = None,
+                   sweeps: int = 4) -> DiagramLayout:
+    """Layered (Sugiyama-)Layout von links nach rechts
+
+    Args:
+        nodes: [(node_id, width, height)] in Einfügereihenfolge
+        edges: [(edge_id, source_id, target_id)]; Kanten zu unbekannten Knoten werden ignoriert
+        lanes: Lane-IDs von oben nach unten
+        lane_of: node_id → lane_id; Knoten ohne Lane erben die Lane eines Nachbarn
+        sweeps: Baryzentrum-Sweeps (je einmal abwärts und aufwärts)
+
+    Returns:
+        DiagramLayout
+    """
+    ids = [node_id for node_id, _, _ in nodes]
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    sizes = [(width, height) for _, width, height in nodes]
+    n = len(ids)
+    if not n:
+        return DiagramLayout()
+
+    edges = [(edge_id, index[source], index[target]) for edge_id, source, target in edges
+             if source in index and target in index]
+
+    succ = [[] for _ in range(n)]
+    has_incoming = [False] * n
+    for e, (_, s, t) in enumerate(edges):
+        succ[s].append((e, t))
+        has_incoming[t] = True
+
+    # 1. Rückwärtskanten (inkl. Schleifen) - Start bei Knoten ohne Eingang
+    roots = [v for v in range(n) if not has_incoming[v]] + list(range(n))
+    back = _back_edges(n, succ, roots)
+
+    # 2. Layer: längster Pfad im azyklischen Rest
+    dag_succ = [[] for _ in range(n)]
+    dag_pred = [[] for _ in range(n)]
+    for e, (_, s, t) in enumerate(edges):
+        if e not in back:
+            dag_succ[s].append(t)
+            dag_pred[t].append(s)
+
+    topo = _topological_order(n, dag_succ, dag_pred)
+    layer = [0] * n
+    for u in topo:
+        for v in dag_succ[u]:
+            layer[v] = max(layer[v], layer[u] + 1)
+    # Quellen direkt vor ihren ersten Nachfolger ziehen (z.B. zweites Start-Event)
+    for u in topo:
+        if not dag_pred[u] and dag_succ[u]:
+            layer[u] = min(layer[v] for v in dag_succ[u]) - 1
+
+    # Lanes: explizit oder vom nächsten Nachbarn geerbt
+    lane_ids = list(lanes) or [None]
+    node_lane = _resolve_lanes(n, ids, edges, lane_of or {}, lane_ids)
+    lane_rank = {lane_id: rank for rank, lane_id in enumerate(lane_ids)}
+
+    # 3. Dummy-Knoten: Knoten n.. liegen auf den Zwischen-Layern langer Kanten
+    layer_count = max(layer) + 1
+    layers = [[] for _ in range(layer_count)]
+    lower = [[] for _ in range(n)]
+    upper = [[] for _ in range(n)]
+    chains = {}
+    rank = [lane_rank[node_lane[v]] for v in range(n)]
+
+    for u in topo:
+        layers[layer[u]].append(u)
+    for e, (_, s, t) in enumerate(edges):
+        if e in back:
+            continue
+        chain = [s]
+        for dummy_layer in range(layer[s] + 1, layer[t]):
+            dummy = len(lower)
+            lower.append([])
+            upper.append([])
+            layer.append(dummy_layer)
+            rank.append(rank[s])
+            layers[dummy_layer].append(dummy)
+            chain.append(dummy)
+        chain.append(t)
+        for a, b in zip(chain, chain[1:]):
+            upper[a].append(b)
+            lower[b].append(a)
+        chains[e] = chain
+
+    # 4. Kreuzungsminimierung
+    pos = [0] * len(layer)
+    _number(layers, pos)
+    best_crossings = _count_crossings(layers, upper, pos)
+    best_layers = [list(nodes_in_layer) for nodes_in_layer in layers]
+
+    for _ in range(sweeps):
+        if not best_crossings:
+            break
+        for li in range(1, layer_count):
+            _sort_by_barycenter(layers[li], lower, pos, rank)
+        for li in range(layer_count - 2, -1, -1):
+            _sort_by_barycenter(layers[li], upper, pos, rank)
+        crossings = _count_crossings(layers, upper, pos)
+        if crossings < best_crossings:
+            best_crossings = crossings
+            best_layers = [list(nodes_in_layer) for nodes_in_layer in layers]
+
+    layers = best_layers
+    _number(layers, pos)
+
+    # 5. Koordinaten
+    row_height = max(height for _, height in sizes) + ROW_GAP
+    x_start = MARGIN + (LANE_HEADER if lanes else 0)
+
+    column_x = []
+    x = x_start
+    for nodes_in_layer in layers:
+        column_width = max((sizes[v][0] for v in nodes_in_layer if v < n), default=0)
+        column_x.append((x, column_width))
+        x += column_width + COLUMN_GAP
+    content_right = x - COLUMN_GAP
+
+    # Zeilen je Lane: so viele wie die Lane in ihrem vollsten Layer braucht
+    lane_rows = [1] * len(lane_ids)
+    slots = [0] * len(layer)
+    slot_counts = []
+    for nodes_in_layer in layers:
+        counts = [0] * len(lane_ids)
+        for v in nodes_in_layer:
+            slots[v] = counts[rank[v]]
+            counts[rank[v]] += 1
+        slot_counts.append(counts)
+        for r, count in enumerate(counts):
+            lane_rows[r] = max(lane_rows[r], count)
+
+    lane_top = []
+    y = MARGIN
+    for rows in lane_rows:
+        lane_top.append(y)
+        y += rows * row_height
+    content_bottom = y
+
+    def center(v: int) -> Tuple[float, float]:
+        li, r = layer[v], rank[v]
+        column, column_width = column_x[li]
+        band_middle = lane_top[r] + lane_rows[r] * row_height / 2
+        offset = (slots[v] - (slot_counts[li][r] - 1) / 2) * row_height
+        return column + column_width / 2, band_middle + offset
+
+    layout = DiagramLayout()
+    for v in range(n):
+        cx, cy = center(v)
+        width, height = sizes[v]
+        layout.shapes[ids[v]] = Bounds(cx - width / 2, cy - height / 2, width, height)
+
+    for e, (edge_id, s, t) in enumerate(edges):
+        if e in chains:
+            source, target = layout.shapes[ids[s]], layout.shapes[ids[t]]
+            points = [(source.right, source.center_y)]
+            points += [center(dummy) for dummy in chains[e][1:-1]]
+            points.append((target.x, target.center_y))
+            layout.waypoints[edge_id] = _orthogonal(points)
+
+    # Rückwärtskanten: eigene Bahn unter dem Inhalt, durch die Spaltenlücken
+    loop_y = content_bottom
+    for e in sorted(back):
+        edge_id, s, t = edges[e]
+        source, target = layout.shapes[ids[s]], layout.shapes[ids[t]]
+        loop_y += LOOP_GAP
+        exit_x = source.right + LOOP_GAP
+        entry_x = target.x - LOOP_GAP
+        layout.waypoints[edge_id] = [
+            (source.right, source.center_y), (exit_x, source.center_y), (exit_x, loop_y),
+            (entry_x, loop_y), (entry_x, target.center_y), (target.x, target.center_y)
+        ]
+    if back:
+        content_bottom = loop_y + LOOP_GAP
+
+    layout.node_lanes = {ids[v]: node_lane[v] for v in range(n)} if lanes else {}
+    if lanes:
+        pool_width = content_right + LOOP_GAP * 2 - MARGIN
+        layout.pool = Bounds(MARGIN, MARGIN, pool_width, content_bottom - MARGIN)
+        for r, lane_id in enumerate(lane_ids):
+            band_bottom = lane_top[r + 1] if r + 1 < len(lane_ids) else content_bottom
+            layout.lanes[lane_id] = Bounds(MARGIN + LANE_HEADER, lane_top[r],
+                                           pool_width - LANE_HEADER, band_bottom - lane_top[r])
+
+    layout.width = content_right + LOOP_GAP * 2 + MARGIN
+    layout.height = content_bottom + MARGIN
+    return layout
+
+
+def _back_edges(n: int, succ: List[List[Tuple[int, int]]], roots: List[int]) -> set:
+    """Kanten zu einem Knoten auf dem DFS-Stack (iterativ, ohne Rekursionslimit)"""
+    state = [0] * n  # 0 = neu, 1 = auf dem Stack, 2 = fertig
+    back = set()
+
+    for root in roots:
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, iter(succ[root]))]
+        while stack:
+            v, successors = stack[-1]
+            for e, w in successors:
+                if state[w] == 0:
+                    state[w] = 1
+                    stack.append((w, iter(succ[w])))
+                    break
+                if state[w] == 1:
+                    back.add(e)
+            else:
+                state[v] = 2
+                stack.pop()
+
+    return back
+
+
+def _topological_order(n: int, dag_succ: List[List[int]], dag_pred: List[List[int]]) -> List[int]:
+    """Kahn-Topologie, stabil in Einfügereihenfolge"""
+    indegree = [len(preds) for preds in dag_pred]
+    queue = deque(v for v in range(n) if not indegree[v])
+    order = []
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for v in dag_succ[u]:
+            indegree[v] -= 1
+            if not indegree[v]:
+                queue.append(v)
+    return order
+
+
+def _resolve_lanes(n: int, ids: List[str], edges, lane_of: Dict[str, str], lane_ids: List) -> List:
+    """Lane je Knoten; ohne Zuordnung per BFS vom nächsten zugeordneten Nachbarn"""
+    known = set(lane_ids)
+    node_lane = [lane_of.get(ids[v]) if lane_of.get(ids[v]) in known else None for v in range(n)]
+
+    neighbours = [[] for _ in range(n)]
+    for _, s, t in edges:
+        neighbours[s].append(t)
+        neighbours[t].append(s)
+
+    queue = deque(v for v in range(n) if node_lane[v] is not None)
+    while queue:
+        u = queue.popleft()
+        for v in neighbours[u]:
+            if node_lane[v] is None:
+                node_lane[v] = node_lane[u]
+                queue.append(v)
+
+    return [lane if lane is not None else lane_ids[0] for lane in node_lane]
+
+
+def _number(layers: List[List[int]], pos: List[int]):
+    for nodes_in_layer in layers:
+        for i, v in enumerate(nodes_in_layer):
+            pos[v] = i
+
+
+def _sort_by_barycenter(nodes_in_layer: List[int], neighbours: List[List[int]], pos: List[int], rank: List[int]):
+    """Stabil nach (Lane, Baryzentrum der Nachbarn im Referenz-Layer) sortieren"""
+    def key(v):
+        adjacent = neighbours[v]
+        barycenter = sum(pos[w] for w in adjacent) / len(adjacent) if adjacent else pos[v]
+        return rank[v], barycenter
+
+    nodes_in_layer.sort(key=key)
+    for i, v in enumerate(nodes_in_layer):
+        pos[v] = i
+
+
+def _count_crossings(layers: List[List[int]], upper: List[List[int]], pos: List[int]) -> int:
+    """Kreuzungen zwischen benachbarten Layern: Inversionen per Fenwick-Baum"""
+    crossings = 0
+    for li in range(len(layers) - 1):
+        targets = sorted((pos[u], pos[v]) for u in layers[li] for v in upper[u])
+        size = len(layers[li + 1])
+        tree = [0] * (size + 1)
+        for seen, (_, target) in enumerate(targets):
+            # Bereits gesehene Kanten mit größerer Zielposition kreuzen diese
+            i, not_greater = target + 1, 0
+            while i > 0:
+                not_greater += tree[i]
+                i -= i & -i
+            crossings += seen - not_greater
+            i = target + 1
+            while i <= size:
+                tree[i] += 1
+                i += i & -i
+    return crossings
+
+
+def _orthogonal(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Polylinie mit rechtwinkligen Knicks auf halber Strecke zwischen den Spalten"""
+    route = [points[0]]
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        if y1 != y2:
+            middle = (x1 + x2) / 2
+            route += [(middle, y1), (middle, y2)]
+        route.append((x2, y2))
+
+    # Punkte auf gerader Strecke (z.B. durch Dummy-Knoten) entfallen
+    simplified = [route[0]]
+    for point, following in zip(route[1:], route[2:]):
+        previous = simplified[-1]
+        if (previous[0] == point[0] == following[0]) or (previous[1] == point[1] == following[1]):
+            continue
+        simplified.append(point)
+    simplified.append(route[-1])
+    return simplified
@@ -5,12 +5,25 @@ Erstellt Prozessvisualisierungen für komplexe Sozialrechts-Fälle
 Integriert mit Neo4j für regelbasierte Prozessgenerierung
 """
 
-import xml.etree.ElementTree as ET
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
+import io
 import json
 
+from lxml import etree
+
+try:
+    from .bpmn_layout import layered_layout, DiagramLayout
+except ImportError:
+    from bpmn_layout import layered_layout, DiagramLayout
+
+BPMN_MODEL_NS = 'http://www.omg.org/spec/BPMN/20100524/MODEL'
+BPMN_DI_NS = 'http://www.omg.org/spec/BPMN/20100524/DI'
+DC_NS = 'http://www.omg.org/spec/DD/20100524/DC'
+DI_NS = 'http://www.omg.org/spec/DD/20100524/DI'
+BPMN_NSMAP = {None: BPMN_MODEL_NS, 'bpmndi': BPMN_DI_NS, 'dc': DC_NS, 'di': DI_NS}
+
 
 class BPMNElementType(Enum):
     """BPMN 2.0 Element-Typen"""
@@ -33,6 +46,16 @@ class BPMNElement:
     properties: Dict = None
 
 
+# Shape-Größen wie in bpmn.io / Camunda Modeler (Tasks: 100x80)
+SHAPE_SIZES = {
+    BPMNElementType.START_EVENT: (36, 36),
+    BPMNElementType.END_EVENT: (36, 36),
+    BPMNElementType.GATEWAY_EXCLUSIVE: (50, 50),
+    BPMNElementType.GATEWAY_PARALLEL: (50, 50),
+}
+TASK_SIZE = (100, 80)
+
+
 class SozialrechtBPMNGenerator:
     """
     Generator für BPMN 2.0 Prozess-Diagramme
@@ -154,54 +177,112 @@ class SozialrechtBPMNGenerator:
         })
         return flow_id
 
-    def generate_bpmn_xml(self, process_name: str = "Sozialrecht Prozess") -> str:
-        """Generate BPMN 2.0 XML"""
-
-        # Create root element
-        root = ET.Element('definitions', {
-            'xmlns': 'http://www.omg.org/spec/BPMN/20100524/MODEL',
-            'xmlns:bpmndi': 'http://www.omg.org/spec/BPMN/20100524/DI',
-            'xmlns:dc': 'http://www.omg.org/spec/DD/20100524/DC',
-            'xmlns:di': 'http://www.omg.org/spec/DD/20100524/DI',
-            'id': 'Definitions_1',
-            'targetNamespace': 'http://bpmn.io/schema/bpmn'
-        })
+    def _lanes(self) -> List[Dict]:
+        """Swimlanes als [{'id', 'name', 'elements'}] - der Basis-Generator hat keine"""
+        return []
 
-        # Create process
-        process = ET.SubElement(root, 'process', {
-            'id': 'Process_1',
-            'name': process_name,
-            'isExecutable': 'false'
-        })
+    def compute_layout(self) -> DiagramLayout:
+        """Layered Auto-Layout (BPMNDI-Koordinaten) für alle Elemente und Flows"""
+        lanes = self._lanes()
+        return layered_layout(
+            nodes=[(element.id, *SHAPE_SIZES.get(element.element_type, TASK_SIZE))
+                   for element in self.elements],
+            edges=[(flow['id'], flow['from'], flow['to']) for flow in self.flows],
+            lanes=[lane['id'] for lane in lanes],
+            lane_of={element_id: lane['id'] for lane in lanes for element_id in lane['elements']}
+        )
 
-        # Add all elements
+    def write_bpmn_xml(self, target, process_name: str = "Sozialrecht Prozess"):
+        """Schreibe BPMN 2.0 XML inkl. BPMNDI-Layout inkrementell
+
+        Jedes Element wird direkt über lxml.etree.xmlfile serialisiert, ohne
+        den kompletten Baum im Speicher aufzubauen. Mit Swimlanes entstehen
+        Collaboration/Participant und LaneSet.
+
+        Args:
+            target: Dateipfad oder binäres File-Objekt
+            process_name: Prozessname
+        """
+        layout = self.compute_layout()
+        lanes = self._lanes()
+        plane_element = 'Collaboration_1' if lanes else 'Process_1'
+
+        with etree.xmlfile(target, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(_bpmn('definitions'), {
+                'id': 'Definitions_1',
+                'targetNamespace': 'http://bpmn.io/schema/bpmn'
+            }, nsmap=BPMN_NSMAP):
+
+                if lanes:
+                    with xf.element(_bpmn('collaboration'), {'id': 'Collaboration_1'}):
+                        _write_leaf(xf, _bpmn('participant'), {
+                            'id': 'Participant_1',
+                            'name': process_name,
+                            'processRef': 'Process_1'
+                        })
+
+                with xf.element(_bpmn('process'), {
+                    'id': 'Process_1',
+                    'name': process_name,
+                    'isExecutable': 'false'
+                }):
+                    if lanes:
+                        self._write_lane_set(xf, lanes, layout)
+
+                    for element in self.elements:
+                        with xf.element(_bpmn(element.element_type.value), {'id': element.id, 'name': element.name}):
+                            if element.properties:
+                                # Add properties as documentation
+                                _write_leaf(xf, _bpmn('documentation'), {},
+                                            json.dumps(element.properties, ensure_ascii=False))
+
+                    for flow in self.flows:
+                        flow_attribs = {
+                            'id': flow['id'],
+                            'sourceRef': flow['from'],
+                            'targetRef': flow['to']
+                        }
+                        if flow['condition']:
+                            flow_attribs['name'] = flow['condition']
+                        _write_leaf(xf, _bpmn('sequenceFlow'), flow_attribs)
+
+                with xf.element(_bpmndi('BPMNDiagram'), {'id': 'BPMNDiagram_1'}):
+                    with xf.element(_bpmndi('BPMNPlane'), {'id': 'BPMNPlane_1', 'bpmnElement': plane_element}):
+                        if lanes:
+                            _write_shape(xf, 'Participant_1', layout.pool, isHorizontal='true')
+                            for lane in lanes:
+                                _write_shape(xf, lane['id'], layout.lanes[lane['id']], isHorizontal='true')
+
+                        for element in self.elements:
+                            extra = {'isMarkerVisible': 'true'} \
+                                if element.element_type == BPMNElementType.GATEWAY_EXCLUSIVE else {}
+                            _write_shape(xf, element.id, layout.shapes[element.id], **extra)
+
+                        for flow in self.flows:
+                            if flow['id'] not in layout.waypoints:
+                                continue
+                            with xf.element(_bpmndi('BPMNEdge'), {'id': f"{flow['id']}_di", 'bpmnElement': flow['id']}):
+                                for x, y in layout.waypoints[flow['id']]:
+                                    _write_leaf(xf, _di('waypoint'), {'x': _coordinate(x), 'y': _coordinate(y)})
+
+    def _write_lane_set(self, xf, lanes: List[Dict], layout: DiagramLayout):
+        """LaneSet mit allen Flow-Nodes - ohne explizite Lane wie im Layout zugeordnet"""
+        lane_nodes = {lane['id']: [] for lane in lanes}
         for element in self.elements:
-            elem_attribs = {'id': element.id, 'name': element.name}
-
-            if element.properties:
-                # Add properties as documentation
-                doc = ET.SubElement(
-                    ET.SubElement(process, element.element_type.value, elem_attribs),
-                    'documentation'
-                )
-                doc.text = json.dumps(element.properties, ensure_ascii=False)
-            else:
-                ET.SubElement(process, element.element_type.value, elem_attribs)
-
-        # Add all flows
-        for flow in self.flows:
-            flow_attribs = {
-                'id': flow['id'],
-                'sourceRef': flow['from'],
-                'targetRef': flow['to']
-            }
-            if flow['condition']:
-                flow_attribs['name'] = flow['condition']
+            lane_nodes[layout.node_lanes[element.id]].append(element.id)
 
-            ET.SubElement(process, 'sequenceFlow', flow_attribs)
+        with xf.element(_bpmn('laneSet'), {'id': 'LaneSet_1'}):
+            for lane in lanes:
+                with xf.element(_bpmn('lane'), {'id': lane['id'], 'name': lane['name']}):
+                    for element_id in lane_nodes[lane['id']]:
+                        _write_leaf(xf, _bpmn('flowNodeRef'), {}, element_id)
 
-        # Generate XML string
-        return ET.tostring(root, encoding='unicode', method='xml')
+    def generate_bpmn_xml(self, process_name: str = "Sozialrecht Prozess") -> str:
+        """Generate BPMN 2.0 XML (inkl. BPMNDI) als String"""
+        buffer = io.BytesIO()
+        self.write_bpmn_xml(buffer, process_name)
+        return buffer.getvalue().decode('utf-8')
 
     def generate_mermaid(self) -> str:
         """Generate Mermaid.js flowchart (leichter zu visualisieren)"""
@@ -233,6 +314,40 @@ class SozialrechtBPMNGenerator:
         return shapes.get(element_type, ("[", "]"))
 
 
+def _bpmn(tag: str) -> str:
+    return f"{{{BPMN_MODEL_NS}}}{tag}"
+
+
+def _bpmndi(tag: str) -> str:
+    return f"{{{BPMN_DI_NS}}}{tag}"
+
+
+def _di(tag: str) -> str:
+    return f"{{{DI_NS}}}{tag}"
+
+
+def _coordinate(value: float) -> str:
+    return str(int(round(value)))
+
+
+def _write_leaf(xf, tag: str, attribs: Dict, text: Optional[str] = None):
+    """Element ohne Kinder in den xmlfile-Stream schreiben"""
+    with xf.element(tag, attribs):
+        if text:
+            xf.write(text)
+
+
+def _write_shape(xf, element_id: str, bounds, **extra):
+    """bpmndi:BPMNShape mit dc:Bounds"""
+    with xf.element(_bpmndi('BPMNShape'), {'id': f"{element_id}_di", 'bpmnElement': element_id, **extra}):
+        _write_leaf(xf, f"{{{DC_NS}}}Bounds", {
+            'x': _coordinate(bounds.x),
+            'y': _coordinate(bounds.y),
+            'width': _coordinate(bounds.width),
+            'height': _coordinate(bounds.height)
+        })
+
+
 # === VORDEFINIERTE PROZESS-TEMPLATES ===
 
 def create_sgb2_antrag_prozess() -> SozialrechtBPMNGenerator:
@@ -555,9 +670,7 @@ def save_bpmn_to_file(bpmn: SozialrechtBPMNGenerator, filename: str, format: str
         format: 'xml' or 'mermaid'
     """
     if format == 'xml':
-        content = bpmn.generate_bpmn_xml()
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        bpmn.write_bpmn_xml(filename)
     elif format == 'mermaid':
         content = bpmn.generate_mermaid()
         with open(filename, 'w', encoding='utf-8') as f:
@@ -0,0 +1,388 @@
+"""
+Compact Legal Document
+Spaltenform eines geparsten LegalDocument für Bulk-Import und Worker-Prozesse
+
+Statt eines Objektgraphen (ein Python-Objekt pro Norm, Absatz, Listenpunkt,
+Änderung) hält CompactLegalDocument:
+
+- eine String-Tabelle: alle Texte und Bezeichner dedupliziert in einem
+  einzigen UTF-8-bytes-Blob, adressiert über ein Byte-Offset-Array
+- pro Entität Spalten als array('I') mit String-Indizes, Offsets und
+  Order-Indizes; die 16-stelligen Hex-IDs gepackt als 8 Bytes
+- Offset-Arrays für Norm -> Absätze/Änderungen und Absatz -> Listenpunkte
+
+Die Builder (LegalKnowledgeGraphBuilder, Neo4jBulkExporter) lesen es wie ein
+LegalDocument: `norms` materialisiert LegalNorm-Objekte erst beim Zugriff, so
+dass immer nur die gerade verarbeitete Norm als Objektgraph existiert. Das
+Objekt pickelt klein und eignet sich daher als Rückgabewert von Parse-Workern.
+
+    compact = CompactLegalDocument.from_document(parser.parse_dokument(xml_path))
+    kg_builder.build_from_xml(compact)
+"""
+
+import logging
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from .xml_legal_parser import (
+        LegalDocument, LegalNorm, StructuralUnit, TextUnit, ListItem, Amendment, LegalXMLParser,
+        parse_amending_act
+    )
+except ImportError:
+    from xml_legal_parser import (
+        LegalDocument, LegalNorm, StructuralUnit, TextUnit, ListItem, Amendment, LegalXMLParser,
+        parse_amending_act
+    )
+
+logger = logging.getLogger(__name__)
+
+ID_BYTES = 8  # sha256(...).hexdigest()[:16]
+
+
+class StringTable:
+    """Deduplicated strings stored as one UTF-8 bytes blob plus a byte offset array
+
+    Index 0 steht für None. Während des Aufbaus hält ein dict die
+    Deduplizierung; freeze() kodiert alles in einen bytes-Blob und gibt das
+    dict frei. Bewusst bytes statt str: CPython speichert einen str in der
+    Breite seines breitesten Zeichens, ein einziges "•" oder "–" im
+    Gesetzestext verdoppelt sonst den ganzen Blob. get() dekodiert die
+    jeweilige Scheibe.
+    """
+
+    __slots__ = ('_blob', '_offsets', '_parts', '_index')
+
+    def __init__(self):
+        self._blob = b""
+        self._offsets = array('I', [0, 0])
+        self._parts: Optional[List[str]] = [""]
+        self._index: Optional[Dict[str, int]] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        """Index of value, adding it if new
+
+        Raises:
+            RuntimeError: Table is already frozen
+        """
+        if value is None:
+            return 0
+        if self._index is None:
+            raise RuntimeError("StringTable is frozen")
+
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self._parts)
+            self._index[value] = idx
+            self._parts.append(value)
+        return idx
+
+    def freeze(self):
+        """Encode all strings into one blob and drop the build-time index"""
+        if self._index is not None:
+            encoded = [part.encode('utf-8') for part in self._parts]
+            offsets = array('I', [0])
+            position = 0
+            for part in encoded:
+                position += len(part)
+                offsets.append(position)
+            self._blob = b"".join(encoded)
+            self._offsets = offsets
+            self._parts = None
+            self._index = None
+
+    def get(self, idx: int) -> Optional[str]:
+        if idx == 0:
+            return None
+        if self._parts is not None:
+            return self._parts[idx]
+        return self._blob[self._offsets[idx]:self._offsets[idx + 1]].decode('utf-8')
+
+    def __len__(self) -> int:
+        if self._parts is not None:
+            return len(self._parts)
+        return len(self._offsets) - 1
+
+    def __getstate__(self):
+        self.freeze()
+        return self._blob, self._offsets
+
+    def __setstate__(self, state):
+        self._blob, self._offsets = state
+        self._parts = None
+        self._index = None
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._blob) + self._offsets.itemsize * len(self._offsets)
+
+
+def _pack_id(packed: bytearray, value: str):
+    packed += bytes.fromhex(value)
+
+
+def _unpack_id(packed: bytes, idx: int) -> str:
+    return packed[idx * ID_BYTES:(idx + 1) * ID_BYTES].hex()
+
+
+class _NormSequence(Sequence):
+    """Read-only view of the norms; materialises one LegalNorm per access"""
+
+    __slots__ = ('_doc',)
+
+    def __init__(self, doc: 'CompactLegalDocument'):
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return len(self._doc._norm_order)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._doc.norm(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return self._doc.norm(idx)
+
+
+class CompactLegalDocument:
+    """Columnar LegalDocument (see module docstring)"""
+
+    __slots__ = (
+        # Document metadata (one value each)
+        'id', 'doknr', 'builddate', 'jurabk', 'lange_titel', 'sgb_nummer',
+        'ausfertigung_datum', 'fundstelle', 'trust_score', 'source_type', 'xml_source_url',
+        'structures', 'strings',
+        # Norm columns
+        '_norm_ids', '_norm_doknr', '_norm_enbez', '_norm_paragraph', '_norm_titel',
+        '_norm_footnotes', '_norm_order', '_norm_gliederung',
+        '_norm_text_offsets', '_norm_amendment_offsets', '_norm_tables',
+        # TextUnit columns
+        '_tu_ids', '_tu_type', '_tu_text', '_tu_absatz', '_tu_order', '_tu_item_offsets',
+        # ListItem columns
+        '_li_ids', '_li_type', '_li_term', '_li_definition', '_li_order',
+        # Amendment columns
+        '_am_ids', '_am_standtyp', '_am_kommentar', '_am_date', '_am_bgbl',
+    )
+
+    def __init__(self):
+        self.strings = StringTable()
+        self.structures: tuple = ()
+
+        self._norm_ids = bytearray()
+        self._norm_doknr = array('I')
+        self._norm_enbez = array('I')
+        self._norm_paragraph = array('I')
+        self._norm_titel = array('I')
+        self._norm_footnotes = bytearray()
+        self._norm_order = array('I')
+        # kennzahl, bez, titel per norm; has_gliederung flag in _norm_footnotes bit 1
+        self._norm_gliederung = array('I')
+        self._norm_text_offsets = array('I', [0])
+        self._norm_amendment_offsets = array('I', [0])
+        # Few norms have tables (Anlagen); kept as frozen Table objects per norm index
+        self._norm_tables: Dict[int, tuple] = {}
+
+        self._tu_ids = bytearray()
+        self._tu_type = array('I')
+        self._tu_text = array('I')
+        self._tu_absatz = array('I')
+        self._tu_order = array('I')
+        self._tu_item_offsets = array('I', [0])
+
+        self._li_ids = bytearray()
+        self._li_type = array('I')
+        self._li_term = array('I')
+        self._li_definition = array('I')
+        self._li_order = array('I')
+
+        self._am_ids = bytearray()
+        self._am_standtyp = array('I')
+        self._am_kommentar = array('I')
+        self._am_date = array('I')  # date.toordinal(), 0 = None
+        self._am_bgbl = array('I')
+
+    # === BUILD ===
+
+    @classmethod
+    def from_document(cls, doc: LegalDocument) -> 'CompactLegalDocument':
+        """Convert a parsed LegalDocument into columns
+
+        Args:
+            doc: Parsed LegalDocument (its object graph can be dropped afterwards)
+
+        Returns:
+            Frozen CompactLegalDocument
+        """
+        compact = cls()
+        for name in ('id', 'doknr', 'builddate', 'jurabk', 'lange_titel', 'sgb_nummer',
+                     'ausfertigung_datum', 'fundstelle', 'trust_score', 'source_type',
+                     'xml_source_url'):
+            setattr(compact, name, getattr(doc, name))
+
+        # A few hundred per document; kept as (frozen, slotted) objects
+        compact.structures = tuple(doc.structures)
+
+        for norm in doc.norms:
+            compact._add_norm(norm)
+
+        compact.strings.freeze()
+        return compact
+
+    def _add_norm(self, norm: LegalNorm):
+        add = self.strings.add
+
+        _pack_id(self._norm_ids, norm.id)
+        self._norm_doknr.append(add(norm.norm_doknr))
+        self._norm_enbez.append(add(norm.enbez))
+        self._norm_paragraph.append(add(norm.paragraph_nummer))
+        self._norm_titel.append(add(norm.titel))
+        self._norm_footnotes.append(int(bool(norm.has_footnotes)) | (2 if norm.gliederung is not None else 0))
+        if norm.tables:
+            self._norm_tables[len(self._norm_order)] = tuple(norm.tables)
+        self._norm_order.append(norm.order_index)
+
+        gliederung = norm.gliederung or {}
+        self._norm_gliederung.extend((add(gliederung.get('kennzahl')),
+                                      add(gliederung.get('bez')),
+                                      add(gliederung.get('titel'))))
+
+        for text_unit in norm.text_units:
+            _pack_id(self._tu_ids, text_unit.id)
+            self._tu_type.append(add(text_unit.type))
+            self._tu_text.append(add(text_unit.text))
+            self._tu_absatz.append(add(text_unit.absatz_nummer))
+            self._tu_order.append(text_unit.order_index)
+
+            for item in text_unit.list_items:
+                _pack_id(self._li_ids, item.id)
+                self._li_type.append(add(item.list_type))
+                self._li_term.append(add(item.term))
+                self._li_definition.append(add(item.definition))
+                self._li_order.append(item.order_index)
+            self._tu_item_offsets.append(len(self._li_order))
+        self._norm_text_offsets.append(len(self._tu_order))
+
+        for amendment in norm.amendments:
+            _pack_id(self._am_ids, amendment.id)
+            self._am_standtyp.append(add(amendment.standtyp))
+            self._am_kommentar.append(add(amendment.standkommentar))
+            self._am_date.append(amendment.amendment_date.toordinal() if amendment.amendment_date else 0)
+            self._am_bgbl.append(add(amendment.bgbl_reference))
+        self._norm_amendment_offsets.append(len(self._am_standtyp))
+
+    # === READ (LegalDocument-compatible) ===
+
+    @property
+    def norms(self) -> _NormSequence:
+        return _NormSequence(self)
+
+    def norm(self, idx: int) -> LegalNorm:
+        """Materialise norm idx with its text units and amendments"""
+        get = self.strings.get
+        flags = self._norm_footnotes[idx]
+
+        gliederung = None
+        if flags & 2:
+            kennzahl, bez, titel = self._norm_gliederung[3 * idx:3 * idx + 3]
+            gliederung = {'kennzahl': get(kennzahl), 'bez': get(bez), 'titel': get(titel)}
+
+        return LegalNorm(
+            id=_unpack_id(self._norm_ids, idx),
+            norm_doknr=get(self._norm_doknr[idx]),
+            enbez=get(self._norm_enbez[idx]),
+            paragraph_nummer=get(self._norm_paragraph[idx]),
+            titel=get(self._norm_titel[idx]),
+            has_footnotes=bool(flags & 1),
+            order_index=self._norm_order[idx],
+            text_units=[self._text_unit(t) for t in range(self._norm_text_offsets[idx],
+                                                           self._norm_text_offsets[idx + 1])],
+            amendments=[self._amendment(a) for a in range(self._norm_amendment_offsets[idx],
+                                                           self._norm_amendment_offsets[idx + 1])],
+            gliederung=gliederung,
+            tables=list(self._norm_tables.get(idx, ()))
+        )
+
+    def _text_unit(self, t: int) -> TextUnit:
+        get = self.strings.get
+        return TextUnit(
+            id=_unpack_id(self._tu_ids, t),
+            type=get(self._tu_type[t]),
+            text=get(self._tu_text[t]),
+            absatz_nummer=get(self._tu_absatz[t]),
+            order_index=self._tu_order[t],
+            list_items=tuple(ListItem(
+                id=_unpack_id(self._li_ids, i),
+                list_type=get(self._li_type[i]),
+                term=get(self._li_term[i]),
+                definition=get(self._li_definition[i]),
+                order_index=self._li_order[i]
+            ) for i in range(self._tu_item_offsets[t], self._tu_item_offsets[t + 1]))
+        )
+
+    def _amendment(self, a: int) -> Amendment:
+        get = self.strings.get
+        ordinal = self._am_date[a]
+        standkommentar = get(self._am_kommentar[a])
+        return Amendment(
+            id=_unpack_id(self._am_ids, a),
+            standtyp=get(self._am_standtyp[a]),
+            standkommentar=standkommentar,
+            amendment_date=date.fromordinal(ordinal) if ordinal else None,
+            bgbl_reference=get(self._am_bgbl[a]),
+            # Keine eigene Spalte: das Änderungsgesetz ergibt sich deterministisch aus dem Kommentar
+            act=parse_amending_act(standkommentar)
+        )
+
+    def to_document(self) -> LegalDocument:
+        """Fully materialised LegalDocument (all norms at once)"""
+        return LegalDocument(
+            id=self.id, doknr=self.doknr, builddate=self.builddate, jurabk=self.jurabk,
+            lange_titel=self.lange_titel, sgb_nummer=self.sgb_nummer,
+            ausfertigung_datum=self.ausfertigung_datum, fundstelle=self.fundstelle,
+            trust_score=self.trust_score, source_type=self.source_type,
+            xml_source_url=self.xml_source_url,
+            norms=list(self.norms), structures=list(self.structures)
+        )
+
+    # === PICKLE / SIZE ===
+
+    def __getstate__(self):
+        self.strings.freeze()
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of strings and columns in bytes (without tables)"""
+        columns = sum(len(getattr(self, name)) * getattr(getattr(self, name), 'itemsize', 1)
+                      for name in self.__slots__ if name.startswith('_') and name != '_norm_tables')
+        return self.strings.nbytes + columns
+
+
+def parse_compact(xml_path: Path, parser: Optional[LegalXMLParser] = None) -> CompactLegalDocument:
+    """Parse an XML file and return it in columnar form
+
+    Top-level function so it can be used directly with ProcessPoolExecutor;
+    only the compact columns travel back to the parent process.
+
+    Args:
+        xml_path: Path to XML file
+        parser: Parser instance (default: new LegalXMLParser)
+
+    Returns:
+        CompactLegalDocument
+    """
+    document = (parser or LegalXMLParser()).parse_dokument(xml_path)
+    compact = CompactLegalDocument.from_document(document)
+    logger.info(f"🗜️  Compacted {compact.jurabk}: {len(compact.norms)} norms, "
+                f"{compact.nbytes / 1024 / 1024:.1f} MB columns")
+    return compact
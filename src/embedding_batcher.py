@@ -0,0 +1,167 @@
+"""
+Embedding Micro-Batcher
+Bündelt nebenläufige Encode-Anfragen zu einem Forward-Pass
+
+Statt jede Query unter einem globalen Lock einzeln zu encodieren, sammelt ein
+Worker-Thread alle Anfragen, die innerhalb eines kurzen Zeitfensters
+(Standard 3 ms) oder bis zur maximalen Batch-Größe eintreffen, und schickt sie
+gemeinsam durch das Modell. Jeder Aufrufer erhält seine eigenen Vektoren über
+ein Future zurück.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EmbeddingMicroBatcher:
+    """
+    Micro-Batching vor einem SentenceTransformer-Modell
+
+    Der Worker-Thread ist der einzige Thread, der das Modell aufruft; ein
+    zusätzlicher Lock ist daher nicht nötig.
+    """
+
+    def __init__(self, embedding_model, max_batch_size: int = 32, max_wait_ms: float = 3.0):
+        """Initialize batcher and start the worker thread
+
+        Args:
+            embedding_model: Model with an `encode(texts)` method
+            max_batch_size: Flush as soon as this many texts are collected
+            max_wait_ms: Collection window after the first request of a batch
+        """
+        self.embedding_model = embedding_model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self.stats = {'batches': 0, 'requests': 0, 'texts': 0}
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        """Queue texts for encoding
+
+        Args:
+            texts: Texts to encode (one request)
+
+        Returns:
+            Future resolving to the embeddings for exactly these texts
+        """
+        future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("EmbeddingMicroBatcher is closed")
+            self._queue.put((list(texts), future))
+        return future
+
+    def encode(self, texts: List[str]):
+        """Blocking encode through the batcher (drop-in for model.encode)"""
+        return self.submit(texts).result()
+
+    def _run(self):
+        """Worker loop: collect a batch, encode, distribute results"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            if not self._claim(item):
+                continue
+
+            batch = [item]
+            batch_texts = len(item[0])
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+
+            while batch_texts < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if not self._claim(item):
+                    continue
+                batch.append(item)
+                batch_texts += len(item[0])
+
+            self._encode_batch(batch)
+
+            if stop:
+                break
+
+        self._fail_pending()
+
+    @staticmethod
+    def _claim(item) -> bool:
+        """Mark a request as running; False if its caller already cancelled it
+
+        asyncio.wrap_future() cancelt das Future, wenn der aufrufende Task
+        abgebrochen wird - solche Anfragen werden nicht mehr encodiert.
+        """
+        return item[1].set_running_or_notify_cancel()
+
+    @staticmethod
+    def _resolve(future: Future, result=None, exception: BaseException = None):
+        """set_result/set_exception that cannot end the worker loop"""
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            logger.debug("Embedding request already resolved or cancelled")
+
+    def _encode_batch(self, batch: List):
+        """Encode all texts of a batch in one forward pass"""
+        texts = [text for request_texts, _ in batch for text in request_texts]
+
+        try:
+            embeddings = self.embedding_model.encode(texts, show_progress_bar=False) if texts else []
+        except Exception as e:
+            logger.error(f"❌ Embedding batch failed: {e}")
+            for _, future in batch:
+                self._resolve(future, exception=e)
+            return
+
+        self.stats['batches'] += 1
+        self.stats['requests'] += len(batch)
+        self.stats['texts'] += len(texts)
+
+        position = 0
+        for request_texts, future in batch:
+            self._resolve(future, embeddings[position:position + len(request_texts)])
+            position += len(request_texts)
+
+    def _fail_pending(self):
+        """Reject requests that arrived after close()"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self._resolve(item[1], exception=RuntimeError("EmbeddingMicroBatcher is closed"))
+
+    def close(self):
+        """Stop the worker after the current batch"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join()
@@ -0,0 +1,1324 @@
+"""
+Graph Storage Backends
+Speicher-Abstraktion unter SozialrechtNeo4jRAG und LegalKnowledgeGraphBuilder
+
+- Neo4jGraphBackend: Produktivbetrieb, führt die Cypher-Queries über Bolt aus
+- InMemoryGraphBackend: reines Python im selben Prozess (Nodes, Edges,
+  Property-Indexe, numpy Vector Store), damit Import-/Retrieval-Benchmarks und
+  Tests ohne Neo4j-Server laufen
+
+Beide Backends liefern Records mit denselben Keys, sodass Ranking und
+Antwort-Aufbau in SozialrechtNeo4jRAG unverändert bleiben.
+"""
+
+import bisect
+import logging
+import threading
+from datetime import date, datetime
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    from . import query_registry
+    from .instrumentation import span
+except ImportError:
+    import query_registry
+    from instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+# Filter-Key -> Cypher-Prädikat auf Document
+SEARCH_FILTERS = {
+    'sgb_nummer': 'd.sgb_nummer IN $sgb_nummer',
+    'document_type': 'd.document_type IN $document_type',
+    'min_trust_score': 'd.trust_score >= $min_trust_score',
+    'stand_datum_from': 'd.stand_datum >= $stand_datum_from',
+    # Stichtag: nur Dokumente, die an diesem Tag schon vorlagen; die gültige
+    # Gesetzesfassung kommt aus den NormVersion-Knoten (rag.version_search)
+    'as_of': '(d.stand_datum IS NULL OR d.stand_datum <= $as_of)',
+}
+
+
+def normalize_search_filters(filters: Optional[Dict]) -> Dict:
+    """Validate search filters and turn single values into lists
+
+    Args:
+        filters: {'sgb_nummer': 'II' | [...], 'document_type': 'Gesetz' | [...],
+                  'min_trust_score': 90, 'stand_datum_from': '2024-01-01',
+                  'as_of': '2023-01-01' | date}
+
+    Returns:
+        Only the active filters (None values dropped)
+    """
+    filters = {key: value for key, value in (filters or {}).items() if value is not None}
+
+    unknown = set(filters) - set(SEARCH_FILTERS)
+    if unknown:
+        raise ValueError(f"Unknown search filter(s): {', '.join(sorted(unknown))}")
+
+    params = {}
+    for key, value in filters.items():
+        if key in ('sgb_nummer', 'document_type'):
+            value = [value] if isinstance(value, str) else list(value)
+        elif key == 'as_of':
+            value = value.isoformat() if isinstance(value, date) else date.fromisoformat(value).isoformat()
+        params[key] = value
+
+    return params
+
+
+def includes_norm_versions(filters: Dict) -> bool:
+    """Whether a point-in-time search also scores NormVersion nodes
+
+    Fassungen zählen als 'Gesetz' mit trust_score 100, die übrigen Filter
+    werden entsprechend darauf angewendet.
+
+    Args:
+        filters: Output of normalize_search_filters()
+    """
+    if 'as_of' not in filters:
+        return False
+    if 'document_type' in filters and 'Gesetz' not in filters['document_type']:
+        return False
+    return filters.get('min_trust_score', 0) <= 100
+
+
+def merge_by_score(first: List, second: List, limit: int) -> List:
+    """Top `limit` records of two score-sorted result lists"""
+    return sorted([*first, *second], key=lambda record: record['score'], reverse=True)[:limit]
+
+
+class GraphBackend:
+    """
+    Storage operations used by the RAG system and the knowledge graph builder
+
+    Documents (PDF graph):   Document -HAS_CHUNK-> Chunk, Document -CONTAINS_PARAGRAPH-> Paragraph
+    Legal documents (XML):   LegalDocument -HAS_STRUCTURE-> StructuralUnit -CONTAINS_NORM-> LegalNorm
+                             LegalNorm -HAS_CONTENT/HAS_AMENDMENT/HAS_CHUNK-> ...
+                             LegalNorm -AMENDED_BY-> BGBlReference <-PUBLISHED_IN- Amendment
+                             (BGBlReference = Änderungsgesetz, one node per BGBl citation)
+                             LegalNorm -HAS_TABLE-> Table -HAS_ROW-> TableRow -HAS_CELL-> TableCell
+                             LegalNorm -HAS_VERSION-> NormVersion -SUPERSEDES-> NormVersion
+                             (Fassung je builddate, gültig in [valid_from, valid_to))
+                             plus the retrieval projection: LegalDocument -CONTAINS_NORM-> LegalNorm,
+                             LegalDocument -HAS_CHUNK-> Chunk and the Chunk properties from
+                             LegalKnowledgeGraphBuilder.chunk_projection()
+    """
+
+    def initialize_schema(self):
+        """Create constraints and indexes (no-op where not needed)"""
+
+    def warm_up(self):
+        """Precompile the RAG queries (no-op where not needed)"""
+
+    def upsert_document(self, doc_id: str, properties: Dict, chunks: List[Dict], paragraphs: List[Dict]):
+        """Write a Document with its chunks and paragraphs
+
+        Args:
+            doc_id: Document ID
+            properties: Document properties (sgb_nummer, document_type, trust_score, ...)
+            chunks: [{'text', 'embedding', 'index', 'paragraph_nummer', 'paragraph_context'}]
+            paragraphs: [{'para_id', 'paragraph_nummer', 'sgb_nummer', 'content', 'chunk_count'}]
+        """
+        raise NotImplementedError
+
+    def upsert_legal_document(self, document: Dict, structures: List[Dict], norms: List[Dict]):
+        """Write a parsed legal document (XML graph)
+
+        Args:
+            document: LegalDocument properties (id, doknr, jurabk, sgb_nummer, ...)
+            structures: StructuralUnit properties
+            norms: [{'properties', 'struct_id', 'text_units' (with 'list_items'),
+                     'amendments', 'chunks', 'version', 'tables', 'table_rows', 'table_cells'}]
+        """
+        raise NotImplementedError
+
+    def replace_legal_document(self, document: Dict, structures: List[Dict], norms: List[Dict]) -> Dict:
+        """Re-import a law (new builddate) without losing the NormVersion history
+
+        LegalNorm- und NormVersion-Knoten bleiben stehen und werden gemergt
+        (die Vorgängerfassung wird dabei geschlossen). Vorher gelöscht werden
+        nur unversionierte Knoten, die der Import vollständig neu schreibt:
+        die LegalDocuments des SGB (die ID enthält das builddate), ihre
+        StructuralUnits sowie TextUnits, ListItems und Tabellen ihrer Normen.
+        Normen, die im neuen Stand fehlen, bekommen repealed_at = builddate,
+        ihre offene Fassung endet dort und ihre Chunks werden entfernt.
+
+        Args:
+            document, structures, norms: wie upsert_legal_document
+
+        Returns:
+            {'deleted': unversioned nodes removed, 'repealed': norms retired}
+        """
+        raise NotImplementedError
+
+    def search_chunks(self, query_embeddings: List[List[float]], limit: int,
+                      filters: Optional[Dict] = None) -> List[List[Dict]]:
+        """Cosine search over Document chunks, one result list per query embedding"""
+        raise NotImplementedError
+
+    def find_paragraph(self, sgb_nummer: str, paragraph_nummer: str,
+                       as_of: Optional[str] = None) -> List[Dict]:
+        """All documents containing this paragraph (Gesetz first)
+
+        With as_of the Gesetz text is the NormVersion valid on that date and
+        only documents with stand_datum <= as_of are returned.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> Optional[Dict]:
+        """Counts with keys doc_count, chunk_count, paragraph_count, sgbs, types"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release resources"""
+
+
+class Neo4jGraphBackend(GraphBackend):
+    """Neo4j backend (Bolt driver)"""
+
+    # Queries live in query_registry (shared with AsyncSozialrechtNeo4jRAG);
+    # {document_filter} wird durch document_filter() ersetzt
+    HYBRID_SEARCH_QUERY = query_registry.HYBRID_SEARCH_TEMPLATE
+    BATCH_SEARCH_QUERY = query_registry.BATCH_SEARCH_TEMPLATE
+    PARAGRAPH_SEARCH_QUERY = query_registry.PARAGRAPH_SEARCH_QUERY
+    PARAGRAPH_AS_OF_QUERY = query_registry.PARAGRAPH_AS_OF_QUERY
+    VERSION_SEARCH_QUERY = query_registry.VERSION_SEARCH_QUERY
+    STATS_QUERY = query_registry.STATS_QUERY
+
+    def __init__(self, driver):
+        """Initialize backend
+
+        Args:
+            driver: Neo4j driver instance
+        """
+        self.driver = driver
+
+    @staticmethod
+    def document_filter(filters: Optional[Dict]) -> Tuple[str, Dict]:
+        """
+        Baut die WHERE-Klausel für Document aus den gesetzten Filtern
+
+        Nur aktive Filter landen in der Query, damit der Planner die
+        Document-Indexe nutzt und nur die Chunks passender Dokumente bewertet.
+        Da vor ORDER BY/LIMIT gefiltert wird, liefert die Suche k Treffer,
+        sofern so viele passende Chunks existieren.
+
+        Args:
+            filters: siehe normalize_search_filters()
+
+        Returns:
+            (WHERE-Klausel oder '', Query-Parameter)
+        """
+        params = normalize_search_filters(filters)
+        if not params:
+            return '', params
+
+        clause = 'WHERE ' + ' AND '.join(SEARCH_FILTERS[key] for key in params)
+        return clause, params
+
+    def initialize_schema(self):
+        """Create Sozialrecht-specific Neo4j schema"""
+        with self.driver.session() as session:
+            # Create constraints
+            session.run("""
+                CREATE CONSTRAINT IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNIQUE
+            """)
+
+            session.run("""
+                CREATE CONSTRAINT IF NOT EXISTS FOR (p:Paragraph) REQUIRE p.id IS UNIQUE
+            """)
+
+            # XML chunks are merged on their stable chunk_id
+            session.run("""
+                CREATE CONSTRAINT IF NOT EXISTS FOR (c:Chunk) REQUIRE c.chunk_id IS UNIQUE
+            """)
+
+            # Structured tables (UNWIND MERGE on id)
+            for label in ('Table', 'TableRow', 'TableCell', 'NormVersion', 'BGBlReference'):
+                session.run(f"""
+                    CREATE CONSTRAINT IF NOT EXISTS FOR (t:{label}) REQUIRE t.id IS UNIQUE
+                """)
+
+            # Create indexes for Sozialrecht-specific queries
+            try:
+                # SGB-specific index
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.sgb_nummer)
+                """)
+
+                # Paragraph number index
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (p:Paragraph) ON (p.paragraph_nummer)
+                """)
+
+                # Source trust score index
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.trust_score)
+                """)
+
+                # Document type index (for hybrid strategy)
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.document_type)
+                """)
+
+                # Stand index (for "nur Weisungen ab 2024")
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.stand_datum)
+                """)
+
+                # Retrieval projection on XML chunks (SGB filter, same-norm lookup)
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (c:Chunk) ON (c.sgb_nummer)
+                """)
+
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (c:Chunk) ON (c.norm_id)
+                """)
+
+                # Table lookups by row label / column header ("Regelbedarfsstufe 3")
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (r:TableRow) ON (r.label)
+                """)
+
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (c:TableCell) ON (c.column_header)
+                """)
+
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (t:Table) ON (t.sgb_nummer)
+                """)
+
+                # Amendment hub lookup by citation ("BGBl. 2024 I Nr. 245")
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (r:BGBlReference) ON (r.reference)
+                """)
+
+                # Interval index for point-in-time queries: valid_from as range
+                # seek behind the paragraph key, valid_to for the open end
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (v:NormVersion)
+                    ON (v.sgb_nummer, v.paragraph_nummer, v.valid_from)
+                """)
+
+                session.run("""
+                    CREATE INDEX IF NOT EXISTS FOR (v:NormVersion) ON (v.valid_to)
+                """)
+
+                # Full-text search index for chunks
+                try:
+                    session.run("""
+                        CREATE FULLTEXT INDEX sozialrecht_fulltext IF NOT EXISTS
+                        FOR (c:Chunk) ON EACH [c.text, c.paragraph_context]
+                    """)
+                except Exception:
+                    logger.warning("Fulltext index might already exist")
+
+            except Exception as e:
+                logger.warning(f"Some indexes might already exist: {e}")
+
+            logger.info("✅ Sozialrecht-specific Neo4j schema initialized")
+
+    def warm_up(self):
+        """Compile the registered rag.* queries so the first search hits a cached plan"""
+        query_registry.warm_plan_cache(self.driver, prefix="rag.")
+
+    # === DOCUMENT GRAPH (PDF) ===
+
+    def upsert_document(self, doc_id: str, properties: Dict, chunks: List[Dict], paragraphs: List[Dict]):
+        with span("neo4j.write", chunks=len(chunks)), self.driver.session() as session:
+            with session.begin_transaction() as tx:
+                self._write_document(tx, doc_id, properties, chunks, paragraphs)
+                tx.commit()
+
+    def _write_document(self, tx, doc_id: str, properties: Dict, chunks: List[Dict], paragraphs: List[Dict]):
+        # Create Document node
+        cypher_create_doc = """
+            MERGE (d:Document {id: $doc_id})
+            SET d.content = $content,
+                d.created = datetime(),
+                d.chunk_count = $chunk_count,
+                d.sgb_nummer = $sgb_nummer,
+                d.document_type = $document_type,
+                d.source_url = $source_url,
+                d.source_domain = $source_domain,
+                d.trust_score = $trust_score,
+                d.type_priority = $type_priority
+        """
+
+        doc_params = {'doc_id': doc_id}
+        for field, value in properties.items():
+            if field not in doc_params and f"${field}" not in cypher_create_doc:
+                cypher_create_doc += f", d.{field} = ${field}"
+            doc_params[field] = value
+
+        tx.run(cypher_create_doc, **doc_params)
+
+        # Batch insert chunks
+        tx.run("""
+            UNWIND $chunk_data as chunk
+            MATCH (d:Document {id: chunk.doc_id})
+            CREATE (c:Chunk {
+                text: chunk.text,
+                embedding: chunk.embedding,
+                chunk_index: chunk.index,
+                paragraph_nummer: chunk.paragraph_nummer,
+                paragraph_context: chunk.paragraph_context
+            })
+            CREATE (d)-[:HAS_CHUNK]->(c)
+        """, chunk_data=[dict(chunk, doc_id=doc_id) for chunk in chunks])
+
+        # Create Paragraph nodes if paragraph numbers found
+        for paragraph in paragraphs:
+            tx.run("""
+                MERGE (p:Paragraph {id: $para_id})
+                SET p.paragraph_nummer = $paragraph_nummer,
+                    p.sgb_nummer = $sgb_nummer,
+                    p.content = $content,
+                    p.chunk_count = $chunk_count
+                WITH p
+                MATCH (d:Document {id: $doc_id})
+                MERGE (d)-[:CONTAINS_PARAGRAPH]->(p)
+            """, dict(paragraph, doc_id=doc_id))
+
+    def _run(self, session, cypher: str, params: Dict) -> List:
+        """session.run + record consumption, each as its own stage"""
+        with span("neo4j.run", cypher=cypher, profile=lambda: self.profile(cypher, params)):
+            result = session.run(cypher, params)
+        with span("neo4j.consume"):
+            return list(result)
+
+    def profile(self, cypher: str, params: Dict) -> List[str]:
+        """Execute the query with PROFILE and flatten the operator tree
+
+        Returns:
+            One line per operator: "<indent>Operator rows=.. dbHits=.."
+        """
+        with self.driver.session() as session:
+            summary = session.run("PROFILE " + cypher, params).consume()
+
+        lines = []
+
+        def walk(operator, depth: int):
+            lines.append(f"{'  ' * depth}{operator.get('operatorType')} "
+                         f"rows={operator.get('rows')} dbHits={operator.get('dbHits')}")
+            for child in operator.get('children', []):
+                walk(child, depth + 1)
+
+        if summary.profile:
+            walk(summary.profile, 0)
+        return lines
+
+    def search_chunks(self, query_embeddings: List[List[float]], limit: int,
+                      filters: Optional[Dict] = None) -> List[List[Dict]]:
+        document_filter, filter_params = self.document_filter(filters)
+
+        with self.driver.session() as session:
+            if len(query_embeddings) == 1:
+                params = dict(filter_params, query_embedding=list(query_embeddings[0]), limit=limit)
+                cypher = self.HYBRID_SEARCH_QUERY.format(document_filter=document_filter)
+                records_per_query = [self._run(session, cypher, params)]
+            else:
+                query_params = [
+                    {'idx': idx, 'embedding': list(embedding)}
+                    for idx, embedding in enumerate(query_embeddings)
+                ]
+
+                params = dict(filter_params, queries=query_params, limit=limit)
+                cypher = self.BATCH_SEARCH_QUERY.format(document_filter=document_filter)
+
+                records_per_query = [[] for _ in query_embeddings]
+                for record in self._run(session, cypher, params):
+                    records_per_query[record['query_idx']].append(record)
+
+            if includes_norm_versions(filter_params):
+                versions_per_query = self._search_versions(session, query_embeddings, limit, filter_params)
+                records_per_query = [merge_by_score(records, versions, limit)
+                                     for records, versions in zip(records_per_query, versions_per_query)]
+
+            return records_per_query
+
+    def _search_versions(self, session, query_embeddings: List[List[float]], limit: int,
+                         filter_params: Dict) -> List[List[Dict]]:
+        """rag.version_search: norm versions valid at filter_params['as_of']"""
+        params = {
+            'queries': [{'idx': idx, 'embedding': list(embedding)}
+                        for idx, embedding in enumerate(query_embeddings)],
+            'as_of': filter_params['as_of'],
+            'sgb_nummer': filter_params.get('sgb_nummer', []),
+            'limit': limit,
+        }
+
+        versions_per_query = [[] for _ in query_embeddings]
+        for record in self._run(session, self.VERSION_SEARCH_QUERY, params):
+            versions_per_query[record['query_idx']].append(record)
+        return versions_per_query
+
+    def find_paragraph(self, sgb_nummer: str, paragraph_nummer: str,
+                       as_of: Optional[str] = None) -> List[Dict]:
+        params = {'sgb': sgb_nummer, 'paragraph': paragraph_nummer}
+        if as_of is not None:
+            params['as_of'] = normalize_search_filters({'as_of': as_of})['as_of']
+
+        with self.driver.session() as session:
+            cypher = self.PARAGRAPH_SEARCH_QUERY if as_of is None else self.PARAGRAPH_AS_OF_QUERY
+            return self._run(session, cypher, params)
+
+    def stats(self) -> Optional[Dict]:
+        with self.driver.session() as session:
+            records = self._run(session, self.STATS_QUERY, {})
+            return records[0] if records else None
+
+    # === LEGAL DOCUMENT GRAPH (XML) ===
+
+    def upsert_legal_document(self, document: Dict, structures: List[Dict], norms: List[Dict]):
+        with span("neo4j.write", norms=len(norms)), self.driver.session() as session:
+            with session.begin_transaction() as tx:
+                self._write_legal_document(tx, document, structures, norms)
+                tx.commit()
+
+    def replace_legal_document(self, document: Dict, structures: List[Dict], norms: List[Dict]) -> Dict:
+        with span("neo4j.write", norms=len(norms)), self.driver.session() as session:
+            with session.begin_transaction() as tx:
+                old_norm_ids, deleted = self._delete_unversioned(tx, document['sgb_nummer'])
+                self._write_legal_document(tx, document, structures, norms)
+                repealed = sorted(set(old_norm_ids) - {norm['properties']['id'] for norm in norms})
+                self._retire_legal_norms(tx, repealed, document['builddate'][:10])
+                tx.commit()
+
+        return {'deleted': deleted, 'repealed': len(repealed)}
+
+    def _write_legal_document(self, tx, document: Dict, structures: List[Dict], norms: List[Dict]):
+        self._create_legal_document(tx, document)
+        for struct in structures:
+            self._create_structural_unit(tx, struct, document['id'])
+        for norm in norms:
+            self._create_legal_norm(tx, norm, document['id'])
+        self._create_amendments(tx, norms)
+
+    def _delete_unversioned(self, tx, sgb_nummer: str) -> Tuple[List[str], int]:
+        """Delete the unversioned nodes of an SGB's current documents
+
+        Returns:
+            (IDs of the norms these documents contained, deleted node count)
+        """
+        old_norm_ids = tx.run("""
+        MATCH (doc:LegalDocument {sgb_nummer: $sgb})-[:CONTAINS_NORM]->(norm:LegalNorm)
+        RETURN collect(DISTINCT norm.id) as norm_ids
+        """, sgb=sgb_nummer).single()['norm_ids']
+
+        deleted = tx.run("""
+        MATCH (doc:LegalDocument {sgb_nummer: $sgb})-[:CONTAINS_NORM]->(norm:LegalNorm)
+        OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
+        OPTIONAL MATCH (text)-[:HAS_LIST_ITEM]->(item:ListItem)
+        OPTIONAL MATCH (norm)-[:HAS_TABLE]->(table:Table)
+        OPTIONAL MATCH (table)-[:HAS_ROW]->(row:TableRow)
+        OPTIONAL MATCH (row)-[:HAS_CELL]->(cell:TableCell)
+        DETACH DELETE text, item, table, row, cell
+        """, sgb=sgb_nummer).consume().counters.nodes_deleted
+
+        deleted += tx.run("""
+        MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+        OPTIONAL MATCH (doc)-[:HAS_STRUCTURE]->(struct:StructuralUnit)
+        DETACH DELETE doc, struct
+        """, sgb=sgb_nummer).consume().counters.nodes_deleted
+
+        return old_norm_ids, deleted
+
+    def _retire_legal_norms(self, tx, norm_ids: List[str], valid_from: str):
+        """Mark norms missing from the new build as repealed
+
+        Sie behalten ihre Fassungen (ohne CONTAINS_NORM); repealed_at hält sie
+        aus der Orphan-Reparatur (graph_consistency.py) heraus.
+        """
+        if not norm_ids:
+            return
+
+        tx.run("""
+        UNWIND $norm_ids AS norm_id
+        MATCH (norm:LegalNorm {id: norm_id})
+        SET norm.repealed_at = date($valid_from)
+        WITH norm
+        OPTIONAL MATCH (norm)-[:HAS_VERSION]->(v:NormVersion)
+        WHERE v.valid_from <= date($valid_from) AND v.valid_to > date($valid_from)
+        SET v.valid_to = date($valid_from)
+        WITH DISTINCT norm
+        OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+        DETACH DELETE chunk
+        """, norm_ids=norm_ids, valid_from=valid_from).consume()
+
+    def _create_legal_document(self, tx, document: Dict):
+        """Create LegalDocument node"""
+        query = """
+        MERGE (d:LegalDocument {id: $id})
+        SET d.doknr = $doknr,
+            d.builddate = datetime($builddate),
+            d.jurabk = $jurabk,
+            d.lange_titel = $lange_titel,
+            d.sgb_nummer = $sgb_nummer,
+            d.ausfertigung_datum = date($ausfertigung_datum),
+            d.fundstelle = $fundstelle,
+            d.trust_score = $trust_score,
+            d.source_type = $source_type,
+            d.xml_source_url = $xml_source_url,
+            d.last_updated = datetime($last_updated),
+            d.structure_count = $structure_count,
+            d.norm_count = $norm_count,
+            d.chunk_count = $chunk_count
+        RETURN d.id as id
+        """
+
+        tx.run(query, **document)
+
+    def _create_structural_unit(self, tx, struct: Dict, doc_id: str):
+        """Create StructuralUnit node and link to document"""
+        query = """
+        MERGE (s:StructuralUnit {id: $id})
+        SET s.gliederungskennzahl = $kennzahl,
+            s.gliederungsbez = $bez,
+            s.gliederungstitel = $titel,
+            s.level = $level,
+            s.order_index = $order_index
+        WITH s
+        MATCH (d:LegalDocument {id: $doc_id})
+        MERGE (d)-[:HAS_STRUCTURE]->(s)
+        RETURN s.id as id
+        """
+
+        tx.run(query,
+            id=struct['id'],
+            kennzahl=struct['gliederungskennzahl'],
+            bez=struct['gliederungsbez'],
+            titel=struct['gliederungstitel'],
+            level=struct['level'],
+            order_index=struct['order_index'],
+            doc_id=doc_id
+        )
+
+    def _create_legal_norm(self, tx, norm: Dict, doc_id: str):
+        """Create LegalNorm node with text units, amendments and chunks"""
+        properties = norm['properties']
+
+        # Direct Document→Norm shortcut, independent of the StructuralUnit
+        norm_query = """
+        MERGE (n:LegalNorm {id: $id})
+        SET n.norm_doknr = $norm_doknr,
+            n.enbez = $enbez,
+            n.paragraph_nummer = $paragraph_nummer,
+            n.titel = $titel,
+            n.content_text = $content_text,
+            n.has_footnotes = $has_footnotes,
+            n.order_index = $order_index,
+            n.repealed_at = null
+        WITH n
+        MATCH (d:LegalDocument {id: $doc_id})
+        MERGE (d)-[:CONTAINS_NORM]->(n)
+        RETURN n.id as id
+        """
+
+        tx.run(norm_query, doc_id=doc_id, **properties)
+
+        # Link to structural unit if applicable
+        if norm.get('struct_id'):
+            link_query = """
+            MATCH (s:StructuralUnit {id: $struct_id})
+            MATCH (n:LegalNorm {id: $norm_id})
+            MERGE (s)-[:CONTAINS_NORM]->(n)
+            """
+            tx.run(link_query, struct_id=norm['struct_id'], norm_id=properties['id'])
+
+        for text_unit in norm['text_units']:
+            query = """
+            MERGE (t:TextUnit {id: $id})
+            SET t.type = $type,
+                t.text = $text,
+                t.absatz_nummer = $absatz_nummer,
+                t.order_index = $order_index
+            WITH t
+            MATCH (n:LegalNorm {id: $norm_id})
+            MERGE (n)-[:HAS_CONTENT]->(t)
+            RETURN t.id as id
+            """
+
+            tx.run(query,
+                id=text_unit['id'],
+                type=text_unit['type'],
+                text=text_unit['text'],
+                absatz_nummer=text_unit['absatz_nummer'],
+                order_index=text_unit['order_index'],
+                norm_id=properties['id']
+            )
+
+            for list_item in text_unit['list_items']:
+                query = """
+                MERGE (l:ListItem {id: $id})
+                SET l.list_type = $list_type,
+                    l.term = $term,
+                    l.definition = $definition,
+                    l.order_index = $order_index
+                WITH l
+                MATCH (t:TextUnit {id: $text_unit_id})
+                MERGE (t)-[:HAS_LIST_ITEM]->(l)
+                """
+
+                tx.run(query, text_unit_id=text_unit['id'], **list_item)
+
+
+        # Tables: one UNWIND batch per level instead of one statement per cell
+        if norm.get('tables'):
+            tx.run("""
+            UNWIND $tables AS table
+            MERGE (t:Table {id: table.id})
+            SET t += table
+            WITH t, table
+            MATCH (n:LegalNorm {id: table.norm_id})
+            MERGE (n)-[:HAS_TABLE]->(t)
+            """, tables=norm['tables'])
+
+            tx.run("""
+            UNWIND $rows AS row
+            MATCH (t:Table {id: row.table_id})
+            MERGE (r:TableRow {id: row.id})
+            SET r += row
+            MERGE (t)-[:HAS_ROW]->(r)
+            """, rows=norm['table_rows'])
+
+            tx.run("""
+            UNWIND $cells AS cell
+            MATCH (r:TableRow {id: cell.row_id})
+            MERGE (c:TableCell {id: cell.id})
+            SET c += cell
+            MERGE (r)-[:HAS_CELL]->(c)
+            """, cells=norm['table_cells'])
+
+        if norm.get('version'):
+            self._create_norm_version(tx, norm['version'])
+
+        # Chunks carry the retrieval projection and hang directly off the
+        # document; MERGE on chunk_id keeps re-imports idempotent
+        for chunk in norm['chunks']:
+            chunk_query = """
+            MERGE (c:Chunk {chunk_id: $chunk_id})
+            SET c.text = $text,
+                c.embedding = $embedding,
+                c.chunk_index = $chunk_index,
+                c.paragraph_context = $paragraph_context,
+                c.doc_id = $doc_id,
+                c.norm_id = $norm_id,
+                c.sgb_nummer = $sgb_nummer,
+                c.jurabk = $jurabk,
+                c.document_type = $document_type,
+                c.trust_score = $trust_score,
+                c.paragraph_nummer = $paragraph_nummer,
+                c.enbez = $enbez,
+                c.norm_titel = $norm_titel,
+                c.structure_path = $structure_path
+            WITH c
+            MATCH (n:LegalNorm {id: $norm_id})
+            MATCH (d:LegalDocument {id: $doc_id})
+            MERGE (n)-[:HAS_CHUNK]->(c)
+            MERGE (d)-[:HAS_CHUNK]->(c)
+            """
+
+            tx.run(chunk_query, **chunk)
+
+        # A shorter norm leaves its tail chunks behind otherwise
+        tx.run("""
+        MATCH (n:LegalNorm {id: $norm_id})-[:HAS_CHUNK]->(c:Chunk)
+        WHERE c.chunk_index >= $chunk_count
+        DETACH DELETE c
+        """, norm_id=properties['id'], chunk_count=len(norm['chunks']))
+
+    def _create_amendments(self, tx, norms: List[Dict]):
+        """Amendments and amending acts of a whole document as three bulk writes
+
+        Dieselbe Stand-Angabe steht bei vielen Normen; Amendment- und
+        BGBlReference-Knoten werden daher je ID einmal geschrieben, die
+        Kanten (HAS_AMENDMENT, AMENDED_BY) in einem UNWIND über alle Normen.
+        """
+        amendments, acts, links = {}, {}, []
+        for norm in norms:
+            for amendment in norm['amendments']:
+                act = amendment.get('act')
+                amendments[amendment['id']] = dict(
+                    {key: value for key, value in amendment.items() if key != 'act'},
+                    act_id=act['id'] if act else None
+                )
+                if act:
+                    acts[act['id']] = act
+                links.append({'norm_id': norm['properties']['id'], 'amendment_id': amendment['id'],
+                              'act_id': act['id'] if act else None})
+
+        if not links:
+            return
+
+        tx.run("""
+        UNWIND $acts AS act
+        MERGE (g:BGBlReference {id: act.id})
+        SET g.reference = act.reference,
+            g.teil = act.teil,
+            g.year = act.year,
+            g.nummer = act.nummer,
+            g.seite = act.seite,
+            g.act_date = date(act.act_date),
+            g.act_type = act.act_type
+        """, acts=list(acts.values()))
+
+        tx.run("""
+        UNWIND $amendments AS amendment
+        MERGE (a:Amendment {id: amendment.id})
+        SET a.standtyp = amendment.standtyp,
+            a.standkommentar = amendment.standkommentar,
+            a.amendment_date = date(amendment.amendment_date),
+            a.bgbl_reference = amendment.bgbl_reference
+        WITH a, amendment
+        WHERE amendment.act_id IS NOT NULL
+        MATCH (g:BGBlReference {id: amendment.act_id})
+        MERGE (a)-[:PUBLISHED_IN]->(g)
+        """, amendments=list(amendments.values()))
+
+        tx.run("""
+        UNWIND $links AS link
+        MATCH (n:LegalNorm {id: link.norm_id})
+        MATCH (a:Amendment {id: link.amendment_id})
+        MERGE (n)-[:HAS_AMENDMENT]->(a)
+        WITH n, link
+        WHERE link.act_id IS NOT NULL
+        MATCH (g:BGBlReference {id: link.act_id})
+        MERGE (n)-[:AMENDED_BY]->(g)
+        """, links=links)
+
+    def _create_norm_version(self, tx, version: Dict):
+        """Merge the NormVersion of this import and close the previous interval
+
+        Hat die zu valid_from gültige Fassung denselben Text, bleibt sie mit
+        ihrem Intervall bestehen (nur Titel/Embedding werden aktualisiert).
+        Sonst gilt die neue Fassung (ID aus norm_id + valid_from) ab builddate
+        bis zur nächstjüngeren Fassung (Import älterer Stände) bzw. offen; die
+        bis dahin gültige Fassung endet am neuen valid_from und wird per
+        SUPERSEDES verkettet. Eine Rückänderung A → B → A ergibt so drei
+        Intervalle.
+        """
+        query = """
+        MATCH (n:LegalNorm {id: $norm_id})
+        OPTIONAL MATCH (n)-[:HAS_VERSION]->(current:NormVersion)
+        WHERE current.valid_from <= date($valid_from) AND current.valid_to > date($valid_from)
+        WITH n, [c IN collect(current) WHERE c.content_text = $content_text] AS unchanged
+        FOREACH (c IN unchanged | SET c.titel = $titel, c.embedding = $embedding)
+        WITH n, unchanged
+        WHERE size(unchanged) = 0
+        OPTIONAL MATCH (n)-[:HAS_VERSION]->(later:NormVersion)
+        WHERE later.valid_from > date($valid_from)
+        WITH n, min(later.valid_from) AS next_from
+        MERGE (v:NormVersion {id: $id})
+        ON CREATE SET v.valid_from = date($valid_from),
+                      v.valid_to = coalesce(next_from, date($valid_to))
+        SET v.norm_id = $norm_id,
+            v.sgb_nummer = $sgb_nummer,
+            v.jurabk = $jurabk,
+            v.paragraph_nummer = $paragraph_nummer,
+            v.enbez = $enbez,
+            v.titel = $titel,
+            v.content_text = $content_text,
+            v.builddate = datetime($builddate),
+            v.embedding = $embedding
+        MERGE (n)-[:HAS_VERSION]->(v)
+        WITH n, v
+        OPTIONAL MATCH (n)-[:HAS_VERSION]->(previous:NormVersion)
+        WHERE previous <> v AND previous.valid_from <= v.valid_from AND previous.valid_to > v.valid_from
+        FOREACH (p IN CASE WHEN previous IS NULL THEN [] ELSE [previous] END |
+            SET p.valid_to = v.valid_from
+            MERGE (v)-[:SUPERSEDES]->(p)
+        )
+        """
+
+        tx.run(query, **version)
+
+    def close(self):
+        self.driver.close()
+
+
+class InMemoryGraphBackend(GraphBackend):
+    """
+    In-process graph store for benchmarks and tests without a Neo4j server
+
+    Nodes are dicts per label, relationships adjacency sets per type, selected
+    properties are indexed (wie die Neo4j-Indexe) and chunk embeddings live in
+    a growing numpy matrix. MERGE/CREATE semantics follow the Cypher of
+    Neo4jGraphBackend (Document chunks are created, XML chunks merged on chunk_id).
+    """
+
+    # (label, property) pairs with an exact-match index
+    INDEXED_PROPERTIES = [
+        ('Document', 'sgb_nummer'),
+        ('Document', 'document_type'),
+        ('Paragraph', 'paragraph_nummer'),
+        ('LegalDocument', 'sgb_nummer'),
+        ('LegalNorm', 'paragraph_nummer'),
+        ('TableRow', 'label'),
+        ('TableCell', 'column_header'),
+    ]
+
+    def __init__(self, embedding_dimensions: Optional[int] = None):
+        """Initialize empty store
+
+        Args:
+            embedding_dimensions: Size of the chunk embedding vectors
+                                  (default: taken from the first chunk)
+        """
+        self.driver = None
+        self.embedding_dimensions = embedding_dimensions
+
+        self.nodes: Dict[str, Dict[str, Dict]] = {}
+        self.relationships: Dict[str, Dict[str, set]] = {}
+        self.indexes = {key: {} for key in self.INDEXED_PROPERTIES}
+
+        # Vector store: row i belongs to self._chunk_ids[i]
+        self._vectors = np.zeros((0, embedding_dimensions or 0), dtype=np.float32)
+        self._vector_count = 0
+        self._chunk_ids: List[Optional[str]] = []
+        self._chunk_owner_doc: List[Optional[str]] = []
+        self._chunk_rows: Dict[str, int] = {}
+
+        # Interval index over NormVersion: per norm (valid_from, id) sorted by
+        # start. The intervals of one norm are disjoint, so the version valid
+        # at a date is the last one starting on or before it (one bisect);
+        # valid_to is read from the node because a later import closes it
+        self._norm_version_starts: Dict[str, List[Tuple[str, str]]] = {}
+        self._paragraph_norms: Dict[Tuple[str, str], set] = {}
+
+        self._lock = threading.RLock()
+
+    # === PRIMITIVES ===
+
+    def merge_node(self, label: str, node_id: str, properties: Dict) -> Dict:
+        """MERGE (n:label {id}) SET n += properties"""
+        with self._lock:
+            nodes = self.nodes.setdefault(label, {})
+            node = nodes.setdefault(node_id, {'id': node_id})
+
+            for (index_label, prop), index in self.indexes.items():
+                if index_label == label and prop in properties:
+                    old_value = node.get(prop)
+                    if old_value in index:
+                        index[old_value].discard(node_id)
+                    index.setdefault(properties[prop], set()).add(node_id)
+
+            node.update(properties)
+            return node
+
+    def merge_relationship(self, rel_type: str, start_id: str, end_id: str):
+        """MERGE (start)-[:rel_type]->(end)"""
+        with self._lock:
+            self.relationships.setdefault(rel_type, {}).setdefault(start_id, set()).add(end_id)
+
+    def neighbours(self, rel_type: str, start_id: str) -> set:
+        return self.relationships.get(rel_type, {}).get(start_id, set())
+
+    def delete_node(self, label: str, node_id: str):
+        """MATCH (n:label {id}) DETACH DELETE n (scans all adjacency sets for incoming edges)"""
+        with self._lock:
+            node = self.nodes.get(label, {}).pop(node_id, None)
+            if node is None:
+                return
+
+            for (index_label, prop), index in self.indexes.items():
+                if index_label == label and node.get(prop) in index:
+                    index[node[prop]].discard(node_id)
+
+            for adjacency in self.relationships.values():
+                adjacency.pop(node_id, None)
+                for end_ids in adjacency.values():
+                    end_ids.discard(node_id)
+
+    def lookup(self, label: str, prop: str, value) -> set:
+        """Node IDs with label and property value (indexed properties only)"""
+        return self.indexes[(label, prop)].get(value, set())
+
+    def _add_chunk(self, owner_label: str, owner_id: str, properties: Dict, embedding,
+                   chunk_id: Optional[str] = None) -> str:
+        """CREATE (PDF) or MERGE on chunk_id (XML) a Chunk node, link it to its owner and store its vector
+
+        Ein bereits bekannter chunk_id überschreibt seine Vektorzeile an Ort
+        und Stelle, Re-Importe legen also keine zweite Zeile an.
+        """
+        with self._lock:
+            if chunk_id is None:
+                chunk_id = f"chunk_{len(self._chunk_ids)}"
+            self.merge_node('Chunk', chunk_id, properties)
+            self.merge_relationship('HAS_CHUNK', owner_id, chunk_id)
+
+            embedding = np.asarray(embedding, dtype=np.float32)
+            if self.embedding_dimensions is None:
+                self.embedding_dimensions = len(embedding)
+                self._vectors = np.zeros((0, self.embedding_dimensions), dtype=np.float32)
+
+            row = self._chunk_rows.get(chunk_id)
+            if row is None:
+                if self._vector_count == len(self._vectors):
+                    grown = np.zeros((max(1024, 2 * len(self._vectors)), self.embedding_dimensions),
+                                     dtype=np.float32)
+                    grown[:self._vector_count] = self._vectors[:self._vector_count]
+                    self._vectors = grown
+
+                row = self._vector_count
+                self._vector_count += 1
+                self._chunk_ids.append(chunk_id)
+                self._chunk_owner_doc.append(owner_id if owner_label == 'Document' else None)
+                self._chunk_rows[chunk_id] = row
+
+            self._vectors[row] = embedding
+            return chunk_id
+
+    def _drop_stale_chunks(self, norm_id: str, doc_id: str, chunk_count: int):
+        """Remove chunks with chunk_index >= chunk_count of a norm that got shorter
+
+        Die Vektorzeile bleibt als Leiche stehen (owner None, wird nie gesucht).
+        """
+        chunks = self.nodes.get('Chunk', {})
+        stale = [chunk_id for chunk_id in self.neighbours('HAS_CHUNK', norm_id)
+                 if chunks[chunk_id].get('chunk_index', 0) >= chunk_count]
+        for chunk_id in stale:
+            del chunks[chunk_id]
+            self.neighbours('HAS_CHUNK', norm_id).discard(chunk_id)
+            self.neighbours('HAS_CHUNK', doc_id).discard(chunk_id)
+            self._chunk_ids[self._chunk_rows.pop(chunk_id)] = None
+
+    # === DOCUMENT GRAPH (PDF) ===
+
+    def upsert_document(self, doc_id: str, properties: Dict, chunks: List[Dict], paragraphs: List[Dict]):
+        with self._lock:
+            self.merge_node('Document', doc_id, dict(properties, created=datetime.now().isoformat()))
+
+            for chunk in chunks:
+                self._add_chunk('Document', doc_id, {
+                    'text': chunk['text'],
+                    'chunk_index': chunk['index'],
+                    'paragraph_nummer': chunk['paragraph_nummer'],
+                    'paragraph_context': chunk['paragraph_context'],
+                }, chunk['embedding'])
+
+            for paragraph in paragraphs:
+                self.merge_node('Paragraph', paragraph['para_id'], {
+                    'paragraph_nummer': paragraph['paragraph_nummer'],
+                    'sgb_nummer': paragraph['sgb_nummer'],
+                    'content': paragraph['content'],
+                    'chunk_count': paragraph['chunk_count'],
+                })
+                self.merge_relationship('CONTAINS_PARAGRAPH', doc_id, paragraph['para_id'])
+
+    def _matching_documents(self, filters: Dict) -> Optional[set]:
+        """Document IDs passing the filters (None = no filter)"""
+        if not filters:
+            return None
+
+        documents = self.nodes.get('Document', {})
+        candidates = None
+
+        for prop in ('sgb_nummer', 'document_type'):
+            if prop in filters:
+                ids = set().union(*(self.lookup('Document', prop, value) for value in filters[prop]))
+                candidates = ids if candidates is None else candidates & ids
+
+        if candidates is None:
+            candidates = set(documents)
+
+        if 'min_trust_score' in filters:
+            candidates = {doc_id for doc_id in candidates
+                          if (documents[doc_id].get('trust_score') or 0) >= filters['min_trust_score']}
+        if 'stand_datum_from' in filters:
+            candidates = {doc_id for doc_id in candidates
+                          if (documents[doc_id].get('stand_datum') or '') >= filters['stand_datum_from']}
+        if 'as_of' in filters:
+            candidates = {doc_id for doc_id in candidates
+                          if (documents[doc_id].get('stand_datum') or '') <= filters['as_of']}
+
+        return candidates
+
+    def search_chunks(self, query_embeddings: List[List[float]], limit: int,
+                      filters: Optional[Dict] = None) -> List[List[Dict]]:
+        filters = normalize_search_filters(filters)
+
+        with span("memory.search", queries=len(query_embeddings)), self._lock:
+            vectors = self._vectors[:self._vector_count]
+            owners = self._chunk_owner_doc
+            allowed = self._matching_documents(filters)
+
+            rows = np.array([
+                i for i, owner in enumerate(owners)
+                if owner is not None and (allowed is None or owner in allowed)
+            ], dtype=np.int64)
+
+            queries = np.asarray(query_embeddings, dtype=np.float32)
+            results = [
+                [self._search_record(rows[i], score) for i, score in best]
+                for best in self._top_k(queries, vectors[rows], limit)
+            ]
+
+            if includes_norm_versions(filters):
+                versions = [version for version in self._versions_valid_at(filters['as_of'])
+                            if version.get('embedding') is not None
+                            and ('sgb_nummer' not in filters or version['sgb_nummer'] in filters['sgb_nummer'])]
+                embeddings = np.asarray([version['embedding'] for version in versions], dtype=np.float32)
+                results = [
+                    merge_by_score(records, [self._version_record(versions[i], score) for i, score in best], limit)
+                    for records, best in zip(results, self._top_k(queries, embeddings, limit))
+                ]
+
+            return results
+
+    @staticmethod
+    def _top_k(queries: np.ndarray, candidates: np.ndarray, limit: int) -> List[List[Tuple[int, float]]]:
+        """Cosine top-k per query as [(candidate index, score)], best first"""
+        if not len(candidates):
+            return [[] for _ in queries]
+
+        candidate_norms = np.linalg.norm(candidates, axis=1)
+        candidate_norms[candidate_norms == 0] = 1.0
+
+        query_norms = np.linalg.norm(queries, axis=1)
+        query_norms[query_norms == 0] = 1.0
+
+        similarities = (queries @ candidates.T) / np.outer(query_norms, candidate_norms)
+
+        results = []
+        top = min(limit, len(candidates))
+        for scores in similarities:
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+            results.append([(int(i), float(scores[i])) for i in best])
+
+        return results
+
+    def _search_record(self, row: int, score: float) -> Dict:
+        """Record with the same keys as HYBRID_SEARCH_QUERY"""
+        chunk = self.nodes['Chunk'][self._chunk_ids[row]]
+        doc = self.nodes['Document'][self._chunk_owner_doc[row]]
+        return {
+            'text': chunk['text'],
+            'paragraph_nummer': chunk.get('paragraph_nummer'),
+            'score': score,
+            'doc_id': doc['id'],
+            'sgb_nummer': doc.get('sgb_nummer'),
+            'document_type': doc.get('document_type'),
+            'trust_score': doc.get('trust_score'),
+            'type_priority': doc.get('type_priority'),
+            'source_url': doc.get('source_url'),
+            'stand_datum': doc.get('stand_datum'),
+            'filename': doc.get('filename'),
+        }
+
+    def _version_record(self, version: Dict, score: float) -> Dict:
+        """Record with the same keys as rag.version_search"""
+        return {
+            'text': version['content_text'],
+            'paragraph_nummer': version.get('paragraph_nummer'),
+            'score': score,
+            'doc_id': version['norm_id'],
+            'sgb_nummer': version.get('sgb_nummer'),
+            'document_type': 'Gesetz',
+            'trust_score': 100,
+            'type_priority': 1,
+            'source_url': None,
+            'stand_datum': version['valid_from'],
+            'filename': version.get('jurabk'),
+        }
+
+    def find_paragraph(self, sgb_nummer: str, paragraph_nummer: str,
+                       as_of: Optional[str] = None) -> List[Dict]:
+        if as_of is not None:
+            as_of = normalize_search_filters({'as_of': as_of})['as_of']
+
+        with self._lock:
+            paragraph_ids = self.lookup('Paragraph', 'paragraph_nummer', paragraph_nummer)
+            records = []
+            for doc_id in self.lookup('Document', 'sgb_nummer', sgb_nummer):
+                doc = self.nodes['Document'][doc_id]
+                if as_of is not None and (doc.get('stand_datum') or '') > as_of:
+                    continue
+                for para_id in self.neighbours('CONTAINS_PARAGRAPH', doc_id) & paragraph_ids:
+                    records.append((doc, self.nodes['Paragraph'][para_id].get('content')))
+
+            if as_of is not None:
+                for version in self._versions_valid_at(as_of, (sgb_nummer, paragraph_nummer)):
+                    records.append(({
+                        'document_type': 'Gesetz',
+                        'trust_score': 100,
+                        'filename': version.get('jurabk'),
+                        'stand_datum': version['valid_from'],
+                        'type_priority': 1,
+                    }, version['content_text']))
+
+            records.sort(key=lambda r: (r[0].get('type_priority', 99), -(r[0].get('trust_score') or 0)))
+            return [{
+                'type': doc.get('document_type'),
+                'trust': doc.get('trust_score'),
+                'filename': doc.get('filename'),
+                'stand_datum': doc.get('stand_datum'),
+                'content': content,
+            } for doc, content in records]
+
+    def _versions_valid_at(self, as_of: str, key: Optional[Tuple[str, str]] = None) -> List[Dict]:
+        """NormVersions with valid_from <= as_of < valid_to (optionally for one paragraph)
+
+        Eine Bisektion pro Norm: O(log v) für einen Paragraphen, O(n log v)
+        über alle n Normen (search_chunks ohne Paragraph-Schlüssel).
+        """
+        norm_ids = self._norm_version_starts if key is None else self._paragraph_norms.get(key, ())
+        versions = self.nodes.get('NormVersion', {})
+        valid = []
+        for norm_id in norm_ids:
+            starts = self._norm_version_starts[norm_id]
+            position = bisect.bisect_right(starts, (as_of, '\uffff'))
+            if position:
+                version = versions[starts[position - 1][1]]
+                if version['valid_to'] > as_of:
+                    valid.append(version)
+        return valid
+
+    def stats(self) -> Optional[Dict]:
+        with self._lock:
+            documents = self.nodes.get('Document', {})
+            chunk_count = sum(1 for owner in self._chunk_owner_doc if owner is not None)
+            paragraph_ids = set().union(*(self.neighbours('CONTAINS_PARAGRAPH', doc_id)
+                                          for doc_id in documents))
+            return {
+                'doc_count': len(documents),
+                'chunk_count': chunk_count,
+                'paragraph_count': len(paragraph_ids),
+                'sgbs': sorted({d.get('sgb_nummer') for d in documents.values() if d.get('sgb_nummer')}),
+                'types': sorted({d.get('document_type') for d in documents.values() if d.get('document_type')}),
+            }
+
+    # === LEGAL DOCUMENT GRAPH (XML) ===
+
+    def upsert_legal_document(self, document: Dict, structures: List[Dict], norms: List[Dict]):
+        with self._lock:
+            doc_id = document['id']
+            self.merge_node('LegalDocument', doc_id, document)
+
+            for struct in structures:
+                self.merge_node('StructuralUnit', struct['id'], struct)
+                self.merge_relationship('HAS_STRUCTURE', doc_id, struct['id'])
+
+            for norm in norms:
+                norm_id = norm['properties']['id']
+                self.merge_node('LegalNorm', norm_id, norm['properties']).pop('repealed_at', None)
+
+                self.merge_relationship('CONTAINS_NORM', doc_id, norm_id)
+                if norm.get('struct_id'):
+                    self.merge_relationship('CONTAINS_NORM', norm['struct_id'], norm_id)
+
+                for text_unit in norm['text_units']:
+                    properties = {key: value for key, value in text_unit.items() if key != 'list_items'}
+                    self.merge_node('TextUnit', text_unit['id'], properties)
+                    self.merge_relationship('HAS_CONTENT', norm_id, text_unit['id'])
+
+                    for list_item in text_unit['list_items']:
+                        self.merge_node('ListItem', list_item['id'], list_item)
+                        self.merge_relationship('HAS_LIST_ITEM', text_unit['id'], list_item['id'])
+
+                for amendment in norm['amendments']:
+                    self.merge_node('Amendment', amendment['id'],
+                                    {key: value for key, value in amendment.items() if key != 'act'})
+                    self.merge_relationship('HAS_AMENDMENT', norm_id, amendment['id'])
+                    act = amendment.get('act')
+                    if act:
+                        self.merge_node('BGBlReference', act['id'], act)
+                        self.merge_relationship('PUBLISHED_IN', amendment['id'], act['id'])
+                        self.merge_relationship('AMENDED_BY', norm_id, act['id'])
+
+                for table in norm.get('tables', []):
+                    self.merge_node('Table', table['id'], table)
+                    self.merge_relationship('HAS_TABLE', norm_id, table['id'])
+                for row in norm.get('table_rows', []):
+                    self.merge_node('TableRow', row['id'], row)
+                    self.merge_relationship('HAS_ROW', row['table_id'], row['id'])
+                for cell in norm.get('table_cells', []):
+                    self.merge_node('TableCell', cell['id'], cell)
+                    self.merge_relationship('HAS_CELL', cell['row_id'], cell['id'])
+
+                for chunk in norm['chunks']:
+                    properties = {key: value for key, value in chunk.items() if key != 'embedding'}
+                    self._add_chunk('LegalNorm', norm_id, properties, chunk['embedding'],
+                                    chunk_id=chunk['chunk_id'])
+                    self.merge_relationship('HAS_CHUNK', doc_id, chunk['chunk_id'])
+                self._drop_stale_chunks(norm_id, doc_id, len(norm['chunks']))
+
+                if norm.get('version'):
+                    self._merge_norm_version(norm_id, norm['version'])
+
+    def replace_legal_document(self, document: Dict, structures: List[Dict], norms: List[Dict]) -> Dict:
+        with self._lock:
+            old_doc_ids = set(self.lookup('LegalDocument', 'sgb_nummer', document['sgb_nummer']))
+            old_norm_ids = set().union(*(self.neighbours('CONTAINS_NORM', doc_id) for doc_id in old_doc_ids))
+
+            unversioned = []
+            for norm_id in old_norm_ids:
+                for text_id in self.neighbours('HAS_CONTENT', norm_id):
+                    unversioned.append(('TextUnit', text_id))
+                    unversioned.extend(('ListItem', item_id) for item_id in self.neighbours('HAS_LIST_ITEM', text_id))
+                for table_id in self.neighbours('HAS_TABLE', norm_id):
+                    unversioned.append(('Table', table_id))
+                    for row_id in self.neighbours('HAS_ROW', table_id):
+                        unversioned.append(('TableRow', row_id))
+                        unversioned.extend(('TableCell', cell_id) for cell_id in self.neighbours('HAS_CELL', row_id))
+            for doc_id in old_doc_ids:
+                unversioned.append(('LegalDocument', doc_id))
+                unversioned.extend(('StructuralUnit', struct_id) for struct_id in self.neighbours('HAS_STRUCTURE', doc_id))
+
+            deleted = 0
+            for label, node_id in set(unversioned):
+                if node_id in self.nodes.get(label, {}):
+                    self.delete_node(label, node_id)
+                    deleted += 1
+
+            self.upsert_legal_document(document, structures, norms)
+
+            valid_from = document['builddate'][:10]
+            repealed = old_norm_ids - {norm['properties']['id'] for norm in norms}
+            versions = self.nodes.get('NormVersion', {})
+            for norm_id in repealed:
+                self.nodes['LegalNorm'][norm_id]['repealed_at'] = valid_from
+                for version_id in self.neighbours('HAS_VERSION', norm_id):
+                    version = versions[version_id]
+                    if version['valid_from'] <= valid_from < version['valid_to']:
+                        version['valid_to'] = valid_from
+                self._drop_stale_chunks(norm_id, document['id'], 0)
+
+            return {'deleted': deleted, 'repealed': len(repealed)}
+
+    def _merge_norm_version(self, norm_id: str, version: Dict):
+        """Same interval handling as Neo4jGraphBackend._create_norm_version"""
+        versions = self.nodes.setdefault('NormVersion', {})
+        version_id = version['id']
+        valid_from = version['valid_from']
+        siblings = [versions[sibling_id] for sibling_id in self.neighbours('HAS_VERSION', norm_id)]
+
+        unchanged = [sibling for sibling in siblings
+                     if sibling['valid_from'] <= valid_from < sibling['valid_to']
+                     and sibling.get('content_text') == version['content_text']]
+        if unchanged:
+            # Text valid at valid_from is unchanged: keep that interval
+            for sibling in unchanged:
+                sibling.update(titel=version['titel'], embedding=version['embedding'])
+            return
+
+        if version_id in versions:
+            # Same build re-imported with a different text: keep the interval
+            self.merge_node('NormVersion', version_id, {key: value for key, value in version.items()
+                                                        if key not in ('valid_from', 'valid_to')})
+        else:
+            later_starts = [sibling['valid_from'] for sibling in siblings if sibling['valid_from'] > valid_from]
+            self.merge_node('NormVersion', version_id,
+                            dict(version, valid_to=min(later_starts) if later_starts else version['valid_to']))
+            bisect.insort(self._norm_version_starts.setdefault(norm_id, []), (valid_from, version_id))
+            self._paragraph_norms.setdefault((version['sgb_nummer'], version['paragraph_nummer']),
+                                             set()).add(norm_id)
+        self.merge_relationship('HAS_VERSION', norm_id, version_id)
+
+        for previous in siblings:
+            if previous['id'] != version_id and previous['valid_from'] <= valid_from < previous['valid_to']:
+                previous['valid_to'] = valid_from
+                self.merge_relationship('SUPERSEDES', version_id, previous['id'])
@@ -0,0 +1,106 @@
+"""
+Graph Statistics
+Statistiken in konstanter Zeit statt OPTIONAL-MATCH-Kaskaden über Document x Chunk x Paragraph
+
+- Gesamtzahlen pro Label und pro (Start-Label, Relationship-Typ) kommen aus
+  dem Count Store von Neo4j (stats.nodes.*, stats.rels.*) und kosten unabhängig
+  von der Graphgröße gleich viel
+- Zahlen pro SGB kommen aus Zählern, die der Import pro Dokument setzt
+  (LegalDocument.structure_count/norm_count/chunk_count,
+  Document.chunk_count/paragraph_count); aggregiert wird nur über
+  Dokument-Knoten, nie über Chunks
+- refresh_document_counters() rechnet die Zähler einmalig nach, z.B. für
+  Graphen, die vor Einführung der Zähler importiert wurden
+
+    overview = graph_overview(driver)
+    overview['nodes']['LegalNorm'], overview['legal_by_sgb'][0]['chunks']
+"""
+
+import logging
+from typing import Dict, List
+
+try:
+    from . import query_registry
+except ImportError:
+    import query_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _single_value(session, name: str, key: str = 'count'):
+    record = session.run(query_registry.get_query(name).cypher).single()
+    return record[key] if record else 0
+
+
+def node_counts(driver) -> Dict[str, int]:
+    """Node count per label (count store)
+
+    Returns:
+        {label: count} for query_registry.STAT_LABELS
+    """
+    with driver.session() as session:
+        return {label: _single_value(session, f"stats.nodes.{label}")
+                for label in query_registry.STAT_LABELS}
+
+
+def relationship_counts(driver) -> Dict[str, int]:
+    """Relationship count per start label and type (count store)
+
+    Returns:
+        {"LegalNorm-HAS_CHUNK": count, ...} for query_registry.STAT_RELATIONSHIPS
+    """
+    with driver.session() as session:
+        return {f"{label}-{rel_type}": _single_value(session, f"stats.rels.{label}.{rel_type}")
+                for label, rel_type in query_registry.STAT_RELATIONSHIPS}
+
+
+def sgb_counters(driver) -> Dict[str, List[Dict]]:
+    """Per-SGB counters from the import-time counters on the document nodes
+
+    Returns:
+        {'legal': [{sgb, documents, structures, norms, chunks}, ...],
+         'pdf': [{sgb, documents, chunks, paragraphs}, ...]}
+    """
+    with driver.session() as session:
+        return {
+            'legal': [dict(record) for record in session.run(query_registry.get_query("stats.legal_by_sgb").cypher)],
+            'pdf': [dict(record) for record in session.run(query_registry.get_query("stats.pdf_by_sgb").cypher)],
+        }
+
+
+def graph_overview(driver) -> Dict:
+    """Everything graphrag_status and the reports need, without scanning chunks
+
+    Returns:
+        {'nodes': node_counts(), 'relationships': relationship_counts(),
+         'legal_by_sgb': [...], 'pdf_by_sgb': [...]}
+    """
+    by_sgb = sgb_counters(driver)
+    return {
+        'nodes': node_counts(driver),
+        'relationships': relationship_counts(driver),
+        'legal_by_sgb': by_sgb['legal'],
+        'pdf_by_sgb': by_sgb['pdf'],
+    }
+
+
+def refresh_document_counters(driver) -> Dict[str, int]:
+    """Recompute the per-document counters from the graph (one full pass)
+
+    Nur nötig für Graphen, die vor den Import-Zählern entstanden sind, oder
+    nach manuellen Änderungen am Graphen; der Import hält sie sonst aktuell.
+
+    Returns:
+        {'legal_documents': updated, 'documents': updated}
+    """
+    with driver.session() as session:
+        legal = session.run(query_registry.get_query("stats.refresh_legal_counters").cypher).single()
+        pdf = session.run(query_registry.get_query("stats.refresh_pdf_counters").cypher).single()
+
+    updated = {
+        'legal_documents': legal['updated'] if legal else 0,
+        'documents': pdf['updated'] if pdf else 0,
+    }
+    logger.info(f"✅ Document counters refreshed: {updated['legal_documents']} legal documents, "
+                f"{updated['documents']} documents")
+    return updated
@@ -3,29 +3,68 @@ Legal Knowledge Graph Builder using neo4j-graphrag-python
 Builds structured legal knowledge graph from parsed XML documents
 """
 
+import hashlib
 import logging
 from typing import List, Dict, Optional
 from neo4j import GraphDatabase
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from xml_legal_parser import LegalDocument, LegalNorm, StructuralUnit, TextUnit, ListItem, Amendment
+try:
+    from .xml_legal_parser import LegalDocument, LegalNorm, StructuralUnit, TextUnit, ListItem, Amendment, AmendingAct
+    from .graph_backend import GraphBackend, Neo4jGraphBackend
+    from .instrumentation import span
+except ImportError:
+    from xml_legal_parser import LegalDocument, LegalNorm, StructuralUnit, TextUnit, ListItem, Amendment, AmendingAct
+    from graph_backend import GraphBackend, Neo4jGraphBackend
+    from instrumentation import span
 from datetime import datetime
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def chunk_id_for(norm_id: str, chunk_index: int) -> str:
+    """Stable chunk ID (same hashing scheme as the XML parser IDs)"""
+    return hashlib.sha256(f"{norm_id}_CHUNK_{chunk_index}".encode()).hexdigest()[:16]
+
+
+# valid_to offener (aktueller) Fassungen; ein Datum statt NULL, damit
+# "valid_to > $as_of" über den Range-Index läuft
+OPEN_VALID_TO = "9999-12-31"
+
+
+def norm_version_id(norm_id: str, valid_from: str) -> str:
+    """Stable NormVersion ID per (norm, valid_from)
+
+    Nicht über den Text: nach einer Rückänderung (A → B → A) ist die
+    erneute Fassung A ein eigenes Intervall.
+    """
+    return hashlib.sha256(f"{norm_id}_VERSION_{valid_from}".encode()).hexdigest()[:16]
+
+
+def version_embedding(embeddings) -> Optional[List[float]]:
+    """Normalised mean of a norm's chunk embeddings (None without chunks)"""
+    if len(embeddings) == 0:
+        return None
+    mean = np.mean(np.asarray(embeddings, dtype=np.float32), axis=0)
+    norm = np.linalg.norm(mean)
+    return (mean / norm if norm else mean).tolist()
+
+
 class LegalKnowledgeGraphBuilder:
     """Use neo4j-graphrag-python to build legal KG"""
     
-    def __init__(self, neo4j_driver, embedding_model: Optional[SentenceTransformer] = None):
+    def __init__(self, neo4j_driver, embedding_model: Optional[SentenceTransformer] = None,
+                 backend: Optional[GraphBackend] = None):
         """Initialize Knowledge Graph Builder
         
         Args:
             neo4j_driver: Neo4j driver instance
             embedding_model: SentenceTransformer model for embeddings (optional)
+            backend: Storage backend (default: Neo4jGraphBackend on neo4j_driver)
         """
         self.driver = neo4j_driver
+        self.backend = backend or Neo4jGraphBackend(neo4j_driver)
         
         # Use provided embedding model or load default
         if embedding_model:
@@ -42,214 +81,314 @@ class LegalKnowledgeGraphBuilder:
         Args:
             legal_document: Parsed LegalDocument object
         """
-        with self.driver.session() as session:
-            with session.begin_transaction() as tx:
-                # 1. Create Legal Document node
-                doc_node_id = self._create_legal_document(tx, legal_document)
-                
-                # 2. Create Structural Units
-                struct_node_ids = self._create_structural_units(tx, legal_document, doc_node_id)
-                
-                # 3. Create Legal Norms with relationships
-                self._create_legal_norms(tx, legal_document, doc_node_id, struct_node_ids)
-                
-                tx.commit()
+        with span("kg.build", jurabk=legal_document.jurabk, norms=len(legal_document.norms)):
+            document, structures, norms = self._graph_records(legal_document)
+            
+            with span("kg.write"):
+                self.backend.upsert_legal_document(document, structures, norms)
         
+        logger.info(f"Created {len(structures)} structural units")
+        logger.info(f"Created {len(norms)} legal norms with content")
         logger.info(f"✅ Built knowledge graph for {legal_document.jurabk}")
     
-    def _create_legal_document(self, tx, doc: LegalDocument) -> str:
-        """Create LegalDocument node"""
-        query = """
-        MERGE (d:LegalDocument {id: $id})
-        SET d.doknr = $doknr,
-            d.builddate = datetime($builddate),
-            d.jurabk = $jurabk,
-            d.lange_titel = $lange_titel,
-            d.sgb_nummer = $sgb_nummer,
-            d.ausfertigung_datum = date($ausfertigung_datum),
-            d.fundstelle = $fundstelle,
-            d.trust_score = $trust_score,
-            d.source_type = $source_type,
-            d.xml_source_url = $xml_source_url,
-            d.last_updated = datetime($last_updated)
-        RETURN d.id as id
-        """
+    def rebuild_from_xml(self, legal_document: LegalDocument):
+        """Re-import a law without losing its NormVersion history
         
-        result = tx.run(query,
-            id=doc.id,
-            doknr=doc.doknr,
-            builddate=doc.builddate.isoformat(),
-            jurabk=doc.jurabk,
-            lange_titel=doc.lange_titel,
-            sgb_nummer=doc.sgb_nummer,
-            ausfertigung_datum=doc.ausfertigung_datum.isoformat() if doc.ausfertigung_datum else None,
-            fundstelle=doc.fundstelle,
-            trust_score=doc.trust_score,
-            source_type=doc.source_type,
-            xml_source_url=doc.xml_source_url,
-            last_updated=datetime.now().isoformat()
-        )
+        Schreibt über GraphBackend.replace_legal_document: unversionierte
+        Knoten des SGB werden ersetzt, LegalNorm und NormVersion gemergt.
+        Normen, die im neuen Stand fehlen, werden als aufgehoben markiert
+        (repealed_at), ihre offene Fassung endet mit diesem builddate.
+        
+        Args:
+            legal_document: Parsed LegalDocument object
+        """
+        with span("kg.build", jurabk=legal_document.jurabk, norms=len(legal_document.norms)):
+            document, structures, norms = self._graph_records(legal_document)
+            
+            with span("kg.write"):
+                result = self.backend.replace_legal_document(document, structures, norms)
         
-        return result.single()['id']
+        sgb = legal_document.sgb_nummer
+        if result['deleted']:
+            logger.info(f"🗑️  Replaced {result['deleted']} unversioned nodes of SGB {sgb}")
+        if result['repealed']:
+            logger.info(f"🗑️  {result['repealed']} norms no longer in SGB {sgb}: marked repealed, versions closed")
+        logger.info(f"Created {len(structures)} structural units")
+        logger.info(f"Created {len(norms)} legal norms with content")
+        logger.info(f"✅ Rebuilt knowledge graph for {legal_document.jurabk}")
     
-    def _create_structural_units(self, tx, doc: LegalDocument, doc_node_id: str) -> Dict[str, str]:
-        """Create StructuralUnit nodes and link to document"""
-        struct_node_ids = {}
+    def _graph_records(self, legal_document: LegalDocument):
+        """LegalDocument, StructuralUnit and LegalNorm records for the backend"""
+        # 1. Legal Document node
+        document = self._legal_document_record(legal_document)
         
-        for struct in doc.structures:
-            query = """
-            MERGE (s:StructuralUnit {id: $id})
-            SET s.gliederungskennzahl = $kennzahl,
-                s.gliederungsbez = $bez,
-                s.gliederungstitel = $titel,
-                s.level = $level,
-                s.order_index = $order_index
-            WITH s
-            MATCH (d:LegalDocument {id: $doc_id})
-            MERGE (d)-[:HAS_STRUCTURE]->(s)
-            RETURN s.id as id
-            """
-            
-            result = tx.run(query,
-                id=struct.id,
-                kennzahl=struct.gliederungskennzahl,
-                bez=struct.gliederungsbez,
-                titel=struct.gliederungstitel,
-                level=struct.level,
-                order_index=struct.order_index,
-                doc_id=doc_node_id
-            )
-            
-            struct_node_ids[struct.gliederungskennzahl] = struct.id
+        # 2. Structural Units
+        structures = self._structural_unit_records(legal_document)
         
-        logger.info(f"Created {len(struct_node_ids)} structural units")
-        return struct_node_ids
+        # 3. Legal Norms with relationships
+        struct_node_ids = {s['gliederungskennzahl']: s['id'] for s in structures}
+        norms = self._legal_norm_records(legal_document, struct_node_ids)
+        
+        # Zähler für graph_statistics (bei Re-Import überschrieben, nicht addiert)
+        document.update(
+            structure_count=len(structures),
+            norm_count=len(norms),
+            chunk_count=sum(len(norm['chunks']) for norm in norms)
+        )
+        return document, structures, norms
+    
+    def _legal_document_record(self, doc: LegalDocument) -> Dict:
+        """LegalDocument node properties"""
+        return {
+            'id': doc.id,
+            'doknr': doc.doknr,
+            'builddate': doc.builddate.isoformat(),
+            'jurabk': doc.jurabk,
+            'lange_titel': doc.lange_titel,
+            'sgb_nummer': doc.sgb_nummer,
+            'ausfertigung_datum': doc.ausfertigung_datum.isoformat() if doc.ausfertigung_datum else None,
+            'fundstelle': doc.fundstelle,
+            'trust_score': doc.trust_score,
+            'source_type': doc.source_type,
+            'xml_source_url': doc.xml_source_url,
+            'last_updated': datetime.now().isoformat()
+        }
+    
+    def _structural_unit_records(self, doc: LegalDocument) -> List[Dict]:
+        """StructuralUnit node properties"""
+        return [{
+            'id': struct.id,
+            'gliederungskennzahl': struct.gliederungskennzahl,
+            'gliederungsbez': struct.gliederungsbez,
+            'gliederungstitel': struct.gliederungstitel,
+            'level': struct.level,
+            'order_index': struct.order_index
+        } for struct in doc.structures]
     
-    def _create_legal_norms(self, tx, doc: LegalDocument, doc_node_id: str, struct_node_ids: Dict[str, str]):
-        """Create LegalNorm nodes with all relationships"""
+    def _legal_norm_records(self, doc: LegalDocument, struct_node_ids: Dict[str, str]) -> List[Dict]:
+        """LegalNorm records incl. text units, amendments, tables, embedded chunks and NormVersion"""
+        paths = self.structure_paths(doc)
+        norms = []
         for norm in doc.norms:
-            # Create norm node
-            norm_query = """
-            MERGE (n:LegalNorm {id: $id})
-            SET n.norm_doknr = $norm_doknr,
-                n.enbez = $enbez,
-                n.paragraph_nummer = $paragraph_nummer,
-                n.titel = $titel,
-                n.content_text = $content_text,
-                n.has_footnotes = $has_footnotes,
-                n.order_index = $order_index
-            RETURN n.id as id
-            """
-            
-            tx.run(norm_query,
-                id=norm.id,
-                norm_doknr=norm.norm_doknr,
-                enbez=norm.enbez,
-                paragraph_nummer=norm.paragraph_nummer,
-                titel=norm.titel,
-                content_text=norm.content_text,
-                has_footnotes=norm.has_footnotes,
-                order_index=norm.order_index
-            )
-            
             # Link to structural unit if applicable
+            struct_id = None
             if norm.gliederung and norm.gliederung['kennzahl']:
                 struct_id = struct_node_ids.get(norm.gliederung['kennzahl'])
-                if struct_id:
-                    link_query = """
-                    MATCH (s:StructuralUnit {id: $struct_id})
-                    MATCH (n:LegalNorm {id: $norm_id})
-                    MERGE (s)-[:CONTAINS_NORM]->(n)
-                    """
-                    tx.run(link_query, struct_id=struct_id, norm_id=norm.id)
-            
-            # Create text units
-            self._create_text_units(tx, norm)
-            
-            # Create amendments
-            self._create_amendments(tx, norm)
             
-            # Generate chunks with embeddings
-            self._create_chunks_with_embeddings(tx, norm, doc.sgb_nummer)
+            chunks = self._chunk_records(doc, norm, paths)
+            norms.append({
+                'properties': {
+                    'id': norm.id,
+                    'norm_doknr': norm.norm_doknr,
+                    'enbez': norm.enbez,
+                    'paragraph_nummer': norm.paragraph_nummer,
+                    'titel': norm.titel,
+                    'content_text': norm.content_text,
+                    'has_footnotes': norm.has_footnotes,
+                    'order_index': norm.order_index
+                },
+                'struct_id': struct_id,
+                'text_units': [self._text_unit_record(text_unit) for text_unit in norm.text_units],
+                'amendments': [self._amendment_record(amendment) for amendment in norm.amendments],
+                'chunks': chunks,
+                'version': self.norm_version_record(doc, norm, [chunk['embedding'] for chunk in chunks]),
+                **self.table_records(doc, norm)
+            })
         
-        logger.info(f"Created {len(doc.norms)} legal norms with content")
+        return norms
     
-    def _create_text_units(self, tx, norm: LegalNorm):
-        """Create TextUnit nodes and link to norm"""
-        for text_unit in norm.text_units:
-            query = """
-            MERGE (t:TextUnit {id: $id})
-            SET t.type = $type,
-                t.text = $text,
-                t.absatz_nummer = $absatz_nummer,
-                t.order_index = $order_index
-            WITH t
-            MATCH (n:LegalNorm {id: $norm_id})
-            MERGE (n)-[:HAS_CONTENT]->(t)
-            RETURN t.id as id
-            """
+    def structure_paths(self, doc: LegalDocument) -> Dict[str, List[str]]:
+        """Gliederungspfad pro Gliederungskennzahl
+        
+        Die Kennzahlen sind hierarchisch (z.B. "010" Kapitel 1, "010020"
+        Abschnitt 2 in Kapitel 1); der Pfad enthält alle Einheiten, deren
+        Kennzahl ein Präfix der eigenen ist, von außen nach innen.
+        
+        Args:
+            doc: Parsed LegalDocument
             
-            tx.run(query,
-                id=text_unit.id,
-                type=text_unit.type,
-                text=text_unit.text,
-                absatz_nummer=text_unit.absatz_nummer,
-                order_index=text_unit.order_index,
-                norm_id=norm.id
-            )
+        Returns:
+            {gliederungskennzahl: ["Kapitel 1 Allgemeine Vorschriften", ...]}
+        """
+        labels = {}
+        for struct in doc.structures:
+            if struct.gliederungskennzahl:
+                label = f"{struct.gliederungsbez or ''} {struct.gliederungstitel or ''}".strip()
+                labels.setdefault(struct.gliederungskennzahl, label)
+        
+        return {
+            kennzahl: [labels[prefix] for prefix in sorted(labels, key=len)
+                       if kennzahl.startswith(prefix) and labels[prefix]]
+            for kennzahl in labels
+        }
+    
+    def chunk_projection(self, doc: LegalDocument, norm: LegalNorm,
+                         structure_paths: Dict[str, List[str]]) -> Dict:
+        """Retrieval-Projektion: Filter- und Kontext-Properties für jeden Chunk
+        
+        Wird beim Schreiben auf jeden Chunk kopiert, damit Retrieval-Queries
+        SGB, Quelle, Paragraph und Gliederung direkt am Chunk lesen, statt
+        LegalDocument-HAS_STRUCTURE-StructuralUnit-CONTAINS_NORM-LegalNorm
+        zu traversieren. Ein erneuter Import hält die Kopie aktuell.
+        
+        Args:
+            doc: Parsed LegalDocument
+            norm: Parsed LegalNorm of the chunk
+            structure_paths: Result of structure_paths(doc)
             
-            # Create list items if applicable
-            if text_unit.list_items:
-                self._create_list_items(tx, text_unit)
+        Returns:
+            Chunk properties (without text/embedding)
+        """
+        kennzahl = norm.gliederung['kennzahl'] if norm.gliederung else None
+        return {
+            'doc_id': doc.id,
+            'norm_id': norm.id,
+            'sgb_nummer': doc.sgb_nummer,
+            'jurabk': doc.jurabk,
+            'document_type': doc.source_type,
+            'trust_score': doc.trust_score,
+            'paragraph_nummer': norm.paragraph_nummer,
+            'enbez': norm.enbez,
+            'norm_titel': norm.titel,
+            'structure_path': structure_paths.get(kennzahl, []) if kennzahl else [],
+        }
     
-    def _create_list_items(self, tx, text_unit: TextUnit):
-        """Create ListItem nodes and link to text unit"""
-        for list_item in text_unit.list_items:
-            query = """
-            MERGE (l:ListItem {id: $id})
-            SET l.list_type = $list_type,
-                l.term = $term,
-                l.definition = $definition,
-                l.order_index = $order_index
-            WITH l
-            MATCH (t:TextUnit {id: $text_unit_id})
-            MERGE (t)-[:HAS_LIST_ITEM]->(l)
-            """
+    def _text_unit_record(self, text_unit: TextUnit) -> Dict:
+        """TextUnit node properties with its list items"""
+        return {
+            'id': text_unit.id,
+            'type': text_unit.type,
+            'text': text_unit.text,
+            'absatz_nummer': text_unit.absatz_nummer,
+            'order_index': text_unit.order_index,
+            'list_items': [{
+                'id': list_item.id,
+                'list_type': list_item.list_type,
+                'term': list_item.term,
+                'definition': list_item.definition,
+                'order_index': list_item.order_index
+            } for list_item in text_unit.list_items]
+        }
+    
+    def norm_version_record(self, doc: LegalDocument, norm: LegalNorm, chunk_embeddings) -> Dict:
+        """NormVersion record: norm text as of this import's builddate
+        
+        Jeder Import mit neuem builddate und geändertem Text legt eine neue
+        Fassung an; die Backends schließen dabei das Intervall der
+        Vorgängerfassung (valid_to = valid_from der neuen) und verketten beide
+        über SUPERSEDES. Ist der Text gleich dem der zu valid_from gültigen
+        Fassung, legen die Backends keine neue an, diese bleibt offen.
+        
+        Args:
+            doc: Parsed LegalDocument (builddate = valid_from)
+            norm: Parsed LegalNorm
+            chunk_embeddings: Embeddings of the norm's chunks
             
-            tx.run(query,
-                id=list_item.id,
-                list_type=list_item.list_type,
-                term=list_item.term,
-                definition=list_item.definition,
-                order_index=list_item.order_index,
-                text_unit_id=text_unit.id
-            )
+        Returns:
+            NormVersion properties incl. valid_from/valid_to (ISO dates)
+        """
+        content_text = norm.content_text
+        valid_from = doc.builddate.date().isoformat()
+        return {
+            'id': norm_version_id(norm.id, valid_from),
+            'norm_id': norm.id,
+            'sgb_nummer': doc.sgb_nummer,
+            'jurabk': doc.jurabk,
+            'paragraph_nummer': norm.paragraph_nummer,
+            'enbez': norm.enbez,
+            'titel': norm.titel,
+            'content_text': content_text,
+            'builddate': doc.builddate.isoformat(),
+            'valid_from': valid_from,
+            'valid_to': OPEN_VALID_TO,
+            'embedding': version_embedding(chunk_embeddings)
+        }
     
-    def _create_amendments(self, tx, norm: LegalNorm):
-        """Create Amendment nodes and link to norm"""
-        for amendment in norm.amendments:
-            query = """
-            MERGE (a:Amendment {id: $id})
-            SET a.standtyp = $standtyp,
-                a.standkommentar = $standkommentar,
-                a.amendment_date = date($amendment_date),
-                a.bgbl_reference = $bgbl_reference
-            WITH a
-            MATCH (n:LegalNorm {id: $norm_id})
-            MERGE (n)-[:HAS_AMENDMENT]->(a)
-            """
+    def table_records(self, doc: LegalDocument, norm: LegalNorm) -> Dict[str, List[Dict]]:
+        """Flat Table/TableRow/TableCell records of a norm (one UNWIND batch each)
+        
+        Table trägt die komplette Tabelle inkl. Spaltenköpfen als kompaktes
+        JSON (data_json) sowie norm_id/sgb_nummer/paragraph_nummer, Zellen
+        tragen Spaltenkopf, Zeilenlabel und den numerischen Wert. Betragsabfragen
+        ("Regelbedarfsstufe 3 ab 1. Januar 2024") laufen so über indizierte
+        Properties statt über semantische Suche im Fließtext.
+        
+        Args:
+            doc: Parsed LegalDocument
+            norm: Parsed LegalNorm
             
-            tx.run(query,
-                id=amendment.id,
-                standtyp=amendment.standtyp,
-                standkommentar=amendment.standkommentar,
-                amendment_date=amendment.amendment_date.isoformat() if amendment.amendment_date else None,
-                bgbl_reference=amendment.bgbl_reference,
-                norm_id=norm.id
-            )
+        Returns:
+            {'tables': [...], 'table_rows': [...], 'table_cells': [...]}
+        """
+        tables, rows, cells = [], [], []
+        for table in norm.tables:
+            tables.append({
+                'id': table.id,
+                'order_index': table.order_index,
+                'text_unit_id': table.text_unit_id,
+                'norm_id': norm.id,
+                'sgb_nummer': doc.sgb_nummer,
+                'paragraph_nummer': norm.paragraph_nummer,
+                'row_count': len(table.rows),
+                'data_json': table.to_json()
+            })
+            for row in table.rows:
+                rows.append({
+                    'id': row.id,
+                    'table_id': table.id,
+                    'row_index': row.row_index,
+                    'is_header': row.is_header,
+                    'label': row.label
+                })
+                cells.extend({
+                    'id': cell.id,
+                    'row_id': row.id,
+                    'row_index': cell.row_index,
+                    'col_index': cell.col_index,
+                    'col_span': cell.col_span,
+                    'text': cell.text,
+                    'column_header': cell.column_header,
+                    'row_label': row.label,
+                    'value': cell.value,
+                    'unit': cell.unit
+                } for cell in row.cells)
+        
+        return {'tables': tables, 'table_rows': rows, 'table_cells': cells}
+    
+    def _amendment_record(self, amendment: Amendment) -> Dict:
+        """Amendment node properties plus its amending act ('act', None without citation)"""
+        return {
+            'id': amendment.id,
+            'standtyp': amendment.standtyp,
+            'standkommentar': amendment.standkommentar,
+            'amendment_date': amendment.amendment_date.isoformat() if amendment.amendment_date else None,
+            'bgbl_reference': amendment.bgbl_reference,
+            'act': self.amending_act_record(amendment.act) if amendment.act else None
+        }
+    
+    @staticmethod
+    def amending_act_record(act: AmendingAct) -> Dict:
+        """BGBlReference node properties (canonical Änderungsgesetz)"""
+        return {
+            'id': act.id,
+            'reference': act.bgbl_reference,
+            'teil': act.teil,
+            'year': act.year,
+            'nummer': act.nummer,
+            'seite': act.seite,
+            'act_date': act.act_date.isoformat() if act.act_date else None,
+            'act_type': act.act_type
+        }
     
-    def _create_chunks_with_embeddings(self, tx, norm: LegalNorm, sgb_nummer: Optional[str]):
-        """Create Chunk nodes with embeddings for RAG"""
+    def split_norm_into_chunks(self, norm: LegalNorm) -> List[str]:
+        """Combine a norm's text units into RAG chunks (800 char limit)
+        
+        Args:
+            norm: Parsed LegalNorm
+            
+        Returns:
+            List of chunk texts in document order
+        """
         # Combine text units into chunks (respect 800 char limit from existing system)
         chunks = []
         current_chunk = ""
@@ -272,33 +411,32 @@ class LegalKnowledgeGraphBuilder:
         if not chunks and norm.content_text:
             chunks = [norm.content_text[:800]]
         
-        # Generate embeddings and create chunk nodes
-        if chunks:
+        return chunks
+    
+    def _chunk_records(self, doc: LegalDocument, norm: LegalNorm,
+                       structure_paths: Dict[str, List[str]]) -> List[Dict]:
+        """Chunk records with embeddings and retrieval projection for RAG"""
+        with span("kg.chunk"):
+            chunks = self.split_norm_into_chunks(norm)
+        
+        if not chunks:
+            return []
+        
+        # Generate embeddings in one batch per norm
+        with span("kg.embed", texts=len(chunks)):
             embeddings = self.embedding_model.encode(chunks, show_progress_bar=False)
-            
-            for idx, (chunk_text, embedding) in enumerate(zip(chunks, embeddings)):
-                chunk_query = """
-                CREATE (c:Chunk)
-                SET c.text = $text,
-                    c.embedding = $embedding,
-                    c.chunk_index = $chunk_index,
-                    c.paragraph_context = $paragraph_context
-                WITH c
-                MATCH (n:LegalNorm {id: $norm_id})
-                MERGE (n)-[:HAS_CHUNK]->(c)
-                """
-                
-                paragraph_context = f"{sgb_nummer or ''} {norm.enbez} - {norm.titel}"
-                
-                tx.run(chunk_query,
-                    text=chunk_text,
-                    embedding=embedding.tolist(),
-                    chunk_index=idx,
-                    paragraph_context=paragraph_context,
-                    norm_id=norm.id
-                )
-            
-            logger.debug(f"Created {len(chunks)} chunks for {norm.enbez}")
+        paragraph_context = f"{doc.sgb_nummer or ''} {norm.enbez} - {norm.titel}"
+        projection = self.chunk_projection(doc, norm, structure_paths)
+        
+        logger.debug(f"Created {len(chunks)} chunks for {norm.enbez}")
+        
+        return [dict(projection,
+            chunk_id=chunk_id_for(norm.id, idx),
+            text=chunk_text,
+            embedding=embedding.tolist(),
+            chunk_index=idx,
+            paragraph_context=paragraph_context
+        ) for idx, (chunk_text, embedding) in enumerate(zip(chunks, embeddings))]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,224 @@
+"""
+Instrumentation
+Leichtgewichtige Stage-Spans für Import- und Query-Pfade
+
+    with span("rag.encode", texts=3):
+        ...
+
+- Jede Span-Dauer landet in einem Histogramm pro Stage (stage_metrics())
+- Root-Spans mit `query` Attribut, die länger als SLOW_QUERY_MS (Default 500)
+  dauern, landen im Slow-Query-Log: Query-Text, Zeit pro Stage, Cypher und -
+  mit SLOW_QUERY_PROFILE=1 - das Cypher-Profil (PROFILE, führt die Query
+  erneut aus)
+- Mit INSTRUMENTATION_OTEL=1 und installiertem opentelemetry-api wird jede
+  Span zusätzlich als OpenTelemetry-Span exportiert
+- INSTRUMENTATION=0 schaltet alles ab
+"""
+
+import os
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv("INSTRUMENTATION", "1") != "0"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))
+SLOW_QUERY_PROFILE = os.getenv("SLOW_QUERY_PROFILE", "0") == "1"
+
+_tracer = None
+if otel_trace is not None and os.getenv("INSTRUMENTATION_OTEL", "0") == "1":
+    _tracer = otel_trace.get_tracer("sozialrecht_rag")
+
+HISTOGRAM_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class StageHistogram:
+    """Fixed-bucket latency histogram plus a reservoir for percentiles"""
+
+    def __init__(self, reservoir_size: int = 2000):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self._recent = deque(maxlen=reservoir_size)
+        self._lock = threading.Lock()
+
+    def observe(self, duration_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            self.max_ms = max(self.max_ms, duration_ms)
+            self._recent.append(duration_ms)
+
+            for i, upper in enumerate(HISTOGRAM_BUCKETS_MS):
+                if duration_ms < upper:
+                    self.buckets[i] += 1
+                    break
+            else:
+                self.buckets[-1] += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            count, total_ms, max_ms, buckets = self.count, self.total_ms, self.max_ms, list(self.buckets)
+
+        def percentile(p: float) -> Optional[float]:
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(p / 100 * len(recent)))], 3)
+
+        labels = [f"<{upper}ms" for upper in HISTOGRAM_BUCKETS_MS] + [f">={HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        return {
+            'count': count,
+            'total_ms': round(total_ms, 3),
+            'mean_ms': round(total_ms / count, 3) if count else None,
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'p99_ms': percentile(99),
+            'max_ms': round(max_ms, 3),
+            'buckets': dict(zip(labels, buckets)),
+        }
+
+
+class Span:
+    """A timed stage; children report their durations to the root span"""
+
+    def __init__(self, name: str, attributes: Dict, parent: Optional['Span']):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.root = parent.root if parent else self
+        self.duration_ms = 0.0
+        # Only filled on root spans: stage -> accumulated ms
+        self.stages: Dict[str, float] = {}
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+
+_histograms: Dict[str, StageHistogram] = {}
+_histograms_lock = threading.Lock()
+# Tuple of open spans; a ContextVar keeps threads and asyncio tasks apart
+_active: ContextVar[tuple] = ContextVar('instrumentation_spans', default=())
+_slow_queries = deque(maxlen=100)
+
+
+def _histogram(name: str) -> StageHistogram:
+    histogram = _histograms.get(name)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(name, StageHistogram())
+    return histogram
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Time a stage and record it in the stage histogram
+
+    Args:
+        name: Stage name, e.g. "rag.encode", "neo4j.run", "kg.embed"
+        **attributes: Span attributes (query, cypher, texts, ...); a callable
+                      `profile` attribute is used for the slow-query log
+    """
+    if not ENABLED:
+        yield Span(name, attributes, None)
+        return
+
+    stack = _active.get()
+    current = Span(name, attributes, stack[-1] if stack else None)
+    token = _active.set(stack + (current,))
+
+    otel_context = None
+    if _tracer is not None:
+        otel_attributes = {key: value for key, value in attributes.items()
+                           if isinstance(value, (str, bool, int, float))}
+        otel_context = _tracer.start_as_current_span(name, attributes=otel_attributes)
+        otel_context.__enter__()
+
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        _active.reset(token)
+
+        if otel_context is not None:
+            otel_context.__exit__(None, None, None)
+
+        _histogram(name).observe(current.duration_ms)
+
+        if current.parent is not None:
+            current.root.stages[name] = current.root.stages.get(name, 0.0) + current.duration_ms
+            if 'cypher' in attributes:
+                current.root.attributes.setdefault('_cypher_span', current)
+        elif 'query' in attributes and current.duration_ms > SLOW_QUERY_MS:
+            _log_slow_query(current)
+
+
+def _log_slow_query(root: Span):
+    """Store and log a slow root span with its stage breakdown"""
+    cypher_span = root.attributes.get('_cypher_span')
+
+    entry = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'stage': root.name,
+        'query': root.attributes['query'],
+        'duration_ms': round(root.duration_ms, 2),
+        'stages_ms': {name: round(ms, 2) for name, ms in root.stages.items()},
+        'cypher': cypher_span.attributes.get('cypher') if cypher_span else None,
+        'profile': None,
+    }
+
+    if SLOW_QUERY_PROFILE and cypher_span and callable(cypher_span.attributes.get('profile')):
+        try:
+            entry['profile'] = cypher_span.attributes['profile']()
+        except Exception as e:
+            logger.warning(f"⚠️  Cypher profile failed: {e}")
+
+    _slow_queries.append(entry)
+
+    stages = ", ".join(f"{name}={ms:.1f}ms" for name, ms in entry['stages_ms'].items())
+    logger.warning(f"🐢 Slow query ({entry['duration_ms']:.0f}ms) '{entry['query'][:80]}': {stages}")
+
+
+def stage_metrics() -> Dict[str, Dict]:
+    """Per-stage histograms and percentiles"""
+    with _histograms_lock:
+        histograms = dict(_histograms)
+    return {name: histogram.snapshot() for name, histogram in sorted(histograms.items())}
+
+
+def slow_queries() -> List[Dict]:
+    """Most recent slow queries (newest last)"""
+    return list(_slow_queries)
+
+
+def reset_metrics():
+    """Clear histograms and the slow-query log"""
+    with _histograms_lock:
+        _histograms.clear()
+    _slow_queries.clear()
+
+
+def format_stage_report() -> str:
+    """Per-stage table for console output"""
+    lines = [f"{'Stage':<28} {'Count':>8} {'Mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'Max':>9}"]
+    lines.append("-" * 86)
+
+    def fmt(value: Optional[float]) -> str:
+        return f"{value:.2f}" if value is not None else "-"
+
+    for name, m in stage_metrics().items():
+        lines.append(f"{name:<28} {m['count']:>8} {fmt(m['mean_ms']):>9} {fmt(m['p50_ms']):>9} "
+                     f"{fmt(m['p95_ms']):>9} {fmt(m['p99_ms']):>9} {fmt(m['max_ms']):>9}")
+    return "\n".join(lines)
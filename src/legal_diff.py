@@ -0,0 +1,335 @@
+"""
+Legal Document Diff
+Normgenauer Vergleich zweier Builds desselben Gesetzes (gesetze-im-internet.de)
+
+Normen werden über norm_doknr zugeordnet, übrig gebliebene über enbez
+(§-Bezeichnung). Für geänderte Normen wird die Folge der Absätze
+(TextUnit.text) mit difflib.SequenceMatcher verglichen, ersetzte Absätze
+zusätzlich wortweise. Unveränderte Normen kosten nur einen Tupel-Vergleich,
+daher dauert ein Vergleich eines ganzen SGB wenige Millisekunden; die Zeit
+steckt im Parsen der beiden XML-Dateien.
+
+Das Ergebnis (ChangeSet) ist JSON-serialisierbar und liefert die Norm-IDs,
+die ein inkrementeller Import neu schreiben bzw. löschen muss:
+
+    change_set = diff_documents(parser.parse_dokument(old_xml), parser.parse_dokument(new_xml))
+    change_set.upsert_norm_ids, change_set.delete_norm_ids
+"""
+
+import json
+import logging
+import re
+import tempfile
+import zipfile
+from dataclasses import dataclass, field, asdict
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .xml_legal_parser import LegalDocument, LegalNorm, LegalXMLParser
+except ImportError:
+    from xml_legal_parser import LegalDocument, LegalNorm, LegalXMLParser
+
+logger = logging.getLogger(__name__)
+
+# NormChange.kind
+ADDED = 'added'
+REMOVED = 'removed'
+MODIFIED = 'modified'
+RENUMBERED = 'renumbered'  # enbez geändert (Text ggf. ebenfalls)
+REKEYED = 'rekeyed'  # nur die ID hat sich geändert (Positions-enbez "Norm 12"), Inhalt gleich
+
+# Fallback-enbez des Parsers für Normen ohne <enbez> (Position im Dokument);
+# verschiebt sich bei jeder eingefügten/entfernten Norm und ist keine §-Bezeichnung
+POSITIONAL_ENBEZ_RE = re.compile(r'^Norm \d+$')
+
+
+@dataclass
+class TextUnitChange:
+    """One changed block of text units (difflib opcode)"""
+    op: str  # "insert", "delete", "replace"
+    old_range: Tuple[int, int]  # text unit positions in the old norm [start, end)
+    new_range: Tuple[int, int]
+    old_texts: List[str] = field(default_factory=list)
+    new_texts: List[str] = field(default_factory=list)
+    # Wortweiser Diff bei 1:1 ersetzten Absätzen: [("=", "text"), ("-", "alt"), ("+", "neu"), ...]
+    word_diff: Optional[List[Tuple[str, str]]] = None
+
+
+@dataclass
+class NormChange:
+    """Change of one norm between two builds"""
+    kind: str  # ADDED, REMOVED, MODIFIED, RENUMBERED, REKEYED
+    norm_doknr: str
+    old_id: Optional[str] = None
+    new_id: Optional[str] = None
+    old_enbez: Optional[str] = None
+    new_enbez: Optional[str] = None
+    paragraph_nummer: Optional[str] = None  # of the new norm (old one if removed)
+    titel_changed: bool = False
+    amendments_changed: bool = False
+    similarity: float = 0.0  # SequenceMatcher ratio over the text units
+    unit_changes: List[TextUnitChange] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        """'§ 20' or '§ 20 → § 20a'"""
+        if self.kind == RENUMBERED:
+            return f"{self.old_enbez} → {self.new_enbez}"
+        return self.new_enbez or self.old_enbez or self.norm_doknr
+
+
+@dataclass
+class ChangeSet:
+    """All norm changes between two builds of one legal document"""
+    doknr: str
+    jurabk: str
+    sgb_nummer: Optional[str]
+    old_builddate: str
+    new_builddate: str
+    old_document_id: str
+    new_document_id: str
+    unchanged_count: int = 0
+    changes: List[NormChange] = field(default_factory=list)
+
+    def of_kind(self, kind: str) -> List[NormChange]:
+        return [change for change in self.changes if change.kind == kind]
+
+    @property
+    def upsert_norm_ids(self) -> List[str]:
+        """LegalNorm IDs the incremental import has to (re)write"""
+        return [change.new_id for change in self.changes if change.kind != REMOVED]
+
+    @property
+    def delete_norm_ids(self) -> List[str]:
+        """LegalNorm IDs that no longer exist (removed, or new ID = hash(doknr, enbez))"""
+        return [change.old_id for change in self.changes
+                if change.kind == REMOVED or (change.new_id is not None and change.old_id != change.new_id)]
+
+    def summary(self) -> Dict[str, int]:
+        counts = {kind: 0 for kind in (ADDED, REMOVED, MODIFIED, RENUMBERED, REKEYED)}
+        for change in self.changes:
+            counts[change.kind] += 1
+        counts['unchanged'] = self.unchanged_count
+        return counts
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data['summary'] = self.summary()
+        data['upsert_norm_ids'] = self.upsert_norm_ids
+        data['delete_norm_ids'] = self.delete_norm_ids
+        return data
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
+
+def word_diff(old_text: str, new_text: str) -> List[Tuple[str, str]]:
+    """Word-level diff as ("=" | "-" | "+", text) segments"""
+    old_words = old_text.split()
+    new_words = new_text.split()
+    segments = []
+    for op, i1, i2, j1, j2 in SequenceMatcher(None, old_words, new_words, autojunk=False).get_opcodes():
+        if op == 'equal':
+            segments.append(('=', " ".join(old_words[i1:i2])))
+            continue
+        if i2 > i1:
+            segments.append(('-', " ".join(old_words[i1:i2])))
+        if j2 > j1:
+            segments.append(('+', " ".join(new_words[j1:j2])))
+    return segments
+
+
+def render_word_diff(segments: List[Tuple[str, str]], context_words: int = 8) -> str:
+    """Inline rendering for reports: '... bisher [-449-]{+563+} Euro ...'"""
+    parts = []
+    last = len(segments) - 1
+    for idx, (op, text) in enumerate(segments):
+        if op == '-':
+            parts.append(f"[-{text}-]")
+        elif op == '+':
+            parts.append(f"{{+{text}+}}")
+        else:
+            words = text.split()
+            if idx > 0 and idx < last and len(words) > 2 * context_words:
+                text = f"{' '.join(words[:context_words])} … {' '.join(words[-context_words:])}"
+            elif idx == 0 and len(words) > context_words:
+                text = f"… {' '.join(words[-context_words:])}"
+            elif idx == last and len(words) > context_words:
+                text = f"{' '.join(words[:context_words])} …"
+            parts.append(text)
+    return " ".join(parts)
+
+
+def section_label(norm: LegalNorm) -> Optional[str]:
+    """enbez, or None for the parser's positional fallback"""
+    if not norm.enbez or POSITIONAL_ENBEZ_RE.match(norm.enbez):
+        return None
+    return norm.enbez
+
+
+def diff_norms(old: LegalNorm, new: LegalNorm, with_word_diff: bool = True) -> Optional[NormChange]:
+    """Compare two matched norms
+
+    Args:
+        old: Norm from the old build
+        new: Norm with the same norm_doknr (or enbez) from the new build
+        with_word_diff: Also diff 1:1 replaced text units word by word
+
+    Returns:
+        NormChange or None if text, enbez, titel and amendments are unchanged
+    """
+    old_texts = tuple(text_unit.text for text_unit in old.text_units)
+    new_texts = tuple(text_unit.text for text_unit in new.text_units)
+    renumbered = section_label(old) != section_label(new)
+    titel_changed = old.titel != new.titel
+    amendments_changed = (tuple(a.standkommentar for a in old.amendments)
+                          != tuple(a.standkommentar for a in new.amendments))
+
+    if old_texts == new_texts and not (renumbered or titel_changed or amendments_changed):
+        if old.id == new.id:
+            return None
+        kind = REKEYED
+    else:
+        kind = RENUMBERED if renumbered else MODIFIED
+
+    change = NormChange(
+        kind=kind,
+        norm_doknr=new.norm_doknr,
+        old_id=old.id,
+        new_id=new.id,
+        old_enbez=old.enbez,
+        new_enbez=new.enbez,
+        paragraph_nummer=new.paragraph_nummer,
+        titel_changed=titel_changed,
+        amendments_changed=amendments_changed,
+        similarity=1.0
+    )
+
+    if old_texts != new_texts:
+        matcher = SequenceMatcher(None, old_texts, new_texts, autojunk=False)
+        change.similarity = matcher.ratio()
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == 'equal':
+                continue
+            unit_change = TextUnitChange(
+                op=op,
+                old_range=(i1, i2),
+                new_range=(j1, j2),
+                old_texts=list(old_texts[i1:i2]),
+                new_texts=list(new_texts[j1:j2])
+            )
+            if with_word_diff and op == 'replace' and i2 - i1 == 1 and j2 - j1 == 1:
+                unit_change.word_diff = word_diff(old_texts[i1], new_texts[j1])
+            change.unit_changes.append(unit_change)
+
+    return change
+
+
+def diff_documents(old_doc: LegalDocument, new_doc: LegalDocument,
+                   with_word_diff: bool = True) -> ChangeSet:
+    """Norm-level change set between two builds of the same legal document
+
+    Args:
+        old_doc: Parsed old build
+        new_doc: Parsed new build
+        with_word_diff: Word-level diff for replaced text units
+
+    Returns:
+        ChangeSet (changes in order of the new build, removed norms last)
+    """
+    if old_doc.doknr != new_doc.doknr:
+        logger.warning(f"⚠️  Comparing different documents: {old_doc.doknr} vs. {new_doc.doknr}")
+
+    change_set = ChangeSet(
+        doknr=new_doc.doknr,
+        jurabk=new_doc.jurabk,
+        sgb_nummer=new_doc.sgb_nummer,
+        old_builddate=old_doc.builddate.isoformat(),
+        new_builddate=new_doc.builddate.isoformat(),
+        old_document_id=old_doc.id,
+        new_document_id=new_doc.id
+    )
+
+    old_by_doknr = {norm.norm_doknr: norm for norm in old_doc.norms}
+    matched_old = set()
+    unmatched_new = []
+    pairs = []
+
+    for norm in new_doc.norms:
+        old = old_by_doknr.get(norm.norm_doknr)
+        if old is not None and old.norm_doknr not in matched_old:
+            matched_old.add(old.norm_doknr)
+            pairs.append((old, norm))
+        else:
+            pairs.append((None, norm))
+            unmatched_new.append(len(pairs) - 1)
+
+    # Fallback: neue norm_doknr, aber gleiche §-Bezeichnung
+    if unmatched_new:
+        old_by_enbez = {section_label(norm): norm for norm in old_doc.norms
+                        if section_label(norm) and norm.norm_doknr not in matched_old}
+        for position in unmatched_new:
+            new = pairs[position][1]
+            old = old_by_enbez.pop(section_label(new), None) if section_label(new) else None
+            if old is not None:
+                matched_old.add(old.norm_doknr)
+                pairs[position] = (old, new)
+
+    for old, new in pairs:
+        if old is None:
+            change_set.changes.append(NormChange(
+                kind=ADDED, norm_doknr=new.norm_doknr, new_id=new.id, new_enbez=new.enbez,
+                paragraph_nummer=new.paragraph_nummer,
+                unit_changes=[TextUnitChange(op='insert', old_range=(0, 0), new_range=(0, len(new.text_units)),
+                                             new_texts=[text_unit.text for text_unit in new.text_units])]
+            ))
+            continue
+
+        change = diff_norms(old, new, with_word_diff)
+        if change is None:
+            change_set.unchanged_count += 1
+        else:
+            change_set.changes.append(change)
+
+    for old in old_doc.norms:
+        if old.norm_doknr not in matched_old:
+            change_set.changes.append(NormChange(
+                kind=REMOVED, norm_doknr=old.norm_doknr, old_id=old.id, old_enbez=old.enbez,
+                paragraph_nummer=old.paragraph_nummer,
+                unit_changes=[TextUnitChange(op='delete', old_range=(0, len(old.text_units)), new_range=(0, 0),
+                                             old_texts=[text_unit.text for text_unit in old.text_units])]
+            ))
+
+    return change_set
+
+
+def load_build(path: Path, parser: Optional[LegalXMLParser] = None) -> LegalDocument:
+    """Parse one build from an XML file, an xml_cache/<sgb>/ directory or an xml.zip
+
+    Args:
+        path: .xml file, directory containing one .xml, or .zip from gesetze-im-internet.de
+        parser: Parser instance (created if omitted)
+
+    Returns:
+        Parsed LegalDocument
+    """
+    parser = parser or LegalXMLParser()
+    path = Path(path)
+
+    if path.is_dir():
+        xml_files = sorted(path.glob("*.xml"))
+        if not xml_files:
+            raise FileNotFoundError(f"No XML file in {path}")
+        return parser.parse_dokument(xml_files[0])
+
+    if path.suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            members = [name for name in archive.namelist() if name.endswith('.xml')]
+            if not members:
+                raise FileNotFoundError(f"No XML file in {path}")
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                return parser.parse_dokument(Path(archive.extract(members[0], tmp_dir)))
+
+    return parser.parse_dokument(path)
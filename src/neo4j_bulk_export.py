@@ -0,0 +1,392 @@
+"""
+Neo4j Bulk Export for offline full rebuilds
+Writes parsed legal XML (incl. chunks and embeddings) as CSV files in
+`neo4j-admin database import full` format
+
+A cold rebuild of all SGBs then takes one offline import instead of
+thousands of transactional Bolt writes. Constraints, indexes and the
+vector index are created afterwards via `apply_post_import_schema`.
+"""
+
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .xml_legal_parser import LegalDocument, LegalNorm
+    from .graphrag_legal_extractor import LegalKnowledgeGraphBuilder, chunk_id_for
+except ImportError:
+    from xml_legal_parser import LegalDocument, LegalNorm
+    from graphrag_legal_extractor import LegalKnowledgeGraphBuilder, chunk_id_for
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Node files: label -> CSV header (neo4j-admin type annotations)
+NODE_HEADERS = {
+    'LegalDocument': [
+        'id:ID(LegalDocument)', 'doknr', 'builddate:datetime', 'jurabk', 'lange_titel',
+        'sgb_nummer', 'ausfertigung_datum:date', 'fundstelle', 'trust_score:int',
+        'source_type', 'xml_source_url',
+        'structure_count:int', 'norm_count:int', 'chunk_count:int', ':LABEL'
+    ],
+    'StructuralUnit': [
+        'id:ID(StructuralUnit)', 'gliederungskennzahl', 'gliederungsbez',
+        'gliederungstitel', 'level:int', 'order_index:int', ':LABEL'
+    ],
+    'LegalNorm': [
+        'id:ID(LegalNorm)', 'norm_doknr', 'enbez', 'paragraph_nummer', 'titel',
+        'content_text', 'has_footnotes:boolean', 'order_index:int', ':LABEL'
+    ],
+    'TextUnit': [
+        'id:ID(TextUnit)', 'type', 'text', 'absatz_nummer', 'order_index:int', ':LABEL'
+    ],
+    'ListItem': [
+        'id:ID(ListItem)', 'list_type', 'term', 'definition', 'order_index:int', ':LABEL'
+    ],
+    'Amendment': [
+        'id:ID(Amendment)', 'standtyp', 'standkommentar', 'amendment_date:date',
+        'bgbl_reference', ':LABEL'
+    ],
+    # Änderungsgesetz (LegalKnowledgeGraphBuilder.amending_act_record)
+    'BGBlReference': [
+        'id:ID(BGBlReference)', 'reference', 'teil', 'year:int', 'nummer:int', 'seite:int',
+        'act_date:date', 'act_type', ':LABEL'
+    ],
+    'Chunk': [
+        'chunk_id:ID(Chunk)', 'text', 'embedding:float[]', 'chunk_index:int',
+        'paragraph_context',
+        # Retrieval-Projektion (LegalKnowledgeGraphBuilder.chunk_projection)
+        'doc_id', 'norm_id', 'sgb_nummer', 'jurabk', 'document_type', 'trust_score:int',
+        'paragraph_nummer', 'enbez', 'norm_titel', 'structure_path:string[]', ':LABEL'
+    ],
+    # Structured tables (LegalKnowledgeGraphBuilder.table_records); Spaltenköpfe
+    # stehen nur in data_json, da Zelltexte das Array-Trennzeichen enthalten können
+    'Table': [
+        'id:ID(Table)', 'order_index:int', 'text_unit_id', 'norm_id', 'sgb_nummer',
+        'paragraph_nummer', 'row_count:int', 'data_json', ':LABEL'
+    ],
+    'TableRow': [
+        'id:ID(TableRow)', 'table_id', 'row_index:int', 'is_header:boolean', 'label', ':LABEL'
+    ],
+    'TableCell': [
+        'id:ID(TableCell)', 'row_id', 'row_index:int', 'col_index:int', 'col_span:int', 'text',
+        'column_header', 'row_label', 'value:double', 'unit', ':LABEL'
+    ],
+    # Fassung je Norm (LegalKnowledgeGraphBuilder.norm_version_record); ein
+    # Full Rebuild beginnt die Historie neu, alle Intervalle sind offen
+    'NormVersion': [
+        'id:ID(NormVersion)', 'norm_id', 'sgb_nummer', 'jurabk', 'paragraph_nummer', 'enbez',
+        'titel', 'content_text', 'builddate:datetime', 'valid_from:date', 'valid_to:date',
+        'embedding:float[]', ':LABEL'
+    ],
+}
+
+# Relationship files: file key -> (type, start ID group, end ID group)
+RELATIONSHIP_FILES = {
+    'HAS_STRUCTURE': ('HAS_STRUCTURE', 'LegalDocument', 'StructuralUnit'),
+    'CONTAINS_NORM_structure': ('CONTAINS_NORM', 'StructuralUnit', 'LegalNorm'),
+    'CONTAINS_NORM_document': ('CONTAINS_NORM', 'LegalDocument', 'LegalNorm'),
+    'HAS_CONTENT': ('HAS_CONTENT', 'LegalNorm', 'TextUnit'),
+    'HAS_LIST_ITEM': ('HAS_LIST_ITEM', 'TextUnit', 'ListItem'),
+    'HAS_AMENDMENT': ('HAS_AMENDMENT', 'LegalNorm', 'Amendment'),
+    'PUBLISHED_IN': ('PUBLISHED_IN', 'Amendment', 'BGBlReference'),
+    'AMENDED_BY': ('AMENDED_BY', 'LegalNorm', 'BGBlReference'),
+    'HAS_CHUNK': ('HAS_CHUNK', 'LegalNorm', 'Chunk'),
+    'HAS_CHUNK_document': ('HAS_CHUNK', 'LegalDocument', 'Chunk'),
+    'HAS_TABLE': ('HAS_TABLE', 'LegalNorm', 'Table'),
+    'HAS_ROW': ('HAS_ROW', 'Table', 'TableRow'),
+    'HAS_CELL': ('HAS_CELL', 'TableRow', 'TableCell'),
+    'HAS_VERSION': ('HAS_VERSION', 'LegalNorm', 'NormVersion'),
+}
+
+# Schema applied after the offline import (neo4j-admin does not create indexes)
+POST_IMPORT_STATEMENTS = [
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (d:LegalDocument) REQUIRE d.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (s:StructuralUnit) REQUIRE s.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (n:LegalNorm) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (t:TextUnit) REQUIRE t.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (l:ListItem) REQUIRE l.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (a:Amendment) REQUIRE a.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (c:Chunk) REQUIRE c.chunk_id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (t:Table) REQUIRE t.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (r:TableRow) REQUIRE r.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (c:TableCell) REQUIRE c.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (v:NormVersion) REQUIRE v.id IS UNIQUE",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (r:BGBlReference) REQUIRE r.id IS UNIQUE",
+    "CREATE INDEX IF NOT EXISTS FOR (d:LegalDocument) ON (d.sgb_nummer)",
+    "CREATE INDEX idx_norm_paragraph IF NOT EXISTS FOR (n:LegalNorm) ON (n.paragraph_nummer)",
+    "CREATE INDEX IF NOT EXISTS FOR (n:LegalNorm) ON (n.norm_doknr)",
+    "CREATE INDEX IF NOT EXISTS FOR (c:Chunk) ON (c.sgb_nummer)",
+    "CREATE INDEX IF NOT EXISTS FOR (c:Chunk) ON (c.norm_id)",
+    "CREATE INDEX IF NOT EXISTS FOR (r:TableRow) ON (r.label)",
+    "CREATE INDEX IF NOT EXISTS FOR (c:TableCell) ON (c.column_header)",
+    "CREATE INDEX IF NOT EXISTS FOR (t:Table) ON (t.sgb_nummer)",
+    "CREATE INDEX IF NOT EXISTS FOR (r:BGBlReference) ON (r.reference)",
+    "CREATE INDEX IF NOT EXISTS FOR (v:NormVersion) ON (v.sgb_nummer, v.paragraph_nummer, v.valid_from)",
+    "CREATE INDEX IF NOT EXISTS FOR (v:NormVersion) ON (v.valid_to)",
+]
+
+VECTOR_INDEX_STATEMENT = """
+    CREATE VECTOR INDEX chunk_embeddings IF NOT EXISTS
+    FOR (c:Chunk) ON (c.embedding)
+    OPTIONS {{
+        indexConfig: {{
+            `vector.dimensions`: {dimensions},
+            `vector.similarity_function`: 'cosine'
+        }}
+    }}
+"""
+
+ARRAY_DELIMITER = ';'
+
+
+class Neo4jBulkExporter:
+    """
+    Export parsed LegalDocuments into neo4j-admin import CSV files
+
+    Node and relationship IDs are de-duplicated across documents to mirror
+    the MERGE semantics of LegalKnowledgeGraphBuilder.
+    """
+
+    def __init__(self, output_dir: Path, kg_builder: Optional[LegalKnowledgeGraphBuilder] = None):
+        """Initialize exporter
+
+        Args:
+            output_dir: Target directory (e.g. the Neo4j import/ volume)
+            kg_builder: Builder providing chunking and the embedding model
+                        (created without a driver if omitted)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.kg_builder = kg_builder or LegalKnowledgeGraphBuilder(None)
+
+        self._files = {}
+        self._writers = {}
+        self._seen_nodes = {label: set() for label in NODE_HEADERS}
+        self._seen_rels = {key: set() for key in RELATIONSHIP_FILES}
+        self.counts = {label: 0 for label in NODE_HEADERS}
+        self.counts.update({key: 0 for key in RELATIONSHIP_FILES})
+
+        self._open_writers()
+
+    def _open_writers(self):
+        """Open one CSV file (with header row) per node label and relationship file"""
+        for label, header in NODE_HEADERS.items():
+            self._open(f"nodes_{label}", header)
+
+        for key, (_, start_group, end_group) in RELATIONSHIP_FILES.items():
+            self._open(f"rels_{key}", [f':START_ID({start_group})', f':END_ID({end_group})', ':TYPE'])
+
+    def _open(self, name: str, header: List[str]):
+        f = open(self.output_dir / f"{name}.csv", 'w', newline='', encoding='utf-8')
+        writer = csv.writer(f)
+        writer.writerow(header)
+        self._files[name] = f
+        self._writers[name] = writer
+
+    def _write_node(self, label: str, row: List) -> bool:
+        """Write node row once per ID; returns False for duplicates"""
+        node_id = row[0]
+        if node_id in self._seen_nodes[label]:
+            return False
+        self._seen_nodes[label].add(node_id)
+        self._writers[f"nodes_{label}"].writerow(row + [label])
+        self.counts[label] += 1
+        return True
+
+    def _write_rel(self, key: str, start_id: str, end_id: str):
+        pair = (start_id, end_id)
+        if pair in self._seen_rels[key]:
+            return
+        self._seen_rels[key].add(pair)
+        rel_type = RELATIONSHIP_FILES[key][0]
+        self._writers[f"rels_{key}"].writerow([start_id, end_id, rel_type])
+        self.counts[key] += 1
+
+    def export_document(self, doc: LegalDocument):
+        """Export one parsed LegalDocument incl. chunks and embeddings
+
+        Args:
+            doc: Parsed LegalDocument object
+        """
+        struct_ids = {}
+        for struct in doc.structures:
+            self._write_node('StructuralUnit', [
+                struct.id, struct.gliederungskennzahl, struct.gliederungsbez,
+                struct.gliederungstitel, struct.level, struct.order_index
+            ])
+            self._write_rel('HAS_STRUCTURE', doc.id, struct.id)
+            struct_ids[struct.gliederungskennzahl] = struct.id
+
+        # Chunk all norms first so the whole document is embedded in one batch
+        norm_chunks: List[Tuple[LegalNorm, List[str]]] = []
+        for norm in doc.norms:
+            self._export_norm(doc, norm, struct_ids)
+            norm_chunks.append((norm, self.kg_builder.split_norm_into_chunks(norm)))
+
+        self._export_chunks(doc, norm_chunks)
+
+        # Written last so it carries the graph_statistics counters
+        self._write_node('LegalDocument', [
+            doc.id, doc.doknr, doc.builddate.isoformat(), doc.jurabk, doc.lange_titel,
+            doc.sgb_nummer, doc.ausfertigung_datum.isoformat() if doc.ausfertigung_datum else None,
+            doc.fundstelle, doc.trust_score, doc.source_type, doc.xml_source_url,
+            len(doc.structures), len(doc.norms), sum(len(chunks) for _, chunks in norm_chunks)
+        ])
+
+        logger.info(f"✅ Exported {doc.jurabk}: {len(doc.norms)} norms")
+
+    def _export_norm(self, doc: LegalDocument, norm: LegalNorm, struct_ids: Dict[str, str]):
+        """Write norm, text units, list items, amendments and tables"""
+        self._write_node('LegalNorm', [
+            norm.id, norm.norm_doknr, norm.enbez, norm.paragraph_nummer, norm.titel,
+            norm.content_text, norm.has_footnotes, norm.order_index
+        ])
+
+        # Direct Document→Norm shortcut (same as LegalKnowledgeGraphBuilder)
+        self._write_rel('CONTAINS_NORM_document', doc.id, norm.id)
+
+        if norm.gliederung and norm.gliederung['kennzahl']:
+            struct_id = struct_ids.get(norm.gliederung['kennzahl'])
+            if struct_id:
+                self._write_rel('CONTAINS_NORM_structure', struct_id, norm.id)
+
+        for text_unit in norm.text_units:
+            self._write_node('TextUnit', [
+                text_unit.id, text_unit.type, text_unit.text,
+                text_unit.absatz_nummer, text_unit.order_index
+            ])
+            self._write_rel('HAS_CONTENT', norm.id, text_unit.id)
+
+            for list_item in text_unit.list_items:
+                self._write_node('ListItem', [
+                    list_item.id, list_item.list_type, list_item.term,
+                    list_item.definition, list_item.order_index
+                ])
+                self._write_rel('HAS_LIST_ITEM', text_unit.id, list_item.id)
+
+        for amendment in norm.amendments:
+            self._write_node('Amendment', [
+                amendment.id, amendment.standtyp, amendment.standkommentar,
+                amendment.amendment_date.isoformat() if amendment.amendment_date else None,
+                amendment.bgbl_reference
+            ])
+            self._write_rel('HAS_AMENDMENT', norm.id, amendment.id)
+
+            if amendment.act:
+                act = self.kg_builder.amending_act_record(amendment.act)
+                self._write_node('BGBlReference', [
+                    act['id'], act['reference'], act['teil'], act['year'], act['nummer'],
+                    act['seite'], act['act_date'], act['act_type']
+                ])
+                self._write_rel('PUBLISHED_IN', amendment.id, act['id'])
+                self._write_rel('AMENDED_BY', norm.id, act['id'])
+
+        tables = self.kg_builder.table_records(doc, norm)
+        for table in tables['tables']:
+            self._write_node('Table', [
+                table['id'], table['order_index'], table['text_unit_id'], table['norm_id'],
+                table['sgb_nummer'], table['paragraph_nummer'], table['row_count'], table['data_json']
+            ])
+            self._write_rel('HAS_TABLE', norm.id, table['id'])
+
+        for row in tables['table_rows']:
+            self._write_node('TableRow', [
+                row['id'], row['table_id'], row['row_index'], row['is_header'], row['label']
+            ])
+            self._write_rel('HAS_ROW', row['table_id'], row['id'])
+
+        for cell in tables['table_cells']:
+            self._write_node('TableCell', [
+                cell['id'], cell['row_id'], cell['row_index'], cell['col_index'], cell['col_span'],
+                cell['text'], cell['column_header'], cell['row_label'], cell['value'], cell['unit']
+            ])
+            self._write_rel('HAS_CELL', cell['row_id'], cell['id'])
+
+    def _export_chunks(self, doc: LegalDocument, norm_chunks: List[Tuple[LegalNorm, List[str]]]):
+        """Embed all chunks of a document in one batch and write Chunk and NormVersion rows"""
+        all_texts = [text for _, chunks in norm_chunks for text in chunks]
+        embeddings = (self.kg_builder.embedding_model.encode(all_texts, show_progress_bar=False)
+                      if all_texts else [])
+        structure_paths = self.kg_builder.structure_paths(doc)
+
+        position = 0
+        for norm, chunks in norm_chunks:
+            self._export_version(doc, norm, embeddings[position:position + len(chunks)])
+
+            paragraph_context = f"{doc.sgb_nummer or ''} {norm.enbez} - {norm.titel}"
+            projection = self.kg_builder.chunk_projection(doc, norm, structure_paths)
+            for idx, chunk_text in enumerate(chunks):
+                embedding = embeddings[position]
+                position += 1
+
+                chunk_id = chunk_id_for(norm.id, idx)
+                self._write_node('Chunk', [
+                    chunk_id, chunk_text,
+                    ARRAY_DELIMITER.join(f"{value:.7g}" for value in embedding),
+                    idx, paragraph_context,
+                    projection['doc_id'], projection['norm_id'], projection['sgb_nummer'],
+                    projection['jurabk'], projection['document_type'], projection['trust_score'],
+                    projection['paragraph_nummer'], projection['enbez'], projection['norm_titel'],
+                    ARRAY_DELIMITER.join(projection['structure_path'])
+                ])
+                self._write_rel('HAS_CHUNK', norm.id, chunk_id)
+                self._write_rel('HAS_CHUNK_document', doc.id, chunk_id)
+
+    def _export_version(self, doc: LegalDocument, norm: LegalNorm, chunk_embeddings):
+        """Write the NormVersion row (embedding = mean of the norm's chunk embeddings)"""
+        version = self.kg_builder.norm_version_record(doc, norm, chunk_embeddings)
+        embedding = version['embedding']
+        self._write_node('NormVersion', [
+            version['id'], version['norm_id'], version['sgb_nummer'], version['jurabk'],
+            version['paragraph_nummer'], version['enbez'], version['titel'], version['content_text'],
+            version['builddate'], version['valid_from'], version['valid_to'],
+            ARRAY_DELIMITER.join(f"{value:.7g}" for value in embedding) if embedding else None
+        ])
+        self._write_rel('HAS_VERSION', norm.id, version['id'])
+
+    def close(self):
+        """Flush and close all CSV files"""
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def admin_import_command(self, database: str = "neo4j") -> str:
+        """Build the matching `neo4j-admin database import full` command line"""
+        parts = [
+            "neo4j-admin database import full",
+            f"--array-delimiter='{ARRAY_DELIMITER}'",
+            "--multiline-fields=true",
+            "--overwrite-destination=true",
+        ]
+        for label in NODE_HEADERS:
+            parts.append(f"--nodes={self.output_dir / f'nodes_{label}.csv'}")
+        for key in RELATIONSHIP_FILES:
+            parts.append(f"--relationships={self.output_dir / f'rels_{key}.csv'}")
+        parts.append(database)
+        return " \\\n    ".join(parts)
+
+
+def apply_post_import_schema(driver, embedding_dimensions: int = 768):
+    """Create constraints, property indexes and the vector index after import
+
+    Args:
+        driver: Neo4j driver connected to the freshly imported database
+        embedding_dimensions: Dimension of the exported chunk embeddings
+    """
+    with driver.session() as session:
+        for statement in POST_IMPORT_STATEMENTS:
+            session.run(statement)
+
+        # Index OPTIONS do not accept parameters, so the dimension is inlined
+        session.run(VECTOR_INDEX_STATEMENT.format(dimensions=int(embedding_dimensions)))
+
+        session.run("""
+            CREATE FULLTEXT INDEX sozialrecht_fulltext IF NOT EXISTS
+            FOR (c:Chunk) ON EACH [c.text, c.paragraph_context]
+        """)
+
+    logger.info("✅ Post-import schema created (constraints, indexes, vector index)")
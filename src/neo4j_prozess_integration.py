@@ -5,11 +5,100 @@ Verknüpft BPMN Prozess-Schritte mit Sozialrecht-Dokumenten
 Ermöglicht: Click auf Prozess-Schritt → Zeigt relevante Gesetze/Weisungen
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import json
 import logging
+import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+SGB_REF_RE = re.compile(r'SGB\s*([IVX]+)')
+PARAGRAPH_REF_RE = re.compile(r'§\s*(\d+[a-z]?)')
+
+# Singleton-Knoten mit dem monoton steigenden Versionszähler der
+# materialisierten Empfehlungs-Bundles
+RECOMMENDATION_VERSION_ID = 'process_step_recommendations'
+
+# Empfehlungs-Bundle je ProcessStep: Gesetz + passende Chunks, Weisungen
+# (nach Trust-Score) mit Chunks, verknüpfte Paragraphen
+STEP_RECOMMENDATIONS_QUERY = """
+    MATCH (ps:ProcessStep)
+    WHERE ps.id IN $step_ids
+    CALL {
+        WITH ps
+        OPTIONAL MATCH (ps)-[:VERWEIST_AUF]->(para:Paragraph)
+        RETURN collect(DISTINCT {
+                   nummer: para.paragraph_nummer,
+                   sgb: para.sgb_nummer,
+                   content: para.content
+               }) as paragraphen,
+               collect(DISTINCT para.paragraph_nummer) as para_nummern
+    }
+    CALL {
+        WITH ps, para_nummern
+        OPTIONAL MATCH (ps)-[:RECHTLICHE_GRUNDLAGE]->(gesetz:Document {document_type: 'Gesetz'})
+        OPTIONAL MATCH (gesetz)-[:HAS_CHUNK]->(gc:Chunk)
+        WHERE gc.paragraph_nummer IN para_nummern
+        RETURN collect(DISTINCT {
+                   filename: gesetz.filename,
+                   sgb: gesetz.sgb_nummer,
+                   trust: gesetz.trust_score
+               }) as gesetz,
+               collect(DISTINCT gc.text)[0..3] as gesetz_chunks
+    }
+    CALL {
+        WITH ps, para_nummern
+        OPTIONAL MATCH (ps)-[hw:HANDLUNGSEMPFEHLUNG]->(weisung:Document)
+        OPTIONAL MATCH (weisung)-[:HAS_CHUNK]->(wc:Chunk)
+        WHERE wc.paragraph_nummer IN para_nummern
+        WITH weisung, hw, collect(DISTINCT wc.text)[0..2] as chunks
+        ORDER BY weisung.trust_score DESC
+        RETURN collect({
+                   filename: weisung.filename,
+                   type: weisung.document_type,
+                   trust: weisung.trust_score,
+                   stand: weisung.stand_datum,
+                   paragraph: hw.paragraph,
+                   chunks: chunks
+               }) as weisungen
+    }
+    RETURN ps.id as step_id,
+           {
+               name: ps.name,
+               type: ps.type,
+               rechtliche_grundlage: ps.rechtliche_grundlage,
+               assignee: ps.assignee_role
+           } as step,
+           gesetz, gesetz_chunks, weisungen, paragraphen
+"""
+
+# Neu importierte/geänderte Dokumente an die Schritte hängen, die auf ihre
+# Paragraphen verweisen (gleiche Regeln wie add_process_template). Schritte
+# finden ihre Paragraphen über ps.paragraph_ids, auch wenn der Paragraph beim
+# Anlegen des Templates noch nicht existierte; ältere Schritte über VERWEIST_AUF.
+DOCUMENT_LINK_QUERY = """
+    UNWIND $doc_ids AS doc_id
+    MATCH (d:Document {id: doc_id})-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
+    MATCH (ps:ProcessStep)
+    WHERE p.id IN coalesce(ps.paragraph_ids, []) OR EXISTS { (ps)-[:VERWEIST_AUF]->(p) }
+    MERGE (ps)-[ref:VERWEIST_AUF]->(p)
+    ON CREATE SET ref.paragraph = p.paragraph_nummer
+    WITH DISTINCT ps, d, p
+    FOREACH (_ IN CASE WHEN d.document_type = 'Gesetz' THEN [1] ELSE [] END |
+        MERGE (ps)-[:RECHTLICHE_GRUNDLAGE {type: 'Gesetz', priority: 1}]->(d)
+    )
+    FOREACH (_ IN CASE WHEN d.document_type = 'BA_Weisung' THEN [1] ELSE [] END |
+        MERGE (ps)-[:HANDLUNGSEMPFEHLUNG {
+            type: 'Fachliche_Weisung',
+            priority: 2,
+            paragraph: p.paragraph_nummer
+        }]->(d)
+    )
+    RETURN DISTINCT ps.id as step_id
+"""
+
 
 class Neo4jProzessIntegration:
     """
@@ -20,6 +109,10 @@ class Neo4jProzessIntegration:
     def __init__(self, neo4j_driver):
         self.driver = neo4j_driver
 
+        # step_id → (recommendations_version, bundle)
+        self._recommendation_cache = {}
+        self._cache_lock = threading.Lock()
+
     def create_process_schema(self):
         """Erstelle Prozess-spezifisches Schema"""
         with self.driver.session() as session:
@@ -33,6 +126,11 @@ class Neo4jProzessIntegration:
                 CREATE CONSTRAINT IF NOT EXISTS FOR (ps:ProcessStep) REQUIRE ps.id IS UNIQUE
             """)
 
+            # Case Instances (Lookup per id bei Schritt-Wechseln)
+            session.run("""
+                CREATE CONSTRAINT IF NOT EXISTS FOR (ci:CaseInstance) REQUIRE ci.id IS UNIQUE
+            """)
+
             # Decision Node
             session.run("""
                 CREATE INDEX IF NOT EXISTS FOR (d:Decision) ON (d.criteria)
@@ -47,6 +145,12 @@ class Neo4jProzessIntegration:
                             steps: List[Dict]) -> str:
         """Füge Prozess-Template zu Neo4j hinzu
 
+        Template, Schritte und alle Dokument-Verknüpfungen werden in einem
+        Statement geschrieben: die sgb_refs aller Schritte werden vorab
+        geparst und über den Paragraph-Constraint (id = "<SGB>_<§>")
+        aufgelöst, Gesetze und Weisungen über CONTAINS_PARAGRAPH des
+        referenzierten Paragraphen.
+
         Args:
             process_id: Eindeutige ID (z.B. "SGB_II_Antragstellung")
             name: Prozessname
@@ -56,115 +160,83 @@ class Neo4jProzessIntegration:
         Returns:
             Process Template ID
         """
+        step_rows = [self._step_row(process_id, step, order) for order, step in enumerate(steps)]
+
         with self.driver.session() as session:
-            # Create Process Template
-            session.run("""
-                CREATE (pt:ProcessTemplate {
-                    id: $process_id,
-                    name: $name,
-                    sgb: $sgb,
-                    created: datetime(),
-                    step_count: $step_count
-                })
-            """, process_id=process_id, name=name, sgb=sgb, step_count=len(steps))
-
-            # Create Steps and link to documents
-            for i, step in enumerate(steps):
-                self._add_process_step(session, process_id, step, i)
-
-        logger.info(f"✅ Prozess-Template '{name}' mit {len(steps)} Schritten hinzugefügt")
+            summary = session.execute_write(
+                lambda tx: tx.run("""
+                    CREATE (pt:ProcessTemplate {
+                        id: $process_id,
+                        name: $name,
+                        sgb: $sgb,
+                        created: datetime(),
+                        step_count: size($steps)
+                    })
+                    WITH pt
+                    UNWIND $steps AS step
+                    CREATE (ps:ProcessStep {
+                        id: step.id,
+                        name: step.name,
+                        type: step.type,
+                        order: step.order,
+                        rechtliche_grundlage: step.rechtliche_grundlage,
+                        assignee_role: step.assignee,
+                        estimated_minutes: step.estimated_minutes,
+                        paragraph_ids: [ref IN step.paragraphs | ref.para_id]
+                    })
+                    CREATE (pt)-[:HAS_STEP {order: step.order}]->(ps)
+                    WITH ps, step
+                    UNWIND step.paragraphs AS ref
+                    MATCH (p:Paragraph {id: ref.para_id})
+                    MERGE (ps)-[:VERWEIST_AUF {paragraph: ref.paragraph}]->(p)
+                    WITH ps, p, ref
+                    MATCH (d:Document)-[:CONTAINS_PARAGRAPH]->(p)
+                    WHERE d.document_type IN ['Gesetz', 'BA_Weisung']
+                    FOREACH (_ IN CASE WHEN d.document_type = 'Gesetz' THEN [1] ELSE [] END |
+                        MERGE (ps)-[:RECHTLICHE_GRUNDLAGE {type: 'Gesetz', priority: 1}]->(d)
+                    )
+                    FOREACH (_ IN CASE WHEN d.document_type = 'BA_Weisung' THEN [1] ELSE [] END |
+                        MERGE (ps)-[:HANDLUNGSEMPFEHLUNG {
+                            type: 'Fachliche_Weisung',
+                            priority: 2,
+                            paragraph: ref.paragraph
+                        }]->(d)
+                    )
+                """, process_id=process_id, name=name, sgb=sgb, steps=step_rows).consume()
+            )
+
+        links = summary.counters.relationships_created - len(step_rows)
+        logger.info(f"✅ Prozess-Template '{name}' mit {len(steps)} Schritten und "
+                    f"{links} Dokument-Verknüpfungen hinzugefügt")
+
+        self.refresh_step_recommendations(process_id=process_id)
+
         return process_id
 
-    def _add_process_step(self, session, process_id: str, step: Dict, order: int):
-        """Füge einzelnen Prozess-Schritt hinzu"""
-
-        # Create Step Node
-        step_id = f"{process_id}_Step_{order}"
-
-        session.run("""
-            MATCH (pt:ProcessTemplate {id: $process_id})
-            CREATE (ps:ProcessStep {
-                id: $step_id,
-                name: $name,
-                type: $type,
-                order: $order,
-                rechtliche_grundlage: $rechtliche_grundlage,
-                assignee_role: $assignee,
-                estimated_minutes: $estimated_minutes
-            })
-            CREATE (pt)-[:HAS_STEP {order: $order}]->(ps)
-        """, {
-            'process_id': process_id,
-            'step_id': step_id,
+    @staticmethod
+    def _step_row(process_id: str, step: Dict, order: int) -> Dict:
+        """UNWIND-Zeile für einen Prozess-Schritt inkl. aufgelöster Paragraph-IDs"""
+        sgb_ref = step.get('sgb_ref', '')
+        sgb_nummer, paragraphs = parse_sgb_ref(sgb_ref)
+
+        return {
+            'id': f"{process_id}_Step_{order}",
             'name': step.get('name', ''),
             'type': step.get('type', 'Task'),
             'order': order,
-            'rechtliche_grundlage': step.get('sgb_ref', ''),
+            'rechtliche_grundlage': sgb_ref,
             'assignee': step.get('assignee', ''),
-            'estimated_minutes': step.get('estimated_minutes', 30)
-        })
-
-        # Link to relevant Documents/Paragraphs
-        if 'sgb_ref' in step:
-            self._link_step_to_documents(session, step_id, step['sgb_ref'])
-
-    def _link_step_to_documents(self, session, step_id: str, sgb_ref: str):
-        """Verknüpfe Prozess-Schritt mit relevanten Dokumenten
-
-        Args:
-            step_id: ID des Prozess-Schritts
-            sgb_ref: Rechtliche Grundlage (z.B. "SGB II § 20", "§ 11-12")
-        """
-        # Parse SGB reference
-        import re
-
-        # Extract SGB number
-        sgb_match = re.search(r'SGB\s*([IVX]+)', sgb_ref)
-        sgb_nummer = sgb_match.group(1) if sgb_match else None
-
-        # Extract paragraph numbers
-        para_matches = re.findall(r'§\s*(\d+[a-z]?)', sgb_ref)
-
-        if not sgb_nummer or not para_matches:
-            return  # Can't link without specific references
-
-        # Link to Gesetz
-        session.run("""
-            MATCH (ps:ProcessStep {id: $step_id})
-            MATCH (d:Document {sgb_nummer: $sgb, document_type: 'Gesetz'})
-            MERGE (ps)-[:RECHTLICHE_GRUNDLAGE {
-                type: 'Gesetz',
-                priority: 1
-            }]->(d)
-        """, step_id=step_id, sgb=sgb_nummer)
-
-        # Link to Paragraphs
-        for para_num in para_matches:
-            session.run("""
-                MATCH (ps:ProcessStep {id: $step_id})
-                MATCH (p:Paragraph {sgb_nummer: $sgb, paragraph_nummer: $para})
-                MERGE (ps)-[:VERWEIST_AUF {
-                    paragraph: $para
-                }]->(p)
-            """, step_id=step_id, sgb=sgb_nummer, para=para_num)
-
-            # Link to Fachliche Weisungen for this paragraph
-            session.run("""
-                MATCH (ps:ProcessStep {id: $step_id})
-                MATCH (d:Document {
-                    sgb_nummer: $sgb,
-                    document_type: 'BA_Weisung'
-                })-[:CONTAINS_PARAGRAPH]->(p:Paragraph {paragraph_nummer: $para})
-                MERGE (ps)-[:HANDLUNGSEMPFEHLUNG {
-                    type: 'Fachliche_Weisung',
-                    priority: 2,
-                    paragraph: $para
-                }]->(d)
-            """, step_id=step_id, sgb=sgb_nummer, para=para_num)
+            'estimated_minutes': step.get('estimated_minutes', 30),
+            # Paragraph-IDs wie in SozialrechtNeo4jRAG: "<SGB>_<§>"
+            'paragraphs': [{'paragraph': para, 'para_id': f"{sgb_nummer}_{para}"}
+                           for para in paragraphs] if sgb_nummer else []
+        }
 
     def get_recommendations_for_step(self, step_id: str) -> Dict:
         """Hole Handlungsempfehlungen für Prozess-Schritt
 
+        Liest das materialisierte Bundle (siehe refresh_step_recommendations).
+
         Args:
             step_id: Prozess-Schritt ID
 
@@ -172,55 +244,28 @@ class Neo4jProzessIntegration:
             Dictionary mit Gesetz, Weisungen, BMAS Rundschreiben
         """
         with self.driver.session() as session:
-            result = session.run("""
+            record = session.run("""
                 MATCH (ps:ProcessStep {id: $step_id})
-
-                // Get Gesetz
-                OPTIONAL MATCH (ps)-[rg:RECHTLICHE_GRUNDLAGE]->(gesetz:Document {document_type: 'Gesetz'})
-
-                // Get Weisungen
-                OPTIONAL MATCH (ps)-[hw:HANDLUNGSEMPFEHLUNG]->(weisung:Document)
-                WHERE weisung.document_type IN ['BA_Weisung', 'Harald_Thome']
-
-                // Get BMAS Rundschreiben
-                OPTIONAL MATCH (ps)-[hr:HANDLUNGSEMPFEHLUNG]->(bmas:Document {document_type: 'BMAS_Rundschreiben'})
-
-                // Get related Paragraphs
-                OPTIONAL MATCH (ps)-[vp:VERWEIST_AUF]->(para:Paragraph)
-
-                RETURN ps.name as step_name,
-                       ps.rechtliche_grundlage as rechtliche_grundlage,
-                       COLLECT(DISTINCT {
-                           type: 'Gesetz',
-                           filename: gesetz.filename,
-                           sgb: gesetz.sgb_nummer,
-                           trust: gesetz.trust_score
-                       }) as gesetz_docs,
-                       COLLECT(DISTINCT {
-                           type: weisung.document_type,
-                           filename: weisung.filename,
-                           stand: weisung.stand_datum,
-                           trust: weisung.trust_score,
-                           paragraph: hw.paragraph
-                       }) as weisungen,
-                       COLLECT(DISTINCT {
-                           paragraph: para.paragraph_nummer,
-                           content_preview: SUBSTRING(para.content, 0, 200)
-                       }) as paragraphen
-            """, step_id=step_id)
-
-            record = result.single()
-
-            if not record:
-                return {'error': f'Prozess-Schritt {step_id} nicht gefunden'}
-
-            return {
-                'step_name': record['step_name'],
-                'rechtliche_grundlage': record['rechtliche_grundlage'],
-                'gesetz': [g for g in record['gesetz_docs'] if g['filename']],
-                'weisungen': [w for w in record['weisungen'] if w['filename']],
-                'paragraphen': record['paragraphen']
-            }
+                RETURN ps.recommendations_version as version
+            """, step_id=step_id).single()
+
+        bundle = self._load_step_bundle(step_id, record['version']) if record else None
+        if not bundle:
+            return {'error': f'Prozess-Schritt {step_id} nicht gefunden'}
+
+        return {
+            'step_name': bundle['step']['name'],
+            'rechtliche_grundlage': bundle['step']['rechtliche_grundlage'],
+            'gesetz': [{'type': 'Gesetz', **g} for g in bundle['gesetz']],
+            'weisungen': [
+                {key: w[key] for key in ('type', 'filename', 'stand', 'trust', 'paragraph')}
+                for w in bundle['weisungen'] if w['type'] in ('BA_Weisung', 'Harald_Thome')
+            ],
+            'paragraphen': [
+                {'paragraph': para['nummer'], 'content_preview': (para['content'] or '')[:200]}
+                for para in bundle['paragraphen']
+            ]
+        }
 
     def get_full_process_with_docs(self, process_id: str) -> Dict:
         """Hole kompletten Prozess mit allen verknüpften Dokumenten
@@ -265,7 +310,7 @@ class Neo4jProzessIntegration:
 
     def create_case_instance(self,
                            process_template_id: str,
-                           case_data: Dict) -> str:
+                           case_data: Dict) -> Optional[str]:
         """Erstelle Prozess-Instanz für konkreten Fall
 
         Args:
@@ -273,38 +318,77 @@ class Neo4jProzessIntegration:
             case_data: Fall-spezifische Daten (Antragsteller, Einkommen, etc.)
 
         Returns:
-            Case Instance ID
+            Case Instance ID (None, wenn das Template nicht existiert)
+        """
+        case_ids = self.create_case_instances(process_template_id, [case_data])['case_ids']
+        return case_ids[0] if case_ids else None
+
+    def create_case_instances(self,
+                              process_template_id: str,
+                              cases: List[Dict],
+                              batch_size: int = 1000) -> Dict:
+        """Erstelle viele Fall-Instanzen in UNWIND-Batches
+
+        Alle Fall-Daten werden mit ``SET ci += props`` im selben Statement
+        geschrieben - ein Round-Trip pro Batch statt CREATE plus ein SET pro
+        Property und Fall.
+
+        Args:
+            process_template_id: Template ID
+            cases: Fall-spezifische Daten je Fall (wie bei create_case_instance)
+            batch_size: Fälle pro Write-Transaktion
+
+        Returns:
+            {'case_ids', 'created', 'seconds', 'cases_per_sec'} - case_ids nur
+            der tatsächlich angelegten Fälle (aus dem RETURN der Query)
         """
         import uuid
-        case_id = str(uuid.uuid4())
 
-        with self.driver.session() as session:
-            session.run("""
-                MATCH (pt:ProcessTemplate {id: $template_id})
-                CREATE (ci:CaseInstance {
-                    id: $case_id,
-                    created: datetime(),
-                    status: 'In Bearbeitung',
-                    antragsteller: $antragsteller,
-                    current_step: 0
-                })
-                CREATE (ci)-[:BASED_ON]->(pt)
-            """, {
-                'template_id': process_template_id,
-                'case_id': case_id,
-                'antragsteller': case_data.get('antragsteller', 'Unbekannt')
-            })
+        rows = [{
+            'id': str(uuid.uuid4()),
+            'antragsteller': case_data.get('antragsteller', 'Unbekannt'),
+            'props': {key: value for key, value in case_data.items()
+                      if key not in ('id', 'antragsteller')}
+        } for case_data in cases]
 
-            # Add case-specific data
-            for key, value in case_data.items():
-                if key != 'antragsteller':
-                    session.run("""
-                        MATCH (ci:CaseInstance {id: $case_id})
-                        SET ci[$key] = $value
-                    """, case_id=case_id, key=key, value=value)
+        case_ids = []
+        start = time.perf_counter()
 
-        logger.info(f"✅ Fall-Instanz erstellt: {case_id}")
-        return case_id
+        with self.driver.session() as session:
+            for offset in range(0, len(rows), batch_size):
+                batch = rows[offset:offset + batch_size]
+                case_ids += session.execute_write(
+                    lambda tx: tx.run("""
+                        MATCH (pt:ProcessTemplate {id: $template_id})
+                        UNWIND $cases AS case
+                        CREATE (ci:CaseInstance {
+                            id: case.id,
+                            created: datetime(),
+                            status: 'In Bearbeitung',
+                            antragsteller: case.antragsteller,
+                            current_step: 0
+                        })
+                        SET ci += case.props
+                        CREATE (ci)-[:BASED_ON]->(pt)
+                        RETURN collect(ci.id) AS case_ids
+                    """, template_id=process_template_id, cases=batch).single()['case_ids']
+                )
+
+        seconds = time.perf_counter() - start
+        created = len(case_ids)
+        if created < len(rows):
+            logger.warning(f"⚠️  ProcessTemplate '{process_template_id}' nicht gefunden - "
+                           f"{len(rows) - created} Fälle nicht angelegt")
+
+        cases_per_sec = created / seconds if seconds else 0.0
+        logger.info(f"✅ {created} Fall-Instanzen erstellt in {seconds:.2f}s ({cases_per_sec:.0f} cases/sec)")
+
+        return {
+            'case_ids': case_ids,
+            'created': created,
+            'seconds': seconds,
+            'cases_per_sec': cases_per_sec
+        }
 
     def advance_case_to_step(self, case_id: str, step_order: int, decision_data: Optional[Dict] = None):
         """Bewege Fall zu nächstem Schritt
@@ -314,107 +398,264 @@ class Neo4jProzessIntegration:
             step_order: Schritt-Nummer
             decision_data: Entscheidungsdaten (für Gateways)
         """
-        with self.driver.session() as session:
-            # Update case status
-            session.run("""
-                MATCH (ci:CaseInstance {id: $case_id})
-                SET ci.current_step = $step,
-                    ci.last_updated = datetime()
-            """, case_id=case_id, step=step_order)
+        self.advance_cases([{'case_id': case_id, 'step': step_order, 'decision': decision_data}])
+
+    def advance_cases(self, transitions: List[Dict], batch_size: int = 1000) -> Dict:
+        """Bewege viele Fälle in Batches zum nächsten Schritt
+
+        Schritt-Wechsel und Entscheidungen eines Batches laufen in einer
+        Transaktion mit zwei UNWIND-Statements.
+
+        Args:
+            transitions: [{'case_id', 'step', 'decision': Optional[Dict]}] -
+                         'decision' wie decision_data bei advance_case_to_step
+            batch_size: Schritt-Wechsel pro Write-Transaktion
+
+        Returns:
+            {'updated', 'decisions', 'seconds', 'cases_per_sec'}
+        """
+        rows = []
+        for transition in transitions:
+            decision_data = transition.get('decision')
+            rows.append({
+                'case_id': transition['case_id'],
+                'step': transition['step'],
+                'decision': {
+                    'decision': decision_data.get('decision', ''),
+                    'reason': decision_data.get('reason', ''),
+                    'user': decision_data.get('user', 'System')
+                } if decision_data else None
+            })
 
-            # Log decision if provided
-            if decision_data:
-                session.run("""
-                    MATCH (ci:CaseInstance {id: $case_id})
+        def write_batch(tx, batch):
+            updated = tx.run("""
+                UNWIND $transitions AS transition
+                MATCH (ci:CaseInstance {id: transition.case_id})
+                SET ci.current_step = transition.step,
+                    ci.last_updated = datetime()
+                RETURN count(ci) as updated
+            """, transitions=batch).single()['updated']
+
+            decisions = [row for row in batch if row['decision']]
+            if decisions:
+                tx.run("""
+                    UNWIND $transitions AS transition
+                    MATCH (ci:CaseInstance {id: transition.case_id})
                     CREATE (d:Decision {
-                        step: $step,
-                        decision: $decision,
-                        reason: $reason,
-                        decided_by: $user,
+                        step: transition.step,
+                        decision: transition.decision.decision,
+                        reason: transition.decision.reason,
+                        decided_by: transition.decision.user,
                         timestamp: datetime()
                     })
                     CREATE (ci)-[:HAD_DECISION]->(d)
-                """, {
-                    'case_id': case_id,
-                    'step': step_order,
-                    'decision': decision_data.get('decision', ''),
-                    'reason': decision_data.get('reason', ''),
-                    'user': decision_data.get('user', 'System')
-                })
+                """, transitions=decisions).consume()
+
+            return updated, len(decisions)
+
+        updated = 0
+        decisions = 0
+        start = time.perf_counter()
+
+        with self.driver.session() as session:
+            for offset in range(0, len(rows), batch_size):
+                batch = rows[offset:offset + batch_size]
+                batch_updated, batch_decisions = session.execute_write(write_batch, batch)
+                updated += batch_updated
+                decisions += batch_decisions
+
+        seconds = time.perf_counter() - start
+        cases_per_sec = updated / seconds if seconds else 0.0
+        logger.info(f"✅ {updated} Fälle weitergeschaltet, {decisions} Entscheidungen "
+                    f"in {seconds:.2f}s ({cases_per_sec:.0f} cases/sec)")
+
+        return {
+            'updated': updated,
+            'decisions': decisions,
+            'seconds': seconds,
+            'cases_per_sec': cases_per_sec
+        }
 
     def get_current_step_recommendations(self, case_id: str) -> Dict:
         """Hole Empfehlungen für aktuellen Prozess-Schritt
 
+        Die Empfehlungen hängen nur vom Schritt ab, nicht vom Fall: gelesen
+        werden nur Schritt-ID und Bundle-Version des Falls, das Bundle selbst
+        kommt aus dem Prozess-Cache bzw. aus ps.recommendations.
+
         Returns:
             - Relevante Gesetze
             - Fachliche Weisungen
             - Vorherige Entscheidungen in ähnlichen Fällen
         """
         with self.driver.session() as session:
-            result = session.run("""
-                // Get current case and step
-                MATCH (ci:CaseInstance {id: $case_id})
-                MATCH (ci)-[:BASED_ON]->(pt:ProcessTemplate)
+            record = session.run("""
+                MATCH (ci:CaseInstance {id: $case_id})-[:BASED_ON]->(pt:ProcessTemplate)
                 MATCH (pt)-[hs:HAS_STEP]->(ps:ProcessStep)
                 WHERE hs.order = ci.current_step
+                RETURN ps.id as step_id, ps.recommendations_version as version
+            """, case_id=case_id).single()
+
+        bundle = self._load_step_bundle(record['step_id'], record['version']) if record else None
+        if not bundle:
+            return {'error': 'Aktueller Schritt nicht gefunden'}
+
+        return {
+            'step': bundle['step'],
+            'gesetz': {
+                'filename': bundle['gesetz'][0]['filename'] if bundle['gesetz'] else None,
+                'relevant_text': bundle['gesetz_chunks']
+            },
+            'weisungen': bundle['weisungen'],
+            'paragraphen': bundle['paragraphen']
+        }
 
-                // Get linked documents
-                OPTIONAL MATCH (ps)-[:RECHTLICHE_GRUNDLAGE]->(gesetz:Document {document_type: 'Gesetz'})
-                OPTIONAL MATCH (ps)-[:HANDLUNGSEMPFEHLUNG]->(weisung:Document)
-                OPTIONAL MATCH (ps)-[:VERWEIST_AUF]->(para:Paragraph)
-
-                // Get relevant chunks for this step
-                OPTIONAL MATCH (gesetz)-[:HAS_CHUNK]->(gc:Chunk)
-                WHERE gc.paragraph_nummer IN [para.paragraph_nummer]
-
-                OPTIONAL MATCH (weisung)-[:HAS_CHUNK]->(wc:Chunk)
-                WHERE wc.paragraph_nummer IN [para.paragraph_nummer]
-
-                RETURN ps.name as step_name,
-                       ps.type as step_type,
-                       ps.rechtliche_grundlage as rechtliche_grundlage,
-                       ps.assignee_role as assignee,
-
-                       // Gesetz
-                       gesetz.filename as gesetz_file,
-                       COLLECT(DISTINCT gc.text)[0..3] as gesetz_chunks,
-
-                       // Weisungen (sortiert nach Trust-Score)
-                       COLLECT(DISTINCT {
-                           filename: weisung.filename,
-                           type: weisung.document_type,
-                           trust: weisung.trust_score,
-                           stand: weisung.stand_datum,
-                           chunks: COLLECT(DISTINCT wc.text)[0..2]
-                       }) as weisungen,
-
-                       // Paragraphen
-                       COLLECT(DISTINCT {
-                           nummer: para.paragraph_nummer,
-                           sgb: para.sgb_nummer,
-                           content: para.content
-                       }) as paragraphen
-            """, case_id=case_id)
+    # === MATERIALISIERTE EMPFEHLUNGEN ===
 
-            record = result.single()
+    def refresh_step_recommendations(self,
+                                     process_id: Optional[str] = None,
+                                     step_ids: Optional[List[str]] = None) -> Dict:
+        """Materialisiere Empfehlungs-Bundles je ProcessStep
 
-            if not record:
-                return {'error': 'Aktueller Schritt nicht gefunden'}
+        Berechnet Gesetz-Chunks, Weisungen (nach Trust-Score) und Paragraphen
+        einmal je Schritt und speichert sie als JSON in ps.recommendations,
+        zusammen mit einer neuen Graph-Version (ps.recommendations_version).
+        Aufrufen, wenn sich Templates oder verknüpfte Dokumente ändern
+        (Dokument-Importe: refresh_for_documents) - ohne Argumente werden
+        alle Schritte neu berechnet.
 
-            return {
-                'step': {
-                    'name': record['step_name'],
-                    'type': record['step_type'],
-                    'rechtliche_grundlage': record['rechtliche_grundlage'],
-                    'assignee': record['assignee']
-                },
-                'gesetz': {
-                    'filename': record['gesetz_file'],
-                    'relevant_text': record['gesetz_chunks']
-                },
-                'weisungen': record['weisungen'],
-                'paragraphen': record['paragraphen']
-            }
+        Args:
+            process_id: Nur die Schritte dieses Templates
+            step_ids: Nur diese Schritte
+
+        Returns:
+            {'steps', 'graph_version', 'seconds'}
+        """
+        start = time.perf_counter()
+
+        with self.driver.session() as session:
+            if step_ids is None:
+                step_ids = [r['id'] for r in session.run("""
+                    MATCH (ps:ProcessStep)
+                    WHERE $process_id IS NULL
+                       OR EXISTS { (:ProcessTemplate {id: $process_id})-[:HAS_STEP]->(ps) }
+                    RETURN ps.id as id
+                """, process_id=process_id)]
+
+            # Als JSON gespeichert (Neo4j-Properties können keine Maps halten)
+            bundles = {}
+            for record in session.run(STEP_RECOMMENDATIONS_QUERY, step_ids=step_ids):
+                bundles[record['step_id']] = json.dumps(
+                    self._bundle_from_record(record), ensure_ascii=False, default=str
+                )
+
+            def write_bundles(tx):
+                version = tx.run("""
+                    MERGE (v:GraphVersion {id: $version_id})
+                    SET v.version = coalesce(v.version, 0) + 1,
+                        v.updated = datetime()
+                    RETURN v.version as version
+                """, version_id=RECOMMENDATION_VERSION_ID).single()['version']
+
+                tx.run("""
+                    UNWIND $bundles AS bundle
+                    MATCH (ps:ProcessStep {id: bundle.step_id})
+                    SET ps.recommendations = bundle.json,
+                        ps.recommendations_version = $version
+                """, version=version, bundles=[
+                    {'step_id': step_id, 'json': bundle} for step_id, bundle in bundles.items()
+                ]).consume()
+                return version
+
+            version = session.execute_write(write_bundles)
+
+        with self._cache_lock:
+            for step_id, bundle in bundles.items():
+                self._recommendation_cache[step_id] = (version, json.loads(bundle))
+
+        seconds = time.perf_counter() - start
+        logger.info(f"✅ Empfehlungen für {len(bundles)} Prozess-Schritte materialisiert "
+                    f"(Version {version}, {seconds:.2f}s)")
+
+        return {'steps': len(bundles), 'graph_version': version, 'seconds': seconds}
+
+    def refresh_for_documents(self, doc_ids: List[str]) -> Dict:
+        """Dokument-Import: verknüpfen und betroffene Bundles neu materialisieren
+
+        Vom Dokument-Schreibpfad aufzurufen (SozialrechtNeo4jRAG.add_sgb_document,
+        Import-Skripte), damit ps.recommendations nach einem (Re-)Import nicht
+        veraltet: die Schritte, die auf Paragraphen der Dokumente verweisen,
+        werden verknüpft und mit neuer Graph-Version neu berechnet.
+
+        Args:
+            doc_ids: IDs der geschriebenen Document-Knoten
+
+        Returns:
+            {'steps', 'graph_version', 'seconds'} - graph_version None, wenn
+            kein Schritt betroffen ist
+        """
+        with self.driver.session() as session:
+            step_ids = session.execute_write(
+                lambda tx: [record['step_id'] for record in tx.run(DOCUMENT_LINK_QUERY, doc_ids=doc_ids)]
+            )
+
+        if not step_ids:
+            return {'steps': 0, 'graph_version': None, 'seconds': 0.0}
+        return self.refresh_step_recommendations(step_ids=step_ids)
+
+    def _load_step_bundle(self, step_id: str, version: Optional[int]) -> Optional[Dict]:
+        """Bundle aus dem Cache (step_id + Version), sonst aus ps.recommendations
+
+        Schritte ohne materialisiertes Bundle (ältere Graphen) werden
+        einmalig nachberechnet.
+        """
+        if version is not None:
+            with self._cache_lock:
+                cached = self._recommendation_cache.get(step_id)
+            if cached and cached[0] == version:
+                return cached[1]
+
+            with self.driver.session() as session:
+                record = session.run("""
+                    MATCH (ps:ProcessStep {id: $step_id})
+                    RETURN ps.recommendations as bundle, ps.recommendations_version as version
+                """, step_id=step_id).single()
+
+            if record and record['bundle']:
+                bundle = json.loads(record['bundle'])
+                with self._cache_lock:
+                    self._recommendation_cache[step_id] = (record['version'], bundle)
+                return bundle
+
+        if not self.refresh_step_recommendations(step_ids=[step_id])['steps']:
+            return None
+        with self._cache_lock:
+            return self._recommendation_cache[step_id][1]
+
+    @staticmethod
+    def _bundle_from_record(record) -> Dict:
+        """Bundle aus STEP_RECOMMENDATIONS_QUERY ohne die Null-Einträge der OPTIONAL MATCHes"""
+        return {
+            'step': dict(record['step']),
+            'gesetz': [dict(g) for g in record['gesetz'] if g['filename']],
+            'gesetz_chunks': list(record['gesetz_chunks']),
+            'weisungen': [dict(w) for w in record['weisungen'] if w['filename']],
+            'paragraphen': [dict(para) for para in record['paragraphen'] if para['nummer']]
+        }
+
+
+def parse_sgb_ref(sgb_ref: str) -> Tuple[Optional[str], List[str]]:
+    """Zerlege eine Rechtsgrundlage in SGB-Nummer und Paragraphen
+
+    Args:
+        sgb_ref: Rechtliche Grundlage (z.B. "SGB II § 20", "SGB II § 11 § 12")
+
+    Returns:
+        (sgb_nummer, [paragraph_nummer, ...]) - sgb_nummer None ohne SGB-Angabe
+    """
+    sgb_match = SGB_REF_RE.search(sgb_ref)
+    paragraphs = list(dict.fromkeys(PARAGRAPH_REF_RE.findall(sgb_ref)))
+    return (sgb_match.group(1) if sgb_match else None), paragraphs
 
 
 # === BEISPIEL-PROZESS INSTANZIIERUNG ===
@@ -570,8 +811,8 @@ if __name__ == "__main__":
 
     print(f"✅ Fall-Instanz erstellt: {case_id}")
 
-    # Get recommendations for current step
-    recommendations = prozess_int.get_current_step_recommendations(
+    # Get recommendations for the first step
+    recommendations = prozess_int.get_recommendations_for_step(
         f"{process_id}_Step_0"
     )
 
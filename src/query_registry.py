@@ -0,0 +1,904 @@
+"""
+Query Registry
+Zentrale, parametrisierte Cypher-Queries für RAG-System und Use-Case-Evaluatoren
+
+Alle Werte (SGB, Paragraphen, Suchbegriffe, Limits) sind Parameter statt
+Literale, damit der Server pro Query genau einen Plan cached - egal welcher
+Use Case welches SGB abfragt. Jede Query wird beim Import validiert
+(Parameter im Cypher == Default-Parameter) und kann per warm_plan_cache()
+beim Start mit EXPLAIN vorkompiliert werden.
+
+    query = get_query("uc.norm_titles")
+    session.run(query.cypher, query.params(sgb="III", paragraphs=["136", "137"]))
+
+Namensräume:
+- rag.*       SozialrechtNeo4jRAG / AsyncSozialrechtNeo4jRAG / Neo4jGraphBackend
+- uc.*        scripts/evaluate_sachbearbeiter_use_cases.py (UC01-UC20)
+- validate.*  scripts/validate_and_visualize_use_cases.py (+ Export nach cypher/use_cases/)
+- stats.*     graph_statistics.py (Count Store und Zähler pro Dokument)
+"""
+
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = 768
+
+PARAMETER = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+@dataclass(frozen=True)
+class RegisteredQuery:
+    """Named Cypher query with default parameters"""
+    name: str
+    cypher: str
+    defaults: Dict = field(default_factory=dict)
+    description: str = ""
+
+    def params(self, **overrides) -> Dict:
+        """Default parameters updated with overrides
+
+        Raises:
+            ValueError: Unknown parameter name
+        """
+        unknown = set(overrides) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Unknown parameter(s) for '{self.name}': {', '.join(sorted(unknown))}")
+        return {**self.defaults, **overrides}
+
+
+QUERIES: Dict[str, RegisteredQuery] = {}
+
+
+def register(name: str, cypher: str, description: str = "", **defaults) -> RegisteredQuery:
+    """Register a query; every $parameter needs a default and vice versa
+
+    Raises:
+        ValueError: Duplicate name or parameter mismatch
+    """
+    if name in QUERIES:
+        raise ValueError(f"Query '{name}' already registered")
+
+    used = set(PARAMETER.findall(cypher))
+    if used != set(defaults):
+        missing = sorted(used - set(defaults))
+        unused = sorted(set(defaults) - used)
+        raise ValueError(f"Query '{name}': missing defaults {missing}, unused defaults {unused}")
+
+    query = RegisteredQuery(name, cypher, defaults, description)
+    QUERIES[name] = query
+    return query
+
+
+def get_query(name: str) -> RegisteredQuery:
+    """Look up a registered query
+
+    Raises:
+        ValueError: Unknown query name
+    """
+    try:
+        return QUERIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown query '{name}'") from None
+
+
+def queries_with_prefix(prefix: Optional[str] = None) -> List[RegisteredQuery]:
+    """All registered queries, optionally restricted to a namespace like 'uc.'"""
+    return [query for name, query in QUERIES.items() if not prefix or name.startswith(prefix)]
+
+
+def warm_plan_cache(driver, prefix: Optional[str] = None) -> Dict[str, str]:
+    """Compile every query with EXPLAIN so the first real call hits a cached plan
+
+    EXPLAIN plant nur und führt nichts aus; die Default-Parameter liefern
+    die Typen, die auch zur Laufzeit übergeben werden.
+
+    Args:
+        driver: Neo4j driver
+        prefix: Optional namespace ('rag.', 'uc.', 'validate.')
+
+    Returns:
+        {query name: error} for queries that failed to compile
+    """
+    errors = {}
+    with driver.session() as session:
+        for query in queries_with_prefix(prefix):
+            try:
+                session.run("EXPLAIN " + query.cypher, query.defaults).consume()
+            except Exception as e:
+                errors[query.name] = str(e)
+
+    _log_warmup(prefix, errors)
+    return errors
+
+
+async def warm_plan_cache_async(driver, prefix: Optional[str] = None) -> Dict[str, str]:
+    """warm_plan_cache() for the AsyncGraphDatabase driver"""
+    errors = {}
+    async with driver.session() as session:
+        for query in queries_with_prefix(prefix):
+            try:
+                result = await session.run("EXPLAIN " + query.cypher, query.defaults)
+                await result.consume()
+            except Exception as e:
+                errors[query.name] = str(e)
+
+    _log_warmup(prefix, errors)
+    return errors
+
+
+def _log_warmup(prefix: Optional[str], errors: Dict[str, str]):
+    total = len(queries_with_prefix(prefix))
+    logger.info(f"🔥 Plan cache warmed: {total - len(errors)}/{total} queries ({prefix or 'all'})")
+    for name, error in errors.items():
+        logger.warning(f"⚠️  {name} failed to compile: {error}")
+
+
+_EMPTY_EMBEDDING = [0.0] * EMBEDDING_DIMENSIONS
+
+
+# === RAG (PDF graph) ===
+
+# Vector search with source metadata (shared with AsyncSozialrechtNeo4jRAG)
+# {document_filter} wird durch Neo4jGraphBackend.document_filter() ersetzt:
+# Filter greifen auf Document (indiziert) vor dem Similarity-Scan, nicht danach
+HYBRID_SEARCH_TEMPLATE = """
+    MATCH (d:Document)
+    {document_filter}
+    MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+    WITH d, c,
+         gds.similarity.cosine(c.embedding, $query_embedding) as similarity
+    ORDER BY similarity DESC
+    LIMIT $limit
+    RETURN c.text as text,
+           c.paragraph_nummer as paragraph_nummer,
+           similarity as score,
+           d.id as doc_id,
+           d.sgb_nummer as sgb_nummer,
+           d.document_type as document_type,
+           d.trust_score as trust_score,
+           d.type_priority as type_priority,
+           d.source_url as source_url,
+           d.stand_datum as stand_datum,
+           d.filename as filename
+"""
+
+# Mehrere Queries in einem Round-Trip: jede Query sucht in ihrem eigenen
+# Subquery, damit LIMIT pro Query und nicht global greift
+BATCH_SEARCH_TEMPLATE = """
+    UNWIND $queries AS q
+    CALL {{
+        WITH q
+        MATCH (d:Document)
+        {document_filter}
+        MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+        WITH d, c,
+             gds.similarity.cosine(c.embedding, q.embedding) as similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+        RETURN c.text as text,
+               c.paragraph_nummer as paragraph_nummer,
+               similarity as score,
+               d.id as doc_id,
+               d.sgb_nummer as sgb_nummer,
+               d.document_type as document_type,
+               d.trust_score as trust_score,
+               d.type_priority as type_priority,
+               d.source_url as source_url,
+               d.stand_datum as stand_datum,
+               d.filename as filename
+    }}
+    RETURN q.idx as query_idx, text, paragraph_nummer, score, doc_id,
+           sgb_nummer, document_type, trust_score, type_priority,
+           source_url, stand_datum, filename
+"""
+
+register(
+    "rag.hybrid_search",
+    HYBRID_SEARCH_TEMPLATE.format(document_filter=""),
+    "Vector search over all Document chunks (unfiltered variant)",
+    query_embedding=_EMPTY_EMBEDDING, limit=15,
+)
+
+register(
+    "rag.batch_search",
+    BATCH_SEARCH_TEMPLATE.format(document_filter=""),
+    "Several vector searches in one round trip (unfiltered variant)",
+    queries=[{'idx': 0, 'embedding': _EMPTY_EMBEDDING}], limit=15,
+)
+
+PARAGRAPH_SEARCH_QUERY = register(
+    "rag.paragraph_search",
+    """
+    MATCH (d:Document)-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
+    WHERE d.sgb_nummer = $sgb AND p.paragraph_nummer = $paragraph
+    RETURN d.document_type as type,
+           d.trust_score as trust,
+           d.filename as filename,
+           d.stand_datum as stand_datum,
+           p.content as content
+    ORDER BY d.type_priority ASC, d.trust_score DESC
+    """,
+    "All documents containing a paragraph (Gesetz first)",
+    sgb="II", paragraph="20",
+).cypher
+
+# === POINT-IN-TIME (NormVersion) ===
+
+# Fassungen gelten im Intervall [valid_from, valid_to); offene Fassungen haben
+# valid_to = 9999-12-31, so dass beide Prädikate Range-Index-Seeks sind
+# (NormVersion(sgb_nummer, paragraph_nummer, valid_from) bzw. (valid_to)) und
+# ein Stichtag so viele Knoten liest wie die aktuelle Fassung
+PARAGRAPH_AS_OF_QUERY = register(
+    "rag.paragraph_search_as_of",
+    """
+    CALL {
+        MATCH (v:NormVersion {sgb_nummer: $sgb, paragraph_nummer: $paragraph})
+        WHERE v.valid_from <= date($as_of) AND v.valid_to > date($as_of)
+        RETURN 'Gesetz' as type,
+               100 as trust,
+               v.jurabk as filename,
+               toString(v.valid_from) as stand_datum,
+               v.content_text as content,
+               1 as type_priority
+      UNION ALL
+        MATCH (d:Document)-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
+        WHERE d.sgb_nummer = $sgb AND p.paragraph_nummer = $paragraph
+          AND (d.stand_datum IS NULL OR d.stand_datum <= $as_of)
+        RETURN d.document_type as type,
+               d.trust_score as trust,
+               d.filename as filename,
+               d.stand_datum as stand_datum,
+               p.content as content,
+               d.type_priority as type_priority
+    }
+    RETURN type, trust, filename, stand_datum, content
+    ORDER BY type_priority ASC, trust DESC
+    """,
+    "Paragraph as of a date: valid norm version plus documents issued by then",
+    sgb="II", paragraph="20", as_of="2023-01-01",
+).cypher
+
+# Gleiche Record-Keys wie BATCH_SEARCH_TEMPLATE, damit _rank_chunks die
+# Fassungen zusammen mit den Document-Chunks bewertet
+VERSION_SEARCH_QUERY = register(
+    "rag.version_search",
+    """
+    UNWIND $queries AS q
+    CALL {
+        WITH q
+        MATCH (v:NormVersion)
+        WHERE v.valid_to > date($as_of) AND v.valid_from <= date($as_of)
+          AND v.embedding IS NOT NULL
+          AND (size($sgb_nummer) = 0 OR v.sgb_nummer IN $sgb_nummer)
+        WITH v, gds.similarity.cosine(v.embedding, q.embedding) as similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+        RETURN v.content_text as text,
+               v.paragraph_nummer as paragraph_nummer,
+               similarity as score,
+               v.norm_id as doc_id,
+               v.sgb_nummer as sgb_nummer,
+               'Gesetz' as document_type,
+               100 as trust_score,
+               1 as type_priority,
+               null as source_url,
+               toString(v.valid_from) as stand_datum,
+               v.jurabk as filename
+    }
+    RETURN q.idx as query_idx, text, paragraph_nummer, score, doc_id,
+           sgb_nummer, document_type, trust_score, type_priority,
+           source_url, stand_datum, filename
+    """,
+    "Vector search over the norm versions valid at a date",
+    queries=[{'idx': 0, 'embedding': _EMPTY_EMBEDDING}], as_of="2023-01-01", sgb_nummer=[], limit=15,
+).cypher
+
+# Zählungen einzeln aus dem Count Store statt OPTIONAL MATCH über
+# Document x Chunk x Paragraph; nur sgbs/types lesen Document-Knoten
+STATS_QUERY = register(
+    "rag.stats",
+    """
+    CALL { MATCH (d:Document) RETURN count(d) as doc_count }
+    CALL { MATCH (:Document)-[r:HAS_CHUNK]->() RETURN count(r) as chunk_count }
+    CALL { MATCH (p:Paragraph) RETURN count(p) as paragraph_count }
+    CALL {
+        MATCH (d:Document)
+        RETURN collect(DISTINCT d.sgb_nummer) as sgbs,
+               collect(DISTINCT d.document_type) as types
+    }
+    RETURN doc_count, chunk_count, paragraph_count, sgbs, types
+    """,
+    "Document/Chunk/Paragraph counts (count store)",
+).cypher
+
+
+# === SACHBEARBEITER USE CASES (evaluate_sachbearbeiter_use_cases.py) ===
+
+register(
+    "uc.norm_overview",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: $paragraph})
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    RETURN norm.enbez as paragraph,
+           norm.titel as titel,
+           count(chunk) as chunks,
+           norm.content_text as text
+    """,
+    "Single norm with chunk count and full text",
+    sgb="II", paragraph="20",
+)
+
+register(
+    "uc.norm_text_units",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm {paragraph_nummer: $paragraph})
+    OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
+    RETURN norm.enbez as paragraph,
+           norm.titel as titel,
+           count(text) as text_units
+    """,
+    "Single norm with its number of text units",
+    sgb="II", paragraph="15",
+)
+
+register(
+    "uc.norms_text_units",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    OPTIONAL MATCH (norm)-[:HAS_CONTENT]->(text:TextUnit)
+    RETURN norm.paragraph_nummer as para_nr,
+           norm.enbez as paragraph,
+           norm.titel as pruefpunkt,
+           count(text) as text_units
+    ORDER BY para_nr
+    """,
+    "Several norms with their number of text units",
+    sgb="II", paragraphs=["7", "8", "9"],
+)
+
+register(
+    "uc.norms_by_prefix",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer STARTS WITH $prefix
+    RETURN norm.paragraph_nummer as para,
+           norm.titel as titel,
+           norm.enbez as paragraph
+    ORDER BY para
+    """,
+    "Norm family like § 11, § 11a, § 11b",
+    sgb="II", prefix="11",
+)
+
+register(
+    "uc.norm_chunks_by_prefix",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer STARTS WITH $prefix
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    RETURN norm.paragraph_nummer as para,
+           norm.titel as titel,
+           count(chunk) as chunks
+    """,
+    "Norm family with chunk counts",
+    sgb="II", prefix="22",
+)
+
+register(
+    "uc.norm_chunks",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    RETURN norm.paragraph_nummer as para,
+           norm.titel as titel,
+           count(chunk) as chunks
+    """,
+    "Several norms with chunk counts",
+    sgb="II", paragraphs=["12", "12a"],
+)
+
+register(
+    "uc.norm_titles",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN norm.paragraph_nummer as para,
+           norm.titel as titel
+    ORDER BY para
+    """,
+    "Titles of several norms of one SGB",
+    sgb="II", paragraphs=["31", "31a", "31b", "32"],
+)
+
+register(
+    "uc.pruefschritte",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN norm.paragraph_nummer as para,
+           norm.titel as pruefschritt
+    ORDER BY [i IN range(0, size($paragraphs) - 1) WHERE $paragraphs[i] = para][0]
+    """,
+    "Norms in the order of the given workflow steps",
+    sgb="II", paragraphs=["7", "8", "9", "11", "12", "20", "21", "22", "37", "40"],
+)
+
+register(
+    "uc.structure_navigation",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:HAS_STRUCTURE]->(struct:StructuralUnit)
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    RETURN struct.gliederungsbez as struktur,
+           struct.gliederungstitel as titel,
+           count(norm) as anzahl_normen,
+           struct.order_index as order_idx
+    ORDER BY order_idx
+    LIMIT $limit
+    """,
+    "Chapters/sections with their number of norms",
+    sgb="II", limit=10,
+)
+
+register(
+    "uc.chunk_text_search",
+    """
+    MATCH (chunk:Chunk)
+    WHERE chunk.paragraph_context CONTAINS $term
+       OR chunk.text CONTAINS $term
+    RETURN chunk.enbez as paragraph,
+           chunk.norm_titel as titel,
+           count(chunk) as relevante_chunks
+    ORDER BY relevante_chunks DESC
+    LIMIT $limit
+    """,
+    "Text search over all chunks",
+    term="Regelbedarf", limit=5,
+)
+
+register(
+    "uc.weisungen",
+    """
+    MATCH (d:Document)
+    WHERE d.document_type = $document_type
+      AND (d.sgb_nummer = $sgb OR d.filename CONTAINS $filename_term)
+    OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+    RETURN d.filename as dokument,
+           d.trust_score as vertrauenswuerdigkeit,
+           count(c) as chunks
+    ORDER BY d.trust_score DESC
+    LIMIT $limit
+    """,
+    "PDF documents of one type for an SGB",
+    document_type="Fachliche Weisung", sgb="II", filename_term="SGB", limit=5,
+)
+
+register(
+    "uc.amendments",
+    """
+    MATCH (norm:LegalNorm)-[:HAS_AMENDMENT]->(amendment:Amendment)
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})-[:CONTAINS_NORM]->(norm)
+    WHERE amendment.amendment_date IS NOT NULL
+    RETURN norm.enbez as paragraph,
+           norm.titel as titel,
+           amendment.standkommentar as aenderung,
+           amendment.amendment_date as datum
+    ORDER BY amendment.amendment_date DESC
+    LIMIT $limit
+    """,
+    "Latest dated amendments of an SGB",
+    sgb="II", limit=10,
+)
+
+register(
+    "uc.table_column_values",
+    """
+    MATCH (cell:TableCell)
+    WHERE cell.column_header STARTS WITH $column
+    MATCH (table:Table)-[:HAS_ROW]->(:TableRow)-[:HAS_CELL]->(cell)
+    WHERE table.sgb_nummer = $sgb
+    RETURN table.paragraph_nummer as paragraph,
+           cell.column_header as spalte,
+           cell.row_label as zeile,
+           cell.text as text,
+           cell.value as wert,
+           cell.unit as einheit
+    ORDER BY table.id, cell.row_index
+    LIMIT $limit
+    """,
+    "One column of the structured tables, e.g. Regelbedarfsstufe 3 per year",
+    sgb="XII", column="Regelbedarfsstufe 3", limit=50,
+)
+
+register(
+    "uc.table_row_lookup",
+    """
+    MATCH (row:TableRow)
+    WHERE row.label STARTS WITH $label
+    MATCH (table:Table)-[:HAS_ROW]->(row)
+    WHERE table.sgb_nummer = $sgb
+    MATCH (row)-[:HAS_CELL]->(cell:TableCell)
+    WITH table, row, cell
+    ORDER BY cell.col_index
+    RETURN table.paragraph_nummer as paragraph,
+           row.label as zeile,
+           collect({spalte: cell.column_header, text: cell.text,
+                    wert: cell.value, einheit: cell.unit}) as zellen
+    LIMIT $limit
+    """,
+    "One row of the structured tables with all cells, e.g. amounts valid from a date",
+    sgb="XII", label="1. Januar 2024", limit=10,
+)
+
+# Alle Normen, die durch dasselbe Änderungsgesetz geändert wurden: ein
+# Index-Lookup auf BGBlReference.reference plus ein Hop über AMENDED_BY
+register(
+    "uc.norms_amended_by_act",
+    """
+    MATCH (act:BGBlReference {reference: $reference})<-[:AMENDED_BY]-(n:LegalNorm)
+    OPTIONAL MATCH (d:LegalDocument)-[:CONTAINS_NORM]->(n)
+    RETURN d.jurabk as gesetz,
+           n.enbez as paragraph,
+           n.titel as titel,
+           act.act_type as art,
+           act.act_date as datum
+    ORDER BY gesetz, n.order_index
+    LIMIT $limit
+    """,
+    "Norms amended by one act (BGBlReference hub)",
+    reference="BGBl. 2024 I Nr. 245", limit=50,
+)
+
+
+# === USE-CASE VALIDATION (validate_and_visualize_use_cases.py) ===
+
+register(
+    "validate.uc01",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+          -[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN
+        norm.paragraph_nummer as paragraph,
+        norm.enbez as titel,
+        count(DISTINCT chunk) as chunks,
+        collect(DISTINCT chunk.text)[0..2] as beispiel_texte
+    ORDER BY norm.order_index
+    """,
+    sgb="II", paragraphs=["20", "21", "22", "23"],
+)
+
+register(
+    "validate.uc02",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer = $paragraph
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        count(DISTINCT chunk) as relevante_chunks,
+        collect(DISTINCT chunk.text)[0..1] as beispiele
+    """,
+    sgb="II", paragraph="32", terms=["Meldeversäumnis", "Minderung", "Sanktion"],
+)
+
+register(
+    "validate.uc03",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    WITH norm, collect(chunk.text) as chunks
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        size(chunks) as chunk_count,
+        chunks[0..2] as beispiele
+    ORDER BY norm.paragraph_nummer
+    """,
+    sgb="II", paragraphs=["11", "11b"],
+)
+
+register(
+    "validate.uc06",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer = $paragraph
+    MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        count(chunk) as chunks,
+        collect(chunk.text)[0..3] as beispiel_definitionen
+    ORDER BY chunk.chunk_index
+    """,
+    sgb="II", paragraph="7",
+)
+
+register(
+    "validate.uc08",
+    """
+    MATCH (chunk:Chunk {sgb_nummer: $sgb, paragraph_nummer: $paragraph})
+    WHERE any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN
+        chunk.enbez as enbez,
+        count(chunk) as relevante_chunks,
+        collect(chunk.text)[0..2] as beispiele
+    """,
+    sgb="II", paragraph="24", terms=["Erstausstattung", "Schwangerschaft", "Darlehen"],
+)
+
+register(
+    "validate.uc10",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        count(chunk) as chunks
+    ORDER BY norm.paragraph_nummer
+    """,
+    sgb="X", paragraphs=["79", "80", "84", "85"],
+)
+
+register(
+    "validate.uc13",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    OPTIONAL MATCH (norm)-[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        count(DISTINCT chunk) as fristen_chunks,
+        collect(DISTINCT chunk.text)[0..2] as beispiel_fristen
+    """,
+    sgb="II", paragraphs=["37", "41", "44"], terms=["Frist", "unverzüglich", "Monat"],
+)
+
+register(
+    "validate.uc16",
+    """
+    MATCH (chunk:Chunk {sgb_nummer: $sgb})
+    WITH chunk.norm_id as norm_id,
+         chunk.paragraph_nummer as paragraph_nummer,
+         chunk.enbez as enbez,
+         count(chunk) as chunk_count,
+         count(CASE WHEN any(term IN $terms WHERE chunk.text CONTAINS term) THEN chunk END) as ausnahmen
+    WHERE chunk_count > $min_chunks AND ausnahmen > 0
+    RETURN
+        paragraph_nummer,
+        enbez,
+        chunk_count as komplexitaet,
+        ausnahmen
+    ORDER BY komplexitaet DESC, ausnahmen DESC
+    LIMIT $limit
+    """,
+    sgb="II", min_chunks=10, terms=["Ausnahme", "abweichend", "jedoch"], limit=10,
+)
+
+register(
+    "validate.uc18",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN
+        norm.paragraph_nummer,
+        norm.enbez,
+        'Phase: ' + $phases[norm.paragraph_nummer] as prozessphase
+    ORDER BY prozessphase, norm.paragraph_nummer
+    """,
+    sgb="II", paragraphs=["7", "11", "11b", "12", "37", "33"],
+    phases={
+        "7": "2 - Anspruchsprüfung",
+        "11": "2 - Bedürftigkeitsprüfung", "11b": "2 - Bedürftigkeitsprüfung", "12": "2 - Bedürftigkeitsprüfung",
+        "37": "3 - Entscheidung", "33": "3 - Entscheidung",
+    },
+)
+
+register(
+    "validate.uc19",
+    """
+    MATCH (doc:LegalDocument {sgb_nummer: $sgb})
+          -[:CONTAINS_NORM]->(norm:LegalNorm)
+          -[:AMENDED_BY]->(act:BGBlReference)
+    WHERE act.act_date >= date($since)
+    RETURN
+        norm.paragraph_nummer as paragraph_nummer,
+        norm.enbez as enbez,
+        act.reference as reference,
+        act.act_type as act_type,
+        toString(act.act_date) as act_date
+    ORDER BY act.act_date DESC, norm.order_index
+    LIMIT $limit
+    """,
+    sgb="II", since="2023-01-01", limit=10,
+)
+
+# Visualisierung (Neo4j Browser): Pfade statt Tabellen
+
+register(
+    "validate.norm_chunk_paths",
+    """
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN path LIMIT $limit
+    """,
+    "Norm -> Chunk paths for a list of paragraphs",
+    sgb="II", paragraphs=["20", "21", "22", "23"], limit=50,
+)
+
+register(
+    "validate.norm_term_chunk_paths",
+    """
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE norm.paragraph_nummer IN $paragraphs
+      AND any(term IN $terms WHERE chunk.text CONTAINS term)
+    RETURN path LIMIT $limit
+    """,
+    "Norm -> Chunk paths restricted to chunks mentioning a term",
+    sgb="II", paragraphs=["24"], terms=["Erstausstattung"], limit=30,
+)
+
+register(
+    "validate.norm_paths",
+    """
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+    WHERE norm.paragraph_nummer IN $paragraphs
+    RETURN path LIMIT $limit
+    """,
+    "Document -> Norm paths",
+    sgb="X", paragraphs=["79", "80", "84", "85"], limit=20,
+)
+
+register(
+    "validate.complex_norm_paths",
+    """
+    MATCH (norm:LegalNorm)-[:HAS_CHUNK]->(chunk:Chunk)
+    WHERE EXISTS {
+        MATCH (norm)<-[:CONTAINS_NORM]-(doc:LegalDocument {sgb_nummer: $sgb})
+    }
+    WITH norm, count(chunk) as chunk_count
+    WHERE chunk_count > $min_chunks
+    MATCH path = (norm)-[:HAS_CHUNK]->(chunk)
+    RETURN path LIMIT $limit
+    """,
+    "Chunk paths of norms with many chunks",
+    sgb="II", min_chunks=15, limit=50,
+)
+
+register(
+    "validate.amendment_paths",
+    """
+    MATCH path = (doc:LegalDocument {sgb_nummer: $sgb})
+                 -[:CONTAINS_NORM]->(norm:LegalNorm)
+                 -[:AMENDED_BY]->(act:BGBlReference)
+    RETURN path LIMIT $limit
+    """,
+    "Norm -> amending act (BGBlReference) paths",
+    sgb="II", limit=20,
+)
+
+
+# === STATISTICS (graph_statistics.py) ===
+
+# Labels und (Start-Label, Typ) für Count-Store-Zählungen: ein MATCH mit
+# genau einem Label bzw. einem Label an einem Ende und count() ohne WHERE
+# beantwortet Neo4j aus dem Count Store, ohne Knoten zu lesen
+STAT_LABELS = (
+    'Document', 'Chunk', 'Paragraph',
+    'LegalDocument', 'StructuralUnit', 'LegalNorm', 'TextUnit', 'ListItem', 'Amendment',
+    'Table', 'TableRow', 'TableCell', 'NormVersion', 'BGBlReference',
+)
+
+STAT_RELATIONSHIPS = (
+    ('Document', 'HAS_CHUNK'),
+    ('Document', 'CONTAINS_PARAGRAPH'),
+    ('LegalDocument', 'HAS_STRUCTURE'),
+    ('LegalDocument', 'CONTAINS_NORM'),
+    ('LegalDocument', 'HAS_CHUNK'),
+    ('StructuralUnit', 'CONTAINS_NORM'),
+    ('LegalNorm', 'HAS_CHUNK'),
+    ('LegalNorm', 'HAS_CONTENT'),
+    ('LegalNorm', 'HAS_AMENDMENT'),
+    ('LegalNorm', 'HAS_TABLE'),
+    ('LegalNorm', 'HAS_VERSION'),
+    ('NormVersion', 'SUPERSEDES'),
+    ('Amendment', 'PUBLISHED_IN'),
+    ('LegalNorm', 'AMENDED_BY'),
+)
+
+for _label in STAT_LABELS:
+    register(
+        f"stats.nodes.{_label}",
+        f"MATCH (n:{_label}) RETURN count(n) as count",
+        f"{_label} node count (count store)",
+    )
+
+for _label, _rel_type in STAT_RELATIONSHIPS:
+    register(
+        f"stats.rels.{_label}.{_rel_type}",
+        f"MATCH (:{_label})-[r:{_rel_type}]->() RETURN count(r) as count",
+        f"{_rel_type} relationships from {_label} (count store)",
+    )
+
+register(
+    "stats.legal_by_sgb",
+    """
+    MATCH (d:LegalDocument)
+    RETURN d.sgb_nummer as sgb,
+           count(d) as documents,
+           sum(coalesce(d.structure_count, 0)) as structures,
+           sum(coalesce(d.norm_count, 0)) as norms,
+           sum(coalesce(d.chunk_count, 0)) as chunks
+    ORDER BY sgb
+    """,
+    "Per-SGB counters of the XML graph (import-time counters on LegalDocument)",
+)
+
+register(
+    "stats.pdf_by_sgb",
+    """
+    MATCH (d:Document)
+    RETURN d.sgb_nummer as sgb,
+           count(d) as documents,
+           sum(coalesce(d.chunk_count, 0)) as chunks,
+           sum(coalesce(d.paragraph_count, 0)) as paragraphs
+    ORDER BY sgb
+    """,
+    "Per-SGB counters of the PDF graph (import-time counters on Document)",
+)
+
+register(
+    "stats.refresh_legal_counters",
+    """
+    MATCH (d:LegalDocument)
+    SET d.structure_count = size([(d)-[:HAS_STRUCTURE]->(s:StructuralUnit) | s]),
+        d.norm_count = size([(d)-[:CONTAINS_NORM]->(n:LegalNorm) | n]),
+        d.chunk_count = size([(d)-[:CONTAINS_NORM]->(:LegalNorm)-[:HAS_CHUNK]->(c:Chunk) | c])
+    RETURN count(d) as updated
+    """,
+    "Recompute LegalDocument counters (backfill for graphs imported without them)",
+)
+
+register(
+    "stats.refresh_pdf_counters",
+    """
+    MATCH (d:Document)
+    SET d.chunk_count = size([(d)-[:HAS_CHUNK]->(c:Chunk) | c]),
+        d.paragraph_count = size([(d)-[:CONTAINS_PARAGRAPH]->(p:Paragraph) | p])
+    RETURN count(d) as updated
+    """,
+    "Recompute Document counters (backfill for graphs imported without them)",
+)
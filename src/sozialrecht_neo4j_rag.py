@@ -20,6 +20,11 @@ from datetime import datetime
 import hashlib
 from dotenv import load_dotenv
 
+from src.embedding_batcher import EmbeddingMicroBatcher
+from src.graph_backend import GraphBackend, Neo4jGraphBackend
+from src.instrumentation import span
+from src.neo4j_prozess_integration import Neo4jProzessIntegration
+
 # Load .env file
 load_dotenv()
 
@@ -58,30 +63,58 @@ class SozialrechtNeo4jRAG:
         'Fachverband': 5
     }
 
-    def __init__(self, uri: str = None, username: str = None, password: str = None):
+    BETRAG_KEYWORDS = [
+        'regelbedarf', 'betrag', 'höhe', 'euro', '€', 'frist', 'datum',
+        'wie viel', 'wieviel', 'berechnung', 'satz'
+    ]
+
+    def __init__(self, uri: str = None, username: str = None, password: str = None,
+                 max_connection_pool_size: int = 10,
+                 backend: Optional[GraphBackend] = None,
+                 embedding_model: Optional[SentenceTransformer] = None):
         """Initialize Sozialrecht Neo4j RAG System
 
         Args:
             uri: Neo4j connection URI
             username: Neo4j username
             password: Neo4j password
+            max_connection_pool_size: Bolt connections shared by all threads
+            backend: Storage backend (default: Neo4jGraphBackend on uri);
+                     InMemoryGraphBackend runs without Neo4j server
+            embedding_model: Already loaded SentenceTransformer (optional)
         """
-        # Default to local Neo4j
-        uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        username = username or os.getenv("NEO4J_USERNAME", "neo4j")
-        password = password or os.getenv("NEO4J_PASSWORD", "password")
-
-        self.driver = GraphDatabase.driver(
-            uri,
-            auth=(username, password),
-            max_connection_pool_size=10,
-            connection_timeout=30.0
-        )
+        if backend is None:
+            # Default to local Neo4j
+            uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
+            username = username or os.getenv("NEO4J_USERNAME", "neo4j")
+            password = password or os.getenv("NEO4J_PASSWORD", "password")
+
+            backend = Neo4jGraphBackend(GraphDatabase.driver(
+                uri,
+                auth=(username, password),
+                max_connection_pool_size=max_connection_pool_size,
+                connection_timeout=30.0
+            ))
+
+        self.backend = backend
+        # Raw driver for callers running their own Cypher (None for in-memory backend)
+        self.driver = getattr(backend, 'driver', None)
+        # Materialisierte Empfehlungen der Prozess-Schritte (nur Neo4j)
+        self.process_integration = Neo4jProzessIntegration(self.driver) if self.driver is not None else None
 
         # German embedding model for better legal text understanding
-        logger.info("Loading German embedding model...")
-        self.embedding_model = SentenceTransformer('paraphrase-multilingual-mpnet-base-v2')
-        self._embedding_lock = threading.Lock()
+        if embedding_model:
+            self.embedding_model = embedding_model
+        else:
+            logger.info("Loading German embedding model...")
+            self.embedding_model = SentenceTransformer('paraphrase-multilingual-mpnet-base-v2')
+
+        # Concurrent encode calls are coalesced into one forward pass
+        self.embedder = EmbeddingMicroBatcher(
+            self.embedding_model,
+            max_batch_size=int(os.getenv("EMBEDDING_MAX_BATCH", "32")),
+            max_wait_ms=float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "3"))
+        )
 
         # Paragraph-specific text splitter (larger chunks for legal context)
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -94,58 +127,11 @@ class SozialrechtNeo4jRAG:
         self._query_cache = {}
         self._cache_lock = threading.Lock()
 
-        # Initialize schema
-        self._initialize_sozialrecht_schema()
-
-        logger.info(f"✅ Sozialrecht RAG System initialized with URI: {uri}")
-
-    def _initialize_sozialrecht_schema(self):
-        """Create Sozialrecht-specific Neo4j schema"""
-        with self.driver.session() as session:
-            # Create constraints
-            session.run("""
-                CREATE CONSTRAINT IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNIQUE
-            """)
-
-            session.run("""
-                CREATE CONSTRAINT IF NOT EXISTS FOR (p:Paragraph) REQUIRE p.id IS UNIQUE
-            """)
-
-            # Create indexes for Sozialrecht-specific queries
-            try:
-                # SGB-specific index
-                session.run("""
-                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.sgb_nummer)
-                """)
-
-                # Paragraph number index
-                session.run("""
-                    CREATE INDEX IF NOT EXISTS FOR (p:Paragraph) ON (p.paragraph_nummer)
-                """)
-
-                # Source trust score index
-                session.run("""
-                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.trust_score)
-                """)
-
-                # Document type index (for hybrid strategy)
-                session.run("""
-                    CREATE INDEX IF NOT EXISTS FOR (d:Document) ON (d.document_type)
-                """)
-
-                # Full-text search index for chunks
-                try:
-                    session.run("""
-                        CREATE FULLTEXT INDEX sozialrecht_fulltext IF NOT EXISTS
-                        FOR (c:Chunk) ON EACH [c.text, c.paragraph_context]
-                    """)
-                except Exception:
-                    logger.warning("Fulltext index might already exist")
-
-            except Exception as e:
-                logger.warning(f"Some indexes might already exist: {e}")
-
-            logger.info("✅ Sozialrecht-specific Neo4j schema initialized")
+        # Initialize schema and precompile the registered queries
+        self.backend.initialize_schema()
+        self.backend.warm_up()
+
+        logger.info(f"✅ Sozialrecht RAG System initialized with {type(backend).__name__}")
 
     def add_sgb_document(self,
                         content: str,
@@ -185,13 +171,13 @@ class SozialrechtNeo4jRAG:
         if metadata:
             doc_metadata.update(metadata)
 
-        # Add to Neo4j
-        with self.driver.session() as session:
-            with session.begin_transaction() as tx:
-                self._add_document_with_paragraphs(
-                    tx, doc_id, content, doc_metadata
-                )
-                tx.commit()
+        # Add to graph
+        with span("rag.add_document", sgb_nummer=sgb_nummer, document_type=document_type):
+            self._add_document_with_paragraphs(doc_id, content, doc_metadata)
+
+        # Bundles der Schritte, die auf Paragraphen dieses Dokuments verweisen
+        if self.process_integration is not None:
+            self.process_integration.refresh_for_documents([doc_id])
 
         logger.info(f"✅ Added: {sgb_nummer} {document_type} (ID: {doc_id}, Trust: {trust_score}%)")
         return doc_id
@@ -209,32 +195,18 @@ class SozialrechtNeo4jRAG:
         match = re.search(r'https?://([^/]+)', url)
         return match.group(1) if match else 'unknown'
 
-    def _add_document_with_paragraphs(self, tx, doc_id: str, content: str, metadata: Dict):
+    def _add_document_with_paragraphs(self, doc_id: str, content: str, metadata: Dict):
         """Add document with paragraph-aware chunking"""
 
         # Split into chunks (paragraph-aware)
-        chunks = self.text_splitter.split_text(content)
+        with span("rag.chunk"):
+            chunks = self.text_splitter.split_text(content)
 
         # Generate embeddings in batch
-        with self._embedding_lock:
-            embeddings = self.embedding_model.encode(chunks)
-
-        # Create Document node
-        cypher_create_doc = """
-            MERGE (d:Document {id: $doc_id})
-            SET d.content = $content,
-                d.created = datetime(),
-                d.chunk_count = $chunk_count,
-                d.sgb_nummer = $sgb_nummer,
-                d.document_type = $document_type,
-                d.source_url = $source_url,
-                d.source_domain = $source_domain,
-                d.trust_score = $trust_score,
-                d.type_priority = $type_priority
-        """
+        with span("rag.encode", texts=len(chunks)):
+            embeddings = self.embedder.encode(chunks)
 
-        doc_params = {
-            'doc_id': doc_id,
+        doc_properties = {
             'content': content[:5000],  # Limit content length in node
             'chunk_count': len(chunks),
             'sgb_nummer': metadata.get('sgb_nummer', 'Unknown'),
@@ -249,19 +221,15 @@ class SozialrechtNeo4jRAG:
         optional_fields = ['stand_datum', 'paragraph_nummer', 'filename', 'file_size_mb']
         for field in optional_fields:
             if field in metadata:
-                cypher_create_doc += f", d.{field} = ${field}"
-                doc_params[field] = metadata[field]
-
-        tx.run(cypher_create_doc, **doc_params)
+                doc_properties[field] = metadata[field]
 
-        # Create Chunk nodes with paragraph context
+        # Chunks with paragraph context
         chunk_data = []
         for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
             # Extract paragraph number if present in chunk
             paragraph_nummer = self._extract_paragraph_number(chunk)
 
             chunk_data.append({
-                'doc_id': doc_id,
                 'text': chunk,
                 'embedding': embedding.tolist(),
                 'index': i,
@@ -269,45 +237,26 @@ class SozialrechtNeo4jRAG:
                 'paragraph_context': chunk[:200]  # First 200 chars for context
             })
 
-        # Batch insert chunks
-        tx.run("""
-            UNWIND $chunk_data as chunk
-            MATCH (d:Document {id: chunk.doc_id})
-            CREATE (c:Chunk {
-                text: chunk.text,
-                embedding: chunk.embedding,
-                chunk_index: chunk.index,
-                paragraph_nummer: chunk.paragraph_nummer,
-                paragraph_context: chunk.paragraph_context
+        # Paragraph nodes if paragraph numbers found
+        paragraphs = []
+        paragraphs_found = set(c['paragraph_nummer'] for c in chunk_data if c['paragraph_nummer'])
+
+        for para_num in paragraphs_found:
+            para_chunks = [c for c in chunk_data if c['paragraph_nummer'] == para_num]
+            para_text = "\n\n".join([c['text'] for c in para_chunks])
+
+            paragraphs.append({
+                'para_id': f"{metadata['sgb_nummer']}_{para_num}",
+                'paragraph_nummer': para_num,
+                'sgb_nummer': metadata['sgb_nummer'],
+                'content': para_text[:5000],
+                'chunk_count': len(para_chunks)
             })
-            CREATE (d)-[:HAS_CHUNK]->(c)
-        """, chunk_data=chunk_data)
 
-        # Create Paragraph nodes if paragraph numbers found
-        paragraphs_found = set(c['paragraph_nummer'] for c in chunk_data if c['paragraph_nummer'])
+        # Zähler für graph_statistics
+        doc_properties['paragraph_count'] = len(paragraphs)
 
-        if paragraphs_found:
-            for para_num in paragraphs_found:
-                para_chunks = [c for c in chunk_data if c['paragraph_nummer'] == para_num]
-                para_text = "\n\n".join([c['text'] for c in para_chunks])
-
-                tx.run("""
-                    MERGE (p:Paragraph {id: $para_id})
-                    SET p.paragraph_nummer = $paragraph_nummer,
-                        p.sgb_nummer = $sgb_nummer,
-                        p.content = $content,
-                        p.chunk_count = $chunk_count
-                    WITH p
-                    MATCH (d:Document {id: $doc_id})
-                    MERGE (d)-[:CONTAINS_PARAGRAPH]->(p)
-                """, {
-                    'para_id': f"{metadata['sgb_nummer']}_{para_num}",
-                    'paragraph_nummer': para_num,
-                    'sgb_nummer': metadata['sgb_nummer'],
-                    'content': para_text[:5000],
-                    'chunk_count': len(para_chunks),
-                    'doc_id': doc_id
-                })
+        self.backend.upsert_document(doc_id, doc_properties, chunk_data, paragraphs)
 
     def _extract_paragraph_number(self, text: str) -> Optional[str]:
         """Extract paragraph number from text (§ X, § XX, etc.)"""
@@ -318,7 +267,9 @@ class SozialrechtNeo4jRAG:
     def hybrid_search_with_source_ranking(self,
                                          query: str,
                                          k: int = 5,
-                                         prefer_gesetz: bool = True) -> List[Dict]:
+                                         prefer_gesetz: bool = True,
+                                         filters: Optional[Dict] = None,
+                                         as_of: Optional[str] = None) -> List[Dict]:
         """
         Hybrid search mit Quellen-Hierarchie
 
@@ -326,103 +277,136 @@ class SozialrechtNeo4jRAG:
             query: Suchanfrage
             k: Anzahl Ergebnisse
             prefer_gesetz: Bevorzuge Gesetz vor Weisungen (für Beträge/Fristen)
+            filters: Optional, siehe normalize_search_filters() (z.B. nur SGB II Gesetz)
+            as_of: Optional, Stichtag (ISO-Datum): Gesetzestext in der an diesem
+                   Tag gültigen Fassung, nur bis dahin erschienene Dokumente
 
         Returns:
             List of results mit Trust-Score und Source-Priority
         """
-        # Generate query embedding
-        with self._embedding_lock:
-            query_embedding = self.embedding_model.encode([query])[0]
+        with span("rag.hybrid_search", query=query, k=k):
+            # Generate query embedding (micro-batched with concurrent callers)
+            with span("rag.encode", texts=1):
+                query_embedding = self.embedder.encode([query])[0]
 
-        with self.driver.session() as session:
             # Vector search mit Source-Ranking
-            result = session.run("""
-                MATCH (d:Document)-[:HAS_CHUNK]->(c:Chunk)
-                WITH d, c,
-                     gds.similarity.cosine(c.embedding, $query_embedding) as similarity
-                ORDER BY similarity DESC
-                LIMIT $limit
-                RETURN c.text as text,
-                       c.paragraph_nummer as paragraph_nummer,
-                       similarity as score,
-                       d.id as doc_id,
-                       d.sgb_nummer as sgb_nummer,
-                       d.document_type as document_type,
-                       d.trust_score as trust_score,
-                       d.type_priority as type_priority,
-                       d.source_url as source_url,
-                       d.stand_datum as stand_datum,
-                       d.filename as filename
-            """, query_embedding=query_embedding.tolist(), limit=k*3)
-
-            chunks = []
-            for record in result:
-                # Calculate combined score (similarity + trust + type priority)
-                similarity_score = float(record['score'])
-                trust_score = int(record.get('trust_score', 70))
-                type_priority = int(record.get('type_priority', 99))
-
-                # Weighted scoring
-                combined_score = (
-                    similarity_score * 0.6 +  # Semantic similarity (60%)
-                    (trust_score / 100) * 0.25 +  # Source trust (25%)
-                    (1 - type_priority / 100) * 0.15  # Type priority (15%)
-                )
-
-                # Boost Gesetz if prefer_gesetz=True
-                if prefer_gesetz and record.get('document_type') == 'Gesetz':
-                    combined_score *= 1.2
-
-                chunks.append({
-                    'text': record['text'],
-                    'paragraph': record.get('paragraph_nummer'),
-                    'score': combined_score,
-                    'similarity': similarity_score,
-                    'doc_id': record['doc_id'],
-                    'sgb': record.get('sgb_nummer', 'Unknown'),
-                    'type': record.get('document_type', 'Unknown'),
-                    'trust_score': trust_score,
-                    'source_url': record.get('source_url', ''),
-                    'stand_datum': record.get('stand_datum'),
-                    'filename': record.get('filename', '')
-                })
-
-            # Sort by combined score
-            chunks.sort(key=lambda x: x['score'], reverse=True)
-            return chunks[:k]
+            records = self.backend.search_chunks([query_embedding.tolist()], k*3,
+                                                 self._with_as_of(filters, as_of))[0]
+
+            with span("rag.rank"):
+                return self._rank_chunks(records, k, prefer_gesetz)
+
+    def search_many(self,
+                    queries: List[str],
+                    k: int = 5,
+                    filters: Optional[Dict] = None,
+                    prefer_gesetz: bool = True,
+                    as_of: Optional[str] = None) -> List[List[Dict]]:
+        """
+        Batch-Suche: viele Queries mit einem Embedding-Batch und einem Backend-Call
+
+        Für Offline-Evaluation und das Vorbeantworten von FAQ-Listen.
+
+        Args:
+            queries: Suchanfragen
+            k: Anzahl Ergebnisse pro Query
+            filters: Optional, siehe normalize_search_filters()
+            prefer_gesetz: Bevorzuge Gesetz vor Weisungen (für Beträge/Fristen)
+            as_of: Optional, Stichtag (siehe hybrid_search_with_source_ranking)
+
+        Returns:
+            Eine Ergebnisliste pro Query (gleiche Reihenfolge wie `queries`)
+        """
+        if not queries:
+            return []
+
+        with span("rag.search_many", query=f"{queries[0]} (+{len(queries) - 1} more)", k=k):
+            with span("rag.encode", texts=len(queries)):
+                embeddings = self.embedder.encode(list(queries))
+
+            records_per_query = self.backend.search_chunks(
+                [embedding.tolist() for embedding in embeddings], k*3, self._with_as_of(filters, as_of)
+            )
+
+            with span("rag.rank"):
+                return [self._rank_chunks(records, k, prefer_gesetz) for records in records_per_query]
+
+    @staticmethod
+    def _with_as_of(filters: Optional[Dict], as_of: Optional[str]) -> Optional[Dict]:
+        """Add the as_of date to the search filters"""
+        if as_of is None:
+            return filters
+        return dict(filters or {}, as_of=as_of)
+
+    @staticmethod
+    def _rank_chunks(records, k: int, prefer_gesetz: bool) -> List[Dict]:
+        """Combine similarity, trust score and type priority into a ranking"""
+        chunks = []
+        for record in records:
+            # Calculate combined score (similarity + trust + type priority)
+            similarity_score = float(record['score'])
+            trust_score = int(record.get('trust_score', 70))
+            type_priority = int(record.get('type_priority', 99))
+
+            # Weighted scoring
+            combined_score = (
+                similarity_score * 0.6 +  # Semantic similarity (60%)
+                (trust_score / 100) * 0.25 +  # Source trust (25%)
+                (1 - type_priority / 100) * 0.15  # Type priority (15%)
+            )
+
+            # Boost Gesetz if prefer_gesetz=True
+            if prefer_gesetz and record.get('document_type') == 'Gesetz':
+                combined_score *= 1.2
+
+            chunks.append({
+                'text': record['text'],
+                'paragraph': record.get('paragraph_nummer'),
+                'score': combined_score,
+                'similarity': similarity_score,
+                'doc_id': record['doc_id'],
+                'sgb': record.get('sgb_nummer', 'Unknown'),
+                'type': record.get('document_type', 'Unknown'),
+                'trust_score': trust_score,
+                'source_url': record.get('source_url', ''),
+                'stand_datum': record.get('stand_datum'),
+                'filename': record.get('filename', '')
+            })
+
+        # Sort by combined score
+        chunks.sort(key=lambda x: x['score'], reverse=True)
+        return chunks[:k]
 
     def search_by_sgb_and_paragraph(self,
                                     sgb_nummer: str,
-                                    paragraph_nummer: str) -> List[Dict]:
+                                    paragraph_nummer: str,
+                                    as_of: Optional[str] = None) -> List[Dict]:
         """
         Suche spezifisch nach SGB und Paragraph
 
         Args:
             sgb_nummer: z.B. "II", "III", "VI"
             paragraph_nummer: z.B. "20", "11a", "136"
+            as_of: Optional, Stichtag (ISO-Datum): Gesetz in der damals gültigen
+                   Fassung, Weisungen nur mit stand_datum bis zu diesem Tag
 
         Returns:
             Alle Dokumente zu diesem Paragraph (Gesetz + Weisungen)
         """
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (d:Document)-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
-                WHERE d.sgb_nummer = $sgb AND p.paragraph_nummer = $paragraph
-                RETURN d.document_type as type,
-                       d.trust_score as trust,
-                       d.filename as filename,
-                       d.stand_datum as stand_datum,
-                       p.content as content
-                ORDER BY d.type_priority ASC, d.trust_score DESC
-            """, sgb=sgb_nummer, paragraph=paragraph_nummer)
-
-            return [{
-                'type': record['type'],
-                'trust': record['trust'],
-                'filename': record['filename'],
-                'stand_datum': record['stand_datum'],
-                'content': record['content']
-            } for record in result]
+        with span("rag.paragraph_lookup", query=f"SGB {sgb_nummer} § {paragraph_nummer}"):
+            records = self.backend.find_paragraph(sgb_nummer, paragraph_nummer, as_of)
+            return self._format_paragraph_results(records)
+
+    @staticmethod
+    def _format_paragraph_results(records) -> List[Dict]:
+        """Map paragraph lookup records to result dicts"""
+        return [{
+            'type': record['type'],
+            'trust': record['trust'],
+            'filename': record['filename'],
+            'stand_datum': record['stand_datum'],
+            'content': record['content']
+        } for record in records]
 
     def get_hybrid_answer(self,
                          query: str,
@@ -438,10 +422,7 @@ class SozialrechtNeo4jRAG:
             Antwort mit Gesetz- und Weisungs-Quellen
         """
         # Detect if this is a query about amounts/dates
-        is_betrag_query = detect_betrag_anfrage and any(word in query.lower() for word in [
-            'regelbedarf', 'betrag', 'höhe', 'euro', '€', 'frist', 'datum',
-            'wie viel', 'wieviel', 'berechnung', 'satz'
-        ])
+        is_betrag_query = detect_betrag_anfrage and self._is_betrag_query(query)
 
         # Search Gesetz with high priority
         gesetz_results = self.hybrid_search_with_source_ranking(
@@ -453,7 +434,19 @@ class SozialrechtNeo4jRAG:
             query, k=3, prefer_gesetz=False
         )
 
-        # Build answer
+        return self._compose_hybrid_answer(gesetz_results, weisungen_results, is_betrag_query)
+
+    @classmethod
+    def _is_betrag_query(cls, query: str) -> bool:
+        """Detect queries about amounts, dates or deadlines"""
+        query_lower = query.lower()
+        return any(word in query_lower for word in cls.BETRAG_KEYWORDS)
+
+    @staticmethod
+    def _compose_hybrid_answer(gesetz_results: List[Dict],
+                               weisungen_results: List[Dict],
+                               is_betrag_query: bool) -> Dict:
+        """Build the answer text from Gesetz and Weisung results"""
         answer_parts = []
 
         if is_betrag_query and gesetz_results:
@@ -495,42 +488,34 @@ class SozialrechtNeo4jRAG:
 
     def get_stats(self) -> Dict:
         """Get Sozialrecht-specific statistics"""
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (d:Document)
-                OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-                OPTIONAL MATCH (d)-[:CONTAINS_PARAGRAPH]->(p:Paragraph)
-                RETURN COUNT(DISTINCT d) as doc_count,
-                       COUNT(DISTINCT c) as chunk_count,
-                       COUNT(DISTINCT p) as paragraph_count,
-                       COLLECT(DISTINCT d.sgb_nummer) as sgbs,
-                       COLLECT(DISTINCT d.document_type) as types
-            """)
-
-            record = result.single()
-
-            if not record:
-                return {
-                    'documents': 0,
-                    'chunks': 0,
-                    'paragraphs': 0,
-                    'sgbs_covered': [],
-                    'document_types': [],
-                    'cache_size': 0
-                }
+        return self._format_stats(self.backend.stats(), len(self._query_cache))
 
+    @staticmethod
+    def _format_stats(record, cache_size: int) -> Dict:
+        """Map the statistics record to the stats dict"""
+        if not record:
             return {
-                'documents': record['doc_count'] or 0,
-                'chunks': record['chunk_count'] or 0,
-                'paragraphs': record['paragraph_count'] or 0,
-                'sgbs_covered': [s for s in record['sgbs'] if s],
-                'document_types': [t for t in record['types'] if t],
-                'cache_size': len(self._query_cache)
+                'documents': 0,
+                'chunks': 0,
+                'paragraphs': 0,
+                'sgbs_covered': [],
+                'document_types': [],
+                'cache_size': 0
             }
 
+        return {
+            'documents': record['doc_count'] or 0,
+            'chunks': record['chunk_count'] or 0,
+            'paragraphs': record['paragraph_count'] or 0,
+            'sgbs_covered': [s for s in record['sgbs'] if s],
+            'document_types': [t for t in record['types'] if t],
+            'cache_size': cache_size
+        }
+
     def close(self):
         """Close Neo4j connection"""
-        self.driver.close()
+        self.embedder.close()
+        self.backend.close()
         logger.info("✅ Neo4j connection closed")
 
 
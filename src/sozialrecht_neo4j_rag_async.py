@@ -0,0 +1,241 @@
+"""
+Sozialrecht Neo4j RAG System (asyncio)
+Asynchrone Variante von SozialrechtNeo4jRAG für nebenläufige Anfragen
+
+Nutzt den AsyncGraphDatabase-Driver; Embeddings laufen über den
+EmbeddingMicroBatcher (ein Worker-Thread), damit der Event-Loop nie durch
+einen Forward-Pass blockiert und gleichzeitige Queries gebündelt werden.
+Scoring und Antwort-Aufbau werden von SozialrechtNeo4jRAG, die Cypher-Queries
+von Neo4jGraphBackend übernommen, damit beide Varianten identische Ergebnisse liefern.
+"""
+
+import os
+import asyncio
+import logging
+from typing import List, Dict, Optional
+from neo4j import AsyncGraphDatabase
+from sentence_transformers import SentenceTransformer
+from dotenv import load_dotenv
+
+from src.sozialrecht_neo4j_rag import SozialrechtNeo4jRAG
+from src.graph_backend import Neo4jGraphBackend, includes_norm_versions, merge_by_score, normalize_search_filters
+from src.embedding_batcher import EmbeddingMicroBatcher
+from src.query_registry import warm_plan_cache_async
+from src.instrumentation import span
+
+# Load .env file
+load_dotenv()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AsyncSozialrechtNeo4jRAG:
+    """
+    Asyncio-native Neo4j RAG-System für Sozialrecht-Dokumente
+
+    Features:
+    - AsyncGraphDatabase mit konfigurierbarem Connection-Pool
+    - Micro-batched Embedding (kein globaler Lock im Event-Loop)
+    - Viele Sachbearbeiter-Anfragen parallel pro Worker-Prozess (asyncio.gather)
+    """
+
+    def __init__(self,
+                 uri: str = None,
+                 username: str = None,
+                 password: str = None,
+                 max_connection_pool_size: int = 50,
+                 embedding_max_batch: int = 32,
+                 embedding_wait_ms: float = 3.0,
+                 embedding_model: Optional[SentenceTransformer] = None):
+        """Initialize async Sozialrecht RAG System
+
+        Args:
+            uri: Neo4j connection URI
+            username: Neo4j username
+            password: Neo4j password
+            max_connection_pool_size: Bolt connections shared by all coroutines
+            embedding_max_batch: Max. Texte pro Forward-Pass
+            embedding_wait_ms: Sammelfenster für gleichzeitige Queries
+            embedding_model: Already loaded SentenceTransformer (optional)
+        """
+        uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        username = username or os.getenv("NEO4J_USERNAME", "neo4j")
+        password = password or os.getenv("NEO4J_PASSWORD", "password")
+
+        self.driver = AsyncGraphDatabase.driver(
+            uri,
+            auth=(username, password),
+            max_connection_pool_size=max_connection_pool_size,
+            connection_timeout=30.0
+        )
+
+        if embedding_model:
+            self.embedding_model = embedding_model
+        else:
+            logger.info("Loading German embedding model...")
+            self.embedding_model = SentenceTransformer('paraphrase-multilingual-mpnet-base-v2')
+
+        self.embedder = EmbeddingMicroBatcher(
+            self.embedding_model,
+            max_batch_size=embedding_max_batch,
+            max_wait_ms=embedding_wait_ms
+        )
+
+        logger.info(f"✅ Async Sozialrecht RAG System initialized with URI: {uri}")
+
+    async def __aenter__(self):
+        await self.warm_up()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def warm_up(self):
+        """Compile the registered rag.* queries so the first search hits a cached plan"""
+        await warm_plan_cache_async(self.driver, prefix="rag.")
+
+    async def _embed_query(self, query: str):
+        """Encode a single query via the micro-batcher"""
+        embeddings = await asyncio.wrap_future(self.embedder.submit([query]))
+        return embeddings[0]
+
+    async def _vector_search(self, query_embedding: List[float], limit: int,
+                             filters: Optional[Dict] = None) -> List:
+        """Run the shared hybrid vector search query (plus rag.version_search for as_of)"""
+        document_filter, filter_params = Neo4jGraphBackend.document_filter(filters)
+        query = Neo4jGraphBackend.HYBRID_SEARCH_QUERY.format(document_filter=document_filter)
+
+        async with self.driver.session() as session:
+            with span("neo4j.run", cypher=query):
+                result = await session.run(query, query_embedding=query_embedding, limit=limit,
+                                           **filter_params)
+                records = [record async for record in result]
+
+            if includes_norm_versions(filter_params):
+                with span("neo4j.run", cypher=Neo4jGraphBackend.VERSION_SEARCH_QUERY):
+                    result = await session.run(Neo4jGraphBackend.VERSION_SEARCH_QUERY,
+                                               queries=[{'idx': 0, 'embedding': query_embedding}],
+                                               as_of=filter_params['as_of'],
+                                               sgb_nummer=filter_params.get('sgb_nummer', []),
+                                               limit=limit)
+                    records = merge_by_score(records, [record async for record in result], limit)
+
+            return records
+
+    async def hybrid_search_with_source_ranking(self,
+                                                query: str,
+                                                k: int = 5,
+                                                prefer_gesetz: bool = True,
+                                                filters: Optional[Dict] = None,
+                                                as_of: Optional[str] = None) -> List[Dict]:
+        """
+        Hybrid search mit Quellen-Hierarchie
+
+        Args:
+            query: Suchanfrage
+            k: Anzahl Ergebnisse
+            prefer_gesetz: Bevorzuge Gesetz vor Weisungen (für Beträge/Fristen)
+            filters: Optional, siehe normalize_search_filters()
+            as_of: Optional, Stichtag (ISO-Datum), siehe SozialrechtNeo4jRAG
+
+        Returns:
+            List of results mit Trust-Score und Source-Priority
+        """
+        with span("rag.hybrid_search", query=query, k=k):
+            with span("rag.encode", texts=1):
+                query_embedding = await self._embed_query(query)
+            records = await self._vector_search(query_embedding.tolist(), k * 3,
+                                                SozialrechtNeo4jRAG._with_as_of(filters, as_of))
+            with span("rag.rank"):
+                return SozialrechtNeo4jRAG._rank_chunks(records, k, prefer_gesetz)
+
+    async def search_by_sgb_and_paragraph(self,
+                                          sgb_nummer: str,
+                                          paragraph_nummer: str,
+                                          as_of: Optional[str] = None) -> List[Dict]:
+        """
+        Suche spezifisch nach SGB und Paragraph
+
+        Args:
+            sgb_nummer: z.B. "II", "III", "VI"
+            paragraph_nummer: z.B. "20", "11a", "136"
+            as_of: Optional, Stichtag (ISO-Datum), siehe SozialrechtNeo4jRAG
+
+        Returns:
+            Alle Dokumente zu diesem Paragraph (Gesetz + Weisungen)
+        """
+        params = {'sgb': sgb_nummer, 'paragraph': paragraph_nummer}
+        query = Neo4jGraphBackend.PARAGRAPH_SEARCH_QUERY
+        if as_of is not None:
+            params.update(normalize_search_filters({'as_of': as_of}))
+            query = Neo4jGraphBackend.PARAGRAPH_AS_OF_QUERY
+
+        async with self.driver.session() as session:
+            result = await session.run(query, params)
+            records = [record async for record in result]
+
+        return SozialrechtNeo4jRAG._format_paragraph_results(records)
+
+    async def get_hybrid_answer(self,
+                                query: str,
+                                detect_betrag_anfrage: bool = True) -> Dict:
+        """
+        Hybrid-Strategie: Gesetz für Beträge, Weisung für Verfahren
+
+        Die Query wird nur einmal eingebettet und gesucht: Gesetz- und
+        Weisungs-Ranking unterscheiden sich nur im Scoring, nicht in den
+        Kandidaten (k*3 mit k=3).
+
+        Args:
+            query: Benutzeranfrage
+            detect_betrag_anfrage: Automatisch erkennen ob Betrag/Frist gefragt ist
+
+        Returns:
+            Antwort mit Gesetz- und Weisungs-Quellen
+        """
+        is_betrag_query = detect_betrag_anfrage and SozialrechtNeo4jRAG._is_betrag_query(query)
+
+        query_embedding = (await self._embed_query(query)).tolist()
+
+        records = await self._vector_search(query_embedding, 9)
+
+        gesetz_results = SozialrechtNeo4jRAG._rank_chunks(records, 3, prefer_gesetz=True)
+        weisungen_results = SozialrechtNeo4jRAG._rank_chunks(records, 3, prefer_gesetz=False)
+
+        return SozialrechtNeo4jRAG._compose_hybrid_answer(
+            gesetz_results, weisungen_results, is_betrag_query
+        )
+
+    async def get_stats(self) -> Dict:
+        """Get Sozialrecht-specific statistics"""
+        async with self.driver.session() as session:
+            result = await session.run(Neo4jGraphBackend.STATS_QUERY)
+            record = await result.single()
+
+        return SozialrechtNeo4jRAG._format_stats(record, 0)
+
+    async def close(self):
+        """Close Neo4j connection and embedding batcher"""
+        await self.driver.close()
+        self.embedder.close()
+        logger.info("✅ Async Neo4j connection closed")
+
+
+if __name__ == "__main__":
+    async def demo():
+        async with AsyncSozialrechtNeo4jRAG() as rag:
+            # Several case workers asking at the same time
+            queries = [
+                "Was ist der Regelbedarf für Alleinstehende?",
+                "Wann liegt Hilfebedürftigkeit vor?",
+                "Welche Fristen gelten für den Widerspruch?"
+            ]
+            answers = await asyncio.gather(*(rag.get_hybrid_answer(q) for q in queries))
+
+            for query, response in zip(queries, answers):
+                print(f"\n❓ {query}\n{response['answer'][:300]}...")
+
+            print(f"\n📊 Database Stats: {await rag.get_stats()}")
+
+    asyncio.run(demo())
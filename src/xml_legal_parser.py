@@ -4,19 +4,163 @@ Parses legal XML structure into Python objects for Neo4j import
 """
 
 import logging
+import sys
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from lxml import etree
 from datetime import datetime, date
+import copy
 import hashlib
+import json
 import re
 
+try:
+    from .instrumentation import span
+except ImportError:
+    from instrumentation import span
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# __slots__ (Python 3.10+) statt __dict__ pro Instanz: beim Parsen des
+# kompletten SGB-Korpus entstehen Hunderttausende dieser Objekte.
+# Blatt-Records sind zusätzlich frozen, da sie nach dem Parsen nie geändert werden.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Inline-Auszeichnungen der gii-norm-DTD: Text wird ohne Trennzeichen angehängt,
+# alle anderen Elemente (P, LA, DT/DD, entry, BR, ...) gelten als Block
+INLINE_TAGS = frozenset({
+    'B', 'I', 'U', 'F', 'SUP', 'SUB', 'SP', 'NB', 'small', 'noindex', 'FnR', 'ABWFORMAT'
+})
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse whitespace runs (incl. newlines, NBSP) to single spaces and strip
+
+    str.split() ist etwa 3x schneller als ein Regex und wird nur
+    aufgerufen, wenn der Text Umbrüche, Tabs oder Mehrfach-Leerzeichen enthält.
+    """
+    if '\n' in text or '  ' in text or '\t' in text or '\xa0' in text or '\r' in text:
+        return " ".join(text.split())
+    return text.strip()
+
+
+# Zellen, die nur aus einer Zahl mit optionaler Einheit bestehen ("449 Euro",
+# "1.234,56 €", "18,6 Prozent"), bekommen value/unit für direkte Abfragen
+CELL_VALUE_RE = re.compile(
+    r'^(?P<sign>[-–])?\s*(?P<number>\d{1,3}(?:\.\d{3})+|\d+)(?:,(?P<decimals>\d+))?'
+    r'\s*(?P<unit>Euro|EUR|€|Prozent|vom Hundert|%)?$'
+)
+CELL_UNITS = {'Euro': 'EUR', 'EUR': 'EUR', '€': 'EUR', 'Prozent': '%', 'vom Hundert': '%', '%': '%'}
+
+# Silbentrennung am Zeilenumbruch in Kopfzeilen: "Regel-<BR/>bedarfsstufe".
+# Nur über ein echtes <BR/> (Marker im Tail) und nicht vor Konjunktionen, sonst
+# würden Ergänzungsstriche verschluckt ("Auskunfts-<BR/>und Vorlagepflicht",
+# "ein- bis dreimal")
+LINE_BREAK_MARK = '\ue000'
+HYPHENATION_RE = re.compile(
+    rf'([a-zäöüß])- ?{LINE_BREAK_MARK}\s*(?!(?:und|oder|bis|sowie)\b)([a-zäöüß])'
+)
+
+# Norm mit dem Inhaltsverzeichnis: ihre Tabellenzeilen ("§ 1 | Aufgabe ...")
+# sind keine Tabellendaten und würden Zeilen-Lookups auf "§ 1" treffen
+TABLE_OF_CONTENTS_ENBEZ = 'Inhaltsverzeichnis'
+
+
+# Amendment-Normalisierung (standkommentar), einmal kompiliert statt re.search pro Datensatz
+GERMAN_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+# Fundstelle im Bundesgesetzblatt: "G v. 19.7.2024 I Nr. 245" (seit 2023 nummeriert),
+# "G v. 20.11.2019 I 1626" (Seite) oder ausgeschrieben "BGBl. I S. 2954"
+BGBL_CITATION_RE = re.compile(
+    r'(?:(?P<typ>G|V|VO|Bek\.)\s+)?v\.\s*(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4})'
+    r'\s+(?P<teil>I{1,3})\s+(?:Nr\.\s*(?P<nr>\d+)|(?P<seite>\d+))'
+)
+BGBL_EXPLICIT_RE = re.compile(r'BGBl\.?\s+(?P<teil>I{1,3})\s+(?:Nr\.\s*(?P<nr>\d+)|S\.\s*(?P<seite>\d+))')
+
+
+def parse_german_date(text: Optional[str]) -> Optional[date]:
+    """First DD.MM.YYYY date in text ('... G v. 24.12.2003 ...')"""
+    match = GERMAN_DATE_RE.search(text or "")
+    if not match:
+        return None
+    day, month, year = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def parse_amending_act(text: Optional[str]) -> Optional['AmendingAct']:
+    """Amending act cited in a standkommentar (first citation)
+
+    "Zuletzt geändert durch Art. 4 G v. 19.7.2024 I Nr. 245" -> BGBl. 2024 I Nr. 245, G v. 2024-07-19
+    "Neugefasst durch Bek. v. 12.11.2009 I 3710, 3973"       -> BGBl. 2009 I S. 3710, Bek. v. 2009-11-12
+
+    Unterschiedlich formulierte Stand-Angaben zum selben Änderungsgesetz
+    ergeben dieselbe ID (Jahr, Teil, Nummer/Seite, Ausfertigungsdatum).
+    """
+    if not text:
+        return None
+
+    match = BGBL_CITATION_RE.search(text)
+    if match:
+        act_type = match['typ']
+        try:
+            act_date = date(int(match['year']), int(match['month']), int(match['day']))
+        except ValueError:
+            act_date = None
+    else:
+        match = BGBL_EXPLICIT_RE.search(text)
+        if not match:
+            return None
+        act_type = None
+        act_date = parse_german_date(text)
+
+    year = act_date.year if act_date else None
+    nummer = int(match['nr']) if match['nr'] else None
+    seite = int(match['seite']) if match['seite'] else None
+    location = f"Nr. {nummer}" if nummer is not None else f"S. {seite}"
+    reference = " ".join(str(part) for part in ("BGBl.", year, match['teil'], location) if part)
+
+    return AmendingAct(
+        id=hashlib.sha256(f"BGBL_{reference}_{act_date}".encode()).hexdigest()[:16],
+        bgbl_reference=reference,
+        teil=match['teil'],
+        year=year,
+        nummer=nummer,
+        seite=seite,
+        act_date=act_date,
+        act_type=act_type
+    )
+
+
+def parse_cell_value(text: str) -> Tuple[Optional[float], Optional[str]]:
+    """Numeric value and unit of a table cell, (None, None) for non-numeric cells"""
+    match = CELL_VALUE_RE.match(text)
+    if not match:
+        return None, None
+    value = float(f"{match['number'].replace('.', '')}.{match['decimals'] or 0}")
+    if match['sign']:
+        value = -value
+    return value, CELL_UNITS.get(match['unit'])
+
+
+@dataclass(frozen=True, **_SLOTS)
+class AmendingAct:
+    """Änderungsgesetz/-verordnung, identified by its BGBl citation"""
+    id: str
+    bgbl_reference: str  # "BGBl. 2024 I Nr. 245"
+    teil: str  # "I", "II"
+    year: Optional[int] = None
+    nummer: Optional[int] = None  # BGBl-Nummer (seit 2023)
+    seite: Optional[int] = None  # Anfangsseite (bis 2022)
+    act_date: Optional[date] = None  # "G v. 19.7.2024"
+    act_type: Optional[str] = None  # "G", "V", "Bek."
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Amendment:
     """Amendment history entry"""
     id: str
@@ -24,9 +168,10 @@ class Amendment:
     standkommentar: str
     amendment_date: Optional[date] = None
     bgbl_reference: Optional[str] = None
+    act: Optional[AmendingAct] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ListItem:
     """List item (enumeration)"""
     id: str
@@ -36,7 +181,7 @@ class ListItem:
     order_index: int
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TextUnit:
     """Text content unit (Absatz, paragraph)"""
     id: str
@@ -44,10 +189,50 @@ class TextUnit:
     text: str
     absatz_nummer: Optional[str] = None
     order_index: int = 0
-    list_items: List[ListItem] = field(default_factory=list)
+    list_items: Tuple[ListItem, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
+class TableCell:
+    """Table cell (<entry>)"""
+    id: str
+    row_index: int
+    col_index: int  # first covered column (namest/colname)
+    text: str
+    column_header: Optional[str] = None  # thead text of that column
+    col_span: int = 1
+    value: Optional[float] = None  # 449.0 for "449 Euro"
+    unit: Optional[str] = None  # "EUR", "%"
+
+
+@dataclass(frozen=True, **_SLOTS)
+class TableRow:
+    """Table row (<row>)"""
+    id: str
+    row_index: int
+    is_header: bool
+    label: str  # first non-empty cell, e.g. "Regelbedarfsstufe 3"
+    cells: Tuple[TableCell, ...] = ()
+
+
+@dataclass(frozen=True, **_SLOTS)
+class Table:
+    """Statutory table (<table>, e.g. Regelbedarfsstufen, Anlagen)"""
+    id: str
+    order_index: int
+    text_unit_id: Optional[str]  # TextUnit containing the table
+    columns: Tuple[str, ...] = ()  # column headers from <thead>
+    rows: Tuple[TableRow, ...] = ()
+    
+    def to_json(self) -> str:
+        """Compact JSON: {"columns": [...], "rows": [[cell, ...], ...]} (body rows only)"""
+        return json.dumps({
+            'columns': list(self.columns),
+            'rows': [[cell.text for cell in row.cells] for row in self.rows if not row.is_header]
+        }, ensure_ascii=False, separators=(',', ':'))
+
+
+@dataclass(**_SLOTS)
 class LegalNorm:
     """Legal Norm (§ paragraph)"""
     id: str
@@ -55,15 +240,20 @@ class LegalNorm:
     enbez: str  # § label
     paragraph_nummer: str  # Normalized number
     titel: str
-    content_text: str
     has_footnotes: bool
     order_index: int
     text_units: List[TextUnit] = field(default_factory=list)
     amendments: List[Amendment] = field(default_factory=list)
     gliederung: Optional[Dict] = None
+    tables: List[Table] = field(default_factory=list)
+    
+    @property
+    def content_text(self) -> str:
+        """Full norm text (join of all text units, not stored twice)"""
+        return " ".join(tu.text for tu in self.text_units)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class StructuralUnit:
     """Structural unit (Chapter, Section)"""
     id: str
@@ -74,7 +264,7 @@ class StructuralUnit:
     order_index: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LegalDocument:
     """Root legal document"""
     id: str
@@ -108,10 +298,15 @@ class LegalXMLParser:
         Returns:
             LegalDocument object
         """
-        with open(xml_path, 'rb') as f:
-            xml_content = f.read()
-        
-        root = etree.fromstring(xml_content)
+        with span("parser.parse", path=str(xml_path)):
+            return self._parse_dokument(xml_path)
+    
+    def _parse_dokument(self, xml_path: Path) -> LegalDocument:
+        with span("parser.read_xml"):
+            with open(xml_path, 'rb') as f:
+                xml_content = f.read()
+            
+            root = etree.fromstring(xml_content)
         
         # Extract root attributes
         doknr = root.get('doknr', 'UNKNOWN')
@@ -172,10 +367,12 @@ class LegalXMLParser:
         )
         
         # Parse all norms
-        document.norms = self.parse_norms(root)
+        with span("parser.norms"):
+            document.norms = self.parse_norms(root)
         
         # Parse structures
-        document.structures = self._extract_structures(root)
+        with span("parser.structures"):
+            document.structures = self._extract_structures(root)
         
         logger.info(f"✅ Parsed document: {jurabk} ({len(document.norms)} norms, {len(document.structures)} structures)")
         
@@ -218,12 +415,13 @@ class LegalXMLParser:
             # Parse text content
             textdaten = norm_elem.find('textdaten')
             text_units = []
-            content_text = ""
+            tables = []
             has_footnotes = False
             
             if textdaten is not None:
-                text_units = self.parse_textdaten(textdaten, norm_doknr)
-                content_text = " ".join(tu.text for tu in text_units)
+                text_units = self.parse_textdaten(
+                    textdaten, norm_doknr, None if enbez == TABLE_OF_CONTENTS_ENBEZ else tables
+                )
                 
                 # Check for footnotes
                 fussnoten = textdaten.find('fussnoten')
@@ -238,12 +436,12 @@ class LegalXMLParser:
                 enbez=enbez,
                 paragraph_nummer=paragraph_nummer,
                 titel=titel,
-                content_text=content_text,
                 has_footnotes=has_footnotes,
                 order_index=idx,
                 text_units=text_units,
                 amendments=amendments,
-                gliederung=gliederung
+                gliederung=gliederung,
+                tables=tables
             )
             
             norms.append(norm)
@@ -274,12 +472,15 @@ class LegalXMLParser:
             'titel': titel.text if titel is not None else None
         }
     
-    def parse_textdaten(self, textdaten, norm_doknr: str) -> List[TextUnit]:
+    def parse_textdaten(self, textdaten, norm_doknr: str,
+                        tables: Optional[List[Table]] = None) -> List[TextUnit]:
         """Extract <Content><P>, <DL>, <table> elements
         
         Args:
             textdaten: textdaten XML element
             norm_doknr: Parent norm doknr
+            tables: If given, structured tables found in the text units
+                    (also nested in P/DL) are appended here
             
         Returns:
             List of TextUnit objects
@@ -297,9 +498,11 @@ class LegalXMLParser:
         order_idx = 0
         
         for child in content_elem:
+            text_unit_id = None
+            
             if child.tag == 'P':
                 # Paragraph
-                text = self._extract_text_recursive(child)
+                text = self._extract_text(child)
                 if text.strip():
                     text_unit_id = hashlib.sha256(f"{norm_doknr}_P_{order_idx}".encode()).hexdigest()[:16]
                     text_units.append(TextUnit(
@@ -324,15 +527,20 @@ class LegalXMLParser:
                     type="List",
                     text=list_text,
                     order_index=order_idx,
-                    list_items=list_items
+                    list_items=tuple(list_items)
                 ))
                 order_idx += 1
             
             elif child.tag == 'table':
-                # Table (simplified extraction)
-                table_text = self._extract_text_recursive(child)
+                # Table: text row by row ("a | b; c | d"), structure in parse_table()
+                table_text = self._extract_text(child)
                 if table_text.strip():
                     text_unit_id = hashlib.sha256(f"{norm_doknr}_TABLE_{order_idx}".encode()).hexdigest()[:16]
+                    table = self.parse_table(child, norm_doknr, len(tables) if tables is not None else 0,
+                                             text_unit_id)
+                    if table.rows:
+                        table_text = "; ".join(" | ".join(cell.text for cell in row.cells if cell.text)
+                                               for row in table.rows)
                     text_units.append(TextUnit(
                         id=text_unit_id,
                         type="Table",
@@ -340,9 +548,103 @@ class LegalXMLParser:
                         order_index=order_idx
                     ))
                     order_idx += 1
+                    if tables is not None:
+                        tables.append(table)
+            
+            if tables is not None and text_unit_id is not None:
+                # Top-level <table> ist oben schon geparst, hier nur verschachtelte
+                for table_elem in child.iter('table'):
+                    if table_elem is not child:
+                        tables.append(self.parse_table(table_elem, norm_doknr, len(tables), text_unit_id))
         
         return text_units
     
+    def parse_table(self, table_elem, norm_doknr: str, table_idx: int,
+                    text_unit_id: Optional[str]) -> Table:
+        """Parse a CALS <table> into rows and cells
+        
+        Spalten werden über <colspec colname> aufgelöst, so dass Zellen mit
+        namest/nameend (horizontal verbunden) oder fehlenden Einträgen in der
+        richtigen Spalte landen. Vertikale Verbindungen (morerows) werden
+        nicht aufgefüllt.
+        
+        Args:
+            table_elem: <table> XML element
+            norm_doknr: Parent norm doknr
+            table_idx: Position of the table within the norm
+            text_unit_id: TextUnit containing the table
+            
+        Returns:
+            Table object
+        """
+        table_id = hashlib.sha256(f"{norm_doknr}_TBL_{table_idx}".encode()).hexdigest()[:16]
+        
+        tgroup = table_elem.find('tgroup')
+        group = tgroup if tgroup is not None else table_elem
+        colnames = {spec.get('colname'): idx for idx, spec in enumerate(group.findall('colspec'))
+                    if spec.get('colname')}
+        
+        raw_rows = []
+        for section, is_header in (('thead', True), ('tbody', False)):
+            section_elem = group.find(section)
+            if section_elem is None:
+                continue
+            for row_elem in section_elem.findall('row'):
+                cells = []
+                next_col = 0
+                for entry in row_elem.findall('entry'):
+                    start = colnames.get(entry.get('namest') or entry.get('colname'), next_col)
+                    end = colnames.get(entry.get('nameend'), start)
+                    text = self._extract_text(entry)
+                    header = self._header_text(entry, text) if is_header else None
+                    cells.append((start, max(end - start + 1, 1), text, header))
+                    next_col = max(end, start) + 1
+                raw_rows.append((is_header, cells))
+        
+        # Column headers: last header row wins, spanned headers cover every column
+        columns = {}
+        for is_header, cells in raw_rows:
+            if is_header:
+                for start, span_width, text, header in cells:
+                    for col in range(start, start + span_width):
+                        columns[col] = header
+        column_count = max(colnames.values(), default=-1) + 1
+        column_count = max([column_count] + [start + span_width for _, cells in raw_rows
+                                             for start, span_width, _, _ in cells])
+        column_headers = tuple(columns.get(col, "") for col in range(column_count)) if columns else ()
+        
+        rows = []
+        for row_idx, (is_header, cells) in enumerate(raw_rows):
+            row_id = hashlib.sha256(f"{table_id}_R{row_idx}".encode()).hexdigest()[:16]
+            table_cells = []
+            for start, span_width, text, _ in cells:
+                value, unit = (None, None) if is_header else parse_cell_value(text)
+                table_cells.append(TableCell(
+                    id=hashlib.sha256(f"{table_id}_R{row_idx}_C{start}".encode()).hexdigest()[:16],
+                    row_index=row_idx,
+                    col_index=start,
+                    text=text,
+                    column_header=columns.get(start) if not is_header else None,
+                    col_span=span_width,
+                    value=value,
+                    unit=unit
+                ))
+            rows.append(TableRow(
+                id=row_id,
+                row_index=row_idx,
+                is_header=is_header,
+                label=next((cell.text for cell in table_cells if cell.text), ""),
+                cells=tuple(table_cells)
+            ))
+        
+        return Table(
+            id=table_id,
+            order_index=table_idx,
+            text_unit_id=text_unit_id,
+            columns=column_headers,
+            rows=tuple(rows)
+        )
+    
     def _parse_list_items(self, dl_elem, norm_doknr: str, base_idx: int) -> List[ListItem]:
         """Parse DL/DT/DD list items"""
         list_items = []
@@ -352,8 +654,8 @@ class LegalXMLParser:
         dd_elements = dl_elem.findall('DD')
         
         for idx, (dt, dd) in enumerate(zip(dt_elements, dd_elements)):
-            term = self._extract_text_recursive(dt)
-            definition = self._extract_text_recursive(dd)
+            term = self._extract_text(dt)
+            definition = self._extract_text(dd)
             
             item_id = hashlib.sha256(f"{norm_doknr}_LIST_{base_idx}_{idx}".encode()).hexdigest()[:16]
             
@@ -390,11 +692,9 @@ class LegalXMLParser:
             standtyp = standtyp_elem.text
             standkommentar = standkommentar_elem.text
             
-            # Try to extract date from standkommentar
-            amendment_date = self._extract_date_from_text(standkommentar)
-            
-            # Try to extract BGBl reference
-            bgbl_ref = self._extract_bgbl_reference(standkommentar)
+            # Amending act (BGBl citation + date) parsed once here
+            act = parse_amending_act(standkommentar)
+            amendment_date = act.act_date if act and act.act_date else self._extract_date_from_text(standkommentar)
             
             amendment_id = hashlib.sha256(f"{standtyp}_{standkommentar}".encode()).hexdigest()[:16]
             
@@ -403,7 +703,8 @@ class LegalXMLParser:
                 standtyp=standtyp,
                 standkommentar=standkommentar,
                 amendment_date=amendment_date,
-                bgbl_reference=bgbl_ref
+                bgbl_reference=act.bgbl_reference if act else None,
+                act=act
             ))
         
         return amendments
@@ -457,16 +758,72 @@ class LegalXMLParser:
     
     # Helper methods
     
-    def _extract_text_recursive(self, elem) -> str:
-        """Recursively extract all text from element"""
-        texts = []
+    def _extract_text(self, elem) -> str:
+        """Extract all text below elem in one pass (document order, linear time)
+
+        Block elements (P, LA, DT/DD, table cells, BR, ...) are separated by a
+        space, inline markup (B, I, SUP, ...) is joined without one, so
+        "<B>§ 7</B>." stays "§ 7." instead of "§ 7 .". Whitespace is
+        normalised to single spaces.
+        """
+        if len(elem) == 0:
+            # Most P/DT/DD elements carry plain text only
+            return normalize_whitespace(elem.text or "")
+        
+        parts = []
+        append = parts.append
         if elem.text:
-            texts.append(elem.text)
-        for child in elem:
-            texts.append(self._extract_text_recursive(child))
-            if child.tail:
-                texts.append(child.tail)
-        return " ".join(texts).strip()
+            append(elem.text)
+        
+        # iter() walks the subtree in C; an element's tail is emitted once the
+        # walk leaves its subtree, i.e. when it is popped from the open stack
+        open_elems = [elem]
+        walk = elem.iter()
+        next(walk)
+        for node in walk:
+            parent = node.getparent()
+            while open_elems[-1] is not parent:
+                self._close_element(open_elems.pop(), append)
+            
+            if not isinstance(node.tag, str):
+                # Comments/processing instructions: only the text after them counts
+                if node.tail:
+                    append(node.tail)
+                continue
+            
+            if node.tag not in INLINE_TAGS:
+                append(" ")
+            if node.text:
+                append(node.text)
+            open_elems.append(node)
+        
+        while len(open_elems) > 1:
+            self._close_element(open_elems.pop(), append)
+        
+        return normalize_whitespace("".join(parts))
+    
+    def _header_text(self, entry, text: str) -> str:
+        """Column header with hyphenation across <BR/> removed
+
+        Args:
+            entry: Header <entry> element
+            text: _extract_text(entry), returned as is when there is no <BR/>
+        """
+        if entry.find('.//BR') is None or '-' not in text:
+            return text
+        
+        marked = copy.deepcopy(entry)
+        for br in marked.iter('BR'):
+            br.tail = LINE_BREAK_MARK + (br.tail or "")
+        joined = HYPHENATION_RE.sub(r'\1\2', self._extract_text(marked))
+        return normalize_whitespace(joined.replace(LINE_BREAK_MARK, " "))
+    
+    @staticmethod
+    def _close_element(node, append):
+        if node.tag not in INLINE_TAGS:
+            append(" ")
+        if node.tail:
+            append(node.tail)
     
     def _parse_builddate(self, builddate_str: str) -> datetime:
         """Parse builddate from YYYYMMDDHHMMSS format"""
@@ -515,22 +872,7 @@ class LegalXMLParser:
     
     def _extract_date_from_text(self, text: str) -> Optional[date]:
         """Extract date from text like 'Neufassung durch Art. 1 G v. 24.12.2003'"""
-        # Match German date format DD.MM.YYYY
-        match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', text)
-        if match:
-            try:
-                day, month, year = match.groups()
-                return date(int(year), int(month), int(day))
-            except ValueError:
-                return None
-        return None
-    
-    def _extract_bgbl_reference(self, text: str) -> Optional[str]:
-        """Extract BGBl reference from text"""
-        match = re.search(r'BGBl\s+[^\s]+\s+[\d,\s]+', text)
-        if match:
-            return match.group(0)
-        return None
+        return parse_german_date(text)
     
     def _determine_structure_level(self, bez: str) -> int:
         """Determine hierarchy level from gliederungsbez"""